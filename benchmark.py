@@ -0,0 +1,210 @@
+"""
+Benchmarks of the generated wrapper and of the generator. The wrapper benchmarks run against a stub libvulkan
+so that no vulkan driver is required.
+
+Usage:
+    python benchmark.py import
+    python benchmark.py calls
+    python benchmark.py structs
+    python benchmark.py generator --input vulkan_core.h
+"""
+import argparse
+import io
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+# Every command resolved from the stub (except vkGetDeviceProcAddr) returns 0 (SUCCESS)
+STUB_SOURCE = r"""
+#include <string.h>
+
+typedef void (*PFN_vkVoidFunction)(void);
+
+static int stub_command(void) { return 0; }
+
+PFN_vkVoidFunction vkGetDeviceProcAddr(void* device, const char* name) { return (PFN_vkVoidFunction)stub_command; }
+
+PFN_vkVoidFunction vkGetInstanceProcAddr(void* instance, const char* name) {
+    if (strcmp(name, "vkGetDeviceProcAddr") == 0)
+        return (PFN_vkVoidFunction)vkGetDeviceProcAddr;
+    return (PFN_vkVoidFunction)stub_command;
+}
+"""
+
+def build_stub_library(directory):
+    "Compile the stub libvulkan in directory. Requires a C compiler (`cc`)"
+    src_path = os.path.join(directory, 'stub_vulkan.c')
+    lib_path = os.path.join(directory, 'libvulkan.so.1')
+    with open(src_path, 'w') as f:
+        f.write(STUB_SOURCE)
+
+    subprocess.check_call(['cc', '-shared', '-fPIC', '-O2', '-o', lib_path, src_path])
+    return lib_path
+
+def run_timed(code, env, runs):
+    "Run code in fresh interpreters and return the best time (in seconds) reported by the child"
+    script = "import time\nt0 = time.perf_counter()\n{}\nprint(time.perf_counter() - t0)".format(code)
+    timings = []
+    for _ in range(runs):
+        out = subprocess.check_output([sys.executable, '-c', script], cwd=ROOT, env=env)
+        timings.append(float(out.decode().split()[-1]))
+    return min(timings)
+
+IMPORT_CASES = (
+    ("import vk", "import vk"),
+    ("import vk + constants", "import vk\nvk.STRUCTURE_TYPE_SUBMIT_INFO; vk.FORMAT_R8G8B8A8_UNORM"),
+    ("import vk + CreateInstance", "import vk\nvk.CreateInstance"),
+    ("import vk + everything (eager)", "import vk\nfor name in list(vk.lazy_definitions): getattr(vk, name, None)"),
+)
+
+def bench_import(args):
+    with tempfile.TemporaryDirectory() as directory:
+        build_stub_library(directory)
+        env = dict(os.environ)
+        env['LD_LIBRARY_PATH'] = os.pathsep.join(p for p in (directory, env.get('LD_LIBRARY_PATH')) if p)
+
+        print("Best of {} runs".format(args.runs))
+        for name, code in IMPORT_CASES:
+            print("{:<35}{:>10.2f} ms".format(name, run_timed(code, env, args.runs) * 1000))
+
+# Setup of the per call benchmarks for each backend. `device` is a dispatch table resolved from the stub
+CALL_SETUPS = (
+    ("ctypes", "vk.py", """
+import vk
+from ctypes import byref
+instance = vk.InstanceDispatch(1, vk.GetInstanceProcAddr)
+device = vk.DeviceDispatch(1, instance.GetDeviceProcAddr)
+unchecked_device = vk.DeviceDispatch(1, instance.GetDeviceProcAddr, unchecked=('QueueSubmit',))
+buffers, offsets = (vk.Buffer * 4)(), (vk.DeviceSize * 4)()
+submit_info = byref(vk.SubmitInfo())
+"""),
+    ("cffi", "vk_cffi.py", """
+import vk_cffi as vk
+instance = vk.InstanceDispatch(1, vk.GetInstanceProcAddr)
+device = vk.DeviceDispatch(1, instance.GetDeviceProcAddr)
+unchecked_device = vk.DeviceDispatch(1, instance.GetDeviceProcAddr, unchecked=('QueueSubmit',))
+buffers, offsets = vk.ffi.new('Buffer[4]'), vk.ffi.new('DeviceSize[4]')
+submit_info = vk.ffi.new('SubmitInfo*')
+"""),
+)
+
+CALL_CASES = (
+    ("CmdDraw", "device.CmdDraw(1, 3, 1, 0, 0)"),
+    ("CmdBindVertexBuffers", "device.CmdBindVertexBuffers(1, 0, 4, buffers, offsets)"),
+    ("QueueSubmit", "device.QueueSubmit(1, 1, submit_info, 0)"),
+    ("QueueSubmit (unchecked)", "unchecked_device.QueueSubmit(1, 1, submit_info, 0)"),
+)
+
+def bench_calls(args):
+    script = "{}\nimport timeit\nfor stmt in {!r}:\n    print(min(timeit.repeat(stmt, number={}, repeat=5, globals=globals())) / {})"
+    statements = [stmt for _, stmt in CALL_CASES]
+
+    with tempfile.TemporaryDirectory() as directory:
+        build_stub_library(directory)
+        env = dict(os.environ)
+        env['LD_LIBRARY_PATH'] = os.pathsep.join(p for p in (directory, env.get('LD_LIBRARY_PATH')) if p)
+
+        print("Best of 5 x {} calls".format(args.calls))
+        print("{:<25}".format('') + ''.join("{:>12}".format(backend) for backend, _, _ in CALL_SETUPS))
+
+        results = []
+        for backend, module, setup in CALL_SETUPS:
+            if not os.path.exists(os.path.join(ROOT, module)):
+                print("{} is missing, the {} backend is skipped".format(module, backend))
+                results.append(['-'] * len(CALL_CASES))
+                continue
+            code = script.format(setup, statements, args.calls, args.calls)
+            out = subprocess.check_output([sys.executable, '-c', code], cwd=ROOT, env=env)
+            results.append(["{:.0f} ns".format(float(t) * 1e9) for t in out.decode().split()])
+
+        for index, (name, _) in enumerate(CALL_CASES):
+            print("{:<25}".format(name) + ''.join("{:>12}".format(r[index]) for r in results))
+
+# Ways of building the short lived structures of a frame. `arena` is a StructArena that is reset after each run
+STRUCT_CASES = (
+    ("constructor", "vk.SubmitInfo(vk.STRUCTURE_TYPE_SUBMIT_INFO, command_buffer_count=1)"),
+    ("template clone", "info = vk.SubmitInfoTemplate.clone(); info.command_buffer_count = 1"),
+    ("StructArena.new", "arena.new(vk.SubmitInfo, vk.STRUCTURE_TYPE_SUBMIT_INFO, command_buffer_count=1)"),
+    ("constructor (16 barriers)", "(vk.ImageMemoryBarrier * 16)()"),
+    ("StructArena.alloc (16 barriers)", "arena.alloc(vk.ImageMemoryBarrier * 16)"),
+)
+
+def bench_structs(args):
+    import timeit
+    sys.path.insert(0, ROOT)
+    import vk
+
+    # Large enough for every case, so that no value overflows the buffer
+    arena = vk.StructArena(size=args.number * 0x1000)
+    namespace = {'vk': vk, 'arena': arena}
+    print("Best of 5 x {} structures".format(args.number))
+    for name, stmt in STRUCT_CASES:
+        timings = []
+        for _ in range(5):
+            timings.append(timeit.timeit(stmt, number=args.number, globals=namespace))
+            arena.reset()
+        print("{:<35}{:>10.0f} ns".format(name, min(timings) / args.number * 1e9))
+
+def best_time(fn, runs):
+    "Call fn `runs` times and return the best time in seconds"
+    timings = []
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - t0)
+    return min(timings)
+
+def bench_generator(args):
+    sys.path.insert(0, ROOT)
+    import create_vulkan_wrapper as generator
+
+    extensions = [e for e in args.extensions.split(',') if e] if args.extensions is not None else None
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        definitions = generator.load_definitions(args.input, cache_dir)
+        selected = generator.select_definitions(definitions, args.api, extensions)
+
+        cases = (
+            ("parse input (no cache)", lambda: generator.load_definitions(args.input, None)),
+            ("load cached definitions", lambda: generator.load_definitions(args.input, cache_dir)),
+            ("select definitions", lambda: generator.select_definitions(definitions, args.api, extensions)),
+            ("write wrapper", lambda: generator.write_wrapper(io.StringIO(), selected, 'benchmark')),
+        )
+
+        print("Best of {} runs".format(args.runs))
+        for name, fn in cases:
+            print("{:<35}{:>10.2f} ms".format(name, best_time(fn, args.runs) * 1000))
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    subparsers = parser.add_subparsers(dest='benchmark')
+    subparsers.required = True
+
+    import_parser = subparsers.add_parser('import', help='Time `import vk` and the first access of lazy values')
+    import_parser.add_argument('--runs', type=int, default=10)
+    import_parser.set_defaults(func=bench_import)
+
+    calls_parser = subparsers.add_parser('calls', help='Time single vulkan calls with the ctypes and the cffi (vk_cffi.py) backends')
+    calls_parser.add_argument('--calls', type=int, default=100000)
+    calls_parser.set_defaults(func=bench_calls)
+
+    structs_parser = subparsers.add_parser('structs', help='Time the creation of structures with constructors, templates and StructArena')
+    structs_parser.add_argument('--number', type=int, default=1000)
+    structs_parser.set_defaults(func=bench_structs)
+
+    generator_parser = subparsers.add_parser('generator', help='Time the steps of create_vulkan_wrapper.py on local inputs')
+    generator_parser.add_argument('--input', action='append', required=True, help='Vulkan header (can be repeated) or vk.xml')
+    generator_parser.add_argument('--api')
+    generator_parser.add_argument('--extensions')
+    generator_parser.add_argument('--runs', type=int, default=5)
+    generator_parser.set_defaults(func=bench_generator)
+
+    args = parser.parse_args()
+    args.func(args)
+
+if __name__ == '__main__':
+    main()
@@ -1,60 +1,661 @@
+import argparse
+import hashlib
+import json
+import os
 import re
 import urllib.request as req
+import xml.etree.ElementTree as ET
 
-src = req.urlopen("https://raw.githubusercontent.com/KhronosGroup/Vulkan-Docs/master/include/vulkan/vulkan_core.h").read().decode('utf-8')
+HEADERS_URL = "https://raw.githubusercontent.com/KhronosGroup/Vulkan-Docs/master/include/vulkan/{}"
+HEADERS = ("vulkan_core.h", "vulkan_win32.h", "vulkan_xcb.h")
 
-src_win32 = req.urlopen("https://raw.githubusercontent.com/KhronosGroup/Vulkan-Docs/master/include/vulkan/vulkan_win32.h").read().decode('utf-8')
+# Platform extensions included when generating from vk.xml. Those match the headers fetched from github
+PLATFORMS = ("win32", "xcb")
 
-src_xcb = req.urlopen("https://raw.githubusercontent.com/KhronosGroup/Vulkan-Docs/master/include/vulkan/vulkan_xcb.h").read().decode('utf-8')
+# Some struct name that are not redefined automatically
+STRUCT_ALIASES = {"MemoryRequirements2KHR": "MemoryRequirements2"}
 
-src += "\n\n" + src_win32 + "\n\n" + src_xcb
+# Arrays whose length is not the member just before them
+ARRAY_COUNTS = {
+    ("SubmitInfo", "wait_dst_stage_mask"): "wait_semaphore_count",
+    ("DescriptorSetLayoutBinding", "immutable_samplers"): "descriptor_count",
+    ("WriteDescriptorSet", "image_info"): "descriptor_count",
+    ("WriteDescriptorSet", "buffer_info"): "descriptor_count",
+    ("WriteDescriptorSet", "texel_buffer_view"): "descriptor_count",
+    ("SubpassDescription", "resolve_attachments"): "color_attachment_count",
+    ("SubpassDescription2KHR", "resolve_attachments"): "color_attachment_count",
+    ("PresentInfoKHR", "image_indices"): "swapchain_count",
+    ("PresentInfoKHR", "results"): "swapchain_count",
+}
 
+# Must be incremented when the format of the parsed definitions changes in order to invalidate the cached definitions
+DEFINITIONS_VERSION = 5
 
-BASE = r"""
-#
-# Vulkan wrapper generated from "https://raw.githubusercontent.com/KhronosGroup/Vulkan-Docs/master/include/vulkan/vulkan_core.h"
-#
+LAZY_BASE = r"""
+from threading import RLock
 
-from ctypes import c_int8, c_uint16, c_int32, c_uint32, c_uint64, c_size_t, c_float, c_char, c_char_p, c_void_p, POINTER, Structure, Union, cast
-from platform import system
-
-# Helper functions
-repr_fn = lambda self: str(dict(self._fields_))
+# Values built on first access. The lock is held while they are built, so that each value is only built once
+lazy_definitions = {}
+lazy_lock = RLock()
 
 def MAKE_VERSION(major, minor, patch):
     return (major<<22) | (minor<<12) | patch
 
-def define_struct(name, *args):
-    return type(name, (Structure,), {'_fields_': args, '__repr__': repr_fn})
+def define_lazy(name, factory):
+    "Register a value that is only built the first time it is accessed (see __getattr__)"
+    lazy_definitions[name] = factory
 
-def define_union(name, *args):
-    return type(name, (Union,), {'_fields_': args, '__repr__': repr_fn})
+def __getattr__(name):
+    # PEP 562: called for the module attributes that are not defined yet
+    try:
+        factory = lazy_definitions[name]
+    except KeyError:
+        raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+    with lazy_lock:
+        # Another thread may have built the value while this one was waiting for the lock
+        if name not in lazy_definitions:
+            return globals()[name]
+
+        # Build the lazy values used by the factory first, because its globals lookups do not go through __getattr__
+        for dep in factory.__code__.co_names:
+            if dep != name and dep in lazy_definitions:
+                __getattr__(dep)
+
+        value = factory()
+        if value is None:
+            raise AttributeError("Function {} could not be loaded".format(name))
+
+        # The value is set before the definition is removed, for lazy_value calls made without the lock
+        globals()[name] = value
+        del lazy_definitions[name]
+        return value
 
-def load_functions(vk_object, functions_list, loader):
+def __dir__():
+    return sorted(list(globals()) + list(lazy_definitions))
+
+def lazy_value(name):
+    "Value of a module attribute. Lazy values are built if needed"
+    return __getattr__(name) if name in lazy_definitions else globals()[name]
+
+"""[1:]
+
+LOADER_BASE = r"""
+class VkError(Exception):
+    "Base class of the exceptions raised when a command returns an error code"
+    result = None
+
+def define_error(name, result):
+    return type(name, (VkError,), {'result': result})
+
+def check_result(result, fn, args):
+    "Raise the exception matching the error codes. Success codes are returned"
+    if result < 0:
+        name = error_names.get(result)
+        raise (lazy_value(name) if name else VkError)(result)
+    return result
+
+def load_functions(vk_object, functions_list, loader, unchecked=()):
     functions = []
     for name, prototype in functions_list:
         py_name = name.decode()[2::]
-        fn_ptr = loader(vk_object, name)
-        fn_ptr = cast(fn_ptr, c_void_p)
-        if fn_ptr:
-            fn = prototype(fn_ptr.value)
+        fn = load_function(vk_object, name, prototype, loader, py_name not in unchecked)
+        if fn is not None:
             functions.append((py_name, fn))
         elif __debug__ == True:
             print('Function {} could not be loaded. (__debug__ == True)'.format(py_name))
     return functions
 
+def cached_enumeration(cache, name, fn, args):
+    "Call enumerate_command. The results that cannot change (see enumeration_commands) are stored in cache. Each caller gets a copy"
+    if not enumeration_commands.get(name):
+        return enumerate_command(fn, *args)
+
+    key = (name,) + tuple(getattr(arg, 'value', arg) for arg in args)
+    array = cache.get(key)
+    if array is None:
+        array = cache[key] = enumerate_command(fn, *args)
+    return copy_array(array)
+
+# Cached enumerations of the loader commands
+loader_enumerations = {}
+
+def enumerate_loader(name, *args):
+    "Enumerate the values of a loader command (ex: EnumerateInstanceExtensionProperties). Arguments are the ones before the count"
+    return cached_enumeration(loader_enumerations, name, lazy_value(name), args)
+
+class Dispatch(object):
+    "Function table that only resolves a command the first time it is accessed"
+    __slots__ = ('handle', 'loader', 'unchecked', 'enumerations')
+    functions = {}
+
+    def __init__(self, handle, loader, preload=False, unchecked=()):
+        self.handle = handle
+        self.loader = loader
+        self.unchecked = frozenset(unchecked)
+        self.enumerations = {}
+        if preload:
+            self.preload()
+
+    def __getattr__(self, name):
+        # Only called when the slot of the command is still empty
+        try:
+            vk_name, prototype = self.functions[name]
+        except KeyError:
+            raise AttributeError(name)
+
+        fn = load_function(self.handle, vk_name, prototype, self.loader, name not in self.unchecked)
+        if fn is None:
+            raise AttributeError('Function {} could not be loaded'.format(name))
+
+        setattr(self, name, fn)
+        return fn
+
+    def preload(self):
+        "Resolve every command of the table right away. Commands that cannot be loaded are skipped"
+        for name in self.functions:
+            try:
+                getattr(self, name)
+            except AttributeError:
+                pass
+        return self
+
+    def enumerate(self, name, *args):
+        "Enumerate the values of a two-call command (ex: EnumeratePhysicalDevices). Arguments are the ones before the count"
+        return cached_enumeration(self.enumerations, name, getattr(self, name), args)
+
+    def used_functions(self):
+        "Return the names of the commands that were resolved so far"
+        cls = type(self)
+        used = []
+        for name in self.functions:
+            try:
+                getattr(cls, name).__get__(self, cls)
+            except AttributeError:
+                continue
+            used.append(name)
+        return used
+
+def define_dispatch(name, functions_list):
+    functions = dict((vk_name.decode()[2::], (vk_name, prototype)) for vk_name, prototype in functions_list)
+    return type(name, (Dispatch,), {'__slots__': tuple(functions), 'functions': functions})
+
 API_VERSION_1_0 = MAKE_VERSION(1,0,0)
 
-# System initialization
-system_name = system()
+"""[1:]
+
+BASE = (r"""
+from ctypes import c_int8, c_int16, c_uint16, c_int32, c_uint32, c_int64, c_uint64, c_double, c_size_t, c_float, c_char, c_char_p, c_void_p, POINTER, Structure, Union, Array, _Pointer, _SimpleCData, _CFuncPtr, addressof, alignment, byref, cast, create_string_buffer, memset, sizeof, string_at
+from sys import platform
+
+"""[1:] + LAZY_BASE + r"""# Helper functions
+repr_fn = lambda self: str(dict(self._fields_))
+
+def clone_fn(self):
+    "Copy of the structure (a single memcpy). Objects referenced by the pointers are not kept alive by the copy"
+    return type(self).from_buffer_copy(self)
+
+def define_struct(name, *args):
+    struct = type(name, (Structure,), {'_fields_': args, '__repr__': repr_fn, 'clone': clone_fn})
+    for member in buffer_members.get(name, ()):
+        setattr(struct, member, define_buffer_member(struct, member))
+    return struct
+
+def define_union(name, *args):
+    return type(name, (Union,), {'_fields_': args, '__repr__': repr_fn, 'clone': clone_fn})
+
+def pin_buffer(obj):
+    "Return the address of the memory of obj (bytes or a C contiguous buffer) and the object that keeps this memory alive"
+    if isinstance(obj, bytes):
+        pointer = c_char_p(obj)
+        return c_void_p.from_buffer(pointer).value, pointer
+
+    view = memoryview(obj)
+    if not view.c_contiguous:
+        raise TypeError("Expected bytes or a C contiguous buffer, got {!r}".format(obj))
+    elif view.readonly and isinstance(view.obj, bytes) and view.nbytes == len(view.obj):
+        return pin_buffer(view.obj)
+    elif view.nbytes == 0:
+        return None, view
+
+    # Read only buffers other than bytes cannot be shared with ctypes and are copied
+    data = (c_char * view.nbytes).from_buffer_copy(view) if view.readonly else c_char.from_buffer(view)
+    return addressof(data), data
+
+class BufferMember(property):
+    "Property of the members that accept buffers. Like the members of the structures, it has an offset and a size"
+
+def define_buffer_member(struct, name):
+    "Property replacing a void* member, that can also be set with bytes or a C contiguous buffer. The structure keeps the buffer alive"
+    member = getattr(struct, name)
+
+    def get_member(self):
+        return member.__get__(self, struct)
+
+    def set_member(self, value):
+        if value is None or isinstance(value, int):
+            address = value
+            self.__dict__.pop(name, None)
+        else:
+            if isinstance(value, _SimpleCData):
+                # Pointer values (ex: c_void_p, c_char_p) hold the address, the other values are addresses
+                address = c_void_p.from_buffer(value).value if value._type_ in 'zZP' else value.value
+            elif isinstance(value, Array):
+                address = addressof(value)
+            elif isinstance(value, _Pointer):
+                address = cast(value, c_void_p).value
+            else:
+                address, value = pin_buffer(value)
+            self.__dict__[name] = value
+        c_void_p.from_buffer(self, member.offset).value = address
+
+    buffer_member = BufferMember(get_member, set_member, doc=member.__doc__)
+    buffer_member.offset, buffer_member.size = member.offset, member.size
+    return buffer_member
+
+def define_template(struct):
+    "Zeroed structure with its type member already set. New structures are created with template.clone()"
+    template = struct()
+    structure_type = structure_types.get(struct.__name__)
+    if structure_type is not None:
+        # The type is the first member. It is not set by name because a few structures have two members named `type`
+        StructureType.from_buffer(template).value = structure_type
+    return template
+
+# Numpy dtypes of the structures, by structure type
+struct_dtypes = {}
+
+def ctype_dtype(ctype):
+    "Numpy dtype matching a ctypes type. Pointers and handles are stored as unsigned integers"
+    import numpy
+    if issubclass(ctype, (Structure, Union)):
+        return define_dtype(ctype)
+    elif issubclass(ctype, Array):
+        if ctype._type_ is c_char:
+            return numpy.dtype(('S', ctype._length_))
+        return numpy.dtype((ctype_dtype(ctype._type_), (ctype._length_,)))
+    elif isinstance(getattr(ctype, '_type_', None), str) and ctype._type_ not in 'Pzw':
+        return numpy.dtype(ctype)
+    else:
+        return numpy.dtype(numpy.uintp)
+
+def define_dtype(struct):
+    "Build the numpy structured dtype of a struct or an union. Offsets and sizes are checked against ctypes"
+    dtype = struct_dtypes.get(struct)
+    if dtype is not None:
+        return dtype
+
+    import numpy
+    fields = {}
+    for field in struct._fields_:
+        # Bit fields cannot be represented, but their bytes are still part of the itemsize
+        if len(field) == 3:
+            continue
+
+        # When two members share a name, ctypes exposes the last one
+        name, ctype = field
+        fields[name] = ctype_dtype(ctype)
+
+    offsets = []
+    for name, field_dtype in fields.items():
+        descriptor = getattr(struct, name)
+        if field_dtype.itemsize != descriptor.size:
+            raise TypeError("{}.{}: numpy size {} does not match ctypes size {}".format(struct.__name__, name, field_dtype.itemsize, descriptor.size))
+        offsets.append(descriptor.offset)
+
+    dtype = numpy.dtype({'names': list(fields), 'formats': list(fields.values()), 'offsets': offsets, 'itemsize': sizeof(struct)})
+    if dtype.itemsize != sizeof(struct):
+        raise TypeError("{}: numpy itemsize {} does not match ctypes size {}".format(struct.__name__, dtype.itemsize, sizeof(struct)))
+
+    struct_dtypes[struct] = dtype
+    return dtype
+
+def as_ndarray(obj, count=None):
+    "View a ctypes array of structs (or `count` structs behind a pointer) as a numpy structured array, without copying"
+    import numpy
+    if count is not None:
+        obj = cast(obj, POINTER(obj._type_ * count)).contents
+    return numpy.frombuffer(obj, define_dtype(obj._type_))
+
+def from_ndarray(array, struct):
+    "Share the memory of a writable, C contiguous ndarray as a ctypes array of struct (usable as a POINTER(struct) argument)"
+    if array.nbytes % sizeof(struct) != 0:
+        raise TypeError("An array of {} bytes cannot hold {} structures of {} bytes".format(array.nbytes, struct.__name__, sizeof(struct)))
+    return (struct * (array.nbytes // sizeof(struct))).from_buffer(array)
+
+# Name of the structures, by StructureType value
+define_lazy('structure_names', lambda: dict((value, name) for name, value in structure_types.items()))
+
+# Layouts of the structures (see struct_layout), by structure type
+struct_layouts = {}
+
+def add_struct_layout(struct, offset, mask, pointers, handles):
+    arrays = array_members.get(struct.__name__, {})
+    handle_names = handle_members.get(struct.__name__, ())
+    for index, field in enumerate(struct._fields_):
+        name, ctype = field[0], field[1]
+
+        # The first member is at offset 0. This also works for the structures that have two members named `type`
+        member_offset = offset + (getattr(struct, name).offset if index else 0)
+        if issubclass(ctype, (_Pointer, _CFuncPtr)) or ctype in (c_char_p, c_void_p):
+            count, count_offset, count_type = arrays.get(name), None, None
+            if count is not None:
+                count_type = dict(f[:2] for f in struct._fields_)[count]
+                count_offset = offset + getattr(struct, count).offset
+
+            if ctype is c_char_p:
+                kind = 'string'
+            elif ctype is c_void_p:
+                kind = 'next' if name == 'next' else 'data' if count is not None else None
+            else:
+                kind = 'array' if issubclass(ctype, _Pointer) else None
+            element = ctype._type_ if kind == 'array' else c_char
+            size = sizeof(element) if count is not None and count.endswith('_size') else 1
+            pointers.append((member_offset, kind, element, count_offset, count_type, size, name in handle_names))
+        elif issubclass(ctype, Structure):
+            add_struct_layout(ctype, member_offset, mask, pointers, handles)
+        elif issubclass(ctype, Array) and issubclass(ctype._type_, Structure):
+            for item in range(ctype._length_):
+                add_struct_layout(ctype._type_, member_offset + item * sizeof(ctype._type_), mask, pointers, handles)
+        else:
+            mask[member_offset:member_offset + sizeof(ctype)] = b'\xff' * sizeof(ctype)
+            if name in handle_names:
+                handles.append((member_offset, ctype))
+
+# The layout of a structure is (mask, pointers, handles). mask is an int with the bits of the value bytes set (padding
+# and pointers are excluded). pointers are (offset, kind, element type, count offset, count type, count divisor,
+# handle elements) where kind is 'string', 'next', 'data' (bytes), 'array' or None for the pointers that are not followed.
+# handles are the (offset, type) of the handle members.
+def struct_layout(struct):
+    "Layout of a structure type. The members of the nested structures are part of the layout of their parent"
+    layout = struct_layouts.get(struct)
+    if layout is None:
+        mask, pointers, handles = bytearray(sizeof(struct)), [], []
+        add_struct_layout(struct, 0, mask, pointers, handles)
+        layout = struct_layouts[struct] = (int.from_bytes(mask, 'little'), tuple(pointers), tuple(handles))
+    return layout
+
+def struct_children(value):
+    "Yield (offset, data) for the pointers of a structure that are followed. data is bytes, or a tuple of structures or of strings"
+    address = addressof(value)
+    for offset, kind, element, count_offset, count_type, size, _ in struct_layout(type(value))[1]:
+        pointer = c_void_p.from_address(address + offset).value
+        if not pointer or kind is None:
+            continue
+
+        count = 1 if count_offset is None else count_type.from_address(address + count_offset).value // size
+        if kind == 'string':
+            yield offset, string_at(pointer)
+        elif kind == 'next':
+            name = lazy_value('structure_names').get(c_int32.from_address(pointer).value)
+            if name is not None:
+                yield offset, (lazy_value(name).from_address(pointer),)
+        elif kind == 'data':
+            yield offset, string_at(pointer, count)
+        elif element is c_char_p:
+            yield offset, tuple(c_char_p.from_address(pointer + index * sizeof(c_char_p)).value for index in range(count))
+        elif issubclass(element, Structure):
+            yield offset, tuple((element * count).from_address(pointer))
+        else:
+            yield offset, string_at(pointer, count * sizeof(element))
+
+def struct_tree(value):
+    "Copy of a structure and of everything it points to, as (type name, bytes, ((offset, data), ...)). data is bytes, or a tuple of trees or of strings"
+    children = []
+    for offset, data in struct_children(value):
+        if data and isinstance(data[0], Structure):
+            data = tuple(struct_tree(item) for item in data)
+        children.append((offset, data))
+
+    # The pointer values are cleared, so that the trees of identical structures are equal
+    data = bytearray(value)
+    for layout in struct_layout(type(value))[1]:
+        data[layout[0]:layout[0] + sizeof(c_void_p)] = bytes(sizeof(c_void_p))
+    return (type(value).__name__, bytes(data), tuple(children))
+
+def struct_key(value):
+    "Hashable key of the content of a structure and of the data it points to. Padding and the pointer values are ignored"
+    children = []
+    for offset, data in struct_children(value):
+        if data and isinstance(data[0], Structure):
+            data = tuple(struct_key(item) for item in data)
+        children.append((offset, data))
+    return (type(value).__name__, int.from_bytes(bytes(value), 'little') & struct_layout(type(value))[0], tuple(children))
+
+def build_struct(tree, objects, handle=None):
+    "Structure rebuilt from a struct_tree. The values it points to are appended to objects, handle(value) maps the handles it holds"
+    name, data, children = tree
+    struct = lazy_value(name)
+    value = struct.from_buffer_copy(data)
+    address = addressof(value)
+    _, pointers, handles = struct_layout(struct)
+
+    if handle is not None:
+        for offset, ctype in handles:
+            member = ctype.from_address(address + offset)
+            member.value = handle(member.value)
+
+    # The pointers that are not followed are cleared
+    layouts = {}
+    for layout in pointers:
+        layouts[layout[0]] = layout
+        c_void_p.from_address(address + layout[0]).value = None
+
+    for offset, child in children:
+        _, kind, element, _, _, _, handle_elements = layouts[offset]
+        if isinstance(child, bytes):
+            child = create_string_buffer(child, len(child) + (kind == 'string'))
+            if handle_elements and handle is not None:
+                values = (element * (len(child) // sizeof(element))).from_buffer(child)
+                values[:] = [handle(value) for value in values]
+        elif not child or isinstance(child[0], bytes):
+            child = (c_char_p * len(child))(*child)
+        else:
+            items = [build_struct(item, objects, handle) for item in child]
+            child = items[0] if kind == 'next' else (element * len(items))(*items)
+        objects.append(child)
+        c_void_p.from_address(address + offset).value = addressof(child)
+
+    return value
+
+class StructArena(object):
+    "Keep the short lived structures and arrays of a frame, and the data they point to, alive until reset()"
+    __slots__ = ('buffer', 'address', 'size', 'offset', 'overflow', 'objects')
+
+    def __init__(self, size=0x10000):
+        self.buffer = bytearray(size)
+        self.address = addressof(c_char.from_buffer(self.buffer))
+        self.size = size
+        self.offset = 0
+        self.overflow = 0
+
+        # Values allocated by the arena and data passed to keep(), until the next reset. The values in the buffer are views
+        # of it, but they hold the objects assigned to their members (ex: the bytes of a c_char_p or the ctypes arrays)
+        self.objects = []
+
+    def alloc(self, ctype):
+        "Return a zeroed instance of ctype (a structure, an union or an array type)"
+        align = alignment(ctype)
+        offset = (self.offset + align - 1) & -align
+        end = offset + sizeof(ctype)
+        if end <= self.size:
+            self.offset = end
+            value = ctype.from_address(self.address + offset)
+        else:
+            # A bytearray cannot be resized while it is used. The buffer grows at the next reset
+            self.overflow += end - self.offset
+            value = ctype()
+        self.objects.append(value)
+        return value
+
+    def new(self, struct, *args, **kwargs):
+        "Allocate a structure. The arguments are the ones of the structure constructor"
+        value = self.alloc(struct)
+        if args or kwargs:
+            struct.__init__(value, *args, **kwargs)
+        return value
+
+    def array(self, ctype, values):
+        "Allocate an array of ctype. values is either the length of the array or the values to copy in it"
+        if isinstance(values, int):
+            return self.alloc(ctype * values)
+        if not isinstance(values, (list, tuple)):
+            values = list(values)
+        array = self.alloc(ctype * len(values))
+        array[:] = values
+        return array
+
+    def keep(self, value):
+        "Keep a value alive until the next reset (ex: data that is not allocated by the arena and only referenced by an address)"
+        self.objects.append(value)
+        return value
+
+    def reset(self):
+        "Release everything that was allocated. The values allocated before must not be used anymore"
+        if self.overflow:
+            self.size += self.overflow
+            self.buffer = bytearray(self.size)
+            self.address = addressof(c_char.from_buffer(self.buffer))
+        else:
+            memset(self.address, 0, self.offset)
+
+        self.offset = self.overflow = 0
+        self.objects = []
+
+# Arguments that are passed to the ctypes pointer types as they are
+ctypes_arguments = (Array, _Pointer, type(byref(c_int8())))
+
+# Pointer types of array_pointer, by (element type, output)
+array_pointers = {}
+
+def array_from_param(cls, obj):
+    # The types of the arrays and pointers that were already accepted once are not checked again
+    if type(obj) in cls.accepted_types:
+        return obj
+    elif isinstance(obj, ctypes_arguments):
+        value = cls.pointer_from_param(obj)
+        if not isinstance(obj, ctypes_arguments[-1]):
+            cls.accepted_types.add(type(obj))
+        return value
+
+    try:
+        view = memoryview(obj)
+    except TypeError:
+        return cls.pointer_from_param(obj)
+
+    size = sizeof(cls._type_)
+    if not view.c_contiguous or view.itemsize not in (1, size) or view.nbytes % size != 0:
+        raise TypeError("Expected a C contiguous buffer of {} bytes values, got {!r}".format(size, obj))
+
+    # Read only buffers (ex: bytes) cannot be shared with ctypes and are copied. The functions cannot write in them
+    if view.readonly and cls.output:
+        raise TypeError("Expected a writable buffer, the function writes in this argument, got {!r}".format(obj))
+    array_type = cls._type_ * (view.nbytes // size)
+    return array_type.from_buffer_copy(view) if view.readonly else array_type.from_buffer(view)
+
+# Arguments that ctypes passes as pointers by itself, and the other arguments accepted by c_void_p
+void_arguments = (bytes, type(None)) + ctypes_arguments
+void_pointer_arguments = (int, str, _SimpleCData, _CFuncPtr)
+
+def void_from_param(cls, obj):
+    if isinstance(obj, void_arguments):
+        return obj
+    elif isinstance(obj, void_pointer_arguments):
+        return c_void_p.from_param(obj)
+    try:
+        view = memoryview(obj)
+    except TypeError:
+        return c_void_p.from_param(obj)
+
+    # Writable buffers are shared. The argument keeps the buffer alive during the call
+    if not view.readonly and view.c_contiguous and view.nbytes:
+        return byref(c_char.from_buffer(view))
+    address, data = pin_buffer(view)
+    return data if address else None
+
+def output_void_from_param(cls, obj):
+    # bytes and the other read only buffers cannot be written by the functions
+    if isinstance(obj, bytes) or (not isinstance(obj, void_arguments + void_pointer_arguments) and _readonly_buffer(obj)):
+        raise TypeError("Expected a writable buffer, the function writes in this argument, got {!r}".format(type(obj).__name__))
+    return void_from_param(cls, obj)
+
+def _readonly_buffer(obj):
+    try:
+        return memoryview(obj).readonly
+    except TypeError:
+        return False
+
+# c_void_p of the functions arguments, that also accepts bytes-like objects (numpy arrays, bytearray, memoryview, ctypes structures)
+void_pointer = type('void_pointer', (c_void_p,), {'from_param': classmethod(void_from_param)})
+
+# void_pointer of the arguments that the functions write in. Read only buffers are rejected
+output_void_pointer = type('output_void_pointer', (c_void_p,), {'from_param': classmethod(output_void_from_param)})
+
+def array_pointer(ctype, output=False):
+    "POINTER(ctype) that also accepts C contiguous buffers of ctype values (numpy arrays, array.array, memoryview) without copying. Output arrays reject read only buffers"
+    pointer = array_pointers.get((ctype, output))
+    if pointer is None:
+        base = POINTER(ctype)
+        pointer = type(base.__name__, (base,), {
+            'from_param': classmethod(array_from_param),
+            'pointer_from_param': staticmethod(base.from_param),
+            'accepted_types': set([type(None)]),
+            'output': output,
+        })
+        array_pointers[(ctype, output)] = pointer
+    return pointer
+
+def load_library():
+    if system_name == 'Windows':
+        return windll.LoadLibrary('vulkan-1')
+    elif system_name == 'Linux':
+        return cdll.LoadLibrary('libvulkan.so.1')
+
+def load_function(vk_object, name, prototype, loader, check=True):
+    fn_ptr = cast(loader(vk_object, name), c_void_p)
+    if fn_ptr:
+        fn = prototype(fn_ptr.value)
+        if check and prototype._restype_ is Result:
+            fn.errcheck = check_result
+        return fn
+
+def enumerate_command(fn, *args):
+    "Call a two-call command (count, then fill) until the result is not INCOMPLETE. Return a ctypes array (bytes for a void*)"
+    count_type, array_type = fn.argtypes[-2]._type_, fn.argtypes[-1]._type_
+    element = array_type if isinstance(array_type, type) else c_char
+    template = define_template(element) if element.__name__ in structure_types else None
+
+    count = count_type()
+    result = INCOMPLETE
+    while result == INCOMPLETE:
+        check_result(fn(*args, byref(count), None) or 0, fn, args)
+        if template is not None:
+            array = (element * count.value)(*[template] * count.value)
+        else:
+            array = (element * count.value)()
+        result = fn(*args, byref(count), array)
+        check_result(result or 0, fn, args)
+
+    if element is c_char:
+        return array.raw[:count.value]
+    if count.value < len(array):
+        array = (element * count.value).from_buffer(array)
+    return array
+
+def copy_array(array):
+    "Copy of an array returned by enumerate_command (bytes cannot be modified and are not copied)"
+    return array if isinstance(array, bytes) else type(array).from_buffer_copy(array)
+
+""" + LOADER_BASE + r"""# System initialization
+system_name = {'win32': 'Windows', 'darwin': 'Darwin'}.get(platform, platform.capitalize())
 if system_name == 'Windows':
     from ctypes import WINFUNCTYPE, windll
     FUNCTYPE = WINFUNCTYPE
-    vk = windll.LoadLibrary('vulkan-1')
 elif system_name == 'Linux':
     from ctypes import CFUNCTYPE, cdll
     FUNCTYPE = CFUNCTYPE
-    vk = cdll.LoadLibrary('libvulkan.so.1')
+
+define_lazy('vk', load_library)
 
 # System types
 HINSTANCE = c_size_t
@@ -76,14 +677,15 @@ VisualID = c_uint32
 ANativeWindow = c_size_t
 RROutput = c_uint32
 
-SECURITY_ATTRIBUTES = define_struct('SECURITY_ATTRIBUTES', 
+define_lazy('SECURITY_ATTRIBUTES', lambda: define_struct('SECURITY_ATTRIBUTES', 
     ('nLength', c_uint32),
     ('lpSecurityDescriptor', c_void_p),
     ('bInheritHandle', c_uint32),
-)
+))
 
 # Base types
 Flags = c_uint32
+Flags64 = c_uint64
 Bool32 = c_uint32
 DeviceSize = c_uint64
 SampleMask = c_uint32
@@ -113,8 +715,82 @@ MAX_DRIVER_NAME_SIZE_KHR = 256
 MAX_DRIVER_INFO_SIZE_KHR = 256
 
 
+""")
+
+# Names defined in BASE. The definitions with the same name are not generated again
+BASE_NAMES = set(re.findall("^(\w+) = ", BASE, re.M) + re.findall("^define_lazy\('(\w+)'", BASE, re.M))
+
+CFFI_BASE = r"""
+def load_library():
+    if platform == 'win32':
+        return ffi.dlopen('vulkan-1')
+    return ffi.dlopen('libvulkan.so.1')
+
+def checked_function(fn):
+    "cffi functions have no errcheck, the result is checked by a python function"
+    def call(*args):
+        return check_result(fn(*args), fn, args)
+    call.ctype = ffi.typeof(fn)
+    return call
+
+def enumerate_command(fn, *args):
+    "Call a two-call command (count, then fill) until the result is not INCOMPLETE. Return a cffi array (bytes for a void*)"
+    ctype = getattr(fn, 'ctype', None) or ffi.typeof(fn)
+    element = ctype.args[-1].item if ctype.args[-1].item.kind != 'void' else ffi.typeof('char')
+    structure_type = structure_types.get(element.cname.split(' ')[-1])
+
+    count = ffi.new(ctype.args[-2])
+    result = INCOMPLETE
+    while result == INCOMPLETE:
+        check_result(fn(*args, count, ffi.NULL) or 0, fn, args)
+        array = ffi.new(ffi.getctype(element, '[]'), [[structure_type]] * count[0] if structure_type is not None else count[0])
+        result = fn(*args, count, array)
+        check_result(result or 0, fn, args)
+
+    if element.kind == 'primitive' and element.cname == 'char':
+        return ffi.buffer(array, count[0])[:]
+    if count[0] < len(array):
+        trimmed = ffi.new(ffi.getctype(element, '[]'), count[0])
+        ffi.memmove(trimmed, array, ffi.sizeof(element) * count[0])
+        array = trimmed
+    return array
+
+def copy_array(array):
+    "Copy of an array returned by enumerate_command (bytes cannot be modified and are not copied)"
+    if isinstance(array, bytes):
+        return array
+    copy = ffi.new(ffi.typeof(array), len(array))
+    ffi.memmove(copy, array, ffi.sizeof(array))
+    return copy
+
+def load_function(vk_object, name, prototype, loader, check=True):
+    fn_ptr = loader(vk_object, name)
+    if fn_ptr != ffi.NULL:
+        fn = ffi.cast(prototype, fn_ptr)
+        if check and ffi.typeof(fn).result is ffi.typeof('Result'):
+            return checked_function(fn)
+        return fn
+
+"""[1:] + LOADER_BASE + r"""define_lazy('vk', load_library)
+
+"""
+
+# C declarations of the types defined in BASE, used by the cffi backend
+CFFI_CDEF_BASE = """
+typedef struct SECURITY_ATTRIBUTES {
+    uint32_t nLength;
+    void* lpSecurityDescriptor;
+    uint32_t bInheritHandle;
+} SECURITY_ATTRIBUTES;
 """[1:]
 
+# C types matching the ctypes types of the parsed definitions
+C_TYPES = {
+    'c_int8': 'int8_t', 'c_uint8': 'uint8_t', 'c_int16': 'int16_t', 'c_uint16': 'uint16_t', 'c_int32': 'int32_t', 'c_uint32': 'uint32_t',
+    'c_int64': 'int64_t', 'c_uint64': 'uint64_t', 'c_size_t': 'size_t', 'c_float': 'float', 'c_double': 'double', 'c_char': 'char',
+    'c_char_p': 'char*', 'c_void_p': 'void*', 'None': 'void',
+}
+
 def no_vk(t):
     t = t.replace('Vk', '')
     t = t.replace('PFN_vk', 'Fn')
@@ -122,19 +798,23 @@ def no_vk(t):
     return t
 
 def translate_type(t):
-    table = { 
+    table = {
         "float": 'c_float',
-        "uint32_t": 'c_uint32', 
+        "double": 'c_double',
+        "uint32_t": 'c_uint32',
         "uint64_t": 'c_uint64',
         "size_t": 'c_size_t',
         "float": 'c_float',
+        'int8_t': 'c_int8',
+        'int16_t': 'c_int16',
         'int32_t': 'c_int32',
+        'int64_t': 'c_int64',
         'int': 'c_int32',
         'uint8_t': 'c_int8',
         "uint16_t": 'c_uint16',
         "char": "c_char",
-        "void": "None", 
-        "void*": "c_void_p", 
+        "void": "None",
+        "void*": "c_void_p",
         "const void*": 'c_void_p',
         "const char*": 'c_char_p',
         "const char* const*": 'POINTER(c_char_p)',
@@ -143,26 +823,26 @@ def translate_type(t):
         "const ObjectTableEntryNVX* const*": "POINTER(POINTER(ObjectTableEntryNVX))",
         'v': ''
      }
-     
+
     if t in table.keys():
         return table[t]
 
     if t.endswith("*"):
-        if t.startswith("const"):
-            ttype = t[6:len(t)-1]
-            ttype = table[ttype] if ttype in table else ttype
-            return "POINTER({})".format(ttype)
-        else:
-            ttype = t[:len(t)-1]
-            ttype = table[ttype] if ttype in table else ttype
-            return "POINTER({})".format(ttype)
-    
+        # Pointed type, without the const qualifiers (ex: `const X* const*` points to `const X*`)
+        ttype = t[:len(t)-1].strip()
+        if ttype.endswith(" const"):
+            ttype = ttype[:len(ttype)-6]
+        if ttype.startswith("const "):
+            ttype = ttype[6:]
+        return "POINTER({})".format(translate_type(ttype))
+
     return t
 
 def parse_array(n, t):
-    name, length = n.split('[')
-    length = no_vk(length[0:len(length)-1])
-    type_ = "{} * {}".format(do_type(t), length)
+    name, length = n.split('[', 1)
+    type_ = do_type(t)
+    for dim in reversed(length[0:len(length)-1].split('][')):
+        type_ = "{} * {}".format(type_, no_vk(dim))
     return name, type_
 
 def to_snake_case(name):
@@ -170,14 +850,14 @@ def to_snake_case(name):
     def lower(m):
         g0 = m.group(0)
         g1, g2 = m.groups()
-        
+
         if g1:
             return g0[0] + '_'+g1.lower() + g0[2]
         elif g2:
             return g0[0] + '_' + g0[1:3]
-            
+
     name = re.sub('[^A-Z]([A-Z])[^A-Z]|[^A-Z]([A-Z])', lower, name)
-        
+
     return name
 
 def fix_arg(arg):
@@ -193,52 +873,540 @@ def fix_arg(arg):
 def do_type(t):
     return translate_type(no_vk(t))
 
-def parse_handles_def(f):
-    f.write("# Handles types\n")
-    handles = re.findall("VK_DEFINE_HANDLE\(Vk(\w+)\)", src, re.S)
-    for h in handles:
-        f.write("{} = c_size_t\n".format(h))
+def parse_member(type_, name, bits=None):
+    "Return the [name, type] (or [name, type, bits] for bitfields) of a struct member"
+    if '[' in name:
+        name, type_ = parse_array(name, type_)
+    else:
+        type_ = do_type(type_)
+
+    member = [fix_arg(name), type_]
+    if bits:
+        member.append(int(bits))
+    return member
+
+def is_enumeration(text):
+    "Commands that follow the two-call protocol end with a (non const) count or size pointer and the array to fill"
+    args = [' '.join(arg.split()) for arg in text.split(',')]
+    return len(args) >= 2 and re.match("(uint32_t|size_t)\* p\w+(Count|Size)$", args[-2]) is not None and \
+        '*' in args[-1] and not args[-1].startswith('const')
+
+def const_arguments(text):
+    "Return the indices of the const arguments of a C function (the arguments that the function does not write in)"
+    args = [' '.join(arg.split()) for arg in text.split(',')]
+    return [index for index, arg in enumerate(a for a in args if a != 'void') if arg.startswith('const ')]
+
+def parse_arguments(text):
+    "Return the types of the arguments of a C function. Array arguments are passed as pointers"
+    types = []
+    for arg in text.split(','):
+        arg = ' '.join(arg.split())
+        if arg == 'void':
+            continue
+        type_, name, array = re.match("(.+?)\s*(\w+)(\[\w*\])?$", arg).groups()
+        types.append(do_type(type_ + '*' if array else type_))
+    return types
+
+def split_sections(src):
+    "Split the headers in (name, text). Each section holds the definitions of a vulkan version or of an extension"
+    sections = []
+    start, name = 0, None
+    for m in re.finditer("^#define (VK_VERSION_\d+_\d+|VK_[A-Z]+_[a-z0-9_]+) 1\s*$", src, re.M):
+        sections.append((name, src[start:m.start()]))
+        start, name = m.end(), m.group(1)
+    sections.append((name, src[start:]))
+    return sections
+
+def find_declarations(text):
+    names = re.findall("VK_DEFINE_(?:NON_DISPATCHABLE_)?HANDLE\(Vk(\w+)\)", text)
+    names += re.findall("typedef VkFlags(?:64)? Vk(\w+?);", text)
+    names += re.findall("typedef enum Vk(\w+) {", text)
+    names += re.findall("typedef (?:struct|union) Vk(\w+?) {", text)
+    names += [no_vk(name) for name in re.findall("typedef \w+\*? \(\w+ \*(\w+)\)\(", text)]
+    return names
+
+def parse_header(src):
+    """
+    Parse the vulkan headers in the definitions used to generate the wrapper. The definitions only hold
+    lists, strings and numbers so that they can be cached as json.
+    """
+    definitions = {'basetypes': [], 'constants': [], 'handles': [], 'flags': [], 'enums': [], 'structs': [], 'functions': [], 'enumerations': [], 'const_arguments': {}}
+
+    for type_, name in re.findall("typedef (uint32_t|uint64_t|int32_t|int64_t|void\*) Vk(\w+);", src):
+        definitions['basetypes'].append((name, do_type(type_)))
+
+    for name in re.findall("VK_DEFINE_HANDLE\(Vk(\w+)\)", src):
+        definitions['handles'].append((name, 'c_size_t'))
+
+    for name in re.findall("VK_DEFINE_NON_DISPATCHABLE_HANDLE\(Vk(\w+)\)", src):
+        definitions['handles'].append((name, 'c_uint64'))
+
+    # 64 bits flag bits are not defined with an enum, but with a typedef and constants
+    flag_bits_64 = {}
+    for type_, name, value in re.findall("static const Vk(\w+) VK_(\w+) = (\w+);", src):
+        value = re.sub("^(0x[0-9A-Fa-f]+|\d+)U?L*$", "\\1", value)
+        flag_bits_64.setdefault(type_, []).append((name, no_vk(value)))
+
+    for base, name in re.findall("typedef Vk(Flags|Flags64) Vk(\w+?);", src):
+        if 'FlagBits' in name:
+            definitions['enums'].append((name, 'c_uint64', flag_bits_64.get(name, [])))
+        else:
+            definitions['flags'].append((name, base))
+
+    for name, fields in re.findall("typedef enum Vk(\w+) {(.+?)} \w+;", src, re.S):
+        values = [(value_name, no_vk(value)) for value_name, value in re.findall("VK_(\w+?) = (.*?)(?:,|})", fields, re.S)]
+        # Enums with negative values (ex: the error codes of Result) are signed
+        signed = any(value.startswith('-') for _, value in values)
+        definitions['enums'].append((name, 'c_int32' if signed else 'c_uint32', values))
+
+    for kind, name, fields in re.findall("typedef (struct|union) Vk(\w+?) {(.+?)} \w+?;", src, re.S):
+        members = [parse_member(*m) for m in re.findall("\s+(.+?)\s+([_a-zA-Z0-9[\]]+)(?::(\d+))?;", fields)]
+        definitions['structs'].append((kind, name, members))
+
+    for rt, name, fields in re.findall("typedef (\w+\*?) \(\w+ \*(\w+)\)\((.+?)\);", src, re.S):
+        definitions['functions'].append((no_vk(name), do_type(rt), parse_arguments(fields)))
+        definitions['const_arguments'][no_vk(name)] = const_arguments(fields)
+        if is_enumeration(fields):
+            definitions['enumerations'].append(no_vk(name))
+
+    definitions['sections'] = [(name, find_declarations(text)) for name, text in split_sections(src)]
+    # The headers define the enum values of the extensions with the other values, their section is unknown
+    definitions['value_sections'] = {}
+
+    return definitions
+
+def element_text(element):
+    "Text of a vk.xml element without its comments and with its whitespaces collapsed"
+    parts = [element.text or '']
+    for child in element:
+        if child.tag != 'comment':
+            parts.append(element_text(child))
+        parts.append(child.tail or '')
+    return ' '.join(''.join(parts).split())
+
+def for_vulkan(element):
+    "Check if a vk.xml element applies to vulkan (and not only to vulkansc)"
+    api = element.get('api')
+    return api is None or 'vulkan' in api.split(',')
+
+def enum_value(element, extension_number=None):
+    "Value of a vk.xml enum, as it would be written in the headers"
+    if element.get('alias') is not None:
+        return element.get('alias')
+    elif element.get('bitpos') is not None:
+        return "0x{:08X}".format(1 << int(element.get('bitpos')))
+    elif element.get('offset') is not None:
+        number = int(element.get('extnumber', extension_number))
+        value = 1000000000 + (number - 1) * 1000 + int(element.get('offset'))
+        return str(-value if element.get('dir') == '-' else value)
+    else:
+        return element.get('value')
+
+def constant_value(value):
+    "Python value of a vk.xml API constant"
+    m = re.match("\(~(\d+)(U|ULL)\)$", value)
+    if m:
+        return "{}(-{})".format('c_uint64' if m.group(2) == 'ULL' else 'c_uint32', int(m.group(1)) + 1)
+    return re.sub("^([\d.]+)[FU]?$", "\\1", no_vk(value))
+
+def parse_registry(src):
+    """
+    Parse vk.xml in the definitions used to generate the wrapper. The C declarations of the registry are
+    rendered in a header that is parsed by `parse_header`. The sections are read from the features and the extensions.
+    """
+    registry = ET.fromstring(src)
+    header = []
+
+    enum_values = {}
+    for enums in registry.findall('enums'):
+        values = enum_values.setdefault(enums.get('name'), [])
+        for element in enums.findall('enum'):
+            if for_vulkan(element):
+                values.append((element.get('name'), enum_value(element)))
+
+    # Features and extensions adding each enum value (the values of the enums elements are always defined)
+    value_sections = {}
+
+    def read_requires(element, extension_number=None):
+        "Add the enum values required by a feature or an extension and return the names of its definitions"
+        names = []
+        for require in element.findall('require'):
+            if not for_vulkan(require):
+                continue
+            for item in require:
+                if item.tag == 'enum' and item.get('extends') is not None and for_vulkan(item):
+                    values = enum_values.setdefault(item.get('extends'), [])
+                    if item.get('name') not in (n for n, _ in values):
+                        values.append((item.get('name'), enum_value(item, extension_number)))
+                    value_sections.setdefault(no_vk(item.get('name')), []).append(element.get('name'))
+                elif item.tag == 'type':
+                    names.append(no_vk(item.get('name')))
+                elif item.tag == 'command':
+                    names.append(no_vk('PFN_' + item.get('name')))
+        return names
+
+    sections = []
+    for feature in registry.findall('feature'):
+        if for_vulkan(feature):
+            sections.append((feature.get('name'), read_requires(feature)))
+
+    for extension in registry.find('extensions').findall('extension'):
+        if 'vulkan' not in extension.get('supported', '').split(','):
+            continue
+        names = read_requires(extension, extension.get('number'))
+        if extension.get('platform') in (None,) + PLATFORMS:
+            sections.append((extension.get('name'), names))
+
+    constants = []
+    for element in registry.find("enums[@name='API Constants']").findall('enum'):
+        name = no_vk(element.get('name'))
+        if name not in BASE_NAMES:
+            constants.append((name, constant_value(element.get('alias') or element.get('value'))))
+
+    # Types
+    bitmask_64 = set(e.get('name') for e in registry.findall('enums') if e.get('bitwidth') == '64')
+    for element in registry.find('types').findall('type'):
+        if not for_vulkan(element) or element.get('alias') is not None:
+            continue
+
+        category = element.get('category')
+        if category in ('basetype', 'handle', 'bitmask', 'funcpointer'):
+            header.append(element_text(element))
+        elif category in ('struct', 'union'):
+            name = element.get('name')
+            members = [element_text(m) for m in element.findall('member') if for_vulkan(m)]
+            header.append("typedef {0} {1} {{\n{2}\n}} {1};".format(category, name, '\n'.join('    {};'.format(m) for m in members)))
+        elif category == 'enum':
+            name = element.get('name')
+            values = enum_values.get(name)
+            if values is None:
+                continue
+
+            # Aliases are written after the value they refer to
+            ordered, pending = [], list(values)
+            while pending:
+                defined = set(n for n, _ in ordered)
+                ready = [(n, v) for n, v in pending if not v.startswith('VK_') or v in defined]
+                ordered += ready or pending
+                pending = [item for item in pending if item not in ordered]
+
+            if name in bitmask_64:
+                header.append("typedef VkFlags64 {};".format(name))
+                header.extend("static const {} {} = {};".format(name, n, v) for n, v in ordered)
+            else:
+                header.append("typedef enum {0} {{\n{1}\n}} {0};".format(name, '\n'.join('    {} = {},'.format(n, v) for n, v in ordered)))
+
+    # Commands
+    commands = {}
+    for element in registry.find('commands').findall('command'):
+        if not for_vulkan(element):
+            continue
+
+        if element.get('alias') is not None:
+            name, target = element.get('name'), element.get('alias')
+        else:
+            name = target = element.find('proto').findtext('name')
+            proto = element_text(element.find('proto'))
+            params = [element_text(p) for p in element.findall('param') if for_vulkan(p)]
+            commands[name] = (proto[:len(proto)-len(name)].strip(), params)
+
+        header.append((name, target))
+
+    for i, item in enumerate(header):
+        if isinstance(item, tuple):
+            name, target = item
+            rt, params = commands[target]
+            header[i] = "typedef {} (VKAPI_PTR *PFN_{})(\n    {});".format(rt, name, ',\n    '.join(params))
+
+    definitions = parse_header('\n\n'.join(header))
+    definitions['constants'] = constants
+    definitions['sections'] = sections
+    definitions['value_sections'] = value_sections
+    return definitions
+
+def load_definitions(paths, cache_dir):
+    """
+    Parse the vulkan headers (or vk.xml) at `paths`. If no paths are given, the headers are fetched from github.
+    The definitions are cached in `cache_dir` using the hash of the parsed files as key.
+    """
+    if paths:
+        sources = []
+        for path in paths:
+            with open(path, 'rb') as f:
+                sources.append(f.read())
+    else:
+        sources = [req.urlopen(HEADERS_URL.format(name)).read() for name in HEADERS]
+
+    registry = bool(paths) and paths[0].endswith('.xml')
+
+    digest = hashlib.sha256("{} {}".format(DEFINITIONS_VERSION, registry).encode())
+    for source in sources:
+        digest.update(hashlib.sha256(source).digest())
+
+    cache_path = None
+    if cache_dir is not None:
+        cache_path = os.path.join(cache_dir, digest.hexdigest() + '.json')
+        if os.path.exists(cache_path):
+            with open(cache_path) as f:
+                return json.load(f)
+
+    if registry:
+        definitions = parse_registry(sources[0].decode('utf-8'))
+    else:
+        definitions = parse_header("\n\n".join(source.decode('utf-8') for source in sources))
+
+    if cache_path is not None:
+        os.makedirs(cache_dir, exist_ok=True)
+        tmp_path = cache_path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(definitions, f, separators=(',', ':'))
+        os.replace(tmp_path, cache_path)
+
+    # The cached definitions are read back from json, this keeps the result identical
+    return json.loads(json.dumps(definitions))
+
+def find_dependencies(definitions):
+    "Map the name of the structs, functions and flags to the names used in their definition"
+    dependencies = {}
+
+    for _type, name, members in definitions['structs']:
+        dependencies[name] = set(re.findall("[A-Za-z_]\w*", ' '.join(m[1] for m in members)))
+
+    for name, rt, args in definitions['functions']:
+        dependencies[name] = set(re.findall("[A-Za-z_]\w*", ' '.join([rt] + args)))
+
+    for alias, target in STRUCT_ALIASES.items():
+        dependencies[alias] = set([target])
+
+    # The values of a flags type are defined in the matching "FlagBits" enum
+    enums = set(name for name, _, _ in definitions['enums'])
+    for name, _ in definitions['flags']:
+        head, _, tail = name.rpartition('Flags')
+        dependencies[name] = set([head + 'FlagBits' + tail]) & enums
+
+    return dependencies
+
+def select_definitions(definitions, api, extensions):
+    """
+    Return the definitions of the vulkan versions up to `api` and of `extensions`, including everything they depend on.
+    If `api` or `extensions` is None, every version or every extension is selected. Definitions that depend on
+    unknown types (ex: types of unsupported platforms) are removed.
+    """
+    api = tuple(int(v) for v in api.split('.')) if api is not None else None
+    sections = definitions['sections']
+
+    if extensions is not None:
+        known = set(name for name, _ in sections if name is not None and not name.startswith('VK_VERSION_'))
+        unknown = set(extensions) - known
+        if unknown:
+            raise ValueError("Unknown extensions: {}".format(', '.join(sorted(unknown))))
+
+    defined = set(BASE_NAMES)
+    for key in ('basetypes', 'constants', 'handles', 'flags', 'enums', 'functions'):
+        defined.update(item[0] for item in definitions[key])
+    defined.update(name for _, name, _ in definitions['structs'])
+    defined.update(alias for alias, target in STRUCT_ALIASES.items() if target in defined)
+
+    selected_sections = set()
+    if api is None and extensions is None:
+        wanted = set(defined)
+    else:
+        wanted = set()
+        for name, names in sections:
+            if name is None:
+                selected = True
+            elif name.startswith('VK_VERSION_'):
+                selected = api is None or tuple(int(v) for v in name[11::].split('_')) <= api
+            else:
+                selected = extensions is None or name in extensions
+
+            if selected:
+                selected_sections.add(name)
+                wanted.update(names)
 
-    handles_non_dispatchable = re.findall("VK_DEFINE_NON_DISPATCHABLE_HANDLE\(Vk(\w+)\)", src, re.S)
-    for h in handles_non_dispatchable:
-        f.write("{} = c_uint64\n".format(h))
+    dependencies = find_dependencies(definitions)
+    pending = list(wanted)
+    while pending:
+        for dep in dependencies.get(pending.pop(), ()):
+            if dep not in wanted:
+                wanted.add(dep)
+                pending.append(dep)
 
-def parse_flags_def(f):
+    # Remove the definitions that use unknown names, and the definitions that depend on them
+    builtins = set(['POINTER', 'None'])
+    removed = set(name for name in wanted if name not in defined and name not in builtins and not name.startswith('c_'))
+    while removed:
+        wanted -= removed
+        removed = set(name for name in wanted if dependencies.get(name, set()) & removed)
+
+    selected = {'sections': sections, 'constants': definitions['constants'], 'value_sections': definitions['value_sections']}
+    for key in ('basetypes', 'handles', 'flags', 'enums', 'functions'):
+        selected[key] = [item for item in definitions[key] if item[0] in wanted]
+    selected['structs'] = [item for item in definitions['structs'] if item[1] in wanted]
+
+    # The enum values added by the sections that are not selected are removed, but the structures pulled as dependencies
+    # keep their StructureType
+    if api is not None or extensions is not None:
+        structure_types = set(structure_type_names(selected).values())
+        selected['enums'] = [(name, type_, select_values(values, definitions['value_sections'], selected_sections, structure_types))
+            for name, type_, values in selected['enums']]
+    selected['enumerations'] = [name for name in definitions['enumerations'] if name in wanted]
+    selected['const_arguments'] = dict((name, args) for name, args in definitions['const_arguments'].items() if name in wanted)
+    return selected
+
+def select_values(values, value_sections, selected_sections, required):
+    """
+    Return the enum values that are not added by a feature or an extension, that are added by a selected one or that
+    are in `required`. The values referenced by the aliases are kept.
+    """
+    kept = set(name for name, _ in values if name in required or name not in value_sections or
+        selected_sections.intersection(value_sections[name]))
+    pending = list(kept)
+    names = dict(values)
+    while pending:
+        target = names[pending.pop()]
+        if target in names and target not in kept:
+            kept.add(target)
+            pending.append(target)
+    return [(name, value) for name, value in values if name in kept]
+
+def write_base_types(f, definitions):
+    basetypes = [item for item in definitions['basetypes'] if item[0] not in BASE_NAMES]
+    constants = [item for item in definitions['constants'] if item[0] not in BASE_NAMES]
+    if basetypes or constants:
+        f.write("# Other base types and constants\n")
+        for name, value in basetypes + constants:
+            f.write("{} = {}\n".format(name, value))
+        f.write("\n\n")
+
+def write_handles(f, definitions):
+    f.write("# Handles types\n")
+    for name, type_ in definitions['handles']:
+        f.write("{} = {}\n".format(name, type_))
+
+def write_flags(f, definitions):
     f.write("# Flags types\n")
-    data = re.findall("typedef VkFlags Vk(\w+?);", src)
-    
-    for name in data:
-        f.write("{} = Flags\n".format(name))
+    for name, base in definitions['flags']:
+        f.write("{} = {}\n".format(name, base))
 
-def parse_enums(f):
+def write_enums(f, definitions, types=True):
     f.write("# Enums\n")
+    for name, type_, values in definitions['enums']:
+        if types:
+            f.write("{} = {}\n".format(name, type_))
+        for value_name, value in values:
+                f.write("{} = {}\n".format(value_name, value))
+        f.write("\n")
 
-    data = re.findall("typedef enum Vk(\w+) {(.+?)} \w+;", src, re.S)
+def error_class_name(value_name, tags):
+    "Name of the exception of an error code (ex: ERROR_OUT_OF_DATE_KHR gives VkErrorOutOfDateKHR)"
+    return 'Vk' + ''.join(part if part in tags else part.capitalize() for part in value_name.split('_'))
 
-    for name, fields in data:
-        f.write("{} = c_uint32\n".format(name))
-        for name, value in re.findall("VK_(\w+?) = (.*?)(?:,|})", fields, re.S):
-                f.write("{} = {}\n".format(name, no_vk(value)))
-        f.write("\n")
+def write_errors(f, definitions):
+    results = [values for name, _, values in definitions['enums'] if name == 'Result']
+    if not results:
+        return
+
+    # Vendor tags (ex: KHR) are kept in upper case. They are found at the end of the names of the extension types
+    names = [name for _, name, _ in definitions['structs']] + [name for name, _, _ in definitions['functions']]
+    tags = set(re.findall(r"[a-z0-9]([A-Z]{2,})$", '\n'.join(names), re.M))
+    classes = {}
+    f.write("# Exceptions raised by the commands returning an error code\n")
+    for value_name, value in results[0]:
+        if not value_name.startswith('ERROR_'):
+            continue
+        class_name = error_class_name(value_name, tags)
+        if value in classes:
+            f.write("define_lazy('{}', lambda: {})\n".format(class_name, classes[value]))
+        elif re.match(r"-\d+$", value):
+            classes[value_name] = class_name
+            f.write("define_lazy('{0}', lambda: define_error('{0}', {1}))\n".format(class_name, value_name))
+
+    f.write("\nerror_names = {\n")
+    for value_name, class_name in classes.items():
+        f.write("    {}: '{}',\n".format(value_name, class_name))
+    f.write("}\n")
+
+def structure_type_names(definitions):
+    "Return the StructureType value (ex: STRUCTURE_TYPE_APPLICATION_INFO) of each structure that has a type member"
+    values = [values for name, _, values in definitions['enums'] if name == 'StructureType']
+    values = dict((value_name[15:].replace('_', ''), value_name) for value_name, _ in (values[0] if values else []))
+
+    names = {}
+    for _, name, members in definitions['structs']:
+        if members and members[0][:2] == ['type', 'StructureType'] and name.upper() in values:
+            names[name] = values[name.upper()]
+    return names
+
+def write_structure_types(f, definitions):
+    f.write("# StructureType of the structures (used to fill the type member)\nstructure_types = {\n")
+    for name, value_name in structure_type_names(definitions).items():
+        f.write("    '{}': {},\n".format(name, value_name))
+    f.write("}\n")
+
+def write_buffer_members(f, definitions):
+    # Data pointers that follow their size (ex: `code_size` and `code`) can be set with buffers (see define_buffer_member)
+    f.write("# Data members of the structures that accept buffers\nbuffer_members = {\n")
+    for _type, name, members in definitions['structs']:
+        buffers = [m[0] for m, previous in zip(members[1:], members) if previous[0] == m[0] + '_size' and m[1] in ('c_void_p', 'POINTER(c_uint32)')]
+        if buffers:
+            f.write("    '{}': {!r},\n".format(name, tuple(buffers)))
+    f.write("}\n")
 
-def parse_allocation_callback(f):
+def write_struct_members(f, definitions):
+    # Pointers that follow their count (ex: `stage_count` and `stages`) are arrays, the other pointers point to a single value
+    f.write("# Length member of the array members of the structures. Lengths named `*_size` are in bytes\narray_members = {\n")
+    for _type, name, members in definitions['structs']:
+        arrays = {}
+        for member, previous in zip(members[1:], members):
+            count = ARRAY_COUNTS.get((name, member[0]))
+            if count is None and previous[0].endswith(('_count', '_size')) and (member[1].startswith('POINTER(') or member[1] == 'c_void_p'):
+                count = previous[0]
+            if count is not None:
+                arrays[member[0]] = count
+        if arrays:
+            f.write("    '{}': {!r},\n".format(name, arrays))
+    f.write("}\n\n")
+
+    handles = set(name for name, _ in definitions['handles'])
+    f.write("# Members of the structures holding handles (or pointing to arrays of handles)\nhandle_members = {\n")
+    for _type, name, members in definitions['structs']:
+        names = tuple(m[0] for m in members if m[1] in handles or (m[1].startswith('POINTER(') and m[1][8:-1] in handles))
+        if names:
+            f.write("    '{}': {!r},\n".format(name, names))
+    f.write("}\n")
+
+def write_enumerations(f, definitions):
+    # The results of enumerations made with the loader, the instance or a physical device cannot change
+    # (except for surfaces and displays) when the other arguments are values
+    functions = dict((name, args) for name, _, args in definitions['functions'])
+    values = set(['c_char_p'] + [name for name, _ in definitions['handles'] + definitions['flags']] + [name for name, _, _ in definitions['enums']])
+
+    f.write("# Commands following the two-call enumeration protocol. True if the results are cached\nenumeration_commands = {\n")
+    for name in definitions['enumerations']:
+        args = functions[name][:-2]
+        cached = (not args or args[0] in ('c_char_p', 'Instance', 'PhysicalDevice')) and all(arg in values for arg in args) and \
+            not any(word in name for word in ('Surface', 'Display', 'Present', 'Tool'))
+        f.write("    '{}': {},\n".format(name[2::], cached))
+    f.write("}\n")
+
+def write_allocation_callback(f, definitions):
     # Allocation callback must be defined before the structs, but there are no good way to differenciate them
     # from the function pointers. Hence why they are hardcoded here
     f.write("""
 # Allocation callback
-FnAllocationFunction = FUNCTYPE(c_void_p, c_void_p, c_size_t, c_size_t, SystemAllocationScope)
-FnReallocationFunction = FUNCTYPE(c_void_p, c_void_p, c_size_t, c_size_t, SystemAllocationScope)
-FnFreeFunction = FUNCTYPE(None, c_void_p, c_void_p)
-FnInternalAllocationNotification = FUNCTYPE(None, c_void_p, c_size_t, InternalAllocationType, SystemAllocationScope)
-FnInternalFreeNotification = FUNCTYPE(None, c_void_p, c_size_t, InternalAllocationType, SystemAllocationScope)
-FnDebugReportCallbackEXT = FUNCTYPE(Bool32, DebugReportFlagsEXT, DebugReportObjectTypeEXT, c_uint64, c_size_t, c_uint32, c_char_p, c_char_p, c_void_p)
-
+define_lazy('FnAllocationFunction', lambda: FUNCTYPE(c_void_p, c_void_p, c_size_t, c_size_t, SystemAllocationScope))
+define_lazy('FnReallocationFunction', lambda: FUNCTYPE(c_void_p, c_void_p, c_size_t, c_size_t, SystemAllocationScope))
+define_lazy('FnFreeFunction', lambda: FUNCTYPE(None, c_void_p, c_void_p))
+define_lazy('FnInternalAllocationNotification', lambda: FUNCTYPE(None, c_void_p, c_size_t, InternalAllocationType, SystemAllocationScope))
+define_lazy('FnInternalFreeNotification', lambda: FUNCTYPE(None, c_void_p, c_size_t, InternalAllocationType, SystemAllocationScope))
 """[1::])
+    if any(name == 'FnDebugReportCallbackEXT' for name, _, _ in definitions['functions']):
+        f.write("define_lazy('FnDebugReportCallbackEXT', lambda: FUNCTYPE(Bool32, DebugReportFlagsEXT, DebugReportObjectTypeEXT, c_uint64, c_size_t, c_uint32, c_char_p, c_char_p, c_void_p))\n")
+    f.write("\n")
 
-def parse_structs(f):
-    data = re.findall("typedef (struct|union) Vk(\w+?) {(.+?)} \w+?;", src, re.S)
-
-    for _type, name, fields in data:
+def write_structs(f, definitions):
+    for _type, name, members in definitions['structs']:
 
         # Structures that are not parsed correctly and not used anywhere else
         if name in ("BaseOutStructure", "BaseInStructure"):
@@ -246,81 +1414,268 @@ def parse_structs(f):
 
         # A callback definition MUST be written just before this struct
         if name == "DebugUtilsMessengerCreateInfoEXT":
-            f.write("FnDebugUtilsMessengerCallbackEXT = FUNCTYPE(Bool32, DebugUtilsMessageSeverityFlagBitsEXT, DebugUtilsMessageTypeFlagsEXT, POINTER(DebugUtilsMessengerCallbackDataEXT), c_void_p)\n\n")
+            f.write("define_lazy('FnDebugUtilsMessengerCallbackEXT', lambda: FUNCTYPE(Bool32, DebugUtilsMessageSeverityFlagBitsEXT, DebugUtilsMessageTypeFlagsEXT, POINTER(DebugUtilsMessengerCallbackDataEXT), c_void_p))\n\n")
+
+        f.write("define_lazy('{0}', lambda: define_{1}('{0}', \n".format(name, _type))
+        for member in members:
+            f.write("    ({}),\n".format(', '.join(["'{}'".format(member[0])] + [str(m) for m in member[1::]])))
+        f.write("))\n\n")
+
+        for alias, target in STRUCT_ALIASES.items():
+            if name == target:
+                f.write("define_lazy('{}', lambda: {})\n\n".format(alias, target))
 
-        fields = re.findall("\s+(.+?)\s+([_a-zA-Z0-9[\]]+);", fields)
-        f.write("{0} = define_{1}('{0}', \n".format(name, _type))
-        for type_, fname in fields:
-            if '[' in fname:
-                fname, type_ = parse_array(fname, type_)
-            f.write("    ('{}', {}),\n".format(fix_arg(fname), do_type(type_)))
-        f.write(")\n\n")
+def write_templates(f, definitions):
+    for _type, name, members in definitions['structs']:
+        if name not in ("BaseOutStructure", "BaseInStructure"):
+            f.write("define_lazy('{0}Template', lambda: define_template({0}))\n".format(name))
 
-        # Some struct name that are not redefined automatically
-        if name in ("MemoryRequirements2",):
-            f.write("MemoryRequirements2KHR = MemoryRequirements2\n\n")
+def write_dtypes(f, definitions):
+    for _type, name, members in definitions['structs']:
+        if name not in ("BaseOutStructure", "BaseInStructure"):
+            f.write("define_lazy('{0}Dtype', lambda: define_dtype({0}))\n".format(name))
 
+def write_functions(f, definitions):
+    # Arrays of handles and of device sizes can also be passed as buffers (see array_pointer). Read only buffers are
+    # only accepted by the const arguments
+    array_types = set([name for name, _ in definitions['handles']] + ['DeviceSize'])
+    def array_arg(arg, const):
+        m = re.match(r'^POINTER\((\w+)\)$', arg)
+        if m is None or m.group(1) not in array_types:
+            return arg
+        return 'array_pointer({})'.format(m.group(1)) if const else 'array_pointer({}, output=True)'.format(m.group(1))
 
-def parse_functions(f):
-    data = re.findall("typedef (\w+\*?) \(\w+ \*(\w+)\)\((.+?)\);", src, re.S)
+    for name, rt, args in definitions['functions']:
+        if name not in ('FnAllocationFunction', 'FnReallocationFunction', 'FnFreeFunction', 'FnInternalAllocationNotification', 'FnInternalFreeNotification', 'FnDebugReportCallbackEXT'):
+            const = definitions['const_arguments'].get(name, ())
+            args = [array_arg(arg, index in const) for index, arg in enumerate(args)]
 
-    for rt, name, fields in data:
-        no_vk_name = no_vk(name)
-        if no_vk_name not in ('FnAllocationFunction', 'FnReallocationFunction', 'FnFreeFunction', 'FnInternalAllocationNotification', 'FnInternalFreeNotification', 'FnDebugReportCallbackEXT'):
-            data_fields = ', '.join([do_type(t) for t in re.findall("(?:\s*|)(.+?)\s*\w+(?:,|$)", fields)])
-            f.write("{} = FUNCTYPE({}, {})\n".format(no_vk_name, do_type(rt), data_fields))
+            # The data arguments accept buffers (see void_pointer). Callbacks keep receiving plain integers
+            if 'Callback' not in name:
+                args = args[:1] + [('void_pointer' if index in const else 'output_void_pointer') if arg == 'c_void_p' else arg
+                    for index, arg in enumerate(args[1:], 1)]
+            f.write("define_lazy('{}', lambda: FUNCTYPE({}, {}))\n".format(name, rt, ', '.join(args)))
 
-def group_functions(f):
-    data = re.findall("typedef (\w+\*?) \(\w+ \*(\w+)\)\((.+?)\);", src, re.S)
+def group_functions(f, definitions, cffi=False):
     group_map = {"Instance":[], "Device":[], "Loader":[]}
 
-    for rt, vkname, fields in data:
-        fields_types_name = [do_type(t) for t in re.findall("(?:\s*|)(.+?)\s*\w+(?:,|$)", fields)]
-        table_name = fields_types_name[0]
-        name = no_vk(vkname)
+    for name, rt, args in definitions['functions']:
+        table_name = args[0] if args else ''
 
         if table_name in ('Device', 'Queue', 'CommandBuffer') and name != 'FnGetDeviceProcAddr':
             group_map["Device"].append(name)
         elif table_name in ('Instance', 'PhysicalDevice') or name == 'FnGetDeviceProcAddr':
             group_map["Instance"].append(name)
-        elif table_name in ('c_void_p', '', 'DebugReportFlagsEXT') or name == 'FnGetInstanceProcAddr':
-            # Skip the allocation function and the dll entry point
+        elif table_name in ('c_void_p', '', 'DebugReportFlagsEXT') or name == 'FnGetInstanceProcAddr' or name.endswith('CallbackEXT'):
+            # Skip the allocation function, the callbacks and the dll entry point
             pass
         else:
             #print(table_name, name)
             group_map["Loader"].append(name)
 
     for group_name, group_lines in group_map.items():
-        f.write("{}Functions = (\n".format(group_name))
+        f.write("define_lazy('{}Functions', lambda: (\n".format(group_name))
         for name in group_lines:
-            f.write('  (b"{}", {}),\n'.format(name.replace('Fn', 'vk'), name))
-        f.write(")\n\n")
+            # The cffi backend uses the names of the C declarations as prototypes
+            f.write('  (b"{}", {}),\n'.format(name.replace('Fn', 'vk'), "'{}'".format(name) if cffi else name))
+        f.write("))\n\n")
 
-def write_base_loader(f):
+    for group_name in ("Instance", "Device"):
+        f.write("define_lazy('{0}Dispatch', lambda: define_dispatch('{0}Dispatch', {0}Functions))\n".format(group_name))
+
+    return group_map["Loader"]
+
+def write_base_loader(f, loader_functions, cffi=False):
     f.write('''
 # Loading proc
-GetInstanceProcAddr = FnGetInstanceProcAddr((b"vkGetInstanceProcAddr", vk))
+define_lazy('GetInstanceProcAddr', lambda: {})
+
+# The loader functions are loaded in the module namespace on first access
+'''[1::].format('vk.vkGetInstanceProcAddr' if cffi else 'FnGetInstanceProcAddr((b"vkGetInstanceProcAddr", vk))'))
+    for name in loader_functions:
+        if cffi:
+            f.write("define_lazy('{0}', lambda: load_function(0, b\"{1}\", '{2}', GetInstanceProcAddr))\n".format(name[2::], name.replace('Fn', 'vk'), name))
+        else:
+            f.write("define_lazy('{0}', lambda: load_function(Instance(0), b\"{1}\", {2}, GetInstanceProcAddr))\n".format(name[2::], name.replace('Fn', 'vk'), name))
+
+    f.write('''
+loader_commands = {!r}
+
+def star_names():
+    "Names exported by star imports. The library is not exported, and the loader functions only when they can be loaded"
+    names = []
+    for name in list(globals()) + list(lazy_definitions):
+        if name.startswith('_') or name == 'vk':
+            continue
+        if name == 'GetInstanceProcAddr' or name in loader_commands:
+            try:
+                lazy_value(name)
+            except (OSError, AttributeError):
+                continue
+        names.append(name)
+    return names
 
-# Load the loader functions in the module namespace
-loc = locals()
-for name, fnptr in load_functions(Instance(0), LoaderFunctions, GetInstanceProcAddr):
-    loc[name] = fnptr
-del loc'''[1::])
+# Star imports build every lazy value
+define_lazy('__all__', star_names)'''.format(tuple(name[2::] for name in loader_functions)))
 
-with open("vk.py", 'w') as f:
+def write_wrapper(f, definitions, source):
+    f.write('#\n# Vulkan wrapper generated from "{}"\n#\n\n'.format(source))
     f.write(BASE)
-    parse_handles_def(f)
+    write_base_types(f, definitions)
+    write_handles(f, definitions)
     f.write("\n\n")
-    parse_flags_def(f)
+    write_flags(f, definitions)
     f.write("\n\n")
-    parse_enums(f)
+    write_enums(f, definitions)
     f.write("\n\n")
-    parse_allocation_callback(f)
+    write_errors(f, definitions)
     f.write("\n\n")
-    parse_structs(f)
+    write_structure_types(f, definitions)
     f.write("\n\n")
-    parse_functions(f)
+    write_buffer_members(f, definitions)
     f.write("\n\n")
-    group_functions(f)
+    write_struct_members(f, definitions)
     f.write("\n\n")
-    write_base_loader(f)
+    write_enumerations(f, definitions)
+    f.write("\n\n")
+    write_allocation_callback(f, definitions)
+    f.write("\n\n")
+    write_structs(f, definitions)
+    f.write("\n\n")
+    write_templates(f, definitions)
+    f.write("\n\n")
+    write_dtypes(f, definitions)
+    f.write("\n\n")
+    write_functions(f, definitions)
+    f.write("\n\n")
+    loader_functions = group_functions(f, definitions)
+    f.write("\n\n")
+    write_base_loader(f, loader_functions)
+
+def c_declaration(name, type_):
+    "C declaration of `name` from a type of the parsed definitions (ex: 'c_float * 4' gives 'float name[4]')"
+    dimensions = [d.strip() for d in type_.split('*')]
+    type_, pointers = dimensions.pop(0), ''
+    while type_.startswith('POINTER('):
+        type_, pointers = type_[8:-1], pointers + '*'
+    return '{}{} {}{}'.format(C_TYPES.get(type_, type_), pointers, name, ''.join('[{}]'.format(d) for d in reversed(dimensions))).strip()
+
+def python_constant(value):
+    "Constants defined as ctypes values (ex: c_uint32(-1)) are plain integers in the cffi backend"
+    match = re.match(r"c_uint(\d+)\((-?\d+)\)$", value)
+    if match:
+        return str(int(match.group(2)) & ((1 << int(match.group(1))) - 1))
+    return value
+
+def base_constants(definitions):
+    base = re.findall(r"^(\w+) = (.+)$", BASE[BASE.index('# Base constants'):], re.M)
+    return base + [c for c in definitions['constants'] if c[0] not in BASE_NAMES]
+
+def cffi_cdef(definitions):
+    "C declarations of the parsed definitions. Types keep the names (and members the snake case names) of the ctypes wrapper"
+    lines = []
+    for name, type_ in re.findall(r"^(\w+) = (c_\w+|POINTER\(c_\w+\))$", BASE, re.M):
+        lines.append("typedef {};".format(c_declaration(name, type_)))
+    lines.append(CFFI_CDEF_BASE)
+
+    # Only the integer constants can be used as array sizes
+    values = {}
+    for name, value in base_constants(definitions):
+        value = values.get(value, python_constant(value))
+        if value.isdigit():
+            values[name] = value
+            lines.append("#define {} {}".format(name, value))
+
+    for name, type_ in definitions['basetypes'] + definitions['handles'] + definitions['flags']:
+        if name not in BASE_NAMES:
+            lines.append("typedef {};".format(c_declaration(name, type_)))
+    for name, type_, _ in definitions['enums']:
+        lines.append("typedef {};".format(c_declaration(name, type_)))
+
+    structs = [s for s in definitions['structs'] if s[1] not in ("BaseOutStructure", "BaseInStructure")]
+    for _type, name, _ in structs:
+        lines.append("typedef {0} {1} {1};".format(_type, name))
+    for alias, target in STRUCT_ALIASES.items():
+        if any(name == target for _, name, _ in structs):
+            lines.append("typedef {} {};".format(target, alias))
+
+    for name, rt, args in definitions['functions']:
+        lines.append("typedef {} (__stdcall *{})({});".format(c_declaration('', rt), name, ', '.join(c_declaration('', a) for a in args) or 'void'))
+
+    for _type, name, members in structs:
+        lines.append("{} {} {{".format(_type, name))
+        names = [member[0] for member in members]
+        for index, member in enumerate(members):
+            # C members must have unique names. ctypes only gives access to the last member with a given name
+            member_name = member[0] if member[0] not in names[index+1:] else '{}_{}'.format(member[0], index)
+            bits = ' : {}'.format(member[2]) if len(member) == 3 else ''
+            lines.append("    {}{};".format(c_declaration(member_name, member[1]), bits))
+        lines.append("};")
+
+    lines.append("FnVoidFunction __stdcall vkGetInstanceProcAddr(Instance instance, const char* name);")
+    return '\n'.join(lines) + '\n'
+
+def build_cffi_module(definitions, module_name, path):
+    "Write the out-of-line cffi module holding the C declarations, so they are not parsed at import. Requires cffi"
+    from cffi import FFI
+    ffi = FFI()
+    ffi.cdef(cffi_cdef(definitions))
+    ffi.set_source(module_name, None)
+    ffi.emit_python_code(path)
+
+def write_cffi_wrapper(f, definitions, source, ffi_module):
+    f.write('#\n# Vulkan cffi wrapper generated from "{}"\n#\n\n'.format(source))
+    f.write("from sys import platform\nfrom {} import ffi\n\n".format(ffi_module))
+    f.write(LAZY_BASE)
+    f.write(CFFI_BASE)
+    f.write("# Base constants\n")
+    for name, value in base_constants(definitions):
+        f.write("{} = {}\n".format(name, python_constant(value)))
+    f.write("\n\n")
+    write_enums(f, definitions, types=False)
+    f.write("\n\n")
+    write_errors(f, definitions)
+    f.write("\n\n")
+    write_structure_types(f, definitions)
+    f.write("\n\n")
+    write_enumerations(f, definitions)
+    f.write("\n\n")
+    loader_functions = group_functions(f, definitions, cffi=True)
+    f.write("\n\n")
+    write_base_loader(f, loader_functions, cffi=True)
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a ctypes wrapper for vulkan")
+    parser.add_argument('--input', action='append', help="Local vulkan header (can be repeated) or vk.xml to use instead of the headers on github")
+    parser.add_argument('--cache-dir', default='.vk_cache', help="Directory where the parsed definitions are cached")
+    parser.add_argument('--no-cache', action='store_true', help="Always parse the input")
+    parser.add_argument('--api', help="Highest vulkan version to include (ex: 1.1). Every version is included by default")
+    parser.add_argument('--extensions', help="Comma separated list of the extensions to include (ex: VK_KHR_surface,VK_KHR_swapchain). Every extension is included by default")
+    parser.add_argument('--output', default='vk.py', help="Path of the generated wrapper")
+    parser.add_argument('--cffi-output', help="Also generate a cffi (ABI mode) wrapper at this path. Requires cffi")
+    args = parser.parse_args()
+
+    if args.input and len(args.input) > 1 and any(path.endswith('.xml') for path in args.input):
+        parser.error("vk.xml cannot be combined with other inputs")
+
+    definitions = load_definitions(args.input, None if args.no_cache else args.cache_dir)
+
+    extensions = [e for e in args.extensions.split(',') if e] if args.extensions is not None else None
+    try:
+        definitions = select_definitions(definitions, args.api, extensions)
+    except ValueError as e:
+        parser.error(str(e))
+
+    source = ', '.join(args.input) if args.input else HEADERS_URL.format(HEADERS[0])
+    with open(args.output, 'w') as f:
+        write_wrapper(f, definitions, source)
+
+    if args.cffi_output:
+        directory, filename = os.path.split(args.cffi_output)
+        ffi_module = '_' + os.path.splitext(filename)[0]
+        build_cffi_module(definitions, ffi_module, os.path.join(directory, ffi_module + '.py'))
+        with open(args.cffi_output, 'w') as f:
+            write_cffi_wrapper(f, definitions, source, ffi_module)
+
+if __name__ == '__main__':
+    main()
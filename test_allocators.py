@@ -0,0 +1,211 @@
+"""
+Tests of the memory allocators of vk_utils. The device commands are resolved from the stub libvulkan
+of benchmark.py, so that no vulkan driver is required (a C compiler is).
+
+Usage:
+    python -m unittest test_allocators
+"""
+import ctypes
+import shutil
+import tempfile
+import unittest
+
+import benchmark
+import vk
+import vk_utils
+
+class RingAllocatorTests(unittest.TestCase):
+
+    def test_alignment(self):
+        ring = vk_utils.RingAllocator(1024)
+        self.assertEqual(ring.allocate(10), 0)
+        self.assertEqual(ring.allocate(10, 64), 64)
+        self.assertEqual(ring.used, 20)
+        self.assertEqual(len(ring), 2)
+
+    def test_full(self):
+        ring = vk_utils.RingAllocator(256)
+        self.assertIsNone(ring.allocate(257))
+        self.assertEqual(ring.allocate(200), 0)
+        self.assertIsNone(ring.allocate(100))
+        self.assertEqual(ring.allocate(56), 200)
+        self.assertIsNone(ring.allocate(1))
+
+    def test_wrap_around(self):
+        ring = vk_utils.RingAllocator(256)
+        first, second, third = ring.allocate(100), ring.allocate(100), ring.allocate(50)
+        ring.free(first)
+
+        # The end of the buffer is too small, the range wraps around in the space of the first range
+        self.assertEqual(ring.allocate(80), 0)
+        self.assertIsNone(ring.allocate(30))
+        self.assertEqual(ring.allocate(20), 80)
+
+        ring.free(second)
+        ring.free(third)
+        self.assertEqual(ring.allocate(150), 100)
+
+    def test_release_order(self):
+        ring = vk_utils.RingAllocator(256)
+        first, second = ring.allocate(128), ring.allocate(128)
+
+        # The space of a range is only reused once the older ranges are released
+        ring.free(second)
+        self.assertIsNone(ring.allocate(64))
+        ring.free(first)
+        self.assertEqual(ring.allocate(256), 0)
+        self.assertEqual(ring.used, 256)
+
+    def test_reset(self):
+        ring = vk_utils.RingAllocator(256)
+        ring.allocate(100)
+        ring.allocate(100)
+        ring.reset()
+        self.assertEqual((len(ring), ring.used), (0, 0))
+        self.assertEqual(ring.allocate(256), 0)
+
+class BuddyAllocatorTests(unittest.TestCase):
+
+    def test_split(self):
+        buddy = vk_utils.BuddyAllocator(4096, min_size=256)
+        offsets = [buddy.allocate(size) for size in (1000, 100, 256, 2048)]
+        self.assertEqual(offsets, [0, 1024, 1280, 2048])
+        self.assertEqual(buddy.used, 1024 + 256 + 256 + 2048)
+        self.assertEqual(buddy.allocate(512), 1536)
+        self.assertIsNone(buddy.allocate(1))
+
+    def test_size_and_alignment(self):
+        # The size is rounded down to a power of two, the ranges are aligned on their size
+        buddy = vk_utils.BuddyAllocator(5000, min_size=256)
+        self.assertEqual(buddy.size, 4096)
+        self.assertEqual(buddy.allocate(10), 0)
+        self.assertEqual(buddy.allocate(10, 1024), 1024)
+        self.assertIsNone(buddy.allocate(4096))
+
+    def test_merge(self):
+        buddy = vk_utils.BuddyAllocator(4096, min_size=256)
+        offsets = [buddy.allocate(256) for _ in range(16)]
+        self.assertIsNone(buddy.allocate(256))
+
+        # Release every other range: no buddies can merge, and no range larger than min_size is free
+        for offset in offsets[::2]:
+            buddy.free(offset)
+        self.assertIsNone(buddy.allocate(512))
+
+        for offset in offsets[1::2]:
+            buddy.free(offset)
+        self.assertEqual(buddy.free_ranges[4096], set([0]))
+        self.assertFalse(any(ranges for size, ranges in buddy.free_ranges.items() if size < 4096))
+        self.assertEqual((len(buddy), buddy.used), (0, 0))
+        self.assertEqual(buddy.allocate(4096), 0)
+
+    def test_reset(self):
+        buddy = vk_utils.BuddyAllocator(4096)
+        buddy.allocate(1000)
+        buddy.reset()
+        self.assertEqual((len(buddy), buddy.used), (0, 0))
+        self.assertEqual(buddy.allocate(4096), 0)
+
+@unittest.skipUnless(shutil.which('cc'), "The stub libvulkan requires a C compiler")
+class DeviceMemoryAllocatorTests(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.directory = tempfile.TemporaryDirectory()
+        cls.library = ctypes.CDLL(benchmark.build_stub_library(cls.directory.name))
+        loader = vk.FnGetInstanceProcAddr(ctypes.cast(cls.library.vkGetInstanceProcAddr, ctypes.c_void_p).value)
+        cls.device = vk.DeviceDispatch(1, vk.InstanceDispatch(1, loader).GetDeviceProcAddr)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.directory.cleanup()
+
+    def allocator(self, granularity=1024, max_allocations=4096, block_size=0x10000):
+        # A device local memory type and a host visible one
+        properties = vk.PhysicalDeviceMemoryProperties(memory_type_count=2, memory_heap_count=1)
+        properties.memory_types[0].property_flags = vk.MEMORY_PROPERTY_DEVICE_LOCAL_BIT
+        properties.memory_types[1].property_flags = vk.MEMORY_PROPERTY_HOST_VISIBLE_BIT | vk.MEMORY_PROPERTY_HOST_COHERENT_BIT
+        limits = vk.PhysicalDeviceLimits(buffer_image_granularity=granularity, max_memory_allocation_count=max_allocations,
+            non_coherent_atom_size=64)
+        return vk_utils.DeviceMemoryAllocator(self.device, properties, limits, block_size=block_size)
+
+    def requirements(self, size, alignment=256, memory_type_bits=0b11):
+        return vk.MemoryRequirements(size=size, alignment=alignment, memory_type_bits=memory_type_bits)
+
+    def test_memory_type(self):
+        allocator = self.allocator()
+        self.assertEqual(allocator.memory_type(0b11, 0), 0)
+        self.assertEqual(allocator.memory_type(0b11, 0, vk.MEMORY_PROPERTY_HOST_VISIBLE_BIT), 1)
+        self.assertEqual(allocator.memory_type(0b01, 0, vk.MEMORY_PROPERTY_HOST_VISIBLE_BIT), 0)
+        with self.assertRaises(vk.VkErrorFeatureNotPresent):
+            allocator.memory_type(0b01, vk.MEMORY_PROPERTY_HOST_VISIBLE_BIT)
+
+    def test_granularity_pools(self):
+        # Linear and non linear resources use different blocks when bufferImageGranularity is not 1
+        allocator = self.allocator(granularity=1024)
+        buffer = allocator.allocate(self.requirements(256), linear=True)
+        image = allocator.allocate(self.requirements(256), linear=False)
+        self.assertIsNot(buffer.block, image.block)
+        self.assertEqual(set(allocator.pools), set([(0, True), (0, False)]))
+        self.assertEqual(allocator.stats()['block_count'], 2)
+
+        allocator = self.allocator(granularity=1)
+        buffer = allocator.allocate(self.requirements(256), linear=True)
+        image = allocator.allocate(self.requirements(256), linear=False)
+        self.assertIs(buffer.block, image.block)
+        self.assertNotEqual(buffer.offset, image.offset)
+        self.assertEqual(allocator.stats()['block_count'], 1)
+
+    def test_memory_type_pools(self):
+        allocator = self.allocator()
+        device_local = allocator.allocate(self.requirements(256))
+        host_visible = allocator.allocate(self.requirements(256), vk.MEMORY_PROPERTY_HOST_VISIBLE_BIT)
+        self.assertEqual((device_local.block.memory_type, host_visible.block.memory_type), (0, 1))
+        self.assertEqual(allocator.property_flags(host_visible) & vk.MEMORY_PROPERTY_HOST_VISIBLE_BIT, vk.MEMORY_PROPERTY_HOST_VISIBLE_BIT)
+
+    def test_blocks(self):
+        allocator = self.allocator(block_size=0x10000)
+        allocations = [allocator.allocate(self.requirements(0x4000)) for _ in range(5)]
+        self.assertEqual(allocator.stats()['block_count'], 2)
+        self.assertEqual(len(set(a.offset for a in allocations[:4])), 4)
+        self.assertIsNot(allocations[4].block, allocations[0].block)
+
+        # Empty blocks are freed, except the last block of the pool
+        for allocation in allocations[:4]:
+            allocator.free(allocation)
+        self.assertEqual(allocator.stats()['block_count'], 2)
+        allocator.free(allocations[4])
+        stats = allocator.stats()
+        self.assertEqual((stats['block_count'], stats['allocation_count'], stats['used']), (1, 0, 0))
+
+    def test_dedicated(self):
+        allocator = self.allocator(block_size=0x10000)
+        allocation = allocator.allocate(self.requirements(0x8001))
+        self.assertIsNone(allocation.block.ranges)
+        self.assertEqual((allocation.offset, allocation.size), (0, 0x8001))
+
+        stats = allocator.stats()
+        self.assertEqual((stats['dedicated_count'], stats['block_count'], stats['used']), (1, 0, 0x8001))
+        allocator.free(allocation)
+        self.assertEqual(allocator.stats()['device_memory_count'], 0)
+
+    def test_max_memory_allocation_count(self):
+        allocator = self.allocator(max_allocations=2)
+        allocator.allocate(self.requirements(0x8001))
+        allocator.allocate(self.requirements(256))
+        with self.assertRaises(vk.VkErrorTooManyObjects):
+            allocator.allocate(self.requirements(0x8001))
+
+        # The sub-allocations do not use device memories
+        allocator.allocate(self.requirements(256))
+
+    def test_destroy(self):
+        allocator = self.allocator()
+        allocator.allocate(self.requirements(256))
+        allocator.allocate(self.requirements(0x8001))
+        allocator.destroy()
+        stats = allocator.stats()
+        self.assertEqual((stats['device_memory_count'], stats['allocation_count']), (0, 0))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,311 @@
+"""
+Tests of the command batching helpers of vk_utils: TransferBatcher, ImageLayoutTracker, SubmissionBatcher and FenceWaiter.
+The device commands are resolved from the stub libvulkan of benchmark.py (a C compiler is required) and recorded.
+
+Usage:
+    python -m unittest test_batchers
+"""
+import asyncio
+import ctypes
+import shutil
+import tempfile
+import unittest
+
+import benchmark
+import vk
+import vk_utils
+
+class RecordingDevice(object):
+    "Forward the commands to a device and record their (name, arguments). The functions of `overrides` replace the commands"
+
+    def __init__(self, device):
+        self.device = device
+        self.handle = device.handle
+        self.calls = []
+        self.overrides = {}
+
+    def __getattr__(self, name):
+        command = self.overrides.get(name) or getattr(self.device, name)
+        def call(*args):
+            self.calls.append((name, args))
+            return command(*args)
+        return call
+
+    def names(self):
+        return [name for name, _ in self.calls]
+
+    def arguments(self, name):
+        return [args for call_name, args in self.calls if call_name == name]
+
+def fail(*args):
+    raise vk.VkErrorDeviceLost()
+
+@unittest.skipUnless(shutil.which('cc'), "The stub libvulkan requires a C compiler")
+class StubDeviceTestCase(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.directory = tempfile.TemporaryDirectory()
+        cls.library = ctypes.CDLL(benchmark.build_stub_library(cls.directory.name))
+        loader = vk.FnGetInstanceProcAddr(ctypes.cast(cls.library.vkGetInstanceProcAddr, ctypes.c_void_p).value)
+        cls.stub_device = vk.DeviceDispatch(1, vk.InstanceDispatch(1, loader).GetDeviceProcAddr)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.directory.cleanup()
+
+    def setUp(self):
+        self.device = RecordingDevice(self.stub_device)
+
+class RangeTests(unittest.TestCase):
+
+    def test_subtract_ranges(self):
+        starts, ends = [10, 40], [20, 50]
+        self.assertEqual(vk_utils.subtract_ranges(starts, ends, 0, 60), [(0, 10), (20, 40), (50, 60)])
+        self.assertEqual(vk_utils.subtract_ranges(starts, ends, 12, 18), [])
+        self.assertEqual(vk_utils.subtract_ranges(starts, ends, 15, 45), [(20, 40)])
+        self.assertEqual(vk_utils.subtract_ranges(starts, ends, 20, 40), [(20, 40)])
+
+    def test_add_range(self):
+        starts, ends = [], []
+        vk_utils.add_range(starts, ends, 10, 20)
+        vk_utils.add_range(starts, ends, 40, 50)
+        self.assertEqual((starts, ends), ([10, 40], [20, 50]))
+
+        # Touching and overlapping ranges are merged
+        vk_utils.add_range(starts, ends, 20, 30)
+        self.assertEqual((starts, ends), ([10, 40], [30, 50]))
+        vk_utils.add_range(starts, ends, 25, 45)
+        self.assertEqual((starts, ends), ([10], [50]))
+
+    def test_last_writes(self):
+        copies = [(1, 0, 0, 100), (2, 1000, 20, 10), (3, 500, 90, 20)]
+        self.assertEqual(sorted(vk_utils.TransferBatcher.last_writes(copies), key=lambda copy: copy[2]),
+            [(1, 0, 0, 20), (2, 1000, 20, 10), (1, 30, 30, 60), (3, 500, 90, 20)])
+
+        # A copy overwritten by the later copies is removed
+        self.assertEqual(vk_utils.TransferBatcher.last_writes([(1, 0, 0, 10), (1, 100, 0, 10)]), [(1, 100, 0, 10)])
+
+class TransferBatcherTests(StubDeviceTestCase):
+
+    def buffer_regions(self):
+        return [(args[1], args[2], [(region.src_offset, region.dst_offset, region.size) for region in args[4]])
+            for args in self.device.arguments('CmdCopyBuffer')]
+
+    def image_region(self, x, y, width, height, mip_level=0, buffer_offset=0):
+        return vk.BufferImageCopy(buffer_offset=buffer_offset, image_subresource=vk.ImageSubresourceLayers(vk.IMAGE_ASPECT_COLOR_BIT, mip_level, 0, 1),
+            image_offset=vk.Offset3D(x, y, 0), image_extent=vk.Extent3D(width, height, 1))
+
+    def test_merge_adjacent(self):
+        batcher = vk_utils.TransferBatcher()
+        batcher.copy_buffer(1, 2, 64, 64, 64)
+        batcher.copy_buffer(1, 2, 0, 0, 64)
+        batcher.copy_buffer(1, 2, 256, 512, 64)
+        self.assertEqual(batcher.record(self.device, 9), 1)
+        self.assertEqual(self.buffer_regions(), [(1, 2, [(0, 0, 128), (256, 512, 64)])])
+        self.assertEqual(len(batcher), 0)
+
+    def test_overlap(self):
+        # The copies of a command have no order: the bytes written twice are only copied by the last copy
+        batcher = vk_utils.TransferBatcher()
+        batcher.copy_buffer(1, 2, 0, 0, 100)
+        batcher.copy_buffer(3, 2, 0, 50, 100)
+        batcher.copy_buffer(1, 4, 0, 0, 10)
+        self.assertEqual(batcher.record(self.device, 9), 3)
+        self.assertEqual(self.buffer_regions(), [(1, 2, [(0, 0, 50)]), (3, 2, [(0, 50, 100)]), (1, 4, [(0, 0, 10)])])
+
+    def test_image_overlap(self):
+        # A region that overlaps an earlier region starts a batch, copied after a barrier. The next regions join that batch
+        batcher = vk_utils.TransferBatcher()
+        batcher.copy_buffer_to_image(1, 2, vk.IMAGE_LAYOUT_TRANSFER_DST_OPTIMAL, self.image_region(0, 0, 4, 4))
+        batcher.copy_buffer_to_image(1, 2, vk.IMAGE_LAYOUT_TRANSFER_DST_OPTIMAL, self.image_region(2, 2, 4, 4, buffer_offset=64))
+        batcher.copy_buffer_to_image(1, 2, vk.IMAGE_LAYOUT_TRANSFER_DST_OPTIMAL, self.image_region(0, 0, 4, 4, mip_level=1, buffer_offset=128))
+        self.assertEqual(batcher.record(self.device, 9), 2)
+        self.assertEqual(self.device.names(), ['CmdCopyBufferToImage', 'CmdPipelineBarrier', 'CmdCopyBufferToImage'])
+
+        first, second = self.device.arguments('CmdCopyBufferToImage')
+        self.assertEqual([region.buffer_offset for region in first[5]], [0])
+        self.assertEqual([region.buffer_offset for region in second[5]], [64, 128])
+
+        barrier = self.device.arguments('CmdPipelineBarrier')[0][9]._obj
+        self.assertEqual((barrier.src_access_mask, barrier.dst_access_mask), (vk.ACCESS_TRANSFER_WRITE_BIT, vk.ACCESS_TRANSFER_WRITE_BIT))
+        self.assertEqual(barrier.old_layout, vk.IMAGE_LAYOUT_TRANSFER_DST_OPTIMAL)
+
+    def test_failure(self):
+        batcher = vk_utils.TransferBatcher()
+        batcher.copy_buffer(1, 2, 0, 0, 64)
+        self.device.overrides['CmdCopyBuffer'] = fail
+        with self.assertRaises(vk.VkErrorDeviceLost):
+            batcher.record(self.device, 9)
+        self.assertEqual(len(batcher), 1)
+
+class ImageLayoutTrackerTests(StubDeviceTestCase):
+
+    def barriers(self):
+        "(src stages, dst stages, [(old layout, new layout, src access, dst access, mip levels, array layers)]) of the recorded barriers"
+        _, src_stages, dst_stages, _, _, _, _, _, count, barriers = self.device.arguments('CmdPipelineBarrier')[-1]
+        return src_stages, dst_stages, [(barrier.old_layout, barrier.new_layout, barrier.src_access_mask, barrier.dst_access_mask,
+            (barrier.subresource_range.base_mip_level, barrier.subresource_range.level_count),
+            (barrier.subresource_range.base_array_layer, barrier.subresource_range.layer_count)) for barrier in barriers[:count]]
+
+    def test_read_after_read(self):
+        tracker = vk_utils.ImageLayoutTracker()
+        tracker.add(1, vk.IMAGE_ASPECT_COLOR_BIT, layout=vk.IMAGE_LAYOUT_SHADER_READ_ONLY_OPTIMAL, access=vk.ACCESS_SHADER_READ_BIT,
+            stages=vk.PIPELINE_STAGE_FRAGMENT_SHADER_BIT)
+        tracker.use(1, vk.IMAGE_LAYOUT_SHADER_READ_ONLY_OPTIMAL, vk.ACCESS_SHADER_READ_BIT, vk.PIPELINE_STAGE_COMPUTE_SHADER_BIT)
+        self.assertEqual(tracker.flush(self.device, 9), 0)
+        self.assertEqual(self.device.calls, [])
+        self.assertEqual(tracker.stats['skipped'], 1)
+
+    def test_read_after_write(self):
+        tracker = vk_utils.ImageLayoutTracker()
+        tracker.add(1, vk.IMAGE_ASPECT_COLOR_BIT, layout=vk.IMAGE_LAYOUT_GENERAL, access=vk.ACCESS_SHADER_WRITE_BIT,
+            stages=vk.PIPELINE_STAGE_COMPUTE_SHADER_BIT)
+        tracker.use(1, vk.IMAGE_LAYOUT_GENERAL, vk.ACCESS_SHADER_READ_BIT, vk.PIPELINE_STAGE_FRAGMENT_SHADER_BIT)
+        self.assertEqual(tracker.flush(self.device, 9), 1)
+        self.assertEqual(self.barriers(), (vk.PIPELINE_STAGE_COMPUTE_SHADER_BIT, vk.PIPELINE_STAGE_FRAGMENT_SHADER_BIT,
+            [(vk.IMAGE_LAYOUT_GENERAL, vk.IMAGE_LAYOUT_GENERAL, vk.ACCESS_SHADER_WRITE_BIT, vk.ACCESS_SHADER_READ_BIT, (0, 1), (0, 1))]))
+
+    def test_write_after_read(self):
+        tracker = vk_utils.ImageLayoutTracker()
+        tracker.add(1, vk.IMAGE_ASPECT_COLOR_BIT, layout=vk.IMAGE_LAYOUT_GENERAL, access=vk.ACCESS_SHADER_READ_BIT,
+            stages=vk.PIPELINE_STAGE_FRAGMENT_SHADER_BIT)
+        tracker.use(1, vk.IMAGE_LAYOUT_GENERAL, vk.ACCESS_SHADER_WRITE_BIT, vk.PIPELINE_STAGE_COMPUTE_SHADER_BIT)
+        self.assertEqual(tracker.flush(self.device, 9), 1)
+        self.assertEqual(self.barriers(), (vk.PIPELINE_STAGE_FRAGMENT_SHADER_BIT, vk.PIPELINE_STAGE_COMPUTE_SHADER_BIT,
+            [(vk.IMAGE_LAYOUT_GENERAL, vk.IMAGE_LAYOUT_GENERAL, vk.ACCESS_SHADER_READ_BIT, vk.ACCESS_SHADER_WRITE_BIT, (0, 1), (0, 1))]))
+
+    def test_shared_barrier(self):
+        # A read in the layout of a pending transition is added to the destination of its barrier
+        tracker = vk_utils.ImageLayoutTracker()
+        tracker.add(1, vk.IMAGE_ASPECT_COLOR_BIT)
+        tracker.use(1, vk.IMAGE_LAYOUT_SHADER_READ_ONLY_OPTIMAL, vk.ACCESS_SHADER_READ_BIT, vk.PIPELINE_STAGE_FRAGMENT_SHADER_BIT)
+        tracker.use(1, vk.IMAGE_LAYOUT_SHADER_READ_ONLY_OPTIMAL, vk.ACCESS_SHADER_READ_BIT, vk.PIPELINE_STAGE_COMPUTE_SHADER_BIT)
+        self.assertEqual(tracker.flush(self.device, 9), 1)
+        self.assertEqual(self.barriers(), (vk.PIPELINE_STAGE_TOP_OF_PIPE_BIT, vk.PIPELINE_STAGE_FRAGMENT_SHADER_BIT | vk.PIPELINE_STAGE_COMPUTE_SHADER_BIT,
+            [(vk.IMAGE_LAYOUT_UNDEFINED, vk.IMAGE_LAYOUT_SHADER_READ_ONLY_OPTIMAL, 0, vk.ACCESS_SHADER_READ_BIT, (0, 1), (0, 1))]))
+        self.assertEqual((tracker.stats['transitions'], tracker.stats['skipped']), (1, 0))
+
+    def test_merge(self):
+        tracker = vk_utils.ImageLayoutTracker()
+        tracker.add(1, vk.IMAGE_ASPECT_COLOR_BIT, mip_levels=3, array_layers=4)
+        tracker.add(2, vk.IMAGE_ASPECT_DEPTH_BIT)
+
+        # The subresources with the same transition are merged into one barrier by image, in one CmdPipelineBarrier call
+        tracker.use(1, vk.IMAGE_LAYOUT_TRANSFER_DST_OPTIMAL, vk.ACCESS_TRANSFER_WRITE_BIT, vk.PIPELINE_STAGE_TRANSFER_BIT)
+        tracker.use(2, vk.IMAGE_LAYOUT_DEPTH_STENCIL_ATTACHMENT_OPTIMAL, vk.ACCESS_DEPTH_STENCIL_ATTACHMENT_WRITE_BIT,
+            vk.PIPELINE_STAGE_EARLY_FRAGMENT_TESTS_BIT)
+        self.assertEqual(tracker.flush(self.device, 9), 2)
+        self.assertEqual([barrier[4:] for barrier in self.barriers()[2]], [((0, 3), (0, 4)), ((0, 1), (0, 1))])
+
+        # The layers 1 and 2 of every mip level: one barrier. The mip levels 0 and 2: one barrier each
+        tracker.use(1, vk.IMAGE_LAYOUT_SHADER_READ_ONLY_OPTIMAL, vk.ACCESS_SHADER_READ_BIT, vk.PIPELINE_STAGE_FRAGMENT_SHADER_BIT,
+            vk.ImageSubresourceRange(vk.IMAGE_ASPECT_COLOR_BIT, 0, vk.REMAINING_MIP_LEVELS.value, 1, 2))
+        self.assertEqual(tracker.flush(self.device, 9), 1)
+        self.assertEqual([barrier[4:] for barrier in self.barriers()[2]], [((0, 3), (1, 2))])
+
+        for mip_level in (0, 2):
+            tracker.use(1, vk.IMAGE_LAYOUT_TRANSFER_SRC_OPTIMAL, vk.ACCESS_TRANSFER_READ_BIT, vk.PIPELINE_STAGE_TRANSFER_BIT,
+                vk.ImageSubresourceRange(vk.IMAGE_ASPECT_COLOR_BIT, mip_level, 1, 0, 1))
+        self.assertEqual(tracker.flush(self.device, 9), 2)
+        self.assertEqual([barrier[4:] for barrier in self.barriers()[2]], [((0, 1), (0, 1)), ((2, 1), (0, 1))])
+        self.assertEqual(tracker.layout(1, 2, 0), vk.IMAGE_LAYOUT_TRANSFER_SRC_OPTIMAL)
+        self.assertEqual(tracker.stats['barrier_calls'], 3)
+
+class SubmissionBatcherTests(StubDeviceTestCase):
+
+    def setUp(self):
+        StubDeviceTestCase.setUp(self)
+        # The arrays of the submit infos only live during the call
+        self.submits = []
+        def queue_submit(queue, count, infos, fence):
+            self.submits.append([(infos[i].wait_semaphores[:infos[i].wait_semaphore_count], infos[i].command_buffers[:infos[i].command_buffer_count],
+                infos[i].signal_semaphores[:infos[i].signal_semaphore_count]) for i in range(count)])
+            return vk.SUCCESS
+        self.device.overrides['QueueSubmit'] = queue_submit
+
+    def test_merge(self):
+        # Submissions without waits are merged into the previous one, until it signals
+        batcher = vk_utils.SubmissionBatcher(self.device, 5)
+        batcher.submit([1])
+        batcher.submit([2])
+        batcher.submit([3], signal_semaphores=[10])
+        batcher.submit([4])
+        self.assertEqual(batcher.flush(), 2)
+        self.assertEqual(self.submits, [[([], [1, 2, 3], [10]), ([], [4], [])]])
+        self.assertEqual(batcher.stats, {'submits': 4, 'submit_infos': 2, 'flushes': 1})
+
+    def test_waits(self):
+        # Submissions that wait are never merged, and nothing is merged into them
+        batcher = vk_utils.SubmissionBatcher(self.device, 5)
+        batcher.submit([1])
+        batcher.submit([2], wait_semaphores=[10], wait_stages=[vk.PIPELINE_STAGE_TRANSFER_BIT])
+        batcher.submit([3])
+        batcher.submit([4], wait_semaphores=[11], wait_stages=[vk.PIPELINE_STAGE_TRANSFER_BIT])
+        self.assertEqual(batcher.flush(), 4)
+        self.assertEqual(self.submits, [[([], [1], []), ([10], [2], []), ([], [3], []), ([11], [4], [])]])
+
+        with self.assertRaises(ValueError):
+            batcher.submit([1], wait_semaphores=[10])
+
+    def test_fence(self):
+        batcher = vk_utils.SubmissionBatcher(self.device, 5)
+        self.assertEqual(batcher.flush(), 0)
+        self.assertEqual(self.device.calls, [])
+
+        # A fence is submitted even without submissions
+        self.assertEqual(batcher.flush(7), 0)
+        self.assertEqual([(args[0], args[1], args[3]) for args in self.device.arguments('QueueSubmit')], [(5, 0, 7)])
+
+    def test_failure(self):
+        batcher = vk_utils.SubmissionBatcher(self.device, 5)
+        batcher.submit([1])
+        queue_submit, self.device.overrides['QueueSubmit'] = self.device.overrides['QueueSubmit'], fail
+        with self.assertRaises(vk.VkErrorDeviceLost):
+            batcher.flush()
+        self.assertEqual((len(batcher.submits), batcher.stats['flushes']), (1, 0))
+
+        self.device.overrides['QueueSubmit'] = queue_submit
+        self.assertEqual(batcher.flush(), 1)
+        self.assertEqual(self.submits, [[([], [1], [])]])
+
+class FenceWaiterTests(StubDeviceTestCase):
+
+    def run_waiter(self, test):
+        waiter = vk_utils.FenceWaiter(self.device)
+        try:
+            asyncio.run(asyncio.wait_for(test(waiter), 10))
+        finally:
+            waiter.close()
+
+    def test_batched_wait(self):
+        signaled = set([1, 2])
+        self.device.overrides['GetFenceStatus'] = lambda device, fence: vk.SUCCESS if fence in signaled else vk.NOT_READY
+
+        async def test(waiter):
+            # The fences added together are waited for with one WaitForFences call, the signaled ones are resolved
+            with waiter.condition:
+                futures = [waiter.wait(fence) for fence in (1, 2, 3)]
+            await asyncio.gather(*futures[:2])
+            self.assertFalse(futures[2].done())
+            first = self.device.arguments('WaitForFences')[0]
+            self.assertEqual((first[1], list(first[2]), first[3]), (3, [1, 2, 3], vk.FALSE))
+
+            signaled.add(3)
+            await futures[2]
+            self.assertEqual(waiter.stats['signaled'], 3)
+        self.run_waiter(test)
+
+    def test_error(self):
+        self.device.overrides['WaitForFences'] = fail
+
+        async def test(waiter):
+            with waiter.condition:
+                futures = [waiter.wait(fence) for fence in (1, 2)]
+            results = await asyncio.gather(*futures, return_exceptions=True)
+            self.assertTrue(all(isinstance(result, vk.VkErrorDeviceLost) for result in results))
+            self.assertEqual(waiter.pending, {})
+        self.run_waiter(test)
+
+if __name__ == '__main__':
+    unittest.main()
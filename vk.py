@@ -2,46 +2,624 @@
 # Vulkan wrapper generated from "https://raw.githubusercontent.com/KhronosGroup/Vulkan-Docs/master/include/vulkan/vulkan_core.h"
 #
 
-from ctypes import c_int8, c_uint16, c_int32, c_uint32, c_uint64, c_size_t, c_float, c_char, c_char_p, c_void_p, POINTER, Structure, Union, cast
-from platform import system
+from ctypes import c_int8, c_int16, c_uint16, c_int32, c_uint32, c_int64, c_uint64, c_double, c_size_t, c_float, c_char, c_char_p, c_void_p, POINTER, Structure, Union, Array, _Pointer, _SimpleCData, _CFuncPtr, addressof, alignment, byref, cast, create_string_buffer, memset, sizeof, string_at
+from sys import platform
 
-# Helper functions
-repr_fn = lambda self: str(dict(self._fields_))
+from threading import RLock
+
+# Values built on first access. The lock is held while they are built, so that each value is only built once
+lazy_definitions = {}
+lazy_lock = RLock()
 
 def MAKE_VERSION(major, minor, patch):
     return (major<<22) | (minor<<12) | patch
 
+def define_lazy(name, factory):
+    "Register a value that is only built the first time it is accessed (see __getattr__)"
+    lazy_definitions[name] = factory
+
+def __getattr__(name):
+    # PEP 562: called for the module attributes that are not defined yet
+    try:
+        factory = lazy_definitions[name]
+    except KeyError:
+        raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+    with lazy_lock:
+        # Another thread may have built the value while this one was waiting for the lock
+        if name not in lazy_definitions:
+            return globals()[name]
+
+        # Build the lazy values used by the factory first, because its globals lookups do not go through __getattr__
+        for dep in factory.__code__.co_names:
+            if dep != name and dep in lazy_definitions:
+                __getattr__(dep)
+
+        value = factory()
+        if value is None:
+            raise AttributeError("Function {} could not be loaded".format(name))
+
+        # The value is set before the definition is removed, for lazy_value calls made without the lock
+        globals()[name] = value
+        del lazy_definitions[name]
+        return value
+
+def __dir__():
+    return sorted(list(globals()) + list(lazy_definitions))
+
+def lazy_value(name):
+    "Value of a module attribute. Lazy values are built if needed"
+    return __getattr__(name) if name in lazy_definitions else globals()[name]
+
+# Helper functions
+repr_fn = lambda self: str(dict(self._fields_))
+
+def clone_fn(self):
+    "Copy of the structure (a single memcpy). Objects referenced by the pointers are not kept alive by the copy"
+    return type(self).from_buffer_copy(self)
+
 def define_struct(name, *args):
-    return type(name, (Structure,), {'_fields_': args, '__repr__': repr_fn})
+    struct = type(name, (Structure,), {'_fields_': args, '__repr__': repr_fn, 'clone': clone_fn})
+    for member in buffer_members.get(name, ()):
+        setattr(struct, member, define_buffer_member(struct, member))
+    return struct
 
 def define_union(name, *args):
-    return type(name, (Union,), {'_fields_': args, '__repr__': repr_fn})
-
-def load_functions(vk_object, functions_list, loader):
+    return type(name, (Union,), {'_fields_': args, '__repr__': repr_fn, 'clone': clone_fn})
+
+def pin_buffer(obj):
+    "Return the address of the memory of obj (bytes or a C contiguous buffer) and the object that keeps this memory alive"
+    if isinstance(obj, bytes):
+        pointer = c_char_p(obj)
+        return c_void_p.from_buffer(pointer).value, pointer
+
+    view = memoryview(obj)
+    if not view.c_contiguous:
+        raise TypeError("Expected bytes or a C contiguous buffer, got {!r}".format(obj))
+    elif view.readonly and isinstance(view.obj, bytes) and view.nbytes == len(view.obj):
+        return pin_buffer(view.obj)
+    elif view.nbytes == 0:
+        return None, view
+
+    # Read only buffers other than bytes cannot be shared with ctypes and are copied
+    data = (c_char * view.nbytes).from_buffer_copy(view) if view.readonly else c_char.from_buffer(view)
+    return addressof(data), data
+
+class BufferMember(property):
+    "Property of the members that accept buffers. Like the members of the structures, it has an offset and a size"
+
+def define_buffer_member(struct, name):
+    "Property replacing a void* member, that can also be set with bytes or a C contiguous buffer. The structure keeps the buffer alive"
+    member = getattr(struct, name)
+
+    def get_member(self):
+        return member.__get__(self, struct)
+
+    def set_member(self, value):
+        if value is None or isinstance(value, int):
+            address = value
+            self.__dict__.pop(name, None)
+        else:
+            if isinstance(value, _SimpleCData):
+                # Pointer values (ex: c_void_p, c_char_p) hold the address, the other values are addresses
+                address = c_void_p.from_buffer(value).value if value._type_ in 'zZP' else value.value
+            elif isinstance(value, Array):
+                address = addressof(value)
+            elif isinstance(value, _Pointer):
+                address = cast(value, c_void_p).value
+            else:
+                address, value = pin_buffer(value)
+            self.__dict__[name] = value
+        c_void_p.from_buffer(self, member.offset).value = address
+
+    buffer_member = BufferMember(get_member, set_member, doc=member.__doc__)
+    buffer_member.offset, buffer_member.size = member.offset, member.size
+    return buffer_member
+
+def define_template(struct):
+    "Zeroed structure with its type member already set. New structures are created with template.clone()"
+    template = struct()
+    structure_type = structure_types.get(struct.__name__)
+    if structure_type is not None:
+        # The type is the first member. It is not set by name because a few structures have two members named `type`
+        StructureType.from_buffer(template).value = structure_type
+    return template
+
+# Numpy dtypes of the structures, by structure type
+struct_dtypes = {}
+
+def ctype_dtype(ctype):
+    "Numpy dtype matching a ctypes type. Pointers and handles are stored as unsigned integers"
+    import numpy
+    if issubclass(ctype, (Structure, Union)):
+        return define_dtype(ctype)
+    elif issubclass(ctype, Array):
+        if ctype._type_ is c_char:
+            return numpy.dtype(('S', ctype._length_))
+        return numpy.dtype((ctype_dtype(ctype._type_), (ctype._length_,)))
+    elif isinstance(getattr(ctype, '_type_', None), str) and ctype._type_ not in 'Pzw':
+        return numpy.dtype(ctype)
+    else:
+        return numpy.dtype(numpy.uintp)
+
+def define_dtype(struct):
+    "Build the numpy structured dtype of a struct or an union. Offsets and sizes are checked against ctypes"
+    dtype = struct_dtypes.get(struct)
+    if dtype is not None:
+        return dtype
+
+    import numpy
+    fields = {}
+    for field in struct._fields_:
+        # Bit fields cannot be represented, but their bytes are still part of the itemsize
+        if len(field) == 3:
+            continue
+
+        # When two members share a name, ctypes exposes the last one
+        name, ctype = field
+        fields[name] = ctype_dtype(ctype)
+
+    offsets = []
+    for name, field_dtype in fields.items():
+        descriptor = getattr(struct, name)
+        if field_dtype.itemsize != descriptor.size:
+            raise TypeError("{}.{}: numpy size {} does not match ctypes size {}".format(struct.__name__, name, field_dtype.itemsize, descriptor.size))
+        offsets.append(descriptor.offset)
+
+    dtype = numpy.dtype({'names': list(fields), 'formats': list(fields.values()), 'offsets': offsets, 'itemsize': sizeof(struct)})
+    if dtype.itemsize != sizeof(struct):
+        raise TypeError("{}: numpy itemsize {} does not match ctypes size {}".format(struct.__name__, dtype.itemsize, sizeof(struct)))
+
+    struct_dtypes[struct] = dtype
+    return dtype
+
+def as_ndarray(obj, count=None):
+    "View a ctypes array of structs (or `count` structs behind a pointer) as a numpy structured array, without copying"
+    import numpy
+    if count is not None:
+        obj = cast(obj, POINTER(obj._type_ * count)).contents
+    return numpy.frombuffer(obj, define_dtype(obj._type_))
+
+def from_ndarray(array, struct):
+    "Share the memory of a writable, C contiguous ndarray as a ctypes array of struct (usable as a POINTER(struct) argument)"
+    if array.nbytes % sizeof(struct) != 0:
+        raise TypeError("An array of {} bytes cannot hold {} structures of {} bytes".format(array.nbytes, struct.__name__, sizeof(struct)))
+    return (struct * (array.nbytes // sizeof(struct))).from_buffer(array)
+
+# Name of the structures, by StructureType value
+define_lazy('structure_names', lambda: dict((value, name) for name, value in structure_types.items()))
+
+# Layouts of the structures (see struct_layout), by structure type
+struct_layouts = {}
+
+def add_struct_layout(struct, offset, mask, pointers, handles):
+    arrays = array_members.get(struct.__name__, {})
+    handle_names = handle_members.get(struct.__name__, ())
+    for index, field in enumerate(struct._fields_):
+        name, ctype = field[0], field[1]
+
+        # The first member is at offset 0. This also works for the structures that have two members named `type`
+        member_offset = offset + (getattr(struct, name).offset if index else 0)
+        if issubclass(ctype, (_Pointer, _CFuncPtr)) or ctype in (c_char_p, c_void_p):
+            count, count_offset, count_type = arrays.get(name), None, None
+            if count is not None:
+                count_type = dict(f[:2] for f in struct._fields_)[count]
+                count_offset = offset + getattr(struct, count).offset
+
+            if ctype is c_char_p:
+                kind = 'string'
+            elif ctype is c_void_p:
+                kind = 'next' if name == 'next' else 'data' if count is not None else None
+            else:
+                kind = 'array' if issubclass(ctype, _Pointer) else None
+            element = ctype._type_ if kind == 'array' else c_char
+            size = sizeof(element) if count is not None and count.endswith('_size') else 1
+            pointers.append((member_offset, kind, element, count_offset, count_type, size, name in handle_names))
+        elif issubclass(ctype, Structure):
+            add_struct_layout(ctype, member_offset, mask, pointers, handles)
+        elif issubclass(ctype, Array) and issubclass(ctype._type_, Structure):
+            for item in range(ctype._length_):
+                add_struct_layout(ctype._type_, member_offset + item * sizeof(ctype._type_), mask, pointers, handles)
+        else:
+            mask[member_offset:member_offset + sizeof(ctype)] = b'\xff' * sizeof(ctype)
+            if name in handle_names:
+                handles.append((member_offset, ctype))
+
+# The layout of a structure is (mask, pointers, handles). mask is an int with the bits of the value bytes set (padding
+# and pointers are excluded). pointers are (offset, kind, element type, count offset, count type, count divisor,
+# handle elements) where kind is 'string', 'next', 'data' (bytes), 'array' or None for the pointers that are not followed.
+# handles are the (offset, type) of the handle members.
+def struct_layout(struct):
+    "Layout of a structure type. The members of the nested structures are part of the layout of their parent"
+    layout = struct_layouts.get(struct)
+    if layout is None:
+        mask, pointers, handles = bytearray(sizeof(struct)), [], []
+        add_struct_layout(struct, 0, mask, pointers, handles)
+        layout = struct_layouts[struct] = (int.from_bytes(mask, 'little'), tuple(pointers), tuple(handles))
+    return layout
+
+def struct_children(value):
+    "Yield (offset, data) for the pointers of a structure that are followed. data is bytes, or a tuple of structures or of strings"
+    address = addressof(value)
+    for offset, kind, element, count_offset, count_type, size, _ in struct_layout(type(value))[1]:
+        pointer = c_void_p.from_address(address + offset).value
+        if not pointer or kind is None:
+            continue
+
+        count = 1 if count_offset is None else count_type.from_address(address + count_offset).value // size
+        if kind == 'string':
+            yield offset, string_at(pointer)
+        elif kind == 'next':
+            name = lazy_value('structure_names').get(c_int32.from_address(pointer).value)
+            if name is not None:
+                yield offset, (lazy_value(name).from_address(pointer),)
+        elif kind == 'data':
+            yield offset, string_at(pointer, count)
+        elif element is c_char_p:
+            yield offset, tuple(c_char_p.from_address(pointer + index * sizeof(c_char_p)).value for index in range(count))
+        elif issubclass(element, Structure):
+            yield offset, tuple((element * count).from_address(pointer))
+        else:
+            yield offset, string_at(pointer, count * sizeof(element))
+
+def struct_tree(value):
+    "Copy of a structure and of everything it points to, as (type name, bytes, ((offset, data), ...)). data is bytes, or a tuple of trees or of strings"
+    children = []
+    for offset, data in struct_children(value):
+        if data and isinstance(data[0], Structure):
+            data = tuple(struct_tree(item) for item in data)
+        children.append((offset, data))
+
+    # The pointer values are cleared, so that the trees of identical structures are equal
+    data = bytearray(value)
+    for layout in struct_layout(type(value))[1]:
+        data[layout[0]:layout[0] + sizeof(c_void_p)] = bytes(sizeof(c_void_p))
+    return (type(value).__name__, bytes(data), tuple(children))
+
+def struct_key(value):
+    "Hashable key of the content of a structure and of the data it points to. Padding and the pointer values are ignored"
+    children = []
+    for offset, data in struct_children(value):
+        if data and isinstance(data[0], Structure):
+            data = tuple(struct_key(item) for item in data)
+        children.append((offset, data))
+    return (type(value).__name__, int.from_bytes(bytes(value), 'little') & struct_layout(type(value))[0], tuple(children))
+
+def build_struct(tree, objects, handle=None):
+    "Structure rebuilt from a struct_tree. The values it points to are appended to objects, handle(value) maps the handles it holds"
+    name, data, children = tree
+    struct = lazy_value(name)
+    value = struct.from_buffer_copy(data)
+    address = addressof(value)
+    _, pointers, handles = struct_layout(struct)
+
+    if handle is not None:
+        for offset, ctype in handles:
+            member = ctype.from_address(address + offset)
+            member.value = handle(member.value)
+
+    # The pointers that are not followed are cleared
+    layouts = {}
+    for layout in pointers:
+        layouts[layout[0]] = layout
+        c_void_p.from_address(address + layout[0]).value = None
+
+    for offset, child in children:
+        _, kind, element, _, _, _, handle_elements = layouts[offset]
+        if isinstance(child, bytes):
+            child = create_string_buffer(child, len(child) + (kind == 'string'))
+            if handle_elements and handle is not None:
+                values = (element * (len(child) // sizeof(element))).from_buffer(child)
+                values[:] = [handle(value) for value in values]
+        elif not child or isinstance(child[0], bytes):
+            child = (c_char_p * len(child))(*child)
+        else:
+            items = [build_struct(item, objects, handle) for item in child]
+            child = items[0] if kind == 'next' else (element * len(items))(*items)
+        objects.append(child)
+        c_void_p.from_address(address + offset).value = addressof(child)
+
+    return value
+
+class StructArena(object):
+    "Keep the short lived structures and arrays of a frame, and the data they point to, alive until reset()"
+    __slots__ = ('buffer', 'address', 'size', 'offset', 'overflow', 'objects')
+
+    def __init__(self, size=0x10000):
+        self.buffer = bytearray(size)
+        self.address = addressof(c_char.from_buffer(self.buffer))
+        self.size = size
+        self.offset = 0
+        self.overflow = 0
+
+        # Values allocated by the arena and data passed to keep(), until the next reset. The values in the buffer are views
+        # of it, but they hold the objects assigned to their members (ex: the bytes of a c_char_p or the ctypes arrays)
+        self.objects = []
+
+    def alloc(self, ctype):
+        "Return a zeroed instance of ctype (a structure, an union or an array type)"
+        align = alignment(ctype)
+        offset = (self.offset + align - 1) & -align
+        end = offset + sizeof(ctype)
+        if end <= self.size:
+            self.offset = end
+            value = ctype.from_address(self.address + offset)
+        else:
+            # A bytearray cannot be resized while it is used. The buffer grows at the next reset
+            self.overflow += end - self.offset
+            value = ctype()
+        self.objects.append(value)
+        return value
+
+    def new(self, struct, *args, **kwargs):
+        "Allocate a structure. The arguments are the ones of the structure constructor"
+        value = self.alloc(struct)
+        if args or kwargs:
+            struct.__init__(value, *args, **kwargs)
+        return value
+
+    def array(self, ctype, values):
+        "Allocate an array of ctype. values is either the length of the array or the values to copy in it"
+        if isinstance(values, int):
+            return self.alloc(ctype * values)
+        if not isinstance(values, (list, tuple)):
+            values = list(values)
+        array = self.alloc(ctype * len(values))
+        array[:] = values
+        return array
+
+    def keep(self, value):
+        "Keep a value alive until the next reset (ex: data that is not allocated by the arena and only referenced by an address)"
+        self.objects.append(value)
+        return value
+
+    def reset(self):
+        "Release everything that was allocated. The values allocated before must not be used anymore"
+        if self.overflow:
+            self.size += self.overflow
+            self.buffer = bytearray(self.size)
+            self.address = addressof(c_char.from_buffer(self.buffer))
+        else:
+            memset(self.address, 0, self.offset)
+
+        self.offset = self.overflow = 0
+        self.objects = []
+
+# Arguments that are passed to the ctypes pointer types as they are
+ctypes_arguments = (Array, _Pointer, type(byref(c_int8())))
+
+# Pointer types of array_pointer, by (element type, output)
+array_pointers = {}
+
+def array_from_param(cls, obj):
+    # The types of the arrays and pointers that were already accepted once are not checked again
+    if type(obj) in cls.accepted_types:
+        return obj
+    elif isinstance(obj, ctypes_arguments):
+        value = cls.pointer_from_param(obj)
+        if not isinstance(obj, ctypes_arguments[-1]):
+            cls.accepted_types.add(type(obj))
+        return value
+
+    try:
+        view = memoryview(obj)
+    except TypeError:
+        return cls.pointer_from_param(obj)
+
+    size = sizeof(cls._type_)
+    if not view.c_contiguous or view.itemsize not in (1, size) or view.nbytes % size != 0:
+        raise TypeError("Expected a C contiguous buffer of {} bytes values, got {!r}".format(size, obj))
+
+    # Read only buffers (ex: bytes) cannot be shared with ctypes and are copied. The functions cannot write in them
+    if view.readonly and cls.output:
+        raise TypeError("Expected a writable buffer, the function writes in this argument, got {!r}".format(obj))
+    array_type = cls._type_ * (view.nbytes // size)
+    return array_type.from_buffer_copy(view) if view.readonly else array_type.from_buffer(view)
+
+# Arguments that ctypes passes as pointers by itself, and the other arguments accepted by c_void_p
+void_arguments = (bytes, type(None)) + ctypes_arguments
+void_pointer_arguments = (int, str, _SimpleCData, _CFuncPtr)
+
+def void_from_param(cls, obj):
+    if isinstance(obj, void_arguments):
+        return obj
+    elif isinstance(obj, void_pointer_arguments):
+        return c_void_p.from_param(obj)
+    try:
+        view = memoryview(obj)
+    except TypeError:
+        return c_void_p.from_param(obj)
+
+    # Writable buffers are shared. The argument keeps the buffer alive during the call
+    if not view.readonly and view.c_contiguous and view.nbytes:
+        return byref(c_char.from_buffer(view))
+    address, data = pin_buffer(view)
+    return data if address else None
+
+def output_void_from_param(cls, obj):
+    # bytes and the other read only buffers cannot be written by the functions
+    if isinstance(obj, bytes) or (not isinstance(obj, void_arguments + void_pointer_arguments) and _readonly_buffer(obj)):
+        raise TypeError("Expected a writable buffer, the function writes in this argument, got {!r}".format(type(obj).__name__))
+    return void_from_param(cls, obj)
+
+def _readonly_buffer(obj):
+    try:
+        return memoryview(obj).readonly
+    except TypeError:
+        return False
+
+# c_void_p of the functions arguments, that also accepts bytes-like objects (numpy arrays, bytearray, memoryview, ctypes structures)
+void_pointer = type('void_pointer', (c_void_p,), {'from_param': classmethod(void_from_param)})
+
+# void_pointer of the arguments that the functions write in. Read only buffers are rejected
+output_void_pointer = type('output_void_pointer', (c_void_p,), {'from_param': classmethod(output_void_from_param)})
+
+def array_pointer(ctype, output=False):
+    "POINTER(ctype) that also accepts C contiguous buffers of ctype values (numpy arrays, array.array, memoryview) without copying. Output arrays reject read only buffers"
+    pointer = array_pointers.get((ctype, output))
+    if pointer is None:
+        base = POINTER(ctype)
+        pointer = type(base.__name__, (base,), {
+            'from_param': classmethod(array_from_param),
+            'pointer_from_param': staticmethod(base.from_param),
+            'accepted_types': set([type(None)]),
+            'output': output,
+        })
+        array_pointers[(ctype, output)] = pointer
+    return pointer
+
+def load_library():
+    if system_name == 'Windows':
+        return windll.LoadLibrary('vulkan-1')
+    elif system_name == 'Linux':
+        return cdll.LoadLibrary('libvulkan.so.1')
+
+def load_function(vk_object, name, prototype, loader, check=True):
+    fn_ptr = cast(loader(vk_object, name), c_void_p)
+    if fn_ptr:
+        fn = prototype(fn_ptr.value)
+        if check and prototype._restype_ is Result:
+            fn.errcheck = check_result
+        return fn
+
+def enumerate_command(fn, *args):
+    "Call a two-call command (count, then fill) until the result is not INCOMPLETE. Return a ctypes array (bytes for a void*)"
+    count_type, array_type = fn.argtypes[-2]._type_, fn.argtypes[-1]._type_
+    element = array_type if isinstance(array_type, type) else c_char
+    template = define_template(element) if element.__name__ in structure_types else None
+
+    count = count_type()
+    result = INCOMPLETE
+    while result == INCOMPLETE:
+        check_result(fn(*args, byref(count), None) or 0, fn, args)
+        if template is not None:
+            array = (element * count.value)(*[template] * count.value)
+        else:
+            array = (element * count.value)()
+        result = fn(*args, byref(count), array)
+        check_result(result or 0, fn, args)
+
+    if element is c_char:
+        return array.raw[:count.value]
+    if count.value < len(array):
+        array = (element * count.value).from_buffer(array)
+    return array
+
+def copy_array(array):
+    "Copy of an array returned by enumerate_command (bytes cannot be modified and are not copied)"
+    return array if isinstance(array, bytes) else type(array).from_buffer_copy(array)
+
+class VkError(Exception):
+    "Base class of the exceptions raised when a command returns an error code"
+    result = None
+
+def define_error(name, result):
+    return type(name, (VkError,), {'result': result})
+
+def check_result(result, fn, args):
+    "Raise the exception matching the error codes. Success codes are returned"
+    if result < 0:
+        name = error_names.get(result)
+        raise (lazy_value(name) if name else VkError)(result)
+    return result
+
+def load_functions(vk_object, functions_list, loader, unchecked=()):
     functions = []
     for name, prototype in functions_list:
         py_name = name.decode()[2::]
-        fn_ptr = loader(vk_object, name)
-        fn_ptr = cast(fn_ptr, c_void_p)
-        if fn_ptr:
-            fn = prototype(fn_ptr.value)
+        fn = load_function(vk_object, name, prototype, loader, py_name not in unchecked)
+        if fn is not None:
             functions.append((py_name, fn))
         elif __debug__ == True:
             print('Function {} could not be loaded. (__debug__ == True)'.format(py_name))
     return functions
 
+def cached_enumeration(cache, name, fn, args):
+    "Call enumerate_command. The results that cannot change (see enumeration_commands) are stored in cache. Each caller gets a copy"
+    if not enumeration_commands.get(name):
+        return enumerate_command(fn, *args)
+
+    key = (name,) + tuple(getattr(arg, 'value', arg) for arg in args)
+    array = cache.get(key)
+    if array is None:
+        array = cache[key] = enumerate_command(fn, *args)
+    return copy_array(array)
+
+# Cached enumerations of the loader commands
+loader_enumerations = {}
+
+def enumerate_loader(name, *args):
+    "Enumerate the values of a loader command (ex: EnumerateInstanceExtensionProperties). Arguments are the ones before the count"
+    return cached_enumeration(loader_enumerations, name, lazy_value(name), args)
+
+class Dispatch(object):
+    "Function table that only resolves a command the first time it is accessed"
+    __slots__ = ('handle', 'loader', 'unchecked', 'enumerations')
+    functions = {}
+
+    def __init__(self, handle, loader, preload=False, unchecked=()):
+        self.handle = handle
+        self.loader = loader
+        self.unchecked = frozenset(unchecked)
+        self.enumerations = {}
+        if preload:
+            self.preload()
+
+    def __getattr__(self, name):
+        # Only called when the slot of the command is still empty
+        try:
+            vk_name, prototype = self.functions[name]
+        except KeyError:
+            raise AttributeError(name)
+
+        fn = load_function(self.handle, vk_name, prototype, self.loader, name not in self.unchecked)
+        if fn is None:
+            raise AttributeError('Function {} could not be loaded'.format(name))
+
+        setattr(self, name, fn)
+        return fn
+
+    def preload(self):
+        "Resolve every command of the table right away. Commands that cannot be loaded are skipped"
+        for name in self.functions:
+            try:
+                getattr(self, name)
+            except AttributeError:
+                pass
+        return self
+
+    def enumerate(self, name, *args):
+        "Enumerate the values of a two-call command (ex: EnumeratePhysicalDevices). Arguments are the ones before the count"
+        return cached_enumeration(self.enumerations, name, getattr(self, name), args)
+
+    def used_functions(self):
+        "Return the names of the commands that were resolved so far"
+        cls = type(self)
+        used = []
+        for name in self.functions:
+            try:
+                getattr(cls, name).__get__(self, cls)
+            except AttributeError:
+                continue
+            used.append(name)
+        return used
+
+def define_dispatch(name, functions_list):
+    functions = dict((vk_name.decode()[2::], (vk_name, prototype)) for vk_name, prototype in functions_list)
+    return type(name, (Dispatch,), {'__slots__': tuple(functions), 'functions': functions})
+
 API_VERSION_1_0 = MAKE_VERSION(1,0,0)
 
 # System initialization
-system_name = system()
+system_name = {'win32': 'Windows', 'darwin': 'Darwin'}.get(platform, platform.capitalize())
 if system_name == 'Windows':
     from ctypes import WINFUNCTYPE, windll
     FUNCTYPE = WINFUNCTYPE
-    vk = windll.LoadLibrary('vulkan-1')
 elif system_name == 'Linux':
     from ctypes import CFUNCTYPE, cdll
     FUNCTYPE = CFUNCTYPE
-    vk = cdll.LoadLibrary('libvulkan.so.1')
+
+define_lazy('vk', load_library)
 
 # System types
 HINSTANCE = c_size_t
@@ -63,14 +641,15 @@ VisualID = c_uint32
 ANativeWindow = c_size_t
 RROutput = c_uint32
 
-SECURITY_ATTRIBUTES = define_struct('SECURITY_ATTRIBUTES', 
+define_lazy('SECURITY_ATTRIBUTES', lambda: define_struct('SECURITY_ATTRIBUTES', 
     ('nLength', c_uint32),
     ('lpSecurityDescriptor', c_void_p),
     ('bInheritHandle', c_uint32),
-)
+))
 
 # Base types
 Flags = c_uint32
+Flags64 = c_uint64
 Bool32 = c_uint32
 DeviceSize = c_uint64
 SampleMask = c_uint32
@@ -252,7 +831,7 @@ PIPELINE_CACHE_HEADER_VERSION_BEGIN_RANGE = PIPELINE_CACHE_HEADER_VERSION_ONE
 PIPELINE_CACHE_HEADER_VERSION_END_RANGE = PIPELINE_CACHE_HEADER_VERSION_ONE
 PIPELINE_CACHE_HEADER_VERSION_RANGE_SIZE = (PIPELINE_CACHE_HEADER_VERSION_ONE - PIPELINE_CACHE_HEADER_VERSION_ONE + 1)
 
-Result = c_uint32
+Result = c_int32
 SUCCESS = 0
 NOT_READY = 1
 TIMEOUT = 2
@@ -2233,17 +2812,566 @@ MEMORY_OVERALLOCATION_BEHAVIOR_RANGE_SIZE_AMD = (MEMORY_OVERALLOCATION_BEHAVIOR_
 
 
 
+# Exceptions raised by the commands returning an error code
+define_lazy('VkErrorOutOfHostMemory', lambda: define_error('VkErrorOutOfHostMemory', ERROR_OUT_OF_HOST_MEMORY))
+define_lazy('VkErrorOutOfDeviceMemory', lambda: define_error('VkErrorOutOfDeviceMemory', ERROR_OUT_OF_DEVICE_MEMORY))
+define_lazy('VkErrorInitializationFailed', lambda: define_error('VkErrorInitializationFailed', ERROR_INITIALIZATION_FAILED))
+define_lazy('VkErrorDeviceLost', lambda: define_error('VkErrorDeviceLost', ERROR_DEVICE_LOST))
+define_lazy('VkErrorMemoryMapFailed', lambda: define_error('VkErrorMemoryMapFailed', ERROR_MEMORY_MAP_FAILED))
+define_lazy('VkErrorLayerNotPresent', lambda: define_error('VkErrorLayerNotPresent', ERROR_LAYER_NOT_PRESENT))
+define_lazy('VkErrorExtensionNotPresent', lambda: define_error('VkErrorExtensionNotPresent', ERROR_EXTENSION_NOT_PRESENT))
+define_lazy('VkErrorFeatureNotPresent', lambda: define_error('VkErrorFeatureNotPresent', ERROR_FEATURE_NOT_PRESENT))
+define_lazy('VkErrorIncompatibleDriver', lambda: define_error('VkErrorIncompatibleDriver', ERROR_INCOMPATIBLE_DRIVER))
+define_lazy('VkErrorTooManyObjects', lambda: define_error('VkErrorTooManyObjects', ERROR_TOO_MANY_OBJECTS))
+define_lazy('VkErrorFormatNotSupported', lambda: define_error('VkErrorFormatNotSupported', ERROR_FORMAT_NOT_SUPPORTED))
+define_lazy('VkErrorFragmentedPool', lambda: define_error('VkErrorFragmentedPool', ERROR_FRAGMENTED_POOL))
+define_lazy('VkErrorOutOfPoolMemory', lambda: define_error('VkErrorOutOfPoolMemory', ERROR_OUT_OF_POOL_MEMORY))
+define_lazy('VkErrorInvalidExternalHandle', lambda: define_error('VkErrorInvalidExternalHandle', ERROR_INVALID_EXTERNAL_HANDLE))
+define_lazy('VkErrorSurfaceLostKHR', lambda: define_error('VkErrorSurfaceLostKHR', ERROR_SURFACE_LOST_KHR))
+define_lazy('VkErrorNativeWindowInUseKHR', lambda: define_error('VkErrorNativeWindowInUseKHR', ERROR_NATIVE_WINDOW_IN_USE_KHR))
+define_lazy('VkErrorOutOfDateKHR', lambda: define_error('VkErrorOutOfDateKHR', ERROR_OUT_OF_DATE_KHR))
+define_lazy('VkErrorIncompatibleDisplayKHR', lambda: define_error('VkErrorIncompatibleDisplayKHR', ERROR_INCOMPATIBLE_DISPLAY_KHR))
+define_lazy('VkErrorValidationFailedEXT', lambda: define_error('VkErrorValidationFailedEXT', ERROR_VALIDATION_FAILED_EXT))
+define_lazy('VkErrorInvalidShaderNV', lambda: define_error('VkErrorInvalidShaderNV', ERROR_INVALID_SHADER_NV))
+define_lazy('VkErrorInvalidDrmFormatModifierPlaneLayoutEXT', lambda: define_error('VkErrorInvalidDrmFormatModifierPlaneLayoutEXT', ERROR_INVALID_DRM_FORMAT_MODIFIER_PLANE_LAYOUT_EXT))
+define_lazy('VkErrorFragmentationEXT', lambda: define_error('VkErrorFragmentationEXT', ERROR_FRAGMENTATION_EXT))
+define_lazy('VkErrorNotPermittedEXT', lambda: define_error('VkErrorNotPermittedEXT', ERROR_NOT_PERMITTED_EXT))
+define_lazy('VkErrorOutOfPoolMemoryKHR', lambda: VkErrorOutOfPoolMemory)
+define_lazy('VkErrorInvalidExternalHandleKHR', lambda: VkErrorInvalidExternalHandle)
+
+error_names = {
+    ERROR_OUT_OF_HOST_MEMORY: 'VkErrorOutOfHostMemory',
+    ERROR_OUT_OF_DEVICE_MEMORY: 'VkErrorOutOfDeviceMemory',
+    ERROR_INITIALIZATION_FAILED: 'VkErrorInitializationFailed',
+    ERROR_DEVICE_LOST: 'VkErrorDeviceLost',
+    ERROR_MEMORY_MAP_FAILED: 'VkErrorMemoryMapFailed',
+    ERROR_LAYER_NOT_PRESENT: 'VkErrorLayerNotPresent',
+    ERROR_EXTENSION_NOT_PRESENT: 'VkErrorExtensionNotPresent',
+    ERROR_FEATURE_NOT_PRESENT: 'VkErrorFeatureNotPresent',
+    ERROR_INCOMPATIBLE_DRIVER: 'VkErrorIncompatibleDriver',
+    ERROR_TOO_MANY_OBJECTS: 'VkErrorTooManyObjects',
+    ERROR_FORMAT_NOT_SUPPORTED: 'VkErrorFormatNotSupported',
+    ERROR_FRAGMENTED_POOL: 'VkErrorFragmentedPool',
+    ERROR_OUT_OF_POOL_MEMORY: 'VkErrorOutOfPoolMemory',
+    ERROR_INVALID_EXTERNAL_HANDLE: 'VkErrorInvalidExternalHandle',
+    ERROR_SURFACE_LOST_KHR: 'VkErrorSurfaceLostKHR',
+    ERROR_NATIVE_WINDOW_IN_USE_KHR: 'VkErrorNativeWindowInUseKHR',
+    ERROR_OUT_OF_DATE_KHR: 'VkErrorOutOfDateKHR',
+    ERROR_INCOMPATIBLE_DISPLAY_KHR: 'VkErrorIncompatibleDisplayKHR',
+    ERROR_VALIDATION_FAILED_EXT: 'VkErrorValidationFailedEXT',
+    ERROR_INVALID_SHADER_NV: 'VkErrorInvalidShaderNV',
+    ERROR_INVALID_DRM_FORMAT_MODIFIER_PLANE_LAYOUT_EXT: 'VkErrorInvalidDrmFormatModifierPlaneLayoutEXT',
+    ERROR_FRAGMENTATION_EXT: 'VkErrorFragmentationEXT',
+    ERROR_NOT_PERMITTED_EXT: 'VkErrorNotPermittedEXT',
+}
+
+
+# StructureType of the structures (used to fill the type member)
+structure_types = {
+    'ApplicationInfo': STRUCTURE_TYPE_APPLICATION_INFO,
+    'InstanceCreateInfo': STRUCTURE_TYPE_INSTANCE_CREATE_INFO,
+    'DeviceQueueCreateInfo': STRUCTURE_TYPE_DEVICE_QUEUE_CREATE_INFO,
+    'DeviceCreateInfo': STRUCTURE_TYPE_DEVICE_CREATE_INFO,
+    'SubmitInfo': STRUCTURE_TYPE_SUBMIT_INFO,
+    'MemoryAllocateInfo': STRUCTURE_TYPE_MEMORY_ALLOCATE_INFO,
+    'MappedMemoryRange': STRUCTURE_TYPE_MAPPED_MEMORY_RANGE,
+    'BindSparseInfo': STRUCTURE_TYPE_BIND_SPARSE_INFO,
+    'FenceCreateInfo': STRUCTURE_TYPE_FENCE_CREATE_INFO,
+    'SemaphoreCreateInfo': STRUCTURE_TYPE_SEMAPHORE_CREATE_INFO,
+    'EventCreateInfo': STRUCTURE_TYPE_EVENT_CREATE_INFO,
+    'QueryPoolCreateInfo': STRUCTURE_TYPE_QUERY_POOL_CREATE_INFO,
+    'BufferCreateInfo': STRUCTURE_TYPE_BUFFER_CREATE_INFO,
+    'BufferViewCreateInfo': STRUCTURE_TYPE_BUFFER_VIEW_CREATE_INFO,
+    'ImageCreateInfo': STRUCTURE_TYPE_IMAGE_CREATE_INFO,
+    'ImageViewCreateInfo': STRUCTURE_TYPE_IMAGE_VIEW_CREATE_INFO,
+    'ShaderModuleCreateInfo': STRUCTURE_TYPE_SHADER_MODULE_CREATE_INFO,
+    'PipelineCacheCreateInfo': STRUCTURE_TYPE_PIPELINE_CACHE_CREATE_INFO,
+    'PipelineShaderStageCreateInfo': STRUCTURE_TYPE_PIPELINE_SHADER_STAGE_CREATE_INFO,
+    'PipelineVertexInputStateCreateInfo': STRUCTURE_TYPE_PIPELINE_VERTEX_INPUT_STATE_CREATE_INFO,
+    'PipelineInputAssemblyStateCreateInfo': STRUCTURE_TYPE_PIPELINE_INPUT_ASSEMBLY_STATE_CREATE_INFO,
+    'PipelineTessellationStateCreateInfo': STRUCTURE_TYPE_PIPELINE_TESSELLATION_STATE_CREATE_INFO,
+    'PipelineViewportStateCreateInfo': STRUCTURE_TYPE_PIPELINE_VIEWPORT_STATE_CREATE_INFO,
+    'PipelineRasterizationStateCreateInfo': STRUCTURE_TYPE_PIPELINE_RASTERIZATION_STATE_CREATE_INFO,
+    'PipelineMultisampleStateCreateInfo': STRUCTURE_TYPE_PIPELINE_MULTISAMPLE_STATE_CREATE_INFO,
+    'PipelineDepthStencilStateCreateInfo': STRUCTURE_TYPE_PIPELINE_DEPTH_STENCIL_STATE_CREATE_INFO,
+    'PipelineColorBlendStateCreateInfo': STRUCTURE_TYPE_PIPELINE_COLOR_BLEND_STATE_CREATE_INFO,
+    'PipelineDynamicStateCreateInfo': STRUCTURE_TYPE_PIPELINE_DYNAMIC_STATE_CREATE_INFO,
+    'GraphicsPipelineCreateInfo': STRUCTURE_TYPE_GRAPHICS_PIPELINE_CREATE_INFO,
+    'ComputePipelineCreateInfo': STRUCTURE_TYPE_COMPUTE_PIPELINE_CREATE_INFO,
+    'PipelineLayoutCreateInfo': STRUCTURE_TYPE_PIPELINE_LAYOUT_CREATE_INFO,
+    'SamplerCreateInfo': STRUCTURE_TYPE_SAMPLER_CREATE_INFO,
+    'DescriptorSetLayoutCreateInfo': STRUCTURE_TYPE_DESCRIPTOR_SET_LAYOUT_CREATE_INFO,
+    'DescriptorPoolCreateInfo': STRUCTURE_TYPE_DESCRIPTOR_POOL_CREATE_INFO,
+    'DescriptorSetAllocateInfo': STRUCTURE_TYPE_DESCRIPTOR_SET_ALLOCATE_INFO,
+    'WriteDescriptorSet': STRUCTURE_TYPE_WRITE_DESCRIPTOR_SET,
+    'CopyDescriptorSet': STRUCTURE_TYPE_COPY_DESCRIPTOR_SET,
+    'FramebufferCreateInfo': STRUCTURE_TYPE_FRAMEBUFFER_CREATE_INFO,
+    'RenderPassCreateInfo': STRUCTURE_TYPE_RENDER_PASS_CREATE_INFO,
+    'CommandPoolCreateInfo': STRUCTURE_TYPE_COMMAND_POOL_CREATE_INFO,
+    'CommandBufferAllocateInfo': STRUCTURE_TYPE_COMMAND_BUFFER_ALLOCATE_INFO,
+    'CommandBufferInheritanceInfo': STRUCTURE_TYPE_COMMAND_BUFFER_INHERITANCE_INFO,
+    'CommandBufferBeginInfo': STRUCTURE_TYPE_COMMAND_BUFFER_BEGIN_INFO,
+    'MemoryBarrier': STRUCTURE_TYPE_MEMORY_BARRIER,
+    'BufferMemoryBarrier': STRUCTURE_TYPE_BUFFER_MEMORY_BARRIER,
+    'ImageMemoryBarrier': STRUCTURE_TYPE_IMAGE_MEMORY_BARRIER,
+    'RenderPassBeginInfo': STRUCTURE_TYPE_RENDER_PASS_BEGIN_INFO,
+    'PhysicalDeviceSubgroupProperties': STRUCTURE_TYPE_PHYSICAL_DEVICE_SUBGROUP_PROPERTIES,
+    'BindBufferMemoryInfo': STRUCTURE_TYPE_BIND_BUFFER_MEMORY_INFO,
+    'BindImageMemoryInfo': STRUCTURE_TYPE_BIND_IMAGE_MEMORY_INFO,
+    'PhysicalDevice16BitStorageFeatures': STRUCTURE_TYPE_PHYSICAL_DEVICE_16BIT_STORAGE_FEATURES,
+    'MemoryDedicatedRequirements': STRUCTURE_TYPE_MEMORY_DEDICATED_REQUIREMENTS,
+    'MemoryDedicatedAllocateInfo': STRUCTURE_TYPE_MEMORY_DEDICATED_ALLOCATE_INFO,
+    'MemoryAllocateFlagsInfo': STRUCTURE_TYPE_MEMORY_ALLOCATE_FLAGS_INFO,
+    'DeviceGroupRenderPassBeginInfo': STRUCTURE_TYPE_DEVICE_GROUP_RENDER_PASS_BEGIN_INFO,
+    'DeviceGroupCommandBufferBeginInfo': STRUCTURE_TYPE_DEVICE_GROUP_COMMAND_BUFFER_BEGIN_INFO,
+    'DeviceGroupSubmitInfo': STRUCTURE_TYPE_DEVICE_GROUP_SUBMIT_INFO,
+    'DeviceGroupBindSparseInfo': STRUCTURE_TYPE_DEVICE_GROUP_BIND_SPARSE_INFO,
+    'BindBufferMemoryDeviceGroupInfo': STRUCTURE_TYPE_BIND_BUFFER_MEMORY_DEVICE_GROUP_INFO,
+    'BindImageMemoryDeviceGroupInfo': STRUCTURE_TYPE_BIND_IMAGE_MEMORY_DEVICE_GROUP_INFO,
+    'PhysicalDeviceGroupProperties': STRUCTURE_TYPE_PHYSICAL_DEVICE_GROUP_PROPERTIES,
+    'DeviceGroupDeviceCreateInfo': STRUCTURE_TYPE_DEVICE_GROUP_DEVICE_CREATE_INFO,
+    'BufferMemoryRequirementsInfo2': STRUCTURE_TYPE_BUFFER_MEMORY_REQUIREMENTS_INFO_2,
+    'ImageMemoryRequirementsInfo2': STRUCTURE_TYPE_IMAGE_MEMORY_REQUIREMENTS_INFO_2,
+    'ImageSparseMemoryRequirementsInfo2': STRUCTURE_TYPE_IMAGE_SPARSE_MEMORY_REQUIREMENTS_INFO_2,
+    'MemoryRequirements2': STRUCTURE_TYPE_MEMORY_REQUIREMENTS_2,
+    'SparseImageMemoryRequirements2': STRUCTURE_TYPE_SPARSE_IMAGE_MEMORY_REQUIREMENTS_2,
+    'PhysicalDeviceFeatures2': STRUCTURE_TYPE_PHYSICAL_DEVICE_FEATURES_2,
+    'PhysicalDeviceProperties2': STRUCTURE_TYPE_PHYSICAL_DEVICE_PROPERTIES_2,
+    'FormatProperties2': STRUCTURE_TYPE_FORMAT_PROPERTIES_2,
+    'ImageFormatProperties2': STRUCTURE_TYPE_IMAGE_FORMAT_PROPERTIES_2,
+    'PhysicalDeviceImageFormatInfo2': STRUCTURE_TYPE_PHYSICAL_DEVICE_IMAGE_FORMAT_INFO_2,
+    'QueueFamilyProperties2': STRUCTURE_TYPE_QUEUE_FAMILY_PROPERTIES_2,
+    'PhysicalDeviceMemoryProperties2': STRUCTURE_TYPE_PHYSICAL_DEVICE_MEMORY_PROPERTIES_2,
+    'SparseImageFormatProperties2': STRUCTURE_TYPE_SPARSE_IMAGE_FORMAT_PROPERTIES_2,
+    'PhysicalDeviceSparseImageFormatInfo2': STRUCTURE_TYPE_PHYSICAL_DEVICE_SPARSE_IMAGE_FORMAT_INFO_2,
+    'PhysicalDevicePointClippingProperties': STRUCTURE_TYPE_PHYSICAL_DEVICE_POINT_CLIPPING_PROPERTIES,
+    'RenderPassInputAttachmentAspectCreateInfo': STRUCTURE_TYPE_RENDER_PASS_INPUT_ATTACHMENT_ASPECT_CREATE_INFO,
+    'ImageViewUsageCreateInfo': STRUCTURE_TYPE_IMAGE_VIEW_USAGE_CREATE_INFO,
+    'PipelineTessellationDomainOriginStateCreateInfo': STRUCTURE_TYPE_PIPELINE_TESSELLATION_DOMAIN_ORIGIN_STATE_CREATE_INFO,
+    'RenderPassMultiviewCreateInfo': STRUCTURE_TYPE_RENDER_PASS_MULTIVIEW_CREATE_INFO,
+    'PhysicalDeviceMultiviewFeatures': STRUCTURE_TYPE_PHYSICAL_DEVICE_MULTIVIEW_FEATURES,
+    'PhysicalDeviceMultiviewProperties': STRUCTURE_TYPE_PHYSICAL_DEVICE_MULTIVIEW_PROPERTIES,
+    'PhysicalDeviceVariablePointerFeatures': STRUCTURE_TYPE_PHYSICAL_DEVICE_VARIABLE_POINTER_FEATURES,
+    'PhysicalDeviceProtectedMemoryFeatures': STRUCTURE_TYPE_PHYSICAL_DEVICE_PROTECTED_MEMORY_FEATURES,
+    'PhysicalDeviceProtectedMemoryProperties': STRUCTURE_TYPE_PHYSICAL_DEVICE_PROTECTED_MEMORY_PROPERTIES,
+    'DeviceQueueInfo2': STRUCTURE_TYPE_DEVICE_QUEUE_INFO_2,
+    'ProtectedSubmitInfo': STRUCTURE_TYPE_PROTECTED_SUBMIT_INFO,
+    'SamplerYcbcrConversionCreateInfo': STRUCTURE_TYPE_SAMPLER_YCBCR_CONVERSION_CREATE_INFO,
+    'SamplerYcbcrConversionInfo': STRUCTURE_TYPE_SAMPLER_YCBCR_CONVERSION_INFO,
+    'BindImagePlaneMemoryInfo': STRUCTURE_TYPE_BIND_IMAGE_PLANE_MEMORY_INFO,
+    'ImagePlaneMemoryRequirementsInfo': STRUCTURE_TYPE_IMAGE_PLANE_MEMORY_REQUIREMENTS_INFO,
+    'PhysicalDeviceSamplerYcbcrConversionFeatures': STRUCTURE_TYPE_PHYSICAL_DEVICE_SAMPLER_YCBCR_CONVERSION_FEATURES,
+    'SamplerYcbcrConversionImageFormatProperties': STRUCTURE_TYPE_SAMPLER_YCBCR_CONVERSION_IMAGE_FORMAT_PROPERTIES,
+    'DescriptorUpdateTemplateCreateInfo': STRUCTURE_TYPE_DESCRIPTOR_UPDATE_TEMPLATE_CREATE_INFO,
+    'PhysicalDeviceExternalImageFormatInfo': STRUCTURE_TYPE_PHYSICAL_DEVICE_EXTERNAL_IMAGE_FORMAT_INFO,
+    'ExternalImageFormatProperties': STRUCTURE_TYPE_EXTERNAL_IMAGE_FORMAT_PROPERTIES,
+    'PhysicalDeviceExternalBufferInfo': STRUCTURE_TYPE_PHYSICAL_DEVICE_EXTERNAL_BUFFER_INFO,
+    'ExternalBufferProperties': STRUCTURE_TYPE_EXTERNAL_BUFFER_PROPERTIES,
+    'PhysicalDeviceIDProperties': STRUCTURE_TYPE_PHYSICAL_DEVICE_ID_PROPERTIES,
+    'ExternalMemoryImageCreateInfo': STRUCTURE_TYPE_EXTERNAL_MEMORY_IMAGE_CREATE_INFO,
+    'ExternalMemoryBufferCreateInfo': STRUCTURE_TYPE_EXTERNAL_MEMORY_BUFFER_CREATE_INFO,
+    'ExportMemoryAllocateInfo': STRUCTURE_TYPE_EXPORT_MEMORY_ALLOCATE_INFO,
+    'PhysicalDeviceExternalFenceInfo': STRUCTURE_TYPE_PHYSICAL_DEVICE_EXTERNAL_FENCE_INFO,
+    'ExternalFenceProperties': STRUCTURE_TYPE_EXTERNAL_FENCE_PROPERTIES,
+    'ExportFenceCreateInfo': STRUCTURE_TYPE_EXPORT_FENCE_CREATE_INFO,
+    'ExportSemaphoreCreateInfo': STRUCTURE_TYPE_EXPORT_SEMAPHORE_CREATE_INFO,
+    'PhysicalDeviceExternalSemaphoreInfo': STRUCTURE_TYPE_PHYSICAL_DEVICE_EXTERNAL_SEMAPHORE_INFO,
+    'ExternalSemaphoreProperties': STRUCTURE_TYPE_EXTERNAL_SEMAPHORE_PROPERTIES,
+    'PhysicalDeviceMaintenance3Properties': STRUCTURE_TYPE_PHYSICAL_DEVICE_MAINTENANCE_3_PROPERTIES,
+    'DescriptorSetLayoutSupport': STRUCTURE_TYPE_DESCRIPTOR_SET_LAYOUT_SUPPORT,
+    'PhysicalDeviceShaderDrawParameterFeatures': STRUCTURE_TYPE_PHYSICAL_DEVICE_SHADER_DRAW_PARAMETER_FEATURES,
+    'SwapchainCreateInfoKHR': STRUCTURE_TYPE_SWAPCHAIN_CREATE_INFO_KHR,
+    'PresentInfoKHR': STRUCTURE_TYPE_PRESENT_INFO_KHR,
+    'ImageSwapchainCreateInfoKHR': STRUCTURE_TYPE_IMAGE_SWAPCHAIN_CREATE_INFO_KHR,
+    'BindImageMemorySwapchainInfoKHR': STRUCTURE_TYPE_BIND_IMAGE_MEMORY_SWAPCHAIN_INFO_KHR,
+    'AcquireNextImageInfoKHR': STRUCTURE_TYPE_ACQUIRE_NEXT_IMAGE_INFO_KHR,
+    'DeviceGroupPresentCapabilitiesKHR': STRUCTURE_TYPE_DEVICE_GROUP_PRESENT_CAPABILITIES_KHR,
+    'DeviceGroupPresentInfoKHR': STRUCTURE_TYPE_DEVICE_GROUP_PRESENT_INFO_KHR,
+    'DeviceGroupSwapchainCreateInfoKHR': STRUCTURE_TYPE_DEVICE_GROUP_SWAPCHAIN_CREATE_INFO_KHR,
+    'DisplayModeCreateInfoKHR': STRUCTURE_TYPE_DISPLAY_MODE_CREATE_INFO_KHR,
+    'DisplaySurfaceCreateInfoKHR': STRUCTURE_TYPE_DISPLAY_SURFACE_CREATE_INFO_KHR,
+    'DisplayPresentInfoKHR': STRUCTURE_TYPE_DISPLAY_PRESENT_INFO_KHR,
+    'ImportMemoryFdInfoKHR': STRUCTURE_TYPE_IMPORT_MEMORY_FD_INFO_KHR,
+    'MemoryFdPropertiesKHR': STRUCTURE_TYPE_MEMORY_FD_PROPERTIES_KHR,
+    'MemoryGetFdInfoKHR': STRUCTURE_TYPE_MEMORY_GET_FD_INFO_KHR,
+    'ImportSemaphoreFdInfoKHR': STRUCTURE_TYPE_IMPORT_SEMAPHORE_FD_INFO_KHR,
+    'SemaphoreGetFdInfoKHR': STRUCTURE_TYPE_SEMAPHORE_GET_FD_INFO_KHR,
+    'PhysicalDevicePushDescriptorPropertiesKHR': STRUCTURE_TYPE_PHYSICAL_DEVICE_PUSH_DESCRIPTOR_PROPERTIES_KHR,
+    'PresentRegionsKHR': STRUCTURE_TYPE_PRESENT_REGIONS_KHR,
+    'AttachmentDescription2KHR': STRUCTURE_TYPE_ATTACHMENT_DESCRIPTION_2_KHR,
+    'AttachmentReference2KHR': STRUCTURE_TYPE_ATTACHMENT_REFERENCE_2_KHR,
+    'SubpassDescription2KHR': STRUCTURE_TYPE_SUBPASS_DESCRIPTION_2_KHR,
+    'SubpassDependency2KHR': STRUCTURE_TYPE_SUBPASS_DEPENDENCY_2_KHR,
+    'RenderPassCreateInfo2KHR': STRUCTURE_TYPE_RENDER_PASS_CREATE_INFO_2_KHR,
+    'SubpassBeginInfoKHR': STRUCTURE_TYPE_SUBPASS_BEGIN_INFO_KHR,
+    'SubpassEndInfoKHR': STRUCTURE_TYPE_SUBPASS_END_INFO_KHR,
+    'SharedPresentSurfaceCapabilitiesKHR': STRUCTURE_TYPE_SHARED_PRESENT_SURFACE_CAPABILITIES_KHR,
+    'ImportFenceFdInfoKHR': STRUCTURE_TYPE_IMPORT_FENCE_FD_INFO_KHR,
+    'FenceGetFdInfoKHR': STRUCTURE_TYPE_FENCE_GET_FD_INFO_KHR,
+    'PhysicalDeviceSurfaceInfo2KHR': STRUCTURE_TYPE_PHYSICAL_DEVICE_SURFACE_INFO_2_KHR,
+    'SurfaceCapabilities2KHR': STRUCTURE_TYPE_SURFACE_CAPABILITIES_2_KHR,
+    'SurfaceFormat2KHR': STRUCTURE_TYPE_SURFACE_FORMAT_2_KHR,
+    'DisplayProperties2KHR': STRUCTURE_TYPE_DISPLAY_PROPERTIES_2_KHR,
+    'DisplayPlaneProperties2KHR': STRUCTURE_TYPE_DISPLAY_PLANE_PROPERTIES_2_KHR,
+    'DisplayModeProperties2KHR': STRUCTURE_TYPE_DISPLAY_MODE_PROPERTIES_2_KHR,
+    'DisplayPlaneInfo2KHR': STRUCTURE_TYPE_DISPLAY_PLANE_INFO_2_KHR,
+    'DisplayPlaneCapabilities2KHR': STRUCTURE_TYPE_DISPLAY_PLANE_CAPABILITIES_2_KHR,
+    'ImageFormatListCreateInfoKHR': STRUCTURE_TYPE_IMAGE_FORMAT_LIST_CREATE_INFO_KHR,
+    'PhysicalDevice8BitStorageFeaturesKHR': STRUCTURE_TYPE_PHYSICAL_DEVICE_8BIT_STORAGE_FEATURES_KHR,
+    'PhysicalDeviceShaderAtomicInt64FeaturesKHR': STRUCTURE_TYPE_PHYSICAL_DEVICE_SHADER_ATOMIC_INT64_FEATURES_KHR,
+    'PhysicalDeviceDriverPropertiesKHR': STRUCTURE_TYPE_PHYSICAL_DEVICE_DRIVER_PROPERTIES_KHR,
+    'PhysicalDeviceVulkanMemoryModelFeaturesKHR': STRUCTURE_TYPE_PHYSICAL_DEVICE_VULKAN_MEMORY_MODEL_FEATURES_KHR,
+    'DebugReportCallbackCreateInfoEXT': STRUCTURE_TYPE_DEBUG_REPORT_CALLBACK_CREATE_INFO_EXT,
+    'PipelineRasterizationStateRasterizationOrderAMD': STRUCTURE_TYPE_PIPELINE_RASTERIZATION_STATE_RASTERIZATION_ORDER_AMD,
+    'DebugMarkerObjectNameInfoEXT': STRUCTURE_TYPE_DEBUG_MARKER_OBJECT_NAME_INFO_EXT,
+    'DebugMarkerObjectTagInfoEXT': STRUCTURE_TYPE_DEBUG_MARKER_OBJECT_TAG_INFO_EXT,
+    'DebugMarkerMarkerInfoEXT': STRUCTURE_TYPE_DEBUG_MARKER_MARKER_INFO_EXT,
+    'DedicatedAllocationImageCreateInfoNV': STRUCTURE_TYPE_DEDICATED_ALLOCATION_IMAGE_CREATE_INFO_NV,
+    'DedicatedAllocationBufferCreateInfoNV': STRUCTURE_TYPE_DEDICATED_ALLOCATION_BUFFER_CREATE_INFO_NV,
+    'DedicatedAllocationMemoryAllocateInfoNV': STRUCTURE_TYPE_DEDICATED_ALLOCATION_MEMORY_ALLOCATE_INFO_NV,
+    'PhysicalDeviceTransformFeedbackFeaturesEXT': STRUCTURE_TYPE_PHYSICAL_DEVICE_TRANSFORM_FEEDBACK_FEATURES_EXT,
+    'PhysicalDeviceTransformFeedbackPropertiesEXT': STRUCTURE_TYPE_PHYSICAL_DEVICE_TRANSFORM_FEEDBACK_PROPERTIES_EXT,
+    'PipelineRasterizationStateStreamCreateInfoEXT': STRUCTURE_TYPE_PIPELINE_RASTERIZATION_STATE_STREAM_CREATE_INFO_EXT,
+    'TextureLODGatherFormatPropertiesAMD': STRUCTURE_TYPE_TEXTURE_LOD_GATHER_FORMAT_PROPERTIES_AMD,
+    'PhysicalDeviceCornerSampledImageFeaturesNV': STRUCTURE_TYPE_PHYSICAL_DEVICE_CORNER_SAMPLED_IMAGE_FEATURES_NV,
+    'ExternalMemoryImageCreateInfoNV': STRUCTURE_TYPE_EXTERNAL_MEMORY_IMAGE_CREATE_INFO_NV,
+    'ExportMemoryAllocateInfoNV': STRUCTURE_TYPE_EXPORT_MEMORY_ALLOCATE_INFO_NV,
+    'ValidationFlagsEXT': STRUCTURE_TYPE_VALIDATION_FLAGS_EXT,
+    'ImageViewASTCDecodeModeEXT': STRUCTURE_TYPE_IMAGE_VIEW_ASTC_DECODE_MODE_EXT,
+    'PhysicalDeviceASTCDecodeFeaturesEXT': STRUCTURE_TYPE_PHYSICAL_DEVICE_ASTC_DECODE_FEATURES_EXT,
+    'ConditionalRenderingBeginInfoEXT': STRUCTURE_TYPE_CONDITIONAL_RENDERING_BEGIN_INFO_EXT,
+    'PhysicalDeviceConditionalRenderingFeaturesEXT': STRUCTURE_TYPE_PHYSICAL_DEVICE_CONDITIONAL_RENDERING_FEATURES_EXT,
+    'CommandBufferInheritanceConditionalRenderingInfoEXT': STRUCTURE_TYPE_COMMAND_BUFFER_INHERITANCE_CONDITIONAL_RENDERING_INFO_EXT,
+    'DeviceGeneratedCommandsFeaturesNVX': STRUCTURE_TYPE_DEVICE_GENERATED_COMMANDS_FEATURES_NVX,
+    'DeviceGeneratedCommandsLimitsNVX': STRUCTURE_TYPE_DEVICE_GENERATED_COMMANDS_LIMITS_NVX,
+    'IndirectCommandsLayoutCreateInfoNVX': STRUCTURE_TYPE_INDIRECT_COMMANDS_LAYOUT_CREATE_INFO_NVX,
+    'CmdProcessCommandsInfoNVX': STRUCTURE_TYPE_CMD_PROCESS_COMMANDS_INFO_NVX,
+    'CmdReserveSpaceForCommandsInfoNVX': STRUCTURE_TYPE_CMD_RESERVE_SPACE_FOR_COMMANDS_INFO_NVX,
+    'ObjectTableCreateInfoNVX': STRUCTURE_TYPE_OBJECT_TABLE_CREATE_INFO_NVX,
+    'PipelineViewportWScalingStateCreateInfoNV': STRUCTURE_TYPE_PIPELINE_VIEWPORT_W_SCALING_STATE_CREATE_INFO_NV,
+    'SurfaceCapabilities2EXT': STRUCTURE_TYPE_SURFACE_CAPABILITIES2_EXT,
+    'DisplayPowerInfoEXT': STRUCTURE_TYPE_DISPLAY_POWER_INFO_EXT,
+    'DeviceEventInfoEXT': STRUCTURE_TYPE_DEVICE_EVENT_INFO_EXT,
+    'DisplayEventInfoEXT': STRUCTURE_TYPE_DISPLAY_EVENT_INFO_EXT,
+    'SwapchainCounterCreateInfoEXT': STRUCTURE_TYPE_SWAPCHAIN_COUNTER_CREATE_INFO_EXT,
+    'PresentTimesInfoGOOGLE': STRUCTURE_TYPE_PRESENT_TIMES_INFO_GOOGLE,
+    'PhysicalDeviceMultiviewPerViewAttributesPropertiesNVX': STRUCTURE_TYPE_PHYSICAL_DEVICE_MULTIVIEW_PER_VIEW_ATTRIBUTES_PROPERTIES_NVX,
+    'PipelineViewportSwizzleStateCreateInfoNV': STRUCTURE_TYPE_PIPELINE_VIEWPORT_SWIZZLE_STATE_CREATE_INFO_NV,
+    'PhysicalDeviceDiscardRectanglePropertiesEXT': STRUCTURE_TYPE_PHYSICAL_DEVICE_DISCARD_RECTANGLE_PROPERTIES_EXT,
+    'PipelineDiscardRectangleStateCreateInfoEXT': STRUCTURE_TYPE_PIPELINE_DISCARD_RECTANGLE_STATE_CREATE_INFO_EXT,
+    'PhysicalDeviceConservativeRasterizationPropertiesEXT': STRUCTURE_TYPE_PHYSICAL_DEVICE_CONSERVATIVE_RASTERIZATION_PROPERTIES_EXT,
+    'PipelineRasterizationConservativeStateCreateInfoEXT': STRUCTURE_TYPE_PIPELINE_RASTERIZATION_CONSERVATIVE_STATE_CREATE_INFO_EXT,
+    'HdrMetadataEXT': STRUCTURE_TYPE_HDR_METADATA_EXT,
+    'DebugUtilsObjectNameInfoEXT': STRUCTURE_TYPE_DEBUG_UTILS_OBJECT_NAME_INFO_EXT,
+    'DebugUtilsObjectTagInfoEXT': STRUCTURE_TYPE_DEBUG_UTILS_OBJECT_TAG_INFO_EXT,
+    'DebugUtilsLabelEXT': STRUCTURE_TYPE_DEBUG_UTILS_LABEL_EXT,
+    'DebugUtilsMessengerCallbackDataEXT': STRUCTURE_TYPE_DEBUG_UTILS_MESSENGER_CALLBACK_DATA_EXT,
+    'DebugUtilsMessengerCreateInfoEXT': STRUCTURE_TYPE_DEBUG_UTILS_MESSENGER_CREATE_INFO_EXT,
+    'SamplerReductionModeCreateInfoEXT': STRUCTURE_TYPE_SAMPLER_REDUCTION_MODE_CREATE_INFO_EXT,
+    'PhysicalDeviceSamplerFilterMinmaxPropertiesEXT': STRUCTURE_TYPE_PHYSICAL_DEVICE_SAMPLER_FILTER_MINMAX_PROPERTIES_EXT,
+    'PhysicalDeviceInlineUniformBlockFeaturesEXT': STRUCTURE_TYPE_PHYSICAL_DEVICE_INLINE_UNIFORM_BLOCK_FEATURES_EXT,
+    'PhysicalDeviceInlineUniformBlockPropertiesEXT': STRUCTURE_TYPE_PHYSICAL_DEVICE_INLINE_UNIFORM_BLOCK_PROPERTIES_EXT,
+    'WriteDescriptorSetInlineUniformBlockEXT': STRUCTURE_TYPE_WRITE_DESCRIPTOR_SET_INLINE_UNIFORM_BLOCK_EXT,
+    'DescriptorPoolInlineUniformBlockCreateInfoEXT': STRUCTURE_TYPE_DESCRIPTOR_POOL_INLINE_UNIFORM_BLOCK_CREATE_INFO_EXT,
+    'SampleLocationsInfoEXT': STRUCTURE_TYPE_SAMPLE_LOCATIONS_INFO_EXT,
+    'RenderPassSampleLocationsBeginInfoEXT': STRUCTURE_TYPE_RENDER_PASS_SAMPLE_LOCATIONS_BEGIN_INFO_EXT,
+    'PipelineSampleLocationsStateCreateInfoEXT': STRUCTURE_TYPE_PIPELINE_SAMPLE_LOCATIONS_STATE_CREATE_INFO_EXT,
+    'PhysicalDeviceSampleLocationsPropertiesEXT': STRUCTURE_TYPE_PHYSICAL_DEVICE_SAMPLE_LOCATIONS_PROPERTIES_EXT,
+    'MultisamplePropertiesEXT': STRUCTURE_TYPE_MULTISAMPLE_PROPERTIES_EXT,
+    'PhysicalDeviceBlendOperationAdvancedFeaturesEXT': STRUCTURE_TYPE_PHYSICAL_DEVICE_BLEND_OPERATION_ADVANCED_FEATURES_EXT,
+    'PhysicalDeviceBlendOperationAdvancedPropertiesEXT': STRUCTURE_TYPE_PHYSICAL_DEVICE_BLEND_OPERATION_ADVANCED_PROPERTIES_EXT,
+    'PipelineColorBlendAdvancedStateCreateInfoEXT': STRUCTURE_TYPE_PIPELINE_COLOR_BLEND_ADVANCED_STATE_CREATE_INFO_EXT,
+    'PipelineCoverageToColorStateCreateInfoNV': STRUCTURE_TYPE_PIPELINE_COVERAGE_TO_COLOR_STATE_CREATE_INFO_NV,
+    'PipelineCoverageModulationStateCreateInfoNV': STRUCTURE_TYPE_PIPELINE_COVERAGE_MODULATION_STATE_CREATE_INFO_NV,
+    'DrmFormatModifierPropertiesListEXT': STRUCTURE_TYPE_DRM_FORMAT_MODIFIER_PROPERTIES_LIST_EXT,
+    'PhysicalDeviceImageDrmFormatModifierInfoEXT': STRUCTURE_TYPE_PHYSICAL_DEVICE_IMAGE_DRM_FORMAT_MODIFIER_INFO_EXT,
+    'ImageDrmFormatModifierListCreateInfoEXT': STRUCTURE_TYPE_IMAGE_DRM_FORMAT_MODIFIER_LIST_CREATE_INFO_EXT,
+    'ImageDrmFormatModifierExplicitCreateInfoEXT': STRUCTURE_TYPE_IMAGE_DRM_FORMAT_MODIFIER_EXPLICIT_CREATE_INFO_EXT,
+    'ImageDrmFormatModifierPropertiesEXT': STRUCTURE_TYPE_IMAGE_DRM_FORMAT_MODIFIER_PROPERTIES_EXT,
+    'ValidationCacheCreateInfoEXT': STRUCTURE_TYPE_VALIDATION_CACHE_CREATE_INFO_EXT,
+    'ShaderModuleValidationCacheCreateInfoEXT': STRUCTURE_TYPE_SHADER_MODULE_VALIDATION_CACHE_CREATE_INFO_EXT,
+    'DescriptorSetLayoutBindingFlagsCreateInfoEXT': STRUCTURE_TYPE_DESCRIPTOR_SET_LAYOUT_BINDING_FLAGS_CREATE_INFO_EXT,
+    'PhysicalDeviceDescriptorIndexingFeaturesEXT': STRUCTURE_TYPE_PHYSICAL_DEVICE_DESCRIPTOR_INDEXING_FEATURES_EXT,
+    'PhysicalDeviceDescriptorIndexingPropertiesEXT': STRUCTURE_TYPE_PHYSICAL_DEVICE_DESCRIPTOR_INDEXING_PROPERTIES_EXT,
+    'DescriptorSetVariableDescriptorCountAllocateInfoEXT': STRUCTURE_TYPE_DESCRIPTOR_SET_VARIABLE_DESCRIPTOR_COUNT_ALLOCATE_INFO_EXT,
+    'DescriptorSetVariableDescriptorCountLayoutSupportEXT': STRUCTURE_TYPE_DESCRIPTOR_SET_VARIABLE_DESCRIPTOR_COUNT_LAYOUT_SUPPORT_EXT,
+    'PipelineViewportShadingRateImageStateCreateInfoNV': STRUCTURE_TYPE_PIPELINE_VIEWPORT_SHADING_RATE_IMAGE_STATE_CREATE_INFO_NV,
+    'PhysicalDeviceShadingRateImageFeaturesNV': STRUCTURE_TYPE_PHYSICAL_DEVICE_SHADING_RATE_IMAGE_FEATURES_NV,
+    'PhysicalDeviceShadingRateImagePropertiesNV': STRUCTURE_TYPE_PHYSICAL_DEVICE_SHADING_RATE_IMAGE_PROPERTIES_NV,
+    'PipelineViewportCoarseSampleOrderStateCreateInfoNV': STRUCTURE_TYPE_PIPELINE_VIEWPORT_COARSE_SAMPLE_ORDER_STATE_CREATE_INFO_NV,
+    'RayTracingShaderGroupCreateInfoNV': STRUCTURE_TYPE_RAY_TRACING_SHADER_GROUP_CREATE_INFO_NV,
+    'RayTracingPipelineCreateInfoNV': STRUCTURE_TYPE_RAY_TRACING_PIPELINE_CREATE_INFO_NV,
+    'GeometryTrianglesNV': STRUCTURE_TYPE_GEOMETRY_TRIANGLES_NV,
+    'GeometryAABBNV': STRUCTURE_TYPE_GEOMETRY_AABB_NV,
+    'GeometryNV': STRUCTURE_TYPE_GEOMETRY_NV,
+    'AccelerationStructureInfoNV': STRUCTURE_TYPE_ACCELERATION_STRUCTURE_INFO_NV,
+    'AccelerationStructureCreateInfoNV': STRUCTURE_TYPE_ACCELERATION_STRUCTURE_CREATE_INFO_NV,
+    'BindAccelerationStructureMemoryInfoNV': STRUCTURE_TYPE_BIND_ACCELERATION_STRUCTURE_MEMORY_INFO_NV,
+    'WriteDescriptorSetAccelerationStructureNV': STRUCTURE_TYPE_WRITE_DESCRIPTOR_SET_ACCELERATION_STRUCTURE_NV,
+    'AccelerationStructureMemoryRequirementsInfoNV': STRUCTURE_TYPE_ACCELERATION_STRUCTURE_MEMORY_REQUIREMENTS_INFO_NV,
+    'PhysicalDeviceRayTracingPropertiesNV': STRUCTURE_TYPE_PHYSICAL_DEVICE_RAY_TRACING_PROPERTIES_NV,
+    'PhysicalDeviceRepresentativeFragmentTestFeaturesNV': STRUCTURE_TYPE_PHYSICAL_DEVICE_REPRESENTATIVE_FRAGMENT_TEST_FEATURES_NV,
+    'PipelineRepresentativeFragmentTestStateCreateInfoNV': STRUCTURE_TYPE_PIPELINE_REPRESENTATIVE_FRAGMENT_TEST_STATE_CREATE_INFO_NV,
+    'DeviceQueueGlobalPriorityCreateInfoEXT': STRUCTURE_TYPE_DEVICE_QUEUE_GLOBAL_PRIORITY_CREATE_INFO_EXT,
+    'ImportMemoryHostPointerInfoEXT': STRUCTURE_TYPE_IMPORT_MEMORY_HOST_POINTER_INFO_EXT,
+    'MemoryHostPointerPropertiesEXT': STRUCTURE_TYPE_MEMORY_HOST_POINTER_PROPERTIES_EXT,
+    'PhysicalDeviceExternalMemoryHostPropertiesEXT': STRUCTURE_TYPE_PHYSICAL_DEVICE_EXTERNAL_MEMORY_HOST_PROPERTIES_EXT,
+    'CalibratedTimestampInfoEXT': STRUCTURE_TYPE_CALIBRATED_TIMESTAMP_INFO_EXT,
+    'PhysicalDeviceShaderCorePropertiesAMD': STRUCTURE_TYPE_PHYSICAL_DEVICE_SHADER_CORE_PROPERTIES_AMD,
+    'DeviceMemoryOverallocationCreateInfoAMD': STRUCTURE_TYPE_DEVICE_MEMORY_OVERALLOCATION_CREATE_INFO_AMD,
+    'PhysicalDeviceVertexAttributeDivisorPropertiesEXT': STRUCTURE_TYPE_PHYSICAL_DEVICE_VERTEX_ATTRIBUTE_DIVISOR_PROPERTIES_EXT,
+    'PipelineVertexInputDivisorStateCreateInfoEXT': STRUCTURE_TYPE_PIPELINE_VERTEX_INPUT_DIVISOR_STATE_CREATE_INFO_EXT,
+    'PhysicalDeviceVertexAttributeDivisorFeaturesEXT': STRUCTURE_TYPE_PHYSICAL_DEVICE_VERTEX_ATTRIBUTE_DIVISOR_FEATURES_EXT,
+    'PhysicalDeviceComputeShaderDerivativesFeaturesNV': STRUCTURE_TYPE_PHYSICAL_DEVICE_COMPUTE_SHADER_DERIVATIVES_FEATURES_NV,
+    'PhysicalDeviceMeshShaderFeaturesNV': STRUCTURE_TYPE_PHYSICAL_DEVICE_MESH_SHADER_FEATURES_NV,
+    'PhysicalDeviceMeshShaderPropertiesNV': STRUCTURE_TYPE_PHYSICAL_DEVICE_MESH_SHADER_PROPERTIES_NV,
+    'PhysicalDeviceFragmentShaderBarycentricFeaturesNV': STRUCTURE_TYPE_PHYSICAL_DEVICE_FRAGMENT_SHADER_BARYCENTRIC_FEATURES_NV,
+    'PhysicalDeviceShaderImageFootprintFeaturesNV': STRUCTURE_TYPE_PHYSICAL_DEVICE_SHADER_IMAGE_FOOTPRINT_FEATURES_NV,
+    'PipelineViewportExclusiveScissorStateCreateInfoNV': STRUCTURE_TYPE_PIPELINE_VIEWPORT_EXCLUSIVE_SCISSOR_STATE_CREATE_INFO_NV,
+    'PhysicalDeviceExclusiveScissorFeaturesNV': STRUCTURE_TYPE_PHYSICAL_DEVICE_EXCLUSIVE_SCISSOR_FEATURES_NV,
+    'QueueFamilyCheckpointPropertiesNV': STRUCTURE_TYPE_QUEUE_FAMILY_CHECKPOINT_PROPERTIES_NV,
+    'CheckpointDataNV': STRUCTURE_TYPE_CHECKPOINT_DATA_NV,
+    'PhysicalDevicePCIBusInfoPropertiesEXT': STRUCTURE_TYPE_PHYSICAL_DEVICE_PCI_BUS_INFO_PROPERTIES_EXT,
+    'Win32SurfaceCreateInfoKHR': STRUCTURE_TYPE_WIN32_SURFACE_CREATE_INFO_KHR,
+    'ImportMemoryWin32HandleInfoKHR': STRUCTURE_TYPE_IMPORT_MEMORY_WIN32_HANDLE_INFO_KHR,
+    'ExportMemoryWin32HandleInfoKHR': STRUCTURE_TYPE_EXPORT_MEMORY_WIN32_HANDLE_INFO_KHR,
+    'MemoryWin32HandlePropertiesKHR': STRUCTURE_TYPE_MEMORY_WIN32_HANDLE_PROPERTIES_KHR,
+    'MemoryGetWin32HandleInfoKHR': STRUCTURE_TYPE_MEMORY_GET_WIN32_HANDLE_INFO_KHR,
+    'Win32KeyedMutexAcquireReleaseInfoKHR': STRUCTURE_TYPE_WIN32_KEYED_MUTEX_ACQUIRE_RELEASE_INFO_KHR,
+    'ImportSemaphoreWin32HandleInfoKHR': STRUCTURE_TYPE_IMPORT_SEMAPHORE_WIN32_HANDLE_INFO_KHR,
+    'ExportSemaphoreWin32HandleInfoKHR': STRUCTURE_TYPE_EXPORT_SEMAPHORE_WIN32_HANDLE_INFO_KHR,
+    'D3D12FenceSubmitInfoKHR': STRUCTURE_TYPE_D3D12_FENCE_SUBMIT_INFO_KHR,
+    'SemaphoreGetWin32HandleInfoKHR': STRUCTURE_TYPE_SEMAPHORE_GET_WIN32_HANDLE_INFO_KHR,
+    'ImportFenceWin32HandleInfoKHR': STRUCTURE_TYPE_IMPORT_FENCE_WIN32_HANDLE_INFO_KHR,
+    'ExportFenceWin32HandleInfoKHR': STRUCTURE_TYPE_EXPORT_FENCE_WIN32_HANDLE_INFO_KHR,
+    'FenceGetWin32HandleInfoKHR': STRUCTURE_TYPE_FENCE_GET_WIN32_HANDLE_INFO_KHR,
+    'ImportMemoryWin32HandleInfoNV': STRUCTURE_TYPE_IMPORT_MEMORY_WIN32_HANDLE_INFO_NV,
+    'ExportMemoryWin32HandleInfoNV': STRUCTURE_TYPE_EXPORT_MEMORY_WIN32_HANDLE_INFO_NV,
+    'Win32KeyedMutexAcquireReleaseInfoNV': STRUCTURE_TYPE_WIN32_KEYED_MUTEX_ACQUIRE_RELEASE_INFO_NV,
+    'XcbSurfaceCreateInfoKHR': STRUCTURE_TYPE_XCB_SURFACE_CREATE_INFO_KHR,
+}
+
+
+# Data members of the structures that accept buffers
+buffer_members = {
+    'ShaderModuleCreateInfo': ('code',),
+    'PipelineCacheCreateInfo': ('initial_data',),
+    'SpecializationInfo': ('data',),
+    'DebugMarkerObjectTagInfoEXT': ('tag',),
+    'DebugUtilsObjectTagInfoEXT': ('tag',),
+    'WriteDescriptorSetInlineUniformBlockEXT': ('data',),
+    'ValidationCacheCreateInfoEXT': ('initial_data',),
+}
+
+
+# Length member of the array members of the structures. Lengths named `*_size` are in bytes
+array_members = {
+    'InstanceCreateInfo': {'enabled_layer_names': 'enabled_layer_count', 'enabled_extension_names': 'enabled_extension_count'},
+    'DeviceQueueCreateInfo': {'queue_priorities': 'queue_count'},
+    'DeviceCreateInfo': {'queue_create_infos': 'queue_create_info_count', 'enabled_layer_names': 'enabled_layer_count', 'enabled_extension_names': 'enabled_extension_count'},
+    'SubmitInfo': {'wait_semaphores': 'wait_semaphore_count', 'wait_dst_stage_mask': 'wait_semaphore_count', 'command_buffers': 'command_buffer_count', 'signal_semaphores': 'signal_semaphore_count'},
+    'SparseBufferMemoryBindInfo': {'binds': 'bind_count'},
+    'SparseImageOpaqueMemoryBindInfo': {'binds': 'bind_count'},
+    'SparseImageMemoryBindInfo': {'binds': 'bind_count'},
+    'BindSparseInfo': {'wait_semaphores': 'wait_semaphore_count', 'buffer_binds': 'buffer_bind_count', 'image_opaque_binds': 'image_opaque_bind_count', 'image_binds': 'image_bind_count', 'signal_semaphores': 'signal_semaphore_count'},
+    'BufferCreateInfo': {'queue_family_indices': 'queue_family_index_count'},
+    'ImageCreateInfo': {'queue_family_indices': 'queue_family_index_count'},
+    'ShaderModuleCreateInfo': {'code': 'code_size'},
+    'PipelineCacheCreateInfo': {'initial_data': 'initial_data_size'},
+    'SpecializationInfo': {'map_entries': 'map_entry_count', 'data': 'data_size'},
+    'PipelineVertexInputStateCreateInfo': {'vertex_binding_descriptions': 'vertex_binding_description_count', 'vertex_attribute_descriptions': 'vertex_attribute_description_count'},
+    'PipelineViewportStateCreateInfo': {'viewports': 'viewport_count', 'scissors': 'scissor_count'},
+    'PipelineColorBlendStateCreateInfo': {'attachments': 'attachment_count'},
+    'PipelineDynamicStateCreateInfo': {'dynamic_states': 'dynamic_state_count'},
+    'GraphicsPipelineCreateInfo': {'stages': 'stage_count'},
+    'PipelineLayoutCreateInfo': {'set_layouts': 'set_layout_count', 'push_constant_ranges': 'push_constant_range_count'},
+    'DescriptorSetLayoutBinding': {'immutable_samplers': 'descriptor_count'},
+    'DescriptorSetLayoutCreateInfo': {'bindings': 'binding_count'},
+    'DescriptorPoolCreateInfo': {'pool_sizes': 'pool_size_count'},
+    'DescriptorSetAllocateInfo': {'set_layouts': 'descriptor_set_count'},
+    'WriteDescriptorSet': {'image_info': 'descriptor_count', 'buffer_info': 'descriptor_count', 'texel_buffer_view': 'descriptor_count'},
+    'FramebufferCreateInfo': {'attachments': 'attachment_count'},
+    'SubpassDescription': {'input_attachments': 'input_attachment_count', 'color_attachments': 'color_attachment_count', 'resolve_attachments': 'color_attachment_count', 'preserve_attachments': 'preserve_attachment_count'},
+    'RenderPassCreateInfo': {'attachments': 'attachment_count', 'subpasses': 'subpass_count', 'dependencies': 'dependency_count'},
+    'RenderPassBeginInfo': {'clear_values': 'clear_value_count'},
+    'DeviceGroupRenderPassBeginInfo': {'device_render_areas': 'device_render_area_count'},
+    'DeviceGroupSubmitInfo': {'wait_semaphore_device_indices': 'wait_semaphore_count', 'command_buffer_device_masks': 'command_buffer_count', 'signal_semaphore_device_indices': 'signal_semaphore_count'},
+    'BindBufferMemoryDeviceGroupInfo': {'device_indices': 'device_index_count'},
+    'BindImageMemoryDeviceGroupInfo': {'device_indices': 'device_index_count', 'split_instance_bind_regions': 'split_instance_bind_region_count'},
+    'DeviceGroupDeviceCreateInfo': {'physical_devices': 'physical_device_count'},
+    'RenderPassInputAttachmentAspectCreateInfo': {'aspect_references': 'aspect_reference_count'},
+    'RenderPassMultiviewCreateInfo': {'view_masks': 'subpass_count', 'view_offsets': 'dependency_count', 'correlation_masks': 'correlation_mask_count'},
+    'DescriptorUpdateTemplateCreateInfo': {'descriptor_update_entries': 'descriptor_update_entry_count'},
+    'SwapchainCreateInfoKHR': {'queue_family_indices': 'queue_family_index_count'},
+    'PresentInfoKHR': {'wait_semaphores': 'wait_semaphore_count', 'swapchains': 'swapchain_count', 'image_indices': 'swapchain_count', 'results': 'swapchain_count'},
+    'DeviceGroupPresentInfoKHR': {'device_masks': 'swapchain_count'},
+    'PresentRegionKHR': {'rectangles': 'rectangle_count'},
+    'PresentRegionsKHR': {'regions': 'swapchain_count'},
+    'SubpassDescription2KHR': {'input_attachments': 'input_attachment_count', 'color_attachments': 'color_attachment_count', 'resolve_attachments': 'color_attachment_count', 'preserve_attachments': 'preserve_attachment_count'},
+    'RenderPassCreateInfo2KHR': {'attachments': 'attachment_count', 'subpasses': 'subpass_count', 'dependencies': 'dependency_count', 'correlated_view_masks': 'correlated_view_mask_count'},
+    'ImageFormatListCreateInfoKHR': {'view_formats': 'view_format_count'},
+    'DebugMarkerObjectTagInfoEXT': {'tag': 'tag_size'},
+    'ValidationFlagsEXT': {'disabled_validation_checks': 'disabled_validation_check_count'},
+    'IndirectCommandsLayoutCreateInfoNVX': {'tokens': 'token_count'},
+    'CmdProcessCommandsInfoNVX': {'indirect_commands_tokens': 'indirect_commands_token_count'},
+    'ObjectTableCreateInfoNVX': {'object_entry_types': 'object_count'},
+    'PipelineViewportWScalingStateCreateInfoNV': {'viewport_WScalings': 'viewport_count'},
+    'PresentTimesInfoGOOGLE': {'times': 'swapchain_count'},
+    'PipelineViewportSwizzleStateCreateInfoNV': {'viewport_swizzles': 'viewport_count'},
+    'PipelineDiscardRectangleStateCreateInfoEXT': {'discard_rectangles': 'discard_rectangle_count'},
+    'DebugUtilsObjectTagInfoEXT': {'tag': 'tag_size'},
+    'DebugUtilsMessengerCallbackDataEXT': {'queue_labels': 'queue_label_count', 'cmd_buf_labels': 'cmd_buf_label_count', 'objects': 'object_count'},
+    'WriteDescriptorSetInlineUniformBlockEXT': {'data': 'data_size'},
+    'SampleLocationsInfoEXT': {'sample_locations': 'sample_locations_count'},
+    'RenderPassSampleLocationsBeginInfoEXT': {'attachment_initial_sample_locations': 'attachment_initial_sample_locations_count', 'post_subpass_sample_locations': 'post_subpass_sample_locations_count'},
+    'PipelineCoverageModulationStateCreateInfoNV': {'coverage_modulation_table': 'coverage_modulation_table_count'},
+    'DrmFormatModifierPropertiesListEXT': {'drm_format_modifier_properties': 'drm_format_modifier_count'},
+    'PhysicalDeviceImageDrmFormatModifierInfoEXT': {'queue_family_indices': 'queue_family_index_count'},
+    'ImageDrmFormatModifierListCreateInfoEXT': {'drm_format_modifiers': 'drm_format_modifier_count'},
+    'ImageDrmFormatModifierExplicitCreateInfoEXT': {'plane_layouts': 'drm_format_modifier_plane_count'},
+    'ValidationCacheCreateInfoEXT': {'initial_data': 'initial_data_size'},
+    'DescriptorSetLayoutBindingFlagsCreateInfoEXT': {'binding_flags': 'binding_count'},
+    'DescriptorSetVariableDescriptorCountAllocateInfoEXT': {'descriptor_counts': 'descriptor_set_count'},
+    'ShadingRatePaletteNV': {'shading_rate_palette_entries': 'shading_rate_palette_entry_count'},
+    'PipelineViewportShadingRateImageStateCreateInfoNV': {'shading_rate_palettes': 'viewport_count'},
+    'CoarseSampleOrderCustomNV': {'sample_locations': 'sample_location_count'},
+    'PipelineViewportCoarseSampleOrderStateCreateInfoNV': {'custom_sample_orders': 'custom_sample_order_count'},
+    'RayTracingPipelineCreateInfoNV': {'stages': 'stage_count', 'groups': 'group_count'},
+    'AccelerationStructureInfoNV': {'geometries': 'geometry_count'},
+    'BindAccelerationStructureMemoryInfoNV': {'device_indices': 'device_index_count'},
+    'WriteDescriptorSetAccelerationStructureNV': {'acceleration_structures': 'acceleration_structure_count'},
+    'PipelineVertexInputDivisorStateCreateInfoEXT': {'vertex_binding_divisors': 'vertex_binding_divisor_count'},
+    'PipelineViewportExclusiveScissorStateCreateInfoNV': {'exclusive_scissors': 'exclusive_scissor_count'},
+    'Win32KeyedMutexAcquireReleaseInfoKHR': {'acquire_syncs': 'acquire_count', 'release_syncs': 'release_count'},
+    'D3D12FenceSubmitInfoKHR': {'wait_semaphore_values': 'wait_semaphore_values_count', 'signal_semaphore_values': 'signal_semaphore_values_count'},
+    'Win32KeyedMutexAcquireReleaseInfoNV': {'acquire_syncs': 'acquire_count', 'release_syncs': 'release_count'},
+}
+
+# Members of the structures holding handles (or pointing to arrays of handles)
+handle_members = {
+    'SubmitInfo': ('wait_semaphores', 'command_buffers', 'signal_semaphores'),
+    'MappedMemoryRange': ('memory',),
+    'SparseMemoryBind': ('memory',),
+    'SparseBufferMemoryBindInfo': ('buffer',),
+    'SparseImageOpaqueMemoryBindInfo': ('image',),
+    'SparseImageMemoryBind': ('memory',),
+    'SparseImageMemoryBindInfo': ('image',),
+    'BindSparseInfo': ('wait_semaphores', 'signal_semaphores'),
+    'BufferViewCreateInfo': ('buffer',),
+    'ImageViewCreateInfo': ('image',),
+    'PipelineShaderStageCreateInfo': ('module',),
+    'GraphicsPipelineCreateInfo': ('layout', 'render_pass', 'base_pipeline_handle'),
+    'ComputePipelineCreateInfo': ('layout', 'base_pipeline_handle'),
+    'PipelineLayoutCreateInfo': ('set_layouts',),
+    'DescriptorSetLayoutBinding': ('immutable_samplers',),
+    'DescriptorSetAllocateInfo': ('descriptor_pool', 'set_layouts'),
+    'DescriptorImageInfo': ('sampler', 'image_view'),
+    'DescriptorBufferInfo': ('buffer',),
+    'WriteDescriptorSet': ('dst_set', 'texel_buffer_view'),
+    'CopyDescriptorSet': ('src_set', 'dst_set'),
+    'FramebufferCreateInfo': ('render_pass', 'attachments'),
+    'CommandBufferAllocateInfo': ('command_pool',),
+    'CommandBufferInheritanceInfo': ('render_pass', 'framebuffer'),
+    'BufferMemoryBarrier': ('buffer',),
+    'ImageMemoryBarrier': ('image',),
+    'RenderPassBeginInfo': ('render_pass', 'framebuffer'),
+    'BindBufferMemoryInfo': ('buffer', 'memory'),
+    'BindImageMemoryInfo': ('image', 'memory'),
+    'MemoryDedicatedAllocateInfo': ('image', 'buffer'),
+    'DeviceGroupDeviceCreateInfo': ('physical_devices',),
+    'BufferMemoryRequirementsInfo2': ('buffer',),
+    'ImageMemoryRequirementsInfo2': ('image',),
+    'ImageSparseMemoryRequirementsInfo2': ('image',),
+    'SamplerYcbcrConversionInfo': ('conversion',),
+    'DescriptorUpdateTemplateCreateInfo': ('descriptor_set_layout', 'pipeline_layout'),
+    'SwapchainCreateInfoKHR': ('surface', 'old_swapchain'),
+    'PresentInfoKHR': ('wait_semaphores', 'swapchains'),
+    'ImageSwapchainCreateInfoKHR': ('swapchain',),
+    'BindImageMemorySwapchainInfoKHR': ('swapchain',),
+    'AcquireNextImageInfoKHR': ('swapchain', 'semaphore', 'fence'),
+    'DisplayPropertiesKHR': ('display',),
+    'DisplayModePropertiesKHR': ('display_mode',),
+    'DisplayPlanePropertiesKHR': ('current_display',),
+    'DisplaySurfaceCreateInfoKHR': ('display_mode',),
+    'MemoryGetFdInfoKHR': ('memory',),
+    'ImportSemaphoreFdInfoKHR': ('semaphore',),
+    'SemaphoreGetFdInfoKHR': ('semaphore',),
+    'ImportFenceFdInfoKHR': ('fence',),
+    'FenceGetFdInfoKHR': ('fence',),
+    'PhysicalDeviceSurfaceInfo2KHR': ('surface',),
+    'DisplayPlaneInfo2KHR': ('mode',),
+    'DedicatedAllocationMemoryAllocateInfoNV': ('image', 'buffer'),
+    'ConditionalRenderingBeginInfoEXT': ('buffer',),
+    'IndirectCommandsTokenNVX': ('buffer',),
+    'CmdProcessCommandsInfoNVX': ('object_table', 'indirect_commands_layout', 'target_command_buffer', 'sequences_count_buffer', 'sequences_index_buffer'),
+    'CmdReserveSpaceForCommandsInfoNVX': ('object_table', 'indirect_commands_layout'),
+    'ObjectTablePipelineEntryNVX': ('pipeline',),
+    'ObjectTableDescriptorSetEntryNVX': ('pipeline_layout', 'descriptor_set'),
+    'ObjectTableVertexBufferEntryNVX': ('buffer',),
+    'ObjectTableIndexBufferEntryNVX': ('buffer',),
+    'ObjectTablePushConstantEntryNVX': ('pipeline_layout',),
+    'ShaderModuleValidationCacheCreateInfoEXT': ('validation_cache',),
+    'RayTracingPipelineCreateInfoNV': ('layout', 'base_pipeline_handle'),
+    'GeometryTrianglesNV': ('vertex_data', 'index_data', 'transform_data'),
+    'GeometryAABBNV': ('aabb_data',),
+    'BindAccelerationStructureMemoryInfoNV': ('acceleration_structure', 'memory'),
+    'WriteDescriptorSetAccelerationStructureNV': ('acceleration_structures',),
+    'AccelerationStructureMemoryRequirementsInfoNV': ('acceleration_structure',),
+    'MemoryGetWin32HandleInfoKHR': ('memory',),
+    'Win32KeyedMutexAcquireReleaseInfoKHR': ('acquire_syncs', 'release_syncs'),
+    'ImportSemaphoreWin32HandleInfoKHR': ('semaphore',),
+    'SemaphoreGetWin32HandleInfoKHR': ('semaphore',),
+    'ImportFenceWin32HandleInfoKHR': ('fence',),
+    'FenceGetWin32HandleInfoKHR': ('fence',),
+    'Win32KeyedMutexAcquireReleaseInfoNV': ('acquire_syncs', 'release_syncs'),
+}
+
+
+# Commands following the two-call enumeration protocol. True if the results are cached
+enumeration_commands = {
+    'EnumeratePhysicalDevices': True,
+    'GetPhysicalDeviceQueueFamilyProperties': True,
+    'EnumerateInstanceExtensionProperties': True,
+    'EnumerateDeviceExtensionProperties': True,
+    'EnumerateInstanceLayerProperties': True,
+    'EnumerateDeviceLayerProperties': True,
+    'GetImageSparseMemoryRequirements': False,
+    'GetPhysicalDeviceSparseImageFormatProperties': True,
+    'GetPipelineCacheData': False,
+    'EnumeratePhysicalDeviceGroups': True,
+    'GetImageSparseMemoryRequirements2': False,
+    'GetPhysicalDeviceQueueFamilyProperties2': True,
+    'GetPhysicalDeviceSparseImageFormatProperties2': False,
+    'GetPhysicalDeviceSurfaceFormatsKHR': False,
+    'GetPhysicalDeviceSurfacePresentModesKHR': False,
+    'GetSwapchainImagesKHR': False,
+    'GetPhysicalDevicePresentRectanglesKHR': False,
+    'GetPhysicalDeviceDisplayPropertiesKHR': False,
+    'GetPhysicalDeviceDisplayPlanePropertiesKHR': False,
+    'GetDisplayPlaneSupportedDisplaysKHR': False,
+    'GetDisplayModePropertiesKHR': False,
+    'GetPhysicalDeviceSurfaceFormats2KHR': False,
+    'GetPhysicalDeviceDisplayProperties2KHR': False,
+    'GetPhysicalDeviceDisplayPlaneProperties2KHR': False,
+    'GetDisplayModeProperties2KHR': False,
+    'GetShaderInfoAMD': False,
+    'GetPastPresentationTimingGOOGLE': False,
+    'GetValidationCacheDataEXT': False,
+    'GetQueueCheckpointDataNV': False,
+}
+
+
 # Allocation callback
-FnAllocationFunction = FUNCTYPE(c_void_p, c_void_p, c_size_t, c_size_t, SystemAllocationScope)
-FnReallocationFunction = FUNCTYPE(c_void_p, c_void_p, c_size_t, c_size_t, SystemAllocationScope)
-FnFreeFunction = FUNCTYPE(None, c_void_p, c_void_p)
-FnInternalAllocationNotification = FUNCTYPE(None, c_void_p, c_size_t, InternalAllocationType, SystemAllocationScope)
-FnInternalFreeNotification = FUNCTYPE(None, c_void_p, c_size_t, InternalAllocationType, SystemAllocationScope)
-FnDebugReportCallbackEXT = FUNCTYPE(Bool32, DebugReportFlagsEXT, DebugReportObjectTypeEXT, c_uint64, c_size_t, c_uint32, c_char_p, c_char_p, c_void_p)
+define_lazy('FnAllocationFunction', lambda: FUNCTYPE(c_void_p, c_void_p, c_size_t, c_size_t, SystemAllocationScope))
+define_lazy('FnReallocationFunction', lambda: FUNCTYPE(c_void_p, c_void_p, c_size_t, c_size_t, SystemAllocationScope))
+define_lazy('FnFreeFunction', lambda: FUNCTYPE(None, c_void_p, c_void_p))
+define_lazy('FnInternalAllocationNotification', lambda: FUNCTYPE(None, c_void_p, c_size_t, InternalAllocationType, SystemAllocationScope))
+define_lazy('FnInternalFreeNotification', lambda: FUNCTYPE(None, c_void_p, c_size_t, InternalAllocationType, SystemAllocationScope))
+define_lazy('FnDebugReportCallbackEXT', lambda: FUNCTYPE(Bool32, DebugReportFlagsEXT, DebugReportObjectTypeEXT, c_uint64, c_size_t, c_uint32, c_char_p, c_char_p, c_void_p))
 
 
 
-ApplicationInfo = define_struct('ApplicationInfo', 
+define_lazy('ApplicationInfo', lambda: define_struct('ApplicationInfo', 
     ('type', StructureType),
     ('next', c_void_p),
     ('application_name', c_char_p),
@@ -2251,9 +3379,9 @@ ApplicationInfo = define_struct('ApplicationInfo',
     ('engine_name', c_char_p),
     ('engine_version', c_uint32),
     ('api_version', c_uint32),
-)
+))
 
-InstanceCreateInfo = define_struct('InstanceCreateInfo', 
+define_lazy('InstanceCreateInfo', lambda: define_struct('InstanceCreateInfo', 
     ('type', StructureType),
     ('next', c_void_p),
     ('flags', InstanceCreateFlags),
@@ -2262,18 +3390,18 @@ InstanceCreateInfo = define_struct('InstanceCreateInfo',
     ('enabled_layer_names', POINTER(c_char_p)),
     ('enabled_extension_count', c_uint32),
     ('enabled_extension_names', POINTER(c_char_p)),
-)
+))
 
-AllocationCallbacks = define_struct('AllocationCallbacks', 
+define_lazy('AllocationCallbacks', lambda: define_struct('AllocationCallbacks', 
     ('user_data', c_void_p),
     ('allocation', FnAllocationFunction),
     ('reallocation', FnReallocationFunction),
     ('free', FnFreeFunction),
     ('internal_allocation', FnInternalAllocationNotification),
     ('internal_free', FnInternalFreeNotification),
-)
+))
 
-PhysicalDeviceFeatures = define_struct('PhysicalDeviceFeatures', 
+define_lazy('PhysicalDeviceFeatures', lambda: define_struct('PhysicalDeviceFeatures', 
     ('robust_buffer_access', Bool32),
     ('full_draw_index_uint32', Bool32),
     ('image_cube_array', Bool32),
@@ -2329,29 +3457,29 @@ PhysicalDeviceFeatures = define_struct('PhysicalDeviceFeatures',
     ('sparse_residency_aliased', Bool32),
     ('variable_multisample_rate', Bool32),
     ('inherited_queries', Bool32),
-)
+))
 
-FormatProperties = define_struct('FormatProperties', 
+define_lazy('FormatProperties', lambda: define_struct('FormatProperties', 
     ('linear_tiling_features', FormatFeatureFlags),
     ('optimal_tiling_features', FormatFeatureFlags),
     ('buffer_features', FormatFeatureFlags),
-)
+))
 
-Extent3D = define_struct('Extent3D', 
+define_lazy('Extent3D', lambda: define_struct('Extent3D', 
     ('width', c_uint32),
     ('height', c_uint32),
     ('depth', c_uint32),
-)
+))
 
-ImageFormatProperties = define_struct('ImageFormatProperties', 
+define_lazy('ImageFormatProperties', lambda: define_struct('ImageFormatProperties', 
     ('max_extent', Extent3D),
     ('max_mip_levels', c_uint32),
     ('max_array_layers', c_uint32),
     ('sample_counts', SampleCountFlags),
     ('max_resource_size', DeviceSize),
-)
+))
 
-PhysicalDeviceLimits = define_struct('PhysicalDeviceLimits', 
+define_lazy('PhysicalDeviceLimits', lambda: define_struct('PhysicalDeviceLimits', 
     ('max_image_dimension1_D', c_uint32),
     ('max_image_dimension2_D', c_uint32),
     ('max_image_dimension3_D', c_uint32),
@@ -2458,17 +3586,17 @@ PhysicalDeviceLimits = define_struct('PhysicalDeviceLimits',
     ('optimal_buffer_copy_offset_alignment', DeviceSize),
     ('optimal_buffer_copy_row_pitch_alignment', DeviceSize),
     ('non_coherent_atom_size', DeviceSize),
-)
+))
 
-PhysicalDeviceSparseProperties = define_struct('PhysicalDeviceSparseProperties', 
+define_lazy('PhysicalDeviceSparseProperties', lambda: define_struct('PhysicalDeviceSparseProperties', 
     ('residency_standard2_DBlock_shape', Bool32),
     ('residency_standard2_DMultisample_block_shape', Bool32),
     ('residency_standard3_DBlock_shape', Bool32),
     ('residency_aligned_mip_size', Bool32),
     ('residency_non_resident_strict', Bool32),
-)
+))
 
-PhysicalDeviceProperties = define_struct('PhysicalDeviceProperties', 
+define_lazy('PhysicalDeviceProperties', lambda: define_struct('PhysicalDeviceProperties', 
     ('api_version', c_uint32),
     ('driver_version', c_uint32),
     ('vendor_ID', c_uint32),
@@ -2478,42 +3606,42 @@ PhysicalDeviceProperties = define_struct('PhysicalDeviceProperties',
     ('pipeline_cache_UUID', c_int8 * UUID_SIZE),
     ('limits', PhysicalDeviceLimits),
     ('sparse_properties', PhysicalDeviceSparseProperties),
-)
+))
 
-QueueFamilyProperties = define_struct('QueueFamilyProperties', 
+define_lazy('QueueFamilyProperties', lambda: define_struct('QueueFamilyProperties', 
     ('queue_flags', QueueFlags),
     ('queue_count', c_uint32),
     ('timestamp_valid_bits', c_uint32),
     ('min_image_transfer_granularity', Extent3D),
-)
+))
 
-MemoryType = define_struct('MemoryType', 
+define_lazy('MemoryType', lambda: define_struct('MemoryType', 
     ('property_flags', MemoryPropertyFlags),
     ('heap_index', c_uint32),
-)
+))
 
-MemoryHeap = define_struct('MemoryHeap', 
+define_lazy('MemoryHeap', lambda: define_struct('MemoryHeap', 
     ('size', DeviceSize),
     ('flags', MemoryHeapFlags),
-)
+))
 
-PhysicalDeviceMemoryProperties = define_struct('PhysicalDeviceMemoryProperties', 
+define_lazy('PhysicalDeviceMemoryProperties', lambda: define_struct('PhysicalDeviceMemoryProperties', 
     ('memory_type_count', c_uint32),
     ('memory_types', MemoryType * MAX_MEMORY_TYPES),
     ('memory_heap_count', c_uint32),
     ('memory_heaps', MemoryHeap * MAX_MEMORY_HEAPS),
-)
+))
 
-DeviceQueueCreateInfo = define_struct('DeviceQueueCreateInfo', 
+define_lazy('DeviceQueueCreateInfo', lambda: define_struct('DeviceQueueCreateInfo', 
     ('type', StructureType),
     ('next', c_void_p),
     ('flags', DeviceQueueCreateFlags),
     ('queue_family_index', c_uint32),
     ('queue_count', c_uint32),
     ('queue_priorities', POINTER(c_float)),
-)
+))
 
-DeviceCreateInfo = define_struct('DeviceCreateInfo', 
+define_lazy('DeviceCreateInfo', lambda: define_struct('DeviceCreateInfo', 
     ('type', StructureType),
     ('next', c_void_p),
     ('flags', DeviceCreateFlags),
@@ -2524,21 +3652,21 @@ DeviceCreateInfo = define_struct('DeviceCreateInfo',
     ('enabled_extension_count', c_uint32),
     ('enabled_extension_names', POINTER(c_char_p)),
     ('enabled_features', POINTER(PhysicalDeviceFeatures)),
-)
+))
 
-ExtensionProperties = define_struct('ExtensionProperties', 
+define_lazy('ExtensionProperties', lambda: define_struct('ExtensionProperties', 
     ('extension_name', c_char * MAX_EXTENSION_NAME_SIZE),
     ('spec_version', c_uint32),
-)
+))
 
-LayerProperties = define_struct('LayerProperties', 
+define_lazy('LayerProperties', lambda: define_struct('LayerProperties', 
     ('layer_name', c_char * MAX_EXTENSION_NAME_SIZE),
     ('spec_version', c_uint32),
     ('implementation_version', c_uint32),
     ('description', c_char * MAX_DESCRIPTION_SIZE),
-)
+))
 
-SubmitInfo = define_struct('SubmitInfo', 
+define_lazy('SubmitInfo', lambda: define_struct('SubmitInfo', 
     ('type', StructureType),
     ('next', c_void_p),
     ('wait_semaphore_count', c_uint32),
@@ -2548,91 +3676,91 @@ SubmitInfo = define_struct('SubmitInfo',
     ('command_buffers', POINTER(CommandBuffer)),
     ('signal_semaphore_count', c_uint32),
     ('signal_semaphores', POINTER(Semaphore)),
-)
+))
 
-MemoryAllocateInfo = define_struct('MemoryAllocateInfo', 
+define_lazy('MemoryAllocateInfo', lambda: define_struct('MemoryAllocateInfo', 
     ('type', StructureType),
     ('next', c_void_p),
     ('allocation_size', DeviceSize),
     ('memory_type_index', c_uint32),
-)
+))
 
-MappedMemoryRange = define_struct('MappedMemoryRange', 
+define_lazy('MappedMemoryRange', lambda: define_struct('MappedMemoryRange', 
     ('type', StructureType),
     ('next', c_void_p),
     ('memory', DeviceMemory),
     ('offset', DeviceSize),
     ('size', DeviceSize),
-)
+))
 
-MemoryRequirements = define_struct('MemoryRequirements', 
+define_lazy('MemoryRequirements', lambda: define_struct('MemoryRequirements', 
     ('size', DeviceSize),
     ('alignment', DeviceSize),
     ('memory_type_bits', c_uint32),
-)
+))
 
-SparseImageFormatProperties = define_struct('SparseImageFormatProperties', 
+define_lazy('SparseImageFormatProperties', lambda: define_struct('SparseImageFormatProperties', 
     ('aspect_mask', ImageAspectFlags),
     ('image_granularity', Extent3D),
     ('flags', SparseImageFormatFlags),
-)
+))
 
-SparseImageMemoryRequirements = define_struct('SparseImageMemoryRequirements', 
+define_lazy('SparseImageMemoryRequirements', lambda: define_struct('SparseImageMemoryRequirements', 
     ('format_properties', SparseImageFormatProperties),
     ('image_mip_tail_first_lod', c_uint32),
     ('image_mip_tail_size', DeviceSize),
     ('image_mip_tail_offset', DeviceSize),
     ('image_mip_tail_stride', DeviceSize),
-)
+))
 
-SparseMemoryBind = define_struct('SparseMemoryBind', 
+define_lazy('SparseMemoryBind', lambda: define_struct('SparseMemoryBind', 
     ('resource_offset', DeviceSize),
     ('size', DeviceSize),
     ('memory', DeviceMemory),
     ('memory_offset', DeviceSize),
     ('flags', SparseMemoryBindFlags),
-)
+))
 
-SparseBufferMemoryBindInfo = define_struct('SparseBufferMemoryBindInfo', 
+define_lazy('SparseBufferMemoryBindInfo', lambda: define_struct('SparseBufferMemoryBindInfo', 
     ('buffer', Buffer),
     ('bind_count', c_uint32),
     ('binds', POINTER(SparseMemoryBind)),
-)
+))
 
-SparseImageOpaqueMemoryBindInfo = define_struct('SparseImageOpaqueMemoryBindInfo', 
+define_lazy('SparseImageOpaqueMemoryBindInfo', lambda: define_struct('SparseImageOpaqueMemoryBindInfo', 
     ('image', Image),
     ('bind_count', c_uint32),
     ('binds', POINTER(SparseMemoryBind)),
-)
+))
 
-ImageSubresource = define_struct('ImageSubresource', 
+define_lazy('ImageSubresource', lambda: define_struct('ImageSubresource', 
     ('aspect_mask', ImageAspectFlags),
     ('mip_level', c_uint32),
     ('array_layer', c_uint32),
-)
+))
 
-Offset3D = define_struct('Offset3D', 
+define_lazy('Offset3D', lambda: define_struct('Offset3D', 
     ('x', c_int32),
     ('y', c_int32),
     ('z', c_int32),
-)
+))
 
-SparseImageMemoryBind = define_struct('SparseImageMemoryBind', 
+define_lazy('SparseImageMemoryBind', lambda: define_struct('SparseImageMemoryBind', 
     ('subresource', ImageSubresource),
     ('offset', Offset3D),
     ('extent', Extent3D),
     ('memory', DeviceMemory),
     ('memory_offset', DeviceSize),
     ('flags', SparseMemoryBindFlags),
-)
+))
 
-SparseImageMemoryBindInfo = define_struct('SparseImageMemoryBindInfo', 
+define_lazy('SparseImageMemoryBindInfo', lambda: define_struct('SparseImageMemoryBindInfo', 
     ('image', Image),
     ('bind_count', c_uint32),
     ('binds', POINTER(SparseImageMemoryBind)),
-)
+))
 
-BindSparseInfo = define_struct('BindSparseInfo', 
+define_lazy('BindSparseInfo', lambda: define_struct('BindSparseInfo', 
     ('type', StructureType),
     ('next', c_void_p),
     ('wait_semaphore_count', c_uint32),
@@ -2645,36 +3773,36 @@ BindSparseInfo = define_struct('BindSparseInfo',
     ('image_binds', POINTER(SparseImageMemoryBindInfo)),
     ('signal_semaphore_count', c_uint32),
     ('signal_semaphores', POINTER(Semaphore)),
-)
+))
 
-FenceCreateInfo = define_struct('FenceCreateInfo', 
+define_lazy('FenceCreateInfo', lambda: define_struct('FenceCreateInfo', 
     ('type', StructureType),
     ('next', c_void_p),
     ('flags', FenceCreateFlags),
-)
+))
 
-SemaphoreCreateInfo = define_struct('SemaphoreCreateInfo', 
+define_lazy('SemaphoreCreateInfo', lambda: define_struct('SemaphoreCreateInfo', 
     ('type', StructureType),
     ('next', c_void_p),
     ('flags', SemaphoreCreateFlags),
-)
+))
 
-EventCreateInfo = define_struct('EventCreateInfo', 
+define_lazy('EventCreateInfo', lambda: define_struct('EventCreateInfo', 
     ('type', StructureType),
     ('next', c_void_p),
     ('flags', EventCreateFlags),
-)
+))
 
-QueryPoolCreateInfo = define_struct('QueryPoolCreateInfo', 
+define_lazy('QueryPoolCreateInfo', lambda: define_struct('QueryPoolCreateInfo', 
     ('type', StructureType),
     ('next', c_void_p),
     ('flags', QueryPoolCreateFlags),
     ('query_type', QueryType),
     ('query_count', c_uint32),
     ('pipeline_statistics', QueryPipelineStatisticFlags),
-)
+))
 
-BufferCreateInfo = define_struct('BufferCreateInfo', 
+define_lazy('BufferCreateInfo', lambda: define_struct('BufferCreateInfo', 
     ('type', StructureType),
     ('next', c_void_p),
     ('flags', BufferCreateFlags),
@@ -2683,9 +3811,9 @@ BufferCreateInfo = define_struct('BufferCreateInfo',
     ('sharing_mode', SharingMode),
     ('queue_family_index_count', c_uint32),
     ('queue_family_indices', POINTER(c_uint32)),
-)
+))
 
-BufferViewCreateInfo = define_struct('BufferViewCreateInfo', 
+define_lazy('BufferViewCreateInfo', lambda: define_struct('BufferViewCreateInfo', 
     ('type', StructureType),
     ('next', c_void_p),
     ('flags', BufferViewCreateFlags),
@@ -2693,9 +3821,9 @@ BufferViewCreateInfo = define_struct('BufferViewCreateInfo',
     ('format', Format),
     ('offset', DeviceSize),
     ('range', DeviceSize),
-)
+))
 
-ImageCreateInfo = define_struct('ImageCreateInfo', 
+define_lazy('ImageCreateInfo', lambda: define_struct('ImageCreateInfo', 
     ('type', StructureType),
     ('next', c_void_p),
     ('flags', ImageCreateFlags),
@@ -2711,32 +3839,32 @@ ImageCreateInfo = define_struct('ImageCreateInfo',
     ('queue_family_index_count', c_uint32),
     ('queue_family_indices', POINTER(c_uint32)),
     ('initial_layout', ImageLayout),
-)
+))
 
-SubresourceLayout = define_struct('SubresourceLayout', 
+define_lazy('SubresourceLayout', lambda: define_struct('SubresourceLayout', 
     ('offset', DeviceSize),
     ('size', DeviceSize),
     ('row_pitch', DeviceSize),
     ('array_pitch', DeviceSize),
     ('depth_pitch', DeviceSize),
-)
+))
 
-ComponentMapping = define_struct('ComponentMapping', 
+define_lazy('ComponentMapping', lambda: define_struct('ComponentMapping', 
     ('r', ComponentSwizzle),
     ('g', ComponentSwizzle),
     ('b', ComponentSwizzle),
     ('a', ComponentSwizzle),
-)
+))
 
-ImageSubresourceRange = define_struct('ImageSubresourceRange', 
+define_lazy('ImageSubresourceRange', lambda: define_struct('ImageSubresourceRange', 
     ('aspect_mask', ImageAspectFlags),
     ('base_mip_level', c_uint32),
     ('level_count', c_uint32),
     ('base_array_layer', c_uint32),
     ('layer_count', c_uint32),
-)
+))
 
-ImageViewCreateInfo = define_struct('ImageViewCreateInfo', 
+define_lazy('ImageViewCreateInfo', lambda: define_struct('ImageViewCreateInfo', 
     ('type', StructureType),
     ('next', c_void_p),
     ('flags', ImageViewCreateFlags),
@@ -2745,38 +3873,38 @@ ImageViewCreateInfo = define_struct('ImageViewCreateInfo',
     ('format', Format),
     ('components', ComponentMapping),
     ('subresource_range', ImageSubresourceRange),
-)
+))
 
-ShaderModuleCreateInfo = define_struct('ShaderModuleCreateInfo', 
+define_lazy('ShaderModuleCreateInfo', lambda: define_struct('ShaderModuleCreateInfo', 
     ('type', StructureType),
     ('next', c_void_p),
     ('flags', ShaderModuleCreateFlags),
     ('code_size', c_size_t),
     ('code', POINTER(c_uint32)),
-)
+))
 
-PipelineCacheCreateInfo = define_struct('PipelineCacheCreateInfo', 
+define_lazy('PipelineCacheCreateInfo', lambda: define_struct('PipelineCacheCreateInfo', 
     ('type', StructureType),
     ('next', c_void_p),
     ('flags', PipelineCacheCreateFlags),
     ('initial_data_size', c_size_t),
     ('initial_data', c_void_p),
-)
+))
 
-SpecializationMapEntry = define_struct('SpecializationMapEntry', 
+define_lazy('SpecializationMapEntry', lambda: define_struct('SpecializationMapEntry', 
     ('constant_ID', c_uint32),
     ('offset', c_uint32),
     ('size', c_size_t),
-)
+))
 
-SpecializationInfo = define_struct('SpecializationInfo', 
+define_lazy('SpecializationInfo', lambda: define_struct('SpecializationInfo', 
     ('map_entry_count', c_uint32),
     ('map_entries', POINTER(SpecializationMapEntry)),
     ('data_size', c_size_t),
     ('data', c_void_p),
-)
+))
 
-PipelineShaderStageCreateInfo = define_struct('PipelineShaderStageCreateInfo', 
+define_lazy('PipelineShaderStageCreateInfo', lambda: define_struct('PipelineShaderStageCreateInfo', 
     ('type', StructureType),
     ('next', c_void_p),
     ('flags', PipelineShaderStageCreateFlags),
@@ -2784,22 +3912,22 @@ PipelineShaderStageCreateInfo = define_struct('PipelineShaderStageCreateInfo',
     ('module', ShaderModule),
     ('name', c_char_p),
     ('specialization_info', POINTER(SpecializationInfo)),
-)
+))
 
-VertexInputBindingDescription = define_struct('VertexInputBindingDescription', 
+define_lazy('VertexInputBindingDescription', lambda: define_struct('VertexInputBindingDescription', 
     ('binding', c_uint32),
     ('stride', c_uint32),
     ('input_rate', VertexInputRate),
-)
+))
 
-VertexInputAttributeDescription = define_struct('VertexInputAttributeDescription', 
+define_lazy('VertexInputAttributeDescription', lambda: define_struct('VertexInputAttributeDescription', 
     ('location', c_uint32),
     ('binding', c_uint32),
     ('format', Format),
     ('offset', c_uint32),
-)
+))
 
-PipelineVertexInputStateCreateInfo = define_struct('PipelineVertexInputStateCreateInfo', 
+define_lazy('PipelineVertexInputStateCreateInfo', lambda: define_struct('PipelineVertexInputStateCreateInfo', 
     ('type', StructureType),
     ('next', c_void_p),
     ('flags', PipelineVertexInputStateCreateFlags),
@@ -2807,48 +3935,48 @@ PipelineVertexInputStateCreateInfo = define_struct('PipelineVertexInputStateCrea
     ('vertex_binding_descriptions', POINTER(VertexInputBindingDescription)),
     ('vertex_attribute_description_count', c_uint32),
     ('vertex_attribute_descriptions', POINTER(VertexInputAttributeDescription)),
-)
+))
 
-PipelineInputAssemblyStateCreateInfo = define_struct('PipelineInputAssemblyStateCreateInfo', 
+define_lazy('PipelineInputAssemblyStateCreateInfo', lambda: define_struct('PipelineInputAssemblyStateCreateInfo', 
     ('type', StructureType),
     ('next', c_void_p),
     ('flags', PipelineInputAssemblyStateCreateFlags),
     ('topology', PrimitiveTopology),
     ('primitive_restart_enable', Bool32),
-)
+))
 
-PipelineTessellationStateCreateInfo = define_struct('PipelineTessellationStateCreateInfo', 
+define_lazy('PipelineTessellationStateCreateInfo', lambda: define_struct('PipelineTessellationStateCreateInfo', 
     ('type', StructureType),
     ('next', c_void_p),
     ('flags', PipelineTessellationStateCreateFlags),
     ('patch_control_points', c_uint32),
-)
+))
 
-Viewport = define_struct('Viewport', 
+define_lazy('Viewport', lambda: define_struct('Viewport', 
     ('x', c_float),
     ('y', c_float),
     ('width', c_float),
     ('height', c_float),
     ('min_depth', c_float),
     ('max_depth', c_float),
-)
+))
 
-Offset2D = define_struct('Offset2D', 
+define_lazy('Offset2D', lambda: define_struct('Offset2D', 
     ('x', c_int32),
     ('y', c_int32),
-)
+))
 
-Extent2D = define_struct('Extent2D', 
+define_lazy('Extent2D', lambda: define_struct('Extent2D', 
     ('width', c_uint32),
     ('height', c_uint32),
-)
+))
 
-Rect2D = define_struct('Rect2D', 
+define_lazy('Rect2D', lambda: define_struct('Rect2D', 
     ('offset', Offset2D),
     ('extent', Extent2D),
-)
+))
 
-PipelineViewportStateCreateInfo = define_struct('PipelineViewportStateCreateInfo', 
+define_lazy('PipelineViewportStateCreateInfo', lambda: define_struct('PipelineViewportStateCreateInfo', 
     ('type', StructureType),
     ('next', c_void_p),
     ('flags', PipelineViewportStateCreateFlags),
@@ -2856,9 +3984,9 @@ PipelineViewportStateCreateInfo = define_struct('PipelineViewportStateCreateInfo
     ('viewports', POINTER(Viewport)),
     ('scissor_count', c_uint32),
     ('scissors', POINTER(Rect2D)),
-)
+))
 
-PipelineRasterizationStateCreateInfo = define_struct('PipelineRasterizationStateCreateInfo', 
+define_lazy('PipelineRasterizationStateCreateInfo', lambda: define_struct('PipelineRasterizationStateCreateInfo', 
     ('type', StructureType),
     ('next', c_void_p),
     ('flags', PipelineRasterizationStateCreateFlags),
@@ -2872,9 +4000,9 @@ PipelineRasterizationStateCreateInfo = define_struct('PipelineRasterizationState
     ('depth_bias_clamp', c_float),
     ('depth_bias_slope_factor', c_float),
     ('line_width', c_float),
-)
+))
 
-PipelineMultisampleStateCreateInfo = define_struct('PipelineMultisampleStateCreateInfo', 
+define_lazy('PipelineMultisampleStateCreateInfo', lambda: define_struct('PipelineMultisampleStateCreateInfo', 
     ('type', StructureType),
     ('next', c_void_p),
     ('flags', PipelineMultisampleStateCreateFlags),
@@ -2884,9 +4012,9 @@ PipelineMultisampleStateCreateInfo = define_struct('PipelineMultisampleStateCrea
     ('sample_mask', POINTER(SampleMask)),
     ('alpha_toCoverage_enable', Bool32),
     ('alpha_toOne_enable', Bool32),
-)
+))
 
-StencilOpState = define_struct('StencilOpState', 
+define_lazy('StencilOpState', lambda: define_struct('StencilOpState', 
     ('fail_op', StencilOp),
     ('pass_op', StencilOp),
     ('depth_fail_op', StencilOp),
@@ -2894,9 +4022,9 @@ StencilOpState = define_struct('StencilOpState',
     ('compare_mask', c_uint32),
     ('write_mask', c_uint32),
     ('reference', c_uint32),
-)
+))
 
-PipelineDepthStencilStateCreateInfo = define_struct('PipelineDepthStencilStateCreateInfo', 
+define_lazy('PipelineDepthStencilStateCreateInfo', lambda: define_struct('PipelineDepthStencilStateCreateInfo', 
     ('type', StructureType),
     ('next', c_void_p),
     ('flags', PipelineDepthStencilStateCreateFlags),
@@ -2909,9 +4037,9 @@ PipelineDepthStencilStateCreateInfo = define_struct('PipelineDepthStencilStateCr
     ('back', StencilOpState),
     ('min_depth_bounds', c_float),
     ('max_depth_bounds', c_float),
-)
+))
 
-PipelineColorBlendAttachmentState = define_struct('PipelineColorBlendAttachmentState', 
+define_lazy('PipelineColorBlendAttachmentState', lambda: define_struct('PipelineColorBlendAttachmentState', 
     ('blend_enable', Bool32),
     ('src_color_blend_factor', BlendFactor),
     ('dst_color_blend_factor', BlendFactor),
@@ -2920,9 +4048,9 @@ PipelineColorBlendAttachmentState = define_struct('PipelineColorBlendAttachmentS
     ('dst_alpha_blend_factor', BlendFactor),
     ('alpha_blend_op', BlendOp),
     ('color_write_mask', ColorComponentFlags),
-)
+))
 
-PipelineColorBlendStateCreateInfo = define_struct('PipelineColorBlendStateCreateInfo', 
+define_lazy('PipelineColorBlendStateCreateInfo', lambda: define_struct('PipelineColorBlendStateCreateInfo', 
     ('type', StructureType),
     ('next', c_void_p),
     ('flags', PipelineColorBlendStateCreateFlags),
@@ -2931,17 +4059,17 @@ PipelineColorBlendStateCreateInfo = define_struct('PipelineColorBlendStateCreate
     ('attachment_count', c_uint32),
     ('attachments', POINTER(PipelineColorBlendAttachmentState)),
     ('blend_constants', c_float * 4),
-)
+))
 
-PipelineDynamicStateCreateInfo = define_struct('PipelineDynamicStateCreateInfo', 
+define_lazy('PipelineDynamicStateCreateInfo', lambda: define_struct('PipelineDynamicStateCreateInfo', 
     ('type', StructureType),
     ('next', c_void_p),
     ('flags', PipelineDynamicStateCreateFlags),
     ('dynamic_state_count', c_uint32),
     ('dynamic_states', POINTER(DynamicState)),
-)
+))
 
-GraphicsPipelineCreateInfo = define_struct('GraphicsPipelineCreateInfo', 
+define_lazy('GraphicsPipelineCreateInfo', lambda: define_struct('GraphicsPipelineCreateInfo', 
     ('type', StructureType),
     ('next', c_void_p),
     ('flags', PipelineCreateFlags),
@@ -2961,9 +4089,9 @@ GraphicsPipelineCreateInfo = define_struct('GraphicsPipelineCreateInfo',
     ('subpass', c_uint32),
     ('base_pipeline_handle', Pipeline),
     ('base_pipeline_index', c_int32),
-)
+))
 
-ComputePipelineCreateInfo = define_struct('ComputePipelineCreateInfo', 
+define_lazy('ComputePipelineCreateInfo', lambda: define_struct('ComputePipelineCreateInfo', 
     ('type', StructureType),
     ('next', c_void_p),
     ('flags', PipelineCreateFlags),
@@ -2971,15 +4099,15 @@ ComputePipelineCreateInfo = define_struct('ComputePipelineCreateInfo',
     ('layout', PipelineLayout),
     ('base_pipeline_handle', Pipeline),
     ('base_pipeline_index', c_int32),
-)
+))
 
-PushConstantRange = define_struct('PushConstantRange', 
+define_lazy('PushConstantRange', lambda: define_struct('PushConstantRange', 
     ('stage_flags', ShaderStageFlags),
     ('offset', c_uint32),
     ('size', c_uint32),
-)
+))
 
-PipelineLayoutCreateInfo = define_struct('PipelineLayoutCreateInfo', 
+define_lazy('PipelineLayoutCreateInfo', lambda: define_struct('PipelineLayoutCreateInfo', 
     ('type', StructureType),
     ('next', c_void_p),
     ('flags', PipelineLayoutCreateFlags),
@@ -2987,9 +4115,9 @@ PipelineLayoutCreateInfo = define_struct('PipelineLayoutCreateInfo',
     ('set_layouts', POINTER(DescriptorSetLayout)),
     ('push_constant_range_count', c_uint32),
     ('push_constant_ranges', POINTER(PushConstantRange)),
-)
+))
 
-SamplerCreateInfo = define_struct('SamplerCreateInfo', 
+define_lazy('SamplerCreateInfo', lambda: define_struct('SamplerCreateInfo', 
     ('type', StructureType),
     ('next', c_void_p),
     ('flags', SamplerCreateFlags),
@@ -3008,59 +4136,59 @@ SamplerCreateInfo = define_struct('SamplerCreateInfo',
     ('max_lod', c_float),
     ('border_color', BorderColor),
     ('unnormalized_coordinates', Bool32),
-)
+))
 
-DescriptorSetLayoutBinding = define_struct('DescriptorSetLayoutBinding', 
+define_lazy('DescriptorSetLayoutBinding', lambda: define_struct('DescriptorSetLayoutBinding', 
     ('binding', c_uint32),
     ('descriptor_type', DescriptorType),
     ('descriptor_count', c_uint32),
     ('stage_flags', ShaderStageFlags),
     ('immutable_samplers', POINTER(Sampler)),
-)
+))
 
-DescriptorSetLayoutCreateInfo = define_struct('DescriptorSetLayoutCreateInfo', 
+define_lazy('DescriptorSetLayoutCreateInfo', lambda: define_struct('DescriptorSetLayoutCreateInfo', 
     ('type', StructureType),
     ('next', c_void_p),
     ('flags', DescriptorSetLayoutCreateFlags),
     ('binding_count', c_uint32),
     ('bindings', POINTER(DescriptorSetLayoutBinding)),
-)
+))
 
-DescriptorPoolSize = define_struct('DescriptorPoolSize', 
+define_lazy('DescriptorPoolSize', lambda: define_struct('DescriptorPoolSize', 
     ('type', DescriptorType),
     ('descriptor_count', c_uint32),
-)
+))
 
-DescriptorPoolCreateInfo = define_struct('DescriptorPoolCreateInfo', 
+define_lazy('DescriptorPoolCreateInfo', lambda: define_struct('DescriptorPoolCreateInfo', 
     ('type', StructureType),
     ('next', c_void_p),
     ('flags', DescriptorPoolCreateFlags),
     ('max_sets', c_uint32),
     ('pool_size_count', c_uint32),
     ('pool_sizes', POINTER(DescriptorPoolSize)),
-)
+))
 
-DescriptorSetAllocateInfo = define_struct('DescriptorSetAllocateInfo', 
+define_lazy('DescriptorSetAllocateInfo', lambda: define_struct('DescriptorSetAllocateInfo', 
     ('type', StructureType),
     ('next', c_void_p),
     ('descriptor_pool', DescriptorPool),
     ('descriptor_set_count', c_uint32),
     ('set_layouts', POINTER(DescriptorSetLayout)),
-)
+))
 
-DescriptorImageInfo = define_struct('DescriptorImageInfo', 
+define_lazy('DescriptorImageInfo', lambda: define_struct('DescriptorImageInfo', 
     ('sampler', Sampler),
     ('image_view', ImageView),
     ('image_layout', ImageLayout),
-)
+))
 
-DescriptorBufferInfo = define_struct('DescriptorBufferInfo', 
+define_lazy('DescriptorBufferInfo', lambda: define_struct('DescriptorBufferInfo', 
     ('buffer', Buffer),
     ('offset', DeviceSize),
     ('range', DeviceSize),
-)
+))
 
-WriteDescriptorSet = define_struct('WriteDescriptorSet', 
+define_lazy('WriteDescriptorSet', lambda: define_struct('WriteDescriptorSet', 
     ('type', StructureType),
     ('next', c_void_p),
     ('dst_set', DescriptorSet),
@@ -3071,9 +4199,9 @@ WriteDescriptorSet = define_struct('WriteDescriptorSet',
     ('image_info', POINTER(DescriptorImageInfo)),
     ('buffer_info', POINTER(DescriptorBufferInfo)),
     ('texel_buffer_view', POINTER(BufferView)),
-)
+))
 
-CopyDescriptorSet = define_struct('CopyDescriptorSet', 
+define_lazy('CopyDescriptorSet', lambda: define_struct('CopyDescriptorSet', 
     ('type', StructureType),
     ('next', c_void_p),
     ('src_set', DescriptorSet),
@@ -3083,9 +4211,9 @@ CopyDescriptorSet = define_struct('CopyDescriptorSet',
     ('dst_binding', c_uint32),
     ('dst_array_element', c_uint32),
     ('descriptor_count', c_uint32),
-)
+))
 
-FramebufferCreateInfo = define_struct('FramebufferCreateInfo', 
+define_lazy('FramebufferCreateInfo', lambda: define_struct('FramebufferCreateInfo', 
     ('type', StructureType),
     ('next', c_void_p),
     ('flags', FramebufferCreateFlags),
@@ -3095,9 +4223,9 @@ FramebufferCreateInfo = define_struct('FramebufferCreateInfo',
     ('width', c_uint32),
     ('height', c_uint32),
     ('layers', c_uint32),
-)
+))
 
-AttachmentDescription = define_struct('AttachmentDescription', 
+define_lazy('AttachmentDescription', lambda: define_struct('AttachmentDescription', 
     ('flags', AttachmentDescriptionFlags),
     ('format', Format),
     ('samples', SampleCountFlagBits),
@@ -3107,14 +4235,14 @@ AttachmentDescription = define_struct('AttachmentDescription',
     ('stencil_store_op', AttachmentStoreOp),
     ('initial_layout', ImageLayout),
     ('final_layout', ImageLayout),
-)
+))
 
-AttachmentReference = define_struct('AttachmentReference', 
+define_lazy('AttachmentReference', lambda: define_struct('AttachmentReference', 
     ('attachment', c_uint32),
     ('layout', ImageLayout),
-)
+))
 
-SubpassDescription = define_struct('SubpassDescription', 
+define_lazy('SubpassDescription', lambda: define_struct('SubpassDescription', 
     ('flags', SubpassDescriptionFlags),
     ('pipeline_bind_point', PipelineBindPoint),
     ('input_attachment_count', c_uint32),
@@ -3125,9 +4253,9 @@ SubpassDescription = define_struct('SubpassDescription',
     ('depth_stencil_attachment', POINTER(AttachmentReference)),
     ('preserve_attachment_count', c_uint32),
     ('preserve_attachments', POINTER(c_uint32)),
-)
+))
 
-SubpassDependency = define_struct('SubpassDependency', 
+define_lazy('SubpassDependency', lambda: define_struct('SubpassDependency', 
     ('src_subpass', c_uint32),
     ('dst_subpass', c_uint32),
     ('src_stage_mask', PipelineStageFlags),
@@ -3135,9 +4263,9 @@ SubpassDependency = define_struct('SubpassDependency',
     ('src_access_mask', AccessFlags),
     ('dst_access_mask', AccessFlags),
     ('dependency_flags', DependencyFlags),
-)
+))
 
-RenderPassCreateInfo = define_struct('RenderPassCreateInfo', 
+define_lazy('RenderPassCreateInfo', lambda: define_struct('RenderPassCreateInfo', 
     ('type', StructureType),
     ('next', c_void_p),
     ('flags', RenderPassCreateFlags),
@@ -3147,24 +4275,24 @@ RenderPassCreateInfo = define_struct('RenderPassCreateInfo',
     ('subpasses', POINTER(SubpassDescription)),
     ('dependency_count', c_uint32),
     ('dependencies', POINTER(SubpassDependency)),
-)
+))
 
-CommandPoolCreateInfo = define_struct('CommandPoolCreateInfo', 
+define_lazy('CommandPoolCreateInfo', lambda: define_struct('CommandPoolCreateInfo', 
     ('type', StructureType),
     ('next', c_void_p),
     ('flags', CommandPoolCreateFlags),
     ('queue_family_index', c_uint32),
-)
+))
 
-CommandBufferAllocateInfo = define_struct('CommandBufferAllocateInfo', 
+define_lazy('CommandBufferAllocateInfo', lambda: define_struct('CommandBufferAllocateInfo', 
     ('type', StructureType),
     ('next', c_void_p),
     ('command_pool', CommandPool),
     ('level', CommandBufferLevel),
     ('command_buffer_count', c_uint32),
-)
+))
 
-CommandBufferInheritanceInfo = define_struct('CommandBufferInheritanceInfo', 
+define_lazy('CommandBufferInheritanceInfo', lambda: define_struct('CommandBufferInheritanceInfo', 
     ('type', StructureType),
     ('next', c_void_p),
     ('render_pass', RenderPass),
@@ -3173,96 +4301,96 @@ CommandBufferInheritanceInfo = define_struct('CommandBufferInheritanceInfo',
     ('occlusion_query_enable', Bool32),
     ('query_flags', QueryControlFlags),
     ('pipeline_statistics', QueryPipelineStatisticFlags),
-)
+))
 
-CommandBufferBeginInfo = define_struct('CommandBufferBeginInfo', 
+define_lazy('CommandBufferBeginInfo', lambda: define_struct('CommandBufferBeginInfo', 
     ('type', StructureType),
     ('next', c_void_p),
     ('flags', CommandBufferUsageFlags),
     ('inheritance_info', POINTER(CommandBufferInheritanceInfo)),
-)
+))
 
-BufferCopy = define_struct('BufferCopy', 
+define_lazy('BufferCopy', lambda: define_struct('BufferCopy', 
     ('src_offset', DeviceSize),
     ('dst_offset', DeviceSize),
     ('size', DeviceSize),
-)
+))
 
-ImageSubresourceLayers = define_struct('ImageSubresourceLayers', 
+define_lazy('ImageSubresourceLayers', lambda: define_struct('ImageSubresourceLayers', 
     ('aspect_mask', ImageAspectFlags),
     ('mip_level', c_uint32),
     ('base_array_layer', c_uint32),
     ('layer_count', c_uint32),
-)
+))
 
-ImageCopy = define_struct('ImageCopy', 
+define_lazy('ImageCopy', lambda: define_struct('ImageCopy', 
     ('src_subresource', ImageSubresourceLayers),
     ('src_offset', Offset3D),
     ('dst_subresource', ImageSubresourceLayers),
     ('dst_offset', Offset3D),
     ('extent', Extent3D),
-)
+))
 
-ImageBlit = define_struct('ImageBlit', 
+define_lazy('ImageBlit', lambda: define_struct('ImageBlit', 
     ('src_subresource', ImageSubresourceLayers),
     ('src_offsets', Offset3D * 2),
     ('dst_subresource', ImageSubresourceLayers),
     ('dst_offsets', Offset3D * 2),
-)
+))
 
-BufferImageCopy = define_struct('BufferImageCopy', 
+define_lazy('BufferImageCopy', lambda: define_struct('BufferImageCopy', 
     ('buffer_offset', DeviceSize),
     ('buffer_row_length', c_uint32),
     ('buffer_image_height', c_uint32),
     ('image_subresource', ImageSubresourceLayers),
     ('image_offset', Offset3D),
     ('image_extent', Extent3D),
-)
+))
 
-ClearColorValue = define_union('ClearColorValue', 
+define_lazy('ClearColorValue', lambda: define_union('ClearColorValue', 
     ('float32', c_float * 4),
     ('int32', c_int32 * 4),
     ('uint32', c_uint32 * 4),
-)
+))
 
-ClearDepthStencilValue = define_struct('ClearDepthStencilValue', 
+define_lazy('ClearDepthStencilValue', lambda: define_struct('ClearDepthStencilValue', 
     ('depth', c_float),
     ('stencil', c_uint32),
-)
+))
 
-ClearValue = define_union('ClearValue', 
+define_lazy('ClearValue', lambda: define_union('ClearValue', 
     ('color', ClearColorValue),
     ('depth_stencil', ClearDepthStencilValue),
-)
+))
 
-ClearAttachment = define_struct('ClearAttachment', 
+define_lazy('ClearAttachment', lambda: define_struct('ClearAttachment', 
     ('aspect_mask', ImageAspectFlags),
     ('color_attachment', c_uint32),
     ('clear_value', ClearValue),
-)
+))
 
-ClearRect = define_struct('ClearRect', 
+define_lazy('ClearRect', lambda: define_struct('ClearRect', 
     ('rect', Rect2D),
     ('base_array_layer', c_uint32),
     ('layer_count', c_uint32),
-)
+))
 
-ImageResolve = define_struct('ImageResolve', 
+define_lazy('ImageResolve', lambda: define_struct('ImageResolve', 
     ('src_subresource', ImageSubresourceLayers),
     ('src_offset', Offset3D),
     ('dst_subresource', ImageSubresourceLayers),
     ('dst_offset', Offset3D),
     ('extent', Extent3D),
-)
+))
 
-MemoryBarrier = define_struct('MemoryBarrier', 
+define_lazy('MemoryBarrier', lambda: define_struct('MemoryBarrier', 
     ('type', StructureType),
     ('next', c_void_p),
     ('src_access_mask', AccessFlags),
     ('dst_access_mask', AccessFlags),
-)
+))
 
-BufferMemoryBarrier = define_struct('BufferMemoryBarrier', 
+define_lazy('BufferMemoryBarrier', lambda: define_struct('BufferMemoryBarrier', 
     ('type', StructureType),
     ('next', c_void_p),
     ('src_access_mask', AccessFlags),
@@ -3272,9 +4400,9 @@ BufferMemoryBarrier = define_struct('BufferMemoryBarrier',
     ('buffer', Buffer),
     ('offset', DeviceSize),
     ('size', DeviceSize),
-)
+))
 
-ImageMemoryBarrier = define_struct('ImageMemoryBarrier', 
+define_lazy('ImageMemoryBarrier', lambda: define_struct('ImageMemoryBarrier', 
     ('type', StructureType),
     ('next', c_void_p),
     ('src_access_mask', AccessFlags),
@@ -3285,9 +4413,9 @@ ImageMemoryBarrier = define_struct('ImageMemoryBarrier',
     ('dst_queue_family_index', c_uint32),
     ('image', Image),
     ('subresource_range', ImageSubresourceRange),
-)
+))
 
-RenderPassBeginInfo = define_struct('RenderPassBeginInfo', 
+define_lazy('RenderPassBeginInfo', lambda: define_struct('RenderPassBeginInfo', 
     ('type', StructureType),
     ('next', c_void_p),
     ('render_pass', RenderPass),
@@ -3295,99 +4423,99 @@ RenderPassBeginInfo = define_struct('RenderPassBeginInfo',
     ('render_area', Rect2D),
     ('clear_value_count', c_uint32),
     ('clear_values', POINTER(ClearValue)),
-)
+))
 
-DispatchIndirectCommand = define_struct('DispatchIndirectCommand', 
+define_lazy('DispatchIndirectCommand', lambda: define_struct('DispatchIndirectCommand', 
     ('x', c_uint32),
     ('y', c_uint32),
     ('z', c_uint32),
-)
+))
 
-DrawIndexedIndirectCommand = define_struct('DrawIndexedIndirectCommand', 
+define_lazy('DrawIndexedIndirectCommand', lambda: define_struct('DrawIndexedIndirectCommand', 
     ('index_count', c_uint32),
     ('instance_count', c_uint32),
     ('first_index', c_uint32),
     ('vertex_offset', c_int32),
     ('first_instance', c_uint32),
-)
+))
 
-DrawIndirectCommand = define_struct('DrawIndirectCommand', 
+define_lazy('DrawIndirectCommand', lambda: define_struct('DrawIndirectCommand', 
     ('vertex_count', c_uint32),
     ('instance_count', c_uint32),
     ('first_vertex', c_uint32),
     ('first_instance', c_uint32),
-)
+))
 
-PhysicalDeviceSubgroupProperties = define_struct('PhysicalDeviceSubgroupProperties', 
+define_lazy('PhysicalDeviceSubgroupProperties', lambda: define_struct('PhysicalDeviceSubgroupProperties', 
     ('type', StructureType),
     ('next', c_void_p),
     ('subgroup_size', c_uint32),
     ('supported_stages', ShaderStageFlags),
     ('supported_operations', SubgroupFeatureFlags),
     ('quad_operations_inAll_stages', Bool32),
-)
+))
 
-BindBufferMemoryInfo = define_struct('BindBufferMemoryInfo', 
+define_lazy('BindBufferMemoryInfo', lambda: define_struct('BindBufferMemoryInfo', 
     ('type', StructureType),
     ('next', c_void_p),
     ('buffer', Buffer),
     ('memory', DeviceMemory),
     ('memory_offset', DeviceSize),
-)
+))
 
-BindImageMemoryInfo = define_struct('BindImageMemoryInfo', 
+define_lazy('BindImageMemoryInfo', lambda: define_struct('BindImageMemoryInfo', 
     ('type', StructureType),
     ('next', c_void_p),
     ('image', Image),
     ('memory', DeviceMemory),
     ('memory_offset', DeviceSize),
-)
+))
 
-PhysicalDevice16BitStorageFeatures = define_struct('PhysicalDevice16BitStorageFeatures', 
+define_lazy('PhysicalDevice16BitStorageFeatures', lambda: define_struct('PhysicalDevice16BitStorageFeatures', 
     ('type', StructureType),
     ('next', c_void_p),
     ('storage_buffer16_bit_access', Bool32),
     ('uniform_and_storage_buffer16_bit_access', Bool32),
     ('storage_push_constant16', Bool32),
     ('storage_input_output16', Bool32),
-)
+))
 
-MemoryDedicatedRequirements = define_struct('MemoryDedicatedRequirements', 
+define_lazy('MemoryDedicatedRequirements', lambda: define_struct('MemoryDedicatedRequirements', 
     ('type', StructureType),
     ('next', c_void_p),
     ('prefers_dedicated_allocation', Bool32),
     ('requires_dedicated_allocation', Bool32),
-)
+))
 
-MemoryDedicatedAllocateInfo = define_struct('MemoryDedicatedAllocateInfo', 
+define_lazy('MemoryDedicatedAllocateInfo', lambda: define_struct('MemoryDedicatedAllocateInfo', 
     ('type', StructureType),
     ('next', c_void_p),
     ('image', Image),
     ('buffer', Buffer),
-)
+))
 
-MemoryAllocateFlagsInfo = define_struct('MemoryAllocateFlagsInfo', 
+define_lazy('MemoryAllocateFlagsInfo', lambda: define_struct('MemoryAllocateFlagsInfo', 
     ('type', StructureType),
     ('next', c_void_p),
     ('flags', MemoryAllocateFlags),
     ('device_mask', c_uint32),
-)
+))
 
-DeviceGroupRenderPassBeginInfo = define_struct('DeviceGroupRenderPassBeginInfo', 
+define_lazy('DeviceGroupRenderPassBeginInfo', lambda: define_struct('DeviceGroupRenderPassBeginInfo', 
     ('type', StructureType),
     ('next', c_void_p),
     ('device_mask', c_uint32),
     ('device_render_area_count', c_uint32),
     ('device_render_areas', POINTER(Rect2D)),
-)
+))
 
-DeviceGroupCommandBufferBeginInfo = define_struct('DeviceGroupCommandBufferBeginInfo', 
+define_lazy('DeviceGroupCommandBufferBeginInfo', lambda: define_struct('DeviceGroupCommandBufferBeginInfo', 
     ('type', StructureType),
     ('next', c_void_p),
     ('device_mask', c_uint32),
-)
+))
 
-DeviceGroupSubmitInfo = define_struct('DeviceGroupSubmitInfo', 
+define_lazy('DeviceGroupSubmitInfo', lambda: define_struct('DeviceGroupSubmitInfo', 
     ('type', StructureType),
     ('next', c_void_p),
     ('wait_semaphore_count', c_uint32),
@@ -3396,103 +4524,103 @@ DeviceGroupSubmitInfo = define_struct('DeviceGroupSubmitInfo',
     ('command_buffer_device_masks', POINTER(c_uint32)),
     ('signal_semaphore_count', c_uint32),
     ('signal_semaphore_device_indices', POINTER(c_uint32)),
-)
+))
 
-DeviceGroupBindSparseInfo = define_struct('DeviceGroupBindSparseInfo', 
+define_lazy('DeviceGroupBindSparseInfo', lambda: define_struct('DeviceGroupBindSparseInfo', 
     ('type', StructureType),
     ('next', c_void_p),
     ('resource_device_index', c_uint32),
     ('memory_device_index', c_uint32),
-)
+))
 
-BindBufferMemoryDeviceGroupInfo = define_struct('BindBufferMemoryDeviceGroupInfo', 
+define_lazy('BindBufferMemoryDeviceGroupInfo', lambda: define_struct('BindBufferMemoryDeviceGroupInfo', 
     ('type', StructureType),
     ('next', c_void_p),
     ('device_index_count', c_uint32),
     ('device_indices', POINTER(c_uint32)),
-)
+))
 
-BindImageMemoryDeviceGroupInfo = define_struct('BindImageMemoryDeviceGroupInfo', 
+define_lazy('BindImageMemoryDeviceGroupInfo', lambda: define_struct('BindImageMemoryDeviceGroupInfo', 
     ('type', StructureType),
     ('next', c_void_p),
     ('device_index_count', c_uint32),
     ('device_indices', POINTER(c_uint32)),
     ('split_instance_bind_region_count', c_uint32),
     ('split_instance_bind_regions', POINTER(Rect2D)),
-)
+))
 
-PhysicalDeviceGroupProperties = define_struct('PhysicalDeviceGroupProperties', 
+define_lazy('PhysicalDeviceGroupProperties', lambda: define_struct('PhysicalDeviceGroupProperties', 
     ('type', StructureType),
     ('next', c_void_p),
     ('physical_device_count', c_uint32),
     ('physical_devices', PhysicalDevice * MAX_DEVICE_GROUP_SIZE),
     ('subset_allocation', Bool32),
-)
+))
 
-DeviceGroupDeviceCreateInfo = define_struct('DeviceGroupDeviceCreateInfo', 
+define_lazy('DeviceGroupDeviceCreateInfo', lambda: define_struct('DeviceGroupDeviceCreateInfo', 
     ('type', StructureType),
     ('next', c_void_p),
     ('physical_device_count', c_uint32),
     ('physical_devices', POINTER(PhysicalDevice)),
-)
+))
 
-BufferMemoryRequirementsInfo2 = define_struct('BufferMemoryRequirementsInfo2', 
+define_lazy('BufferMemoryRequirementsInfo2', lambda: define_struct('BufferMemoryRequirementsInfo2', 
     ('type', StructureType),
     ('next', c_void_p),
     ('buffer', Buffer),
-)
+))
 
-ImageMemoryRequirementsInfo2 = define_struct('ImageMemoryRequirementsInfo2', 
+define_lazy('ImageMemoryRequirementsInfo2', lambda: define_struct('ImageMemoryRequirementsInfo2', 
     ('type', StructureType),
     ('next', c_void_p),
     ('image', Image),
-)
+))
 
-ImageSparseMemoryRequirementsInfo2 = define_struct('ImageSparseMemoryRequirementsInfo2', 
+define_lazy('ImageSparseMemoryRequirementsInfo2', lambda: define_struct('ImageSparseMemoryRequirementsInfo2', 
     ('type', StructureType),
     ('next', c_void_p),
     ('image', Image),
-)
+))
 
-MemoryRequirements2 = define_struct('MemoryRequirements2', 
+define_lazy('MemoryRequirements2', lambda: define_struct('MemoryRequirements2', 
     ('type', StructureType),
     ('next', c_void_p),
     ('memory_requirements', MemoryRequirements),
-)
+))
 
-MemoryRequirements2KHR = MemoryRequirements2
+define_lazy('MemoryRequirements2KHR', lambda: MemoryRequirements2)
 
-SparseImageMemoryRequirements2 = define_struct('SparseImageMemoryRequirements2', 
+define_lazy('SparseImageMemoryRequirements2', lambda: define_struct('SparseImageMemoryRequirements2', 
     ('type', StructureType),
     ('next', c_void_p),
     ('memory_requirements', SparseImageMemoryRequirements),
-)
+))
 
-PhysicalDeviceFeatures2 = define_struct('PhysicalDeviceFeatures2', 
+define_lazy('PhysicalDeviceFeatures2', lambda: define_struct('PhysicalDeviceFeatures2', 
     ('type', StructureType),
     ('next', c_void_p),
     ('features', PhysicalDeviceFeatures),
-)
+))
 
-PhysicalDeviceProperties2 = define_struct('PhysicalDeviceProperties2', 
+define_lazy('PhysicalDeviceProperties2', lambda: define_struct('PhysicalDeviceProperties2', 
     ('type', StructureType),
     ('next', c_void_p),
     ('properties', PhysicalDeviceProperties),
-)
+))
 
-FormatProperties2 = define_struct('FormatProperties2', 
+define_lazy('FormatProperties2', lambda: define_struct('FormatProperties2', 
     ('type', StructureType),
     ('next', c_void_p),
     ('format_properties', FormatProperties),
-)
+))
 
-ImageFormatProperties2 = define_struct('ImageFormatProperties2', 
+define_lazy('ImageFormatProperties2', lambda: define_struct('ImageFormatProperties2', 
     ('type', StructureType),
     ('next', c_void_p),
     ('image_format_properties', ImageFormatProperties),
-)
+))
 
-PhysicalDeviceImageFormatInfo2 = define_struct('PhysicalDeviceImageFormatInfo2', 
+define_lazy('PhysicalDeviceImageFormatInfo2', lambda: define_struct('PhysicalDeviceImageFormatInfo2', 
     ('type', StructureType),
     ('next', c_void_p),
     ('format', Format),
@@ -3500,27 +4628,27 @@ PhysicalDeviceImageFormatInfo2 = define_struct('PhysicalDeviceImageFormatInfo2',
     ('tiling', ImageTiling),
     ('usage', ImageUsageFlags),
     ('flags', ImageCreateFlags),
-)
+))
 
-QueueFamilyProperties2 = define_struct('QueueFamilyProperties2', 
+define_lazy('QueueFamilyProperties2', lambda: define_struct('QueueFamilyProperties2', 
     ('type', StructureType),
     ('next', c_void_p),
     ('queue_family_properties', QueueFamilyProperties),
-)
+))
 
-PhysicalDeviceMemoryProperties2 = define_struct('PhysicalDeviceMemoryProperties2', 
+define_lazy('PhysicalDeviceMemoryProperties2', lambda: define_struct('PhysicalDeviceMemoryProperties2', 
     ('type', StructureType),
     ('next', c_void_p),
     ('memory_properties', PhysicalDeviceMemoryProperties),
-)
+))
 
-SparseImageFormatProperties2 = define_struct('SparseImageFormatProperties2', 
+define_lazy('SparseImageFormatProperties2', lambda: define_struct('SparseImageFormatProperties2', 
     ('type', StructureType),
     ('next', c_void_p),
     ('properties', SparseImageFormatProperties),
-)
+))
 
-PhysicalDeviceSparseImageFormatInfo2 = define_struct('PhysicalDeviceSparseImageFormatInfo2', 
+define_lazy('PhysicalDeviceSparseImageFormatInfo2', lambda: define_struct('PhysicalDeviceSparseImageFormatInfo2', 
     ('type', StructureType),
     ('next', c_void_p),
     ('format', Format),
@@ -3528,40 +4656,40 @@ PhysicalDeviceSparseImageFormatInfo2 = define_struct('PhysicalDeviceSparseImageF
     ('samples', SampleCountFlagBits),
     ('usage', ImageUsageFlags),
     ('tiling', ImageTiling),
-)
+))
 
-PhysicalDevicePointClippingProperties = define_struct('PhysicalDevicePointClippingProperties', 
+define_lazy('PhysicalDevicePointClippingProperties', lambda: define_struct('PhysicalDevicePointClippingProperties', 
     ('type', StructureType),
     ('next', c_void_p),
     ('point_clipping_behavior', PointClippingBehavior),
-)
+))
 
-InputAttachmentAspectReference = define_struct('InputAttachmentAspectReference', 
+define_lazy('InputAttachmentAspectReference', lambda: define_struct('InputAttachmentAspectReference', 
     ('subpass', c_uint32),
     ('input_attachment_index', c_uint32),
     ('aspect_mask', ImageAspectFlags),
-)
+))
 
-RenderPassInputAttachmentAspectCreateInfo = define_struct('RenderPassInputAttachmentAspectCreateInfo', 
+define_lazy('RenderPassInputAttachmentAspectCreateInfo', lambda: define_struct('RenderPassInputAttachmentAspectCreateInfo', 
     ('type', StructureType),
     ('next', c_void_p),
     ('aspect_reference_count', c_uint32),
     ('aspect_references', POINTER(InputAttachmentAspectReference)),
-)
+))
 
-ImageViewUsageCreateInfo = define_struct('ImageViewUsageCreateInfo', 
+define_lazy('ImageViewUsageCreateInfo', lambda: define_struct('ImageViewUsageCreateInfo', 
     ('type', StructureType),
     ('next', c_void_p),
     ('usage', ImageUsageFlags),
-)
+))
 
-PipelineTessellationDomainOriginStateCreateInfo = define_struct('PipelineTessellationDomainOriginStateCreateInfo', 
+define_lazy('PipelineTessellationDomainOriginStateCreateInfo', lambda: define_struct('PipelineTessellationDomainOriginStateCreateInfo', 
     ('type', StructureType),
     ('next', c_void_p),
     ('domain_origin', TessellationDomainOrigin),
-)
+))
 
-RenderPassMultiviewCreateInfo = define_struct('RenderPassMultiviewCreateInfo', 
+define_lazy('RenderPassMultiviewCreateInfo', lambda: define_struct('RenderPassMultiviewCreateInfo', 
     ('type', StructureType),
     ('next', c_void_p),
     ('subpass_count', c_uint32),
@@ -3570,57 +4698,57 @@ RenderPassMultiviewCreateInfo = define_struct('RenderPassMultiviewCreateInfo',
     ('view_offsets', POINTER(c_int32)),
     ('correlation_mask_count', c_uint32),
     ('correlation_masks', POINTER(c_uint32)),
-)
+))
 
-PhysicalDeviceMultiviewFeatures = define_struct('PhysicalDeviceMultiviewFeatures', 
+define_lazy('PhysicalDeviceMultiviewFeatures', lambda: define_struct('PhysicalDeviceMultiviewFeatures', 
     ('type', StructureType),
     ('next', c_void_p),
     ('multiview', Bool32),
     ('multiview_geometry_shader', Bool32),
     ('multiview_tessellation_shader', Bool32),
-)
+))
 
-PhysicalDeviceMultiviewProperties = define_struct('PhysicalDeviceMultiviewProperties', 
+define_lazy('PhysicalDeviceMultiviewProperties', lambda: define_struct('PhysicalDeviceMultiviewProperties', 
     ('type', StructureType),
     ('next', c_void_p),
     ('max_multiview_view_count', c_uint32),
     ('max_multiview_instance_index', c_uint32),
-)
+))
 
-PhysicalDeviceVariablePointerFeatures = define_struct('PhysicalDeviceVariablePointerFeatures', 
+define_lazy('PhysicalDeviceVariablePointerFeatures', lambda: define_struct('PhysicalDeviceVariablePointerFeatures', 
     ('type', StructureType),
     ('next', c_void_p),
     ('variable_pointers_storage_buffer', Bool32),
     ('variable_pointers', Bool32),
-)
+))
 
-PhysicalDeviceProtectedMemoryFeatures = define_struct('PhysicalDeviceProtectedMemoryFeatures', 
+define_lazy('PhysicalDeviceProtectedMemoryFeatures', lambda: define_struct('PhysicalDeviceProtectedMemoryFeatures', 
     ('type', StructureType),
     ('next', c_void_p),
     ('protected_memory', Bool32),
-)
+))
 
-PhysicalDeviceProtectedMemoryProperties = define_struct('PhysicalDeviceProtectedMemoryProperties', 
+define_lazy('PhysicalDeviceProtectedMemoryProperties', lambda: define_struct('PhysicalDeviceProtectedMemoryProperties', 
     ('type', StructureType),
     ('next', c_void_p),
     ('protected_noFault', Bool32),
-)
+))
 
-DeviceQueueInfo2 = define_struct('DeviceQueueInfo2', 
+define_lazy('DeviceQueueInfo2', lambda: define_struct('DeviceQueueInfo2', 
     ('type', StructureType),
     ('next', c_void_p),
     ('flags', DeviceQueueCreateFlags),
     ('queue_family_index', c_uint32),
     ('queue_index', c_uint32),
-)
+))
 
-ProtectedSubmitInfo = define_struct('ProtectedSubmitInfo', 
+define_lazy('ProtectedSubmitInfo', lambda: define_struct('ProtectedSubmitInfo', 
     ('type', StructureType),
     ('next', c_void_p),
     ('protected_submit', Bool32),
-)
+))
 
-SamplerYcbcrConversionCreateInfo = define_struct('SamplerYcbcrConversionCreateInfo', 
+define_lazy('SamplerYcbcrConversionCreateInfo', lambda: define_struct('SamplerYcbcrConversionCreateInfo', 
     ('type', StructureType),
     ('next', c_void_p),
     ('format', Format),
@@ -3631,48 +4759,48 @@ SamplerYcbcrConversionCreateInfo = define_struct('SamplerYcbcrConversionCreateIn
     ('y_chroma_offset', ChromaLocation),
     ('chroma_filter', Filter),
     ('force_explicit_reconstruction', Bool32),
-)
+))
 
-SamplerYcbcrConversionInfo = define_struct('SamplerYcbcrConversionInfo', 
+define_lazy('SamplerYcbcrConversionInfo', lambda: define_struct('SamplerYcbcrConversionInfo', 
     ('type', StructureType),
     ('next', c_void_p),
     ('conversion', SamplerYcbcrConversion),
-)
+))
 
-BindImagePlaneMemoryInfo = define_struct('BindImagePlaneMemoryInfo', 
+define_lazy('BindImagePlaneMemoryInfo', lambda: define_struct('BindImagePlaneMemoryInfo', 
     ('type', StructureType),
     ('next', c_void_p),
     ('plane_aspect', ImageAspectFlagBits),
-)
+))
 
-ImagePlaneMemoryRequirementsInfo = define_struct('ImagePlaneMemoryRequirementsInfo', 
+define_lazy('ImagePlaneMemoryRequirementsInfo', lambda: define_struct('ImagePlaneMemoryRequirementsInfo', 
     ('type', StructureType),
     ('next', c_void_p),
     ('plane_aspect', ImageAspectFlagBits),
-)
+))
 
-PhysicalDeviceSamplerYcbcrConversionFeatures = define_struct('PhysicalDeviceSamplerYcbcrConversionFeatures', 
+define_lazy('PhysicalDeviceSamplerYcbcrConversionFeatures', lambda: define_struct('PhysicalDeviceSamplerYcbcrConversionFeatures', 
     ('type', StructureType),
     ('next', c_void_p),
     ('sampler_ycbcr_conversion', Bool32),
-)
+))
 
-SamplerYcbcrConversionImageFormatProperties = define_struct('SamplerYcbcrConversionImageFormatProperties', 
+define_lazy('SamplerYcbcrConversionImageFormatProperties', lambda: define_struct('SamplerYcbcrConversionImageFormatProperties', 
     ('type', StructureType),
     ('next', c_void_p),
     ('combined_image_sampler_descriptor_count', c_uint32),
-)
+))
 
-DescriptorUpdateTemplateEntry = define_struct('DescriptorUpdateTemplateEntry', 
+define_lazy('DescriptorUpdateTemplateEntry', lambda: define_struct('DescriptorUpdateTemplateEntry', 
     ('dst_binding', c_uint32),
     ('dst_array_element', c_uint32),
     ('descriptor_count', c_uint32),
     ('descriptor_type', DescriptorType),
     ('offset', c_size_t),
     ('stride', c_size_t),
-)
+))
 
-DescriptorUpdateTemplateCreateInfo = define_struct('DescriptorUpdateTemplateCreateInfo', 
+define_lazy('DescriptorUpdateTemplateCreateInfo', lambda: define_struct('DescriptorUpdateTemplateCreateInfo', 
     ('type', StructureType),
     ('next', c_void_p),
     ('flags', DescriptorUpdateTemplateCreateFlags),
@@ -3683,41 +4811,41 @@ DescriptorUpdateTemplateCreateInfo = define_struct('DescriptorUpdateTemplateCrea
     ('pipeline_bind_point', PipelineBindPoint),
     ('pipeline_layout', PipelineLayout),
     ('set', c_uint32),
-)
+))
 
-ExternalMemoryProperties = define_struct('ExternalMemoryProperties', 
+define_lazy('ExternalMemoryProperties', lambda: define_struct('ExternalMemoryProperties', 
     ('external_memory_features', ExternalMemoryFeatureFlags),
     ('export_from_imported_handle_types', ExternalMemoryHandleTypeFlags),
     ('compatible_handle_types', ExternalMemoryHandleTypeFlags),
-)
+))
 
-PhysicalDeviceExternalImageFormatInfo = define_struct('PhysicalDeviceExternalImageFormatInfo', 
+define_lazy('PhysicalDeviceExternalImageFormatInfo', lambda: define_struct('PhysicalDeviceExternalImageFormatInfo', 
     ('type', StructureType),
     ('next', c_void_p),
     ('handle_type', ExternalMemoryHandleTypeFlagBits),
-)
+))
 
-ExternalImageFormatProperties = define_struct('ExternalImageFormatProperties', 
+define_lazy('ExternalImageFormatProperties', lambda: define_struct('ExternalImageFormatProperties', 
     ('type', StructureType),
     ('next', c_void_p),
     ('external_memory_properties', ExternalMemoryProperties),
-)
+))
 
-PhysicalDeviceExternalBufferInfo = define_struct('PhysicalDeviceExternalBufferInfo', 
+define_lazy('PhysicalDeviceExternalBufferInfo', lambda: define_struct('PhysicalDeviceExternalBufferInfo', 
     ('type', StructureType),
     ('next', c_void_p),
     ('flags', BufferCreateFlags),
     ('usage', BufferUsageFlags),
     ('handle_type', ExternalMemoryHandleTypeFlagBits),
-)
+))
 
-ExternalBufferProperties = define_struct('ExternalBufferProperties', 
+define_lazy('ExternalBufferProperties', lambda: define_struct('ExternalBufferProperties', 
     ('type', StructureType),
     ('next', c_void_p),
     ('external_memory_properties', ExternalMemoryProperties),
-)
+))
 
-PhysicalDeviceIDProperties = define_struct('PhysicalDeviceIDProperties', 
+define_lazy('PhysicalDeviceIDProperties', lambda: define_struct('PhysicalDeviceIDProperties', 
     ('type', StructureType),
     ('next', c_void_p),
     ('device_UUID', c_int8 * UUID_SIZE),
@@ -3725,86 +4853,86 @@ PhysicalDeviceIDProperties = define_struct('PhysicalDeviceIDProperties',
     ('device_LUID', c_int8 * LUID_SIZE),
     ('device_node_mask', c_uint32),
     ('device_LUIDValid', Bool32),
-)
+))
 
-ExternalMemoryImageCreateInfo = define_struct('ExternalMemoryImageCreateInfo', 
+define_lazy('ExternalMemoryImageCreateInfo', lambda: define_struct('ExternalMemoryImageCreateInfo', 
     ('type', StructureType),
     ('next', c_void_p),
     ('handle_types', ExternalMemoryHandleTypeFlags),
-)
+))
 
-ExternalMemoryBufferCreateInfo = define_struct('ExternalMemoryBufferCreateInfo', 
+define_lazy('ExternalMemoryBufferCreateInfo', lambda: define_struct('ExternalMemoryBufferCreateInfo', 
     ('type', StructureType),
     ('next', c_void_p),
     ('handle_types', ExternalMemoryHandleTypeFlags),
-)
+))
 
-ExportMemoryAllocateInfo = define_struct('ExportMemoryAllocateInfo', 
+define_lazy('ExportMemoryAllocateInfo', lambda: define_struct('ExportMemoryAllocateInfo', 
     ('type', StructureType),
     ('next', c_void_p),
     ('handle_types', ExternalMemoryHandleTypeFlags),
-)
+))
 
-PhysicalDeviceExternalFenceInfo = define_struct('PhysicalDeviceExternalFenceInfo', 
+define_lazy('PhysicalDeviceExternalFenceInfo', lambda: define_struct('PhysicalDeviceExternalFenceInfo', 
     ('type', StructureType),
     ('next', c_void_p),
     ('handle_type', ExternalFenceHandleTypeFlagBits),
-)
+))
 
-ExternalFenceProperties = define_struct('ExternalFenceProperties', 
+define_lazy('ExternalFenceProperties', lambda: define_struct('ExternalFenceProperties', 
     ('type', StructureType),
     ('next', c_void_p),
     ('export_from_imported_handle_types', ExternalFenceHandleTypeFlags),
     ('compatible_handle_types', ExternalFenceHandleTypeFlags),
     ('external_fence_features', ExternalFenceFeatureFlags),
-)
+))
 
-ExportFenceCreateInfo = define_struct('ExportFenceCreateInfo', 
+define_lazy('ExportFenceCreateInfo', lambda: define_struct('ExportFenceCreateInfo', 
     ('type', StructureType),
     ('next', c_void_p),
     ('handle_types', ExternalFenceHandleTypeFlags),
-)
+))
 
-ExportSemaphoreCreateInfo = define_struct('ExportSemaphoreCreateInfo', 
+define_lazy('ExportSemaphoreCreateInfo', lambda: define_struct('ExportSemaphoreCreateInfo', 
     ('type', StructureType),
     ('next', c_void_p),
     ('handle_types', ExternalSemaphoreHandleTypeFlags),
-)
+))
 
-PhysicalDeviceExternalSemaphoreInfo = define_struct('PhysicalDeviceExternalSemaphoreInfo', 
+define_lazy('PhysicalDeviceExternalSemaphoreInfo', lambda: define_struct('PhysicalDeviceExternalSemaphoreInfo', 
     ('type', StructureType),
     ('next', c_void_p),
     ('handle_type', ExternalSemaphoreHandleTypeFlagBits),
-)
+))
 
-ExternalSemaphoreProperties = define_struct('ExternalSemaphoreProperties', 
+define_lazy('ExternalSemaphoreProperties', lambda: define_struct('ExternalSemaphoreProperties', 
     ('type', StructureType),
     ('next', c_void_p),
     ('export_from_imported_handle_types', ExternalSemaphoreHandleTypeFlags),
     ('compatible_handle_types', ExternalSemaphoreHandleTypeFlags),
     ('external_semaphore_features', ExternalSemaphoreFeatureFlags),
-)
+))
 
-PhysicalDeviceMaintenance3Properties = define_struct('PhysicalDeviceMaintenance3Properties', 
+define_lazy('PhysicalDeviceMaintenance3Properties', lambda: define_struct('PhysicalDeviceMaintenance3Properties', 
     ('type', StructureType),
     ('next', c_void_p),
     ('max_per_set_descriptors', c_uint32),
     ('max_memory_allocation_size', DeviceSize),
-)
+))
 
-DescriptorSetLayoutSupport = define_struct('DescriptorSetLayoutSupport', 
+define_lazy('DescriptorSetLayoutSupport', lambda: define_struct('DescriptorSetLayoutSupport', 
     ('type', StructureType),
     ('next', c_void_p),
     ('supported', Bool32),
-)
+))
 
-PhysicalDeviceShaderDrawParameterFeatures = define_struct('PhysicalDeviceShaderDrawParameterFeatures', 
+define_lazy('PhysicalDeviceShaderDrawParameterFeatures', lambda: define_struct('PhysicalDeviceShaderDrawParameterFeatures', 
     ('type', StructureType),
     ('next', c_void_p),
     ('shader_draw_parameters', Bool32),
-)
+))
 
-SurfaceCapabilitiesKHR = define_struct('SurfaceCapabilitiesKHR', 
+define_lazy('SurfaceCapabilitiesKHR', lambda: define_struct('SurfaceCapabilitiesKHR', 
     ('min_image_count', c_uint32),
     ('max_image_count', c_uint32),
     ('current_extent', Extent2D),
@@ -3815,14 +4943,14 @@ SurfaceCapabilitiesKHR = define_struct('SurfaceCapabilitiesKHR',
     ('current_transform', SurfaceTransformFlagBitsKHR),
     ('supported_composite_alpha', CompositeAlphaFlagsKHR),
     ('supported_usage_flags', ImageUsageFlags),
-)
+))
 
-SurfaceFormatKHR = define_struct('SurfaceFormatKHR', 
+define_lazy('SurfaceFormatKHR', lambda: define_struct('SurfaceFormatKHR', 
     ('format', Format),
     ('color_space', ColorSpaceKHR),
-)
+))
 
-SwapchainCreateInfoKHR = define_struct('SwapchainCreateInfoKHR', 
+define_lazy('SwapchainCreateInfoKHR', lambda: define_struct('SwapchainCreateInfoKHR', 
     ('type', StructureType),
     ('next', c_void_p),
     ('flags', SwapchainCreateFlagsKHR),
@@ -3841,9 +4969,9 @@ SwapchainCreateInfoKHR = define_struct('SwapchainCreateInfoKHR',
     ('present_mode', PresentModeKHR),
     ('clipped', Bool32),
     ('old_swapchain', SwapchainKHR),
-)
+))
 
-PresentInfoKHR = define_struct('PresentInfoKHR', 
+define_lazy('PresentInfoKHR', lambda: define_struct('PresentInfoKHR', 
     ('type', StructureType),
     ('next', c_void_p),
     ('wait_semaphore_count', c_uint32),
@@ -3852,22 +4980,22 @@ PresentInfoKHR = define_struct('PresentInfoKHR',
     ('swapchains', POINTER(SwapchainKHR)),
     ('image_indices', POINTER(c_uint32)),
     ('results', POINTER(Result)),
-)
+))
 
-ImageSwapchainCreateInfoKHR = define_struct('ImageSwapchainCreateInfoKHR', 
+define_lazy('ImageSwapchainCreateInfoKHR', lambda: define_struct('ImageSwapchainCreateInfoKHR', 
     ('type', StructureType),
     ('next', c_void_p),
     ('swapchain', SwapchainKHR),
-)
+))
 
-BindImageMemorySwapchainInfoKHR = define_struct('BindImageMemorySwapchainInfoKHR', 
+define_lazy('BindImageMemorySwapchainInfoKHR', lambda: define_struct('BindImageMemorySwapchainInfoKHR', 
     ('type', StructureType),
     ('next', c_void_p),
     ('swapchain', SwapchainKHR),
     ('image_index', c_uint32),
-)
+))
 
-AcquireNextImageInfoKHR = define_struct('AcquireNextImageInfoKHR', 
+define_lazy('AcquireNextImageInfoKHR', lambda: define_struct('AcquireNextImageInfoKHR', 
     ('type', StructureType),
     ('next', c_void_p),
     ('swapchain', SwapchainKHR),
@@ -3875,30 +5003,30 @@ AcquireNextImageInfoKHR = define_struct('AcquireNextImageInfoKHR',
     ('semaphore', Semaphore),
     ('fence', Fence),
     ('device_mask', c_uint32),
-)
+))
 
-DeviceGroupPresentCapabilitiesKHR = define_struct('DeviceGroupPresentCapabilitiesKHR', 
+define_lazy('DeviceGroupPresentCapabilitiesKHR', lambda: define_struct('DeviceGroupPresentCapabilitiesKHR', 
     ('type', StructureType),
     ('next', c_void_p),
     ('present_mask', c_uint32 * MAX_DEVICE_GROUP_SIZE),
     ('modes', DeviceGroupPresentModeFlagsKHR),
-)
+))
 
-DeviceGroupPresentInfoKHR = define_struct('DeviceGroupPresentInfoKHR', 
+define_lazy('DeviceGroupPresentInfoKHR', lambda: define_struct('DeviceGroupPresentInfoKHR', 
     ('type', StructureType),
     ('next', c_void_p),
     ('swapchain_count', c_uint32),
     ('device_masks', POINTER(c_uint32)),
     ('mode', DeviceGroupPresentModeFlagBitsKHR),
-)
+))
 
-DeviceGroupSwapchainCreateInfoKHR = define_struct('DeviceGroupSwapchainCreateInfoKHR', 
+define_lazy('DeviceGroupSwapchainCreateInfoKHR', lambda: define_struct('DeviceGroupSwapchainCreateInfoKHR', 
     ('type', StructureType),
     ('next', c_void_p),
     ('modes', DeviceGroupPresentModeFlagsKHR),
-)
+))
 
-DisplayPropertiesKHR = define_struct('DisplayPropertiesKHR', 
+define_lazy('DisplayPropertiesKHR', lambda: define_struct('DisplayPropertiesKHR', 
     ('display', DisplayKHR),
     ('display_name', c_char_p),
     ('physical_dimensions', Extent2D),
@@ -3906,26 +5034,26 @@ DisplayPropertiesKHR = define_struct('DisplayPropertiesKHR',
     ('supported_transforms', SurfaceTransformFlagsKHR),
     ('plane_reorder_possible', Bool32),
     ('persistent_content', Bool32),
-)
+))
 
-DisplayModeParametersKHR = define_struct('DisplayModeParametersKHR', 
+define_lazy('DisplayModeParametersKHR', lambda: define_struct('DisplayModeParametersKHR', 
     ('visible_region', Extent2D),
     ('refresh_rate', c_uint32),
-)
+))
 
-DisplayModePropertiesKHR = define_struct('DisplayModePropertiesKHR', 
+define_lazy('DisplayModePropertiesKHR', lambda: define_struct('DisplayModePropertiesKHR', 
     ('display_mode', DisplayModeKHR),
     ('parameters', DisplayModeParametersKHR),
-)
+))
 
-DisplayModeCreateInfoKHR = define_struct('DisplayModeCreateInfoKHR', 
+define_lazy('DisplayModeCreateInfoKHR', lambda: define_struct('DisplayModeCreateInfoKHR', 
     ('type', StructureType),
     ('next', c_void_p),
     ('flags', DisplayModeCreateFlagsKHR),
     ('parameters', DisplayModeParametersKHR),
-)
+))
 
-DisplayPlaneCapabilitiesKHR = define_struct('DisplayPlaneCapabilitiesKHR', 
+define_lazy('DisplayPlaneCapabilitiesKHR', lambda: define_struct('DisplayPlaneCapabilitiesKHR', 
     ('supported_alpha', DisplayPlaneAlphaFlagsKHR),
     ('min_src_position', Offset2D),
     ('max_src_position', Offset2D),
@@ -3935,14 +5063,14 @@ DisplayPlaneCapabilitiesKHR = define_struct('DisplayPlaneCapabilitiesKHR',
     ('max_dst_position', Offset2D),
     ('min_dst_extent', Extent2D),
     ('max_dst_extent', Extent2D),
-)
+))
 
-DisplayPlanePropertiesKHR = define_struct('DisplayPlanePropertiesKHR', 
+define_lazy('DisplayPlanePropertiesKHR', lambda: define_struct('DisplayPlanePropertiesKHR', 
     ('current_display', DisplayKHR),
     ('current_stack_index', c_uint32),
-)
+))
 
-DisplaySurfaceCreateInfoKHR = define_struct('DisplaySurfaceCreateInfoKHR', 
+define_lazy('DisplaySurfaceCreateInfoKHR', lambda: define_struct('DisplaySurfaceCreateInfoKHR', 
     ('type', StructureType),
     ('next', c_void_p),
     ('flags', DisplaySurfaceCreateFlagsKHR),
@@ -3953,77 +5081,77 @@ DisplaySurfaceCreateInfoKHR = define_struct('DisplaySurfaceCreateInfoKHR',
     ('global_alpha', c_float),
     ('alpha_mode', DisplayPlaneAlphaFlagBitsKHR),
     ('image_extent', Extent2D),
-)
+))
 
-DisplayPresentInfoKHR = define_struct('DisplayPresentInfoKHR', 
+define_lazy('DisplayPresentInfoKHR', lambda: define_struct('DisplayPresentInfoKHR', 
     ('type', StructureType),
     ('next', c_void_p),
     ('src_rect', Rect2D),
     ('dst_rect', Rect2D),
     ('persistent', Bool32),
-)
+))
 
-ImportMemoryFdInfoKHR = define_struct('ImportMemoryFdInfoKHR', 
+define_lazy('ImportMemoryFdInfoKHR', lambda: define_struct('ImportMemoryFdInfoKHR', 
     ('type', StructureType),
     ('next', c_void_p),
     ('handle_type', ExternalMemoryHandleTypeFlagBits),
     ('fd', c_int32),
-)
+))
 
-MemoryFdPropertiesKHR = define_struct('MemoryFdPropertiesKHR', 
+define_lazy('MemoryFdPropertiesKHR', lambda: define_struct('MemoryFdPropertiesKHR', 
     ('type', StructureType),
     ('next', c_void_p),
     ('memory_type_bits', c_uint32),
-)
+))
 
-MemoryGetFdInfoKHR = define_struct('MemoryGetFdInfoKHR', 
+define_lazy('MemoryGetFdInfoKHR', lambda: define_struct('MemoryGetFdInfoKHR', 
     ('type', StructureType),
     ('next', c_void_p),
     ('memory', DeviceMemory),
     ('handle_type', ExternalMemoryHandleTypeFlagBits),
-)
+))
 
-ImportSemaphoreFdInfoKHR = define_struct('ImportSemaphoreFdInfoKHR', 
+define_lazy('ImportSemaphoreFdInfoKHR', lambda: define_struct('ImportSemaphoreFdInfoKHR', 
     ('type', StructureType),
     ('next', c_void_p),
     ('semaphore', Semaphore),
     ('flags', SemaphoreImportFlags),
     ('handle_type', ExternalSemaphoreHandleTypeFlagBits),
     ('fd', c_int32),
-)
+))
 
-SemaphoreGetFdInfoKHR = define_struct('SemaphoreGetFdInfoKHR', 
+define_lazy('SemaphoreGetFdInfoKHR', lambda: define_struct('SemaphoreGetFdInfoKHR', 
     ('type', StructureType),
     ('next', c_void_p),
     ('semaphore', Semaphore),
     ('handle_type', ExternalSemaphoreHandleTypeFlagBits),
-)
+))
 
-PhysicalDevicePushDescriptorPropertiesKHR = define_struct('PhysicalDevicePushDescriptorPropertiesKHR', 
+define_lazy('PhysicalDevicePushDescriptorPropertiesKHR', lambda: define_struct('PhysicalDevicePushDescriptorPropertiesKHR', 
     ('type', StructureType),
     ('next', c_void_p),
     ('max_push_descriptors', c_uint32),
-)
+))
 
-RectLayerKHR = define_struct('RectLayerKHR', 
+define_lazy('RectLayerKHR', lambda: define_struct('RectLayerKHR', 
     ('offset', Offset2D),
     ('extent', Extent2D),
     ('layer', c_uint32),
-)
+))
 
-PresentRegionKHR = define_struct('PresentRegionKHR', 
+define_lazy('PresentRegionKHR', lambda: define_struct('PresentRegionKHR', 
     ('rectangle_count', c_uint32),
     ('rectangles', POINTER(RectLayerKHR)),
-)
+))
 
-PresentRegionsKHR = define_struct('PresentRegionsKHR', 
+define_lazy('PresentRegionsKHR', lambda: define_struct('PresentRegionsKHR', 
     ('type', StructureType),
     ('next', c_void_p),
     ('swapchain_count', c_uint32),
     ('regions', POINTER(PresentRegionKHR)),
-)
+))
 
-AttachmentDescription2KHR = define_struct('AttachmentDescription2KHR', 
+define_lazy('AttachmentDescription2KHR', lambda: define_struct('AttachmentDescription2KHR', 
     ('type', StructureType),
     ('next', c_void_p),
     ('flags', AttachmentDescriptionFlags),
@@ -4035,17 +5163,17 @@ AttachmentDescription2KHR = define_struct('AttachmentDescription2KHR',
     ('stencil_store_op', AttachmentStoreOp),
     ('initial_layout', ImageLayout),
     ('final_layout', ImageLayout),
-)
+))
 
-AttachmentReference2KHR = define_struct('AttachmentReference2KHR', 
+define_lazy('AttachmentReference2KHR', lambda: define_struct('AttachmentReference2KHR', 
     ('type', StructureType),
     ('next', c_void_p),
     ('attachment', c_uint32),
     ('layout', ImageLayout),
     ('aspect_mask', ImageAspectFlags),
-)
+))
 
-SubpassDescription2KHR = define_struct('SubpassDescription2KHR', 
+define_lazy('SubpassDescription2KHR', lambda: define_struct('SubpassDescription2KHR', 
     ('type', StructureType),
     ('next', c_void_p),
     ('flags', SubpassDescriptionFlags),
@@ -4059,9 +5187,9 @@ SubpassDescription2KHR = define_struct('SubpassDescription2KHR',
     ('depth_stencil_attachment', POINTER(AttachmentReference2KHR)),
     ('preserve_attachment_count', c_uint32),
     ('preserve_attachments', POINTER(c_uint32)),
-)
+))
 
-SubpassDependency2KHR = define_struct('SubpassDependency2KHR', 
+define_lazy('SubpassDependency2KHR', lambda: define_struct('SubpassDependency2KHR', 
     ('type', StructureType),
     ('next', c_void_p),
     ('src_subpass', c_uint32),
@@ -4072,9 +5200,9 @@ SubpassDependency2KHR = define_struct('SubpassDependency2KHR',
     ('dst_access_mask', AccessFlags),
     ('dependency_flags', DependencyFlags),
     ('view_offset', c_int32),
-)
+))
 
-RenderPassCreateInfo2KHR = define_struct('RenderPassCreateInfo2KHR', 
+define_lazy('RenderPassCreateInfo2KHR', lambda: define_struct('RenderPassCreateInfo2KHR', 
     ('type', StructureType),
     ('next', c_void_p),
     ('flags', RenderPassCreateFlags),
@@ -4086,158 +5214,158 @@ RenderPassCreateInfo2KHR = define_struct('RenderPassCreateInfo2KHR',
     ('dependencies', POINTER(SubpassDependency2KHR)),
     ('correlated_view_mask_count', c_uint32),
     ('correlated_view_masks', POINTER(c_uint32)),
-)
+))
 
-SubpassBeginInfoKHR = define_struct('SubpassBeginInfoKHR', 
+define_lazy('SubpassBeginInfoKHR', lambda: define_struct('SubpassBeginInfoKHR', 
     ('type', StructureType),
     ('next', c_void_p),
     ('contents', SubpassContents),
-)
+))
 
-SubpassEndInfoKHR = define_struct('SubpassEndInfoKHR', 
+define_lazy('SubpassEndInfoKHR', lambda: define_struct('SubpassEndInfoKHR', 
     ('type', StructureType),
     ('next', c_void_p),
-)
+))
 
-SharedPresentSurfaceCapabilitiesKHR = define_struct('SharedPresentSurfaceCapabilitiesKHR', 
+define_lazy('SharedPresentSurfaceCapabilitiesKHR', lambda: define_struct('SharedPresentSurfaceCapabilitiesKHR', 
     ('type', StructureType),
     ('next', c_void_p),
     ('shared_present_supported_usage_flags', ImageUsageFlags),
-)
+))
 
-ImportFenceFdInfoKHR = define_struct('ImportFenceFdInfoKHR', 
+define_lazy('ImportFenceFdInfoKHR', lambda: define_struct('ImportFenceFdInfoKHR', 
     ('type', StructureType),
     ('next', c_void_p),
     ('fence', Fence),
     ('flags', FenceImportFlags),
     ('handle_type', ExternalFenceHandleTypeFlagBits),
     ('fd', c_int32),
-)
+))
 
-FenceGetFdInfoKHR = define_struct('FenceGetFdInfoKHR', 
+define_lazy('FenceGetFdInfoKHR', lambda: define_struct('FenceGetFdInfoKHR', 
     ('type', StructureType),
     ('next', c_void_p),
     ('fence', Fence),
     ('handle_type', ExternalFenceHandleTypeFlagBits),
-)
+))
 
-PhysicalDeviceSurfaceInfo2KHR = define_struct('PhysicalDeviceSurfaceInfo2KHR', 
+define_lazy('PhysicalDeviceSurfaceInfo2KHR', lambda: define_struct('PhysicalDeviceSurfaceInfo2KHR', 
     ('type', StructureType),
     ('next', c_void_p),
     ('surface', SurfaceKHR),
-)
+))
 
-SurfaceCapabilities2KHR = define_struct('SurfaceCapabilities2KHR', 
+define_lazy('SurfaceCapabilities2KHR', lambda: define_struct('SurfaceCapabilities2KHR', 
     ('type', StructureType),
     ('next', c_void_p),
     ('surface_capabilities', SurfaceCapabilitiesKHR),
-)
+))
 
-SurfaceFormat2KHR = define_struct('SurfaceFormat2KHR', 
+define_lazy('SurfaceFormat2KHR', lambda: define_struct('SurfaceFormat2KHR', 
     ('type', StructureType),
     ('next', c_void_p),
     ('surface_format', SurfaceFormatKHR),
-)
+))
 
-DisplayProperties2KHR = define_struct('DisplayProperties2KHR', 
+define_lazy('DisplayProperties2KHR', lambda: define_struct('DisplayProperties2KHR', 
     ('type', StructureType),
     ('next', c_void_p),
     ('display_properties', DisplayPropertiesKHR),
-)
+))
 
-DisplayPlaneProperties2KHR = define_struct('DisplayPlaneProperties2KHR', 
+define_lazy('DisplayPlaneProperties2KHR', lambda: define_struct('DisplayPlaneProperties2KHR', 
     ('type', StructureType),
     ('next', c_void_p),
     ('display_plane_properties', DisplayPlanePropertiesKHR),
-)
+))
 
-DisplayModeProperties2KHR = define_struct('DisplayModeProperties2KHR', 
+define_lazy('DisplayModeProperties2KHR', lambda: define_struct('DisplayModeProperties2KHR', 
     ('type', StructureType),
     ('next', c_void_p),
     ('display_mode_properties', DisplayModePropertiesKHR),
-)
+))
 
-DisplayPlaneInfo2KHR = define_struct('DisplayPlaneInfo2KHR', 
+define_lazy('DisplayPlaneInfo2KHR', lambda: define_struct('DisplayPlaneInfo2KHR', 
     ('type', StructureType),
     ('next', c_void_p),
     ('mode', DisplayModeKHR),
     ('plane_index', c_uint32),
-)
+))
 
-DisplayPlaneCapabilities2KHR = define_struct('DisplayPlaneCapabilities2KHR', 
+define_lazy('DisplayPlaneCapabilities2KHR', lambda: define_struct('DisplayPlaneCapabilities2KHR', 
     ('type', StructureType),
     ('next', c_void_p),
     ('capabilities', DisplayPlaneCapabilitiesKHR),
-)
+))
 
-ImageFormatListCreateInfoKHR = define_struct('ImageFormatListCreateInfoKHR', 
+define_lazy('ImageFormatListCreateInfoKHR', lambda: define_struct('ImageFormatListCreateInfoKHR', 
     ('type', StructureType),
     ('next', c_void_p),
     ('view_format_count', c_uint32),
     ('view_formats', POINTER(Format)),
-)
+))
 
-PhysicalDevice8BitStorageFeaturesKHR = define_struct('PhysicalDevice8BitStorageFeaturesKHR', 
+define_lazy('PhysicalDevice8BitStorageFeaturesKHR', lambda: define_struct('PhysicalDevice8BitStorageFeaturesKHR', 
     ('type', StructureType),
     ('next', c_void_p),
     ('storage_buffer8_bit_access', Bool32),
     ('uniform_and_storage_buffer8_bit_access', Bool32),
     ('storage_push_constant8', Bool32),
-)
+))
 
-PhysicalDeviceShaderAtomicInt64FeaturesKHR = define_struct('PhysicalDeviceShaderAtomicInt64FeaturesKHR', 
+define_lazy('PhysicalDeviceShaderAtomicInt64FeaturesKHR', lambda: define_struct('PhysicalDeviceShaderAtomicInt64FeaturesKHR', 
     ('type', StructureType),
     ('next', c_void_p),
     ('shader_buffer_int64_atomics', Bool32),
     ('shader_shared_int64_atomics', Bool32),
-)
+))
 
-ConformanceVersionKHR = define_struct('ConformanceVersionKHR', 
+define_lazy('ConformanceVersionKHR', lambda: define_struct('ConformanceVersionKHR', 
     ('major', c_int8),
     ('minor', c_int8),
     ('subminor', c_int8),
     ('patch', c_int8),
-)
+))
 
-PhysicalDeviceDriverPropertiesKHR = define_struct('PhysicalDeviceDriverPropertiesKHR', 
+define_lazy('PhysicalDeviceDriverPropertiesKHR', lambda: define_struct('PhysicalDeviceDriverPropertiesKHR', 
     ('type', StructureType),
     ('next', c_void_p),
     ('driver_ID', DriverIdKHR),
     ('driver_name', c_char * MAX_DRIVER_NAME_SIZE_KHR),
     ('driver_info', c_char * MAX_DRIVER_INFO_SIZE_KHR),
     ('conformance_version', ConformanceVersionKHR),
-)
+))
 
-PhysicalDeviceVulkanMemoryModelFeaturesKHR = define_struct('PhysicalDeviceVulkanMemoryModelFeaturesKHR', 
+define_lazy('PhysicalDeviceVulkanMemoryModelFeaturesKHR', lambda: define_struct('PhysicalDeviceVulkanMemoryModelFeaturesKHR', 
     ('type', StructureType),
     ('next', c_void_p),
     ('vulkan_memory_model', Bool32),
     ('vulkan_memory_model_device_scope', Bool32),
-)
+))
 
-DebugReportCallbackCreateInfoEXT = define_struct('DebugReportCallbackCreateInfoEXT', 
+define_lazy('DebugReportCallbackCreateInfoEXT', lambda: define_struct('DebugReportCallbackCreateInfoEXT', 
     ('type', StructureType),
     ('next', c_void_p),
     ('flags', DebugReportFlagsEXT),
     ('callback', FnDebugReportCallbackEXT),
     ('user_data', c_void_p),
-)
+))
 
-PipelineRasterizationStateRasterizationOrderAMD = define_struct('PipelineRasterizationStateRasterizationOrderAMD', 
+define_lazy('PipelineRasterizationStateRasterizationOrderAMD', lambda: define_struct('PipelineRasterizationStateRasterizationOrderAMD', 
     ('type', StructureType),
     ('next', c_void_p),
     ('rasterization_order', RasterizationOrderAMD),
-)
+))
 
-DebugMarkerObjectNameInfoEXT = define_struct('DebugMarkerObjectNameInfoEXT', 
+define_lazy('DebugMarkerObjectNameInfoEXT', lambda: define_struct('DebugMarkerObjectNameInfoEXT', 
     ('type', StructureType),
     ('next', c_void_p),
     ('object_type', DebugReportObjectTypeEXT),
     ('object', c_uint64),
     ('object_name', c_char_p),
-)
+))
 
-DebugMarkerObjectTagInfoEXT = define_struct('DebugMarkerObjectTagInfoEXT', 
+define_lazy('DebugMarkerObjectTagInfoEXT', lambda: define_struct('DebugMarkerObjectTagInfoEXT', 
     ('type', StructureType),
     ('next', c_void_p),
     ('object_type', DebugReportObjectTypeEXT),
@@ -4245,42 +5373,42 @@ DebugMarkerObjectTagInfoEXT = define_struct('DebugMarkerObjectTagInfoEXT',
     ('tag_name', c_uint64),
     ('tag_size', c_size_t),
     ('tag', c_void_p),
-)
+))
 
-DebugMarkerMarkerInfoEXT = define_struct('DebugMarkerMarkerInfoEXT', 
+define_lazy('DebugMarkerMarkerInfoEXT', lambda: define_struct('DebugMarkerMarkerInfoEXT', 
     ('type', StructureType),
     ('next', c_void_p),
     ('marker_name', c_char_p),
     ('color', c_float * 4),
-)
+))
 
-DedicatedAllocationImageCreateInfoNV = define_struct('DedicatedAllocationImageCreateInfoNV', 
+define_lazy('DedicatedAllocationImageCreateInfoNV', lambda: define_struct('DedicatedAllocationImageCreateInfoNV', 
     ('type', StructureType),
     ('next', c_void_p),
     ('dedicated_allocation', Bool32),
-)
+))
 
-DedicatedAllocationBufferCreateInfoNV = define_struct('DedicatedAllocationBufferCreateInfoNV', 
+define_lazy('DedicatedAllocationBufferCreateInfoNV', lambda: define_struct('DedicatedAllocationBufferCreateInfoNV', 
     ('type', StructureType),
     ('next', c_void_p),
     ('dedicated_allocation', Bool32),
-)
+))
 
-DedicatedAllocationMemoryAllocateInfoNV = define_struct('DedicatedAllocationMemoryAllocateInfoNV', 
+define_lazy('DedicatedAllocationMemoryAllocateInfoNV', lambda: define_struct('DedicatedAllocationMemoryAllocateInfoNV', 
     ('type', StructureType),
     ('next', c_void_p),
     ('image', Image),
     ('buffer', Buffer),
-)
+))
 
-PhysicalDeviceTransformFeedbackFeaturesEXT = define_struct('PhysicalDeviceTransformFeedbackFeaturesEXT', 
+define_lazy('PhysicalDeviceTransformFeedbackFeaturesEXT', lambda: define_struct('PhysicalDeviceTransformFeedbackFeaturesEXT', 
     ('type', StructureType),
     ('next', c_void_p),
     ('transform_feedback', Bool32),
     ('geometry_streams', Bool32),
-)
+))
 
-PhysicalDeviceTransformFeedbackPropertiesEXT = define_struct('PhysicalDeviceTransformFeedbackPropertiesEXT', 
+define_lazy('PhysicalDeviceTransformFeedbackPropertiesEXT', lambda: define_struct('PhysicalDeviceTransformFeedbackPropertiesEXT', 
     ('type', StructureType),
     ('next', c_void_p),
     ('max_transform_feedback_streams', c_uint32),
@@ -4293,30 +5421,30 @@ PhysicalDeviceTransformFeedbackPropertiesEXT = define_struct('PhysicalDeviceTran
     ('transform_feedback_streams_lines_triangles', Bool32),
     ('transform_feedback_rasterization_stream_select', Bool32),
     ('transform_feedback_draw', Bool32),
-)
+))
 
-PipelineRasterizationStateStreamCreateInfoEXT = define_struct('PipelineRasterizationStateStreamCreateInfoEXT', 
+define_lazy('PipelineRasterizationStateStreamCreateInfoEXT', lambda: define_struct('PipelineRasterizationStateStreamCreateInfoEXT', 
     ('type', StructureType),
     ('next', c_void_p),
     ('flags', PipelineRasterizationStateStreamCreateFlagsEXT),
     ('rasterization_stream', c_uint32),
-)
+))
 
-TextureLODGatherFormatPropertiesAMD = define_struct('TextureLODGatherFormatPropertiesAMD', 
+define_lazy('TextureLODGatherFormatPropertiesAMD', lambda: define_struct('TextureLODGatherFormatPropertiesAMD', 
     ('type', StructureType),
     ('next', c_void_p),
     ('supports_texture_gather_LODBias_AMD', Bool32),
-)
+))
 
-ShaderResourceUsageAMD = define_struct('ShaderResourceUsageAMD', 
+define_lazy('ShaderResourceUsageAMD', lambda: define_struct('ShaderResourceUsageAMD', 
     ('num_used_vgprs', c_uint32),
     ('num_used_sgprs', c_uint32),
     ('lds_size_per_local_work_group', c_uint32),
     ('lds_usage_size_inBytes', c_size_t),
     ('scratch_mem_usage_inBytes', c_size_t),
-)
+))
 
-ShaderStatisticsInfoAMD = define_struct('ShaderStatisticsInfoAMD', 
+define_lazy('ShaderStatisticsInfoAMD', lambda: define_struct('ShaderStatisticsInfoAMD', 
     ('shader_stage_mask', ShaderStageFlags),
     ('resource_usage', ShaderResourceUsageAMD),
     ('num_physical_vgprs', c_uint32),
@@ -4324,80 +5452,80 @@ ShaderStatisticsInfoAMD = define_struct('ShaderStatisticsInfoAMD',
     ('num_available_vgprs', c_uint32),
     ('num_available_sgprs', c_uint32),
     ('compute_work_group_size', c_uint32 * 3),
-)
+))
 
-PhysicalDeviceCornerSampledImageFeaturesNV = define_struct('PhysicalDeviceCornerSampledImageFeaturesNV', 
+define_lazy('PhysicalDeviceCornerSampledImageFeaturesNV', lambda: define_struct('PhysicalDeviceCornerSampledImageFeaturesNV', 
     ('type', StructureType),
     ('next', c_void_p),
     ('corner_sampled_image', Bool32),
-)
+))
 
-ExternalImageFormatPropertiesNV = define_struct('ExternalImageFormatPropertiesNV', 
+define_lazy('ExternalImageFormatPropertiesNV', lambda: define_struct('ExternalImageFormatPropertiesNV', 
     ('image_format_properties', ImageFormatProperties),
     ('external_memory_features', ExternalMemoryFeatureFlagsNV),
     ('export_from_imported_handle_types', ExternalMemoryHandleTypeFlagsNV),
     ('compatible_handle_types', ExternalMemoryHandleTypeFlagsNV),
-)
+))
 
-ExternalMemoryImageCreateInfoNV = define_struct('ExternalMemoryImageCreateInfoNV', 
+define_lazy('ExternalMemoryImageCreateInfoNV', lambda: define_struct('ExternalMemoryImageCreateInfoNV', 
     ('type', StructureType),
     ('next', c_void_p),
     ('handle_types', ExternalMemoryHandleTypeFlagsNV),
-)
+))
 
-ExportMemoryAllocateInfoNV = define_struct('ExportMemoryAllocateInfoNV', 
+define_lazy('ExportMemoryAllocateInfoNV', lambda: define_struct('ExportMemoryAllocateInfoNV', 
     ('type', StructureType),
     ('next', c_void_p),
     ('handle_types', ExternalMemoryHandleTypeFlagsNV),
-)
+))
 
-ValidationFlagsEXT = define_struct('ValidationFlagsEXT', 
+define_lazy('ValidationFlagsEXT', lambda: define_struct('ValidationFlagsEXT', 
     ('type', StructureType),
     ('next', c_void_p),
     ('disabled_validation_check_count', c_uint32),
     ('disabled_validation_checks', POINTER(ValidationCheckEXT)),
-)
+))
 
-ImageViewASTCDecodeModeEXT = define_struct('ImageViewASTCDecodeModeEXT', 
+define_lazy('ImageViewASTCDecodeModeEXT', lambda: define_struct('ImageViewASTCDecodeModeEXT', 
     ('type', StructureType),
     ('next', c_void_p),
     ('decode_mode', Format),
-)
+))
 
-PhysicalDeviceASTCDecodeFeaturesEXT = define_struct('PhysicalDeviceASTCDecodeFeaturesEXT', 
+define_lazy('PhysicalDeviceASTCDecodeFeaturesEXT', lambda: define_struct('PhysicalDeviceASTCDecodeFeaturesEXT', 
     ('type', StructureType),
     ('next', c_void_p),
     ('decode_mode_shared_exponent', Bool32),
-)
+))
 
-ConditionalRenderingBeginInfoEXT = define_struct('ConditionalRenderingBeginInfoEXT', 
+define_lazy('ConditionalRenderingBeginInfoEXT', lambda: define_struct('ConditionalRenderingBeginInfoEXT', 
     ('type', StructureType),
     ('next', c_void_p),
     ('buffer', Buffer),
     ('offset', DeviceSize),
     ('flags', ConditionalRenderingFlagsEXT),
-)
+))
 
-PhysicalDeviceConditionalRenderingFeaturesEXT = define_struct('PhysicalDeviceConditionalRenderingFeaturesEXT', 
+define_lazy('PhysicalDeviceConditionalRenderingFeaturesEXT', lambda: define_struct('PhysicalDeviceConditionalRenderingFeaturesEXT', 
     ('type', StructureType),
     ('next', c_void_p),
     ('conditional_rendering', Bool32),
     ('inherited_conditional_rendering', Bool32),
-)
+))
 
-CommandBufferInheritanceConditionalRenderingInfoEXT = define_struct('CommandBufferInheritanceConditionalRenderingInfoEXT', 
+define_lazy('CommandBufferInheritanceConditionalRenderingInfoEXT', lambda: define_struct('CommandBufferInheritanceConditionalRenderingInfoEXT', 
     ('type', StructureType),
     ('next', c_void_p),
     ('conditional_rendering_enable', Bool32),
-)
+))
 
-DeviceGeneratedCommandsFeaturesNVX = define_struct('DeviceGeneratedCommandsFeaturesNVX', 
+define_lazy('DeviceGeneratedCommandsFeaturesNVX', lambda: define_struct('DeviceGeneratedCommandsFeaturesNVX', 
     ('type', StructureType),
     ('next', c_void_p),
     ('compute_binding_point_support', Bool32),
-)
+))
 
-DeviceGeneratedCommandsLimitsNVX = define_struct('DeviceGeneratedCommandsLimitsNVX', 
+define_lazy('DeviceGeneratedCommandsLimitsNVX', lambda: define_struct('DeviceGeneratedCommandsLimitsNVX', 
     ('type', StructureType),
     ('next', c_void_p),
     ('max_indirect_commands_layout_token_count', c_uint32),
@@ -4405,31 +5533,31 @@ DeviceGeneratedCommandsLimitsNVX = define_struct('DeviceGeneratedCommandsLimitsN
     ('min_sequence_count_buffer_offset_alignment', c_uint32),
     ('min_sequence_index_buffer_offset_alignment', c_uint32),
     ('min_commands_token_buffer_offset_alignment', c_uint32),
-)
+))
 
-IndirectCommandsTokenNVX = define_struct('IndirectCommandsTokenNVX', 
+define_lazy('IndirectCommandsTokenNVX', lambda: define_struct('IndirectCommandsTokenNVX', 
     ('token_type', IndirectCommandsTokenTypeNVX),
     ('buffer', Buffer),
     ('offset', DeviceSize),
-)
+))
 
-IndirectCommandsLayoutTokenNVX = define_struct('IndirectCommandsLayoutTokenNVX', 
+define_lazy('IndirectCommandsLayoutTokenNVX', lambda: define_struct('IndirectCommandsLayoutTokenNVX', 
     ('token_type', IndirectCommandsTokenTypeNVX),
     ('binding_unit', c_uint32),
     ('dynamic_count', c_uint32),
     ('divisor', c_uint32),
-)
+))
 
-IndirectCommandsLayoutCreateInfoNVX = define_struct('IndirectCommandsLayoutCreateInfoNVX', 
+define_lazy('IndirectCommandsLayoutCreateInfoNVX', lambda: define_struct('IndirectCommandsLayoutCreateInfoNVX', 
     ('type', StructureType),
     ('next', c_void_p),
     ('pipeline_bind_point', PipelineBindPoint),
     ('flags', IndirectCommandsLayoutUsageFlagsNVX),
     ('token_count', c_uint32),
     ('tokens', POINTER(IndirectCommandsLayoutTokenNVX)),
-)
+))
 
-CmdProcessCommandsInfoNVX = define_struct('CmdProcessCommandsInfoNVX', 
+define_lazy('CmdProcessCommandsInfoNVX', lambda: define_struct('CmdProcessCommandsInfoNVX', 
     ('type', StructureType),
     ('next', c_void_p),
     ('object_table', ObjectTableNVX),
@@ -4442,17 +5570,17 @@ CmdProcessCommandsInfoNVX = define_struct('CmdProcessCommandsInfoNVX',
     ('sequences_count_offset', DeviceSize),
     ('sequences_index_buffer', Buffer),
     ('sequences_index_offset', DeviceSize),
-)
+))
 
-CmdReserveSpaceForCommandsInfoNVX = define_struct('CmdReserveSpaceForCommandsInfoNVX', 
+define_lazy('CmdReserveSpaceForCommandsInfoNVX', lambda: define_struct('CmdReserveSpaceForCommandsInfoNVX', 
     ('type', StructureType),
     ('next', c_void_p),
     ('object_table', ObjectTableNVX),
     ('indirect_commands_layout', IndirectCommandsLayoutNVX),
     ('max_sequences_count', c_uint32),
-)
+))
 
-ObjectTableCreateInfoNVX = define_struct('ObjectTableCreateInfoNVX', 
+define_lazy('ObjectTableCreateInfoNVX', lambda: define_struct('ObjectTableCreateInfoNVX', 
     ('type', StructureType),
     ('next', c_void_p),
     ('object_count', c_uint32),
@@ -4464,60 +5592,60 @@ ObjectTableCreateInfoNVX = define_struct('ObjectTableCreateInfoNVX',
     ('max_storage_images_per_descriptor', c_uint32),
     ('max_sampled_images_per_descriptor', c_uint32),
     ('max_pipeline_layouts', c_uint32),
-)
+))
 
-ObjectTableEntryNVX = define_struct('ObjectTableEntryNVX', 
+define_lazy('ObjectTableEntryNVX', lambda: define_struct('ObjectTableEntryNVX', 
     ('type', ObjectEntryTypeNVX),
     ('flags', ObjectEntryUsageFlagsNVX),
-)
+))
 
-ObjectTablePipelineEntryNVX = define_struct('ObjectTablePipelineEntryNVX', 
+define_lazy('ObjectTablePipelineEntryNVX', lambda: define_struct('ObjectTablePipelineEntryNVX', 
     ('type', ObjectEntryTypeNVX),
     ('flags', ObjectEntryUsageFlagsNVX),
     ('pipeline', Pipeline),
-)
+))
 
-ObjectTableDescriptorSetEntryNVX = define_struct('ObjectTableDescriptorSetEntryNVX', 
+define_lazy('ObjectTableDescriptorSetEntryNVX', lambda: define_struct('ObjectTableDescriptorSetEntryNVX', 
     ('type', ObjectEntryTypeNVX),
     ('flags', ObjectEntryUsageFlagsNVX),
     ('pipeline_layout', PipelineLayout),
     ('descriptor_set', DescriptorSet),
-)
+))
 
-ObjectTableVertexBufferEntryNVX = define_struct('ObjectTableVertexBufferEntryNVX', 
+define_lazy('ObjectTableVertexBufferEntryNVX', lambda: define_struct('ObjectTableVertexBufferEntryNVX', 
     ('type', ObjectEntryTypeNVX),
     ('flags', ObjectEntryUsageFlagsNVX),
     ('buffer', Buffer),
-)
+))
 
-ObjectTableIndexBufferEntryNVX = define_struct('ObjectTableIndexBufferEntryNVX', 
+define_lazy('ObjectTableIndexBufferEntryNVX', lambda: define_struct('ObjectTableIndexBufferEntryNVX', 
     ('type', ObjectEntryTypeNVX),
     ('flags', ObjectEntryUsageFlagsNVX),
     ('buffer', Buffer),
     ('index_type', IndexType),
-)
+))
 
-ObjectTablePushConstantEntryNVX = define_struct('ObjectTablePushConstantEntryNVX', 
+define_lazy('ObjectTablePushConstantEntryNVX', lambda: define_struct('ObjectTablePushConstantEntryNVX', 
     ('type', ObjectEntryTypeNVX),
     ('flags', ObjectEntryUsageFlagsNVX),
     ('pipeline_layout', PipelineLayout),
     ('stage_flags', ShaderStageFlags),
-)
+))
 
-ViewportWScalingNV = define_struct('ViewportWScalingNV', 
+define_lazy('ViewportWScalingNV', lambda: define_struct('ViewportWScalingNV', 
     ('xcoeff', c_float),
     ('ycoeff', c_float),
-)
+))
 
-PipelineViewportWScalingStateCreateInfoNV = define_struct('PipelineViewportWScalingStateCreateInfoNV', 
+define_lazy('PipelineViewportWScalingStateCreateInfoNV', lambda: define_struct('PipelineViewportWScalingStateCreateInfoNV', 
     ('type', StructureType),
     ('next', c_void_p),
     ('viewport_WScaling_enable', Bool32),
     ('viewport_count', c_uint32),
     ('viewport_WScalings', POINTER(ViewportWScalingNV)),
-)
+))
 
-SurfaceCapabilities2EXT = define_struct('SurfaceCapabilities2EXT', 
+define_lazy('SurfaceCapabilities2EXT', lambda: define_struct('SurfaceCapabilities2EXT', 
     ('type', StructureType),
     ('next', c_void_p),
     ('min_image_count', c_uint32),
@@ -4531,93 +5659,93 @@ SurfaceCapabilities2EXT = define_struct('SurfaceCapabilities2EXT',
     ('supported_composite_alpha', CompositeAlphaFlagsKHR),
     ('supported_usage_flags', ImageUsageFlags),
     ('supported_surface_counters', SurfaceCounterFlagsEXT),
-)
+))
 
-DisplayPowerInfoEXT = define_struct('DisplayPowerInfoEXT', 
+define_lazy('DisplayPowerInfoEXT', lambda: define_struct('DisplayPowerInfoEXT', 
     ('type', StructureType),
     ('next', c_void_p),
     ('power_state', DisplayPowerStateEXT),
-)
+))
 
-DeviceEventInfoEXT = define_struct('DeviceEventInfoEXT', 
+define_lazy('DeviceEventInfoEXT', lambda: define_struct('DeviceEventInfoEXT', 
     ('type', StructureType),
     ('next', c_void_p),
     ('device_event', DeviceEventTypeEXT),
-)
+))
 
-DisplayEventInfoEXT = define_struct('DisplayEventInfoEXT', 
+define_lazy('DisplayEventInfoEXT', lambda: define_struct('DisplayEventInfoEXT', 
     ('type', StructureType),
     ('next', c_void_p),
     ('display_event', DisplayEventTypeEXT),
-)
+))
 
-SwapchainCounterCreateInfoEXT = define_struct('SwapchainCounterCreateInfoEXT', 
+define_lazy('SwapchainCounterCreateInfoEXT', lambda: define_struct('SwapchainCounterCreateInfoEXT', 
     ('type', StructureType),
     ('next', c_void_p),
     ('surface_counters', SurfaceCounterFlagsEXT),
-)
+))
 
-RefreshCycleDurationGOOGLE = define_struct('RefreshCycleDurationGOOGLE', 
+define_lazy('RefreshCycleDurationGOOGLE', lambda: define_struct('RefreshCycleDurationGOOGLE', 
     ('refresh_duration', c_uint64),
-)
+))
 
-PastPresentationTimingGOOGLE = define_struct('PastPresentationTimingGOOGLE', 
+define_lazy('PastPresentationTimingGOOGLE', lambda: define_struct('PastPresentationTimingGOOGLE', 
     ('present_ID', c_uint32),
     ('desired_present_time', c_uint64),
     ('actual_present_time', c_uint64),
     ('earliest_present_time', c_uint64),
     ('present_margin', c_uint64),
-)
+))
 
-PresentTimeGOOGLE = define_struct('PresentTimeGOOGLE', 
+define_lazy('PresentTimeGOOGLE', lambda: define_struct('PresentTimeGOOGLE', 
     ('present_ID', c_uint32),
     ('desired_present_time', c_uint64),
-)
+))
 
-PresentTimesInfoGOOGLE = define_struct('PresentTimesInfoGOOGLE', 
+define_lazy('PresentTimesInfoGOOGLE', lambda: define_struct('PresentTimesInfoGOOGLE', 
     ('type', StructureType),
     ('next', c_void_p),
     ('swapchain_count', c_uint32),
     ('times', POINTER(PresentTimeGOOGLE)),
-)
+))
 
-PhysicalDeviceMultiviewPerViewAttributesPropertiesNVX = define_struct('PhysicalDeviceMultiviewPerViewAttributesPropertiesNVX', 
+define_lazy('PhysicalDeviceMultiviewPerViewAttributesPropertiesNVX', lambda: define_struct('PhysicalDeviceMultiviewPerViewAttributesPropertiesNVX', 
     ('type', StructureType),
     ('next', c_void_p),
     ('per_view_position_all_components', Bool32),
-)
+))
 
-ViewportSwizzleNV = define_struct('ViewportSwizzleNV', 
+define_lazy('ViewportSwizzleNV', lambda: define_struct('ViewportSwizzleNV', 
     ('x', ViewportCoordinateSwizzleNV),
     ('y', ViewportCoordinateSwizzleNV),
     ('z', ViewportCoordinateSwizzleNV),
     ('w', ViewportCoordinateSwizzleNV),
-)
+))
 
-PipelineViewportSwizzleStateCreateInfoNV = define_struct('PipelineViewportSwizzleStateCreateInfoNV', 
+define_lazy('PipelineViewportSwizzleStateCreateInfoNV', lambda: define_struct('PipelineViewportSwizzleStateCreateInfoNV', 
     ('type', StructureType),
     ('next', c_void_p),
     ('flags', PipelineViewportSwizzleStateCreateFlagsNV),
     ('viewport_count', c_uint32),
     ('viewport_swizzles', POINTER(ViewportSwizzleNV)),
-)
+))
 
-PhysicalDeviceDiscardRectanglePropertiesEXT = define_struct('PhysicalDeviceDiscardRectanglePropertiesEXT', 
+define_lazy('PhysicalDeviceDiscardRectanglePropertiesEXT', lambda: define_struct('PhysicalDeviceDiscardRectanglePropertiesEXT', 
     ('type', StructureType),
     ('next', c_void_p),
     ('max_discard_rectangles', c_uint32),
-)
+))
 
-PipelineDiscardRectangleStateCreateInfoEXT = define_struct('PipelineDiscardRectangleStateCreateInfoEXT', 
+define_lazy('PipelineDiscardRectangleStateCreateInfoEXT', lambda: define_struct('PipelineDiscardRectangleStateCreateInfoEXT', 
     ('type', StructureType),
     ('next', c_void_p),
     ('flags', PipelineDiscardRectangleStateCreateFlagsEXT),
     ('discard_rectangle_mode', DiscardRectangleModeEXT),
     ('discard_rectangle_count', c_uint32),
     ('discard_rectangles', POINTER(Rect2D)),
-)
+))
 
-PhysicalDeviceConservativeRasterizationPropertiesEXT = define_struct('PhysicalDeviceConservativeRasterizationPropertiesEXT', 
+define_lazy('PhysicalDeviceConservativeRasterizationPropertiesEXT', lambda: define_struct('PhysicalDeviceConservativeRasterizationPropertiesEXT', 
     ('type', StructureType),
     ('next', c_void_p),
     ('primitive_overestimation_size', c_float),
@@ -4629,22 +5757,22 @@ PhysicalDeviceConservativeRasterizationPropertiesEXT = define_struct('PhysicalDe
     ('degenerate_lines_rasterized', Bool32),
     ('fully_covered_fragment_shader_input_variable', Bool32),
     ('conservative_rasterization_post_depth_coverage', Bool32),
-)
+))
 
-PipelineRasterizationConservativeStateCreateInfoEXT = define_struct('PipelineRasterizationConservativeStateCreateInfoEXT', 
+define_lazy('PipelineRasterizationConservativeStateCreateInfoEXT', lambda: define_struct('PipelineRasterizationConservativeStateCreateInfoEXT', 
     ('type', StructureType),
     ('next', c_void_p),
     ('flags', PipelineRasterizationConservativeStateCreateFlagsEXT),
     ('conservative_rasterization_mode', ConservativeRasterizationModeEXT),
     ('extra_primitive_overestimation_size', c_float),
-)
+))
 
-XYColorEXT = define_struct('XYColorEXT', 
+define_lazy('XYColorEXT', lambda: define_struct('XYColorEXT', 
     ('x', c_float),
     ('y', c_float),
-)
+))
 
-HdrMetadataEXT = define_struct('HdrMetadataEXT', 
+define_lazy('HdrMetadataEXT', lambda: define_struct('HdrMetadataEXT', 
     ('type', StructureType),
     ('next', c_void_p),
     ('display_primary_red', XYColorEXT),
@@ -4655,17 +5783,17 @@ HdrMetadataEXT = define_struct('HdrMetadataEXT',
     ('min_luminance', c_float),
     ('max_content_light_level', c_float),
     ('max_frame_average_light_level', c_float),
-)
+))
 
-DebugUtilsObjectNameInfoEXT = define_struct('DebugUtilsObjectNameInfoEXT', 
+define_lazy('DebugUtilsObjectNameInfoEXT', lambda: define_struct('DebugUtilsObjectNameInfoEXT', 
     ('type', StructureType),
     ('next', c_void_p),
     ('object_type', ObjectType),
     ('object_handle', c_uint64),
     ('object_name', c_char_p),
-)
+))
 
-DebugUtilsObjectTagInfoEXT = define_struct('DebugUtilsObjectTagInfoEXT', 
+define_lazy('DebugUtilsObjectTagInfoEXT', lambda: define_struct('DebugUtilsObjectTagInfoEXT', 
     ('type', StructureType),
     ('next', c_void_p),
     ('object_type', ObjectType),
@@ -4673,16 +5801,16 @@ DebugUtilsObjectTagInfoEXT = define_struct('DebugUtilsObjectTagInfoEXT',
     ('tag_name', c_uint64),
     ('tag_size', c_size_t),
     ('tag', c_void_p),
-)
+))
 
-DebugUtilsLabelEXT = define_struct('DebugUtilsLabelEXT', 
+define_lazy('DebugUtilsLabelEXT', lambda: define_struct('DebugUtilsLabelEXT', 
     ('type', StructureType),
     ('next', c_void_p),
     ('label_name', c_char_p),
     ('color', c_float * 4),
-)
+))
 
-DebugUtilsMessengerCallbackDataEXT = define_struct('DebugUtilsMessengerCallbackDataEXT', 
+define_lazy('DebugUtilsMessengerCallbackDataEXT', lambda: define_struct('DebugUtilsMessengerCallbackDataEXT', 
     ('type', StructureType),
     ('next', c_void_p),
     ('flags', DebugUtilsMessengerCallbackDataFlagsEXT),
@@ -4695,11 +5823,11 @@ DebugUtilsMessengerCallbackDataEXT = define_struct('DebugUtilsMessengerCallbackD
     ('cmd_buf_labels', POINTER(DebugUtilsLabelEXT)),
     ('object_count', c_uint32),
     ('objects', POINTER(DebugUtilsObjectNameInfoEXT)),
-)
+))
 
-FnDebugUtilsMessengerCallbackEXT = FUNCTYPE(Bool32, DebugUtilsMessageSeverityFlagBitsEXT, DebugUtilsMessageTypeFlagsEXT, POINTER(DebugUtilsMessengerCallbackDataEXT), c_void_p)
+define_lazy('FnDebugUtilsMessengerCallbackEXT', lambda: FUNCTYPE(Bool32, DebugUtilsMessageSeverityFlagBitsEXT, DebugUtilsMessageTypeFlagsEXT, POINTER(DebugUtilsMessengerCallbackDataEXT), c_void_p))
 
-DebugUtilsMessengerCreateInfoEXT = define_struct('DebugUtilsMessengerCreateInfoEXT', 
+define_lazy('DebugUtilsMessengerCreateInfoEXT', lambda: define_struct('DebugUtilsMessengerCreateInfoEXT', 
     ('type', StructureType),
     ('next', c_void_p),
     ('flags', DebugUtilsMessengerCreateFlagsEXT),
@@ -4707,29 +5835,29 @@ DebugUtilsMessengerCreateInfoEXT = define_struct('DebugUtilsMessengerCreateInfoE
     ('message_type', DebugUtilsMessageTypeFlagsEXT),
     ('user_callback', FnDebugUtilsMessengerCallbackEXT),
     ('user_data', c_void_p),
-)
+))
 
-SamplerReductionModeCreateInfoEXT = define_struct('SamplerReductionModeCreateInfoEXT', 
+define_lazy('SamplerReductionModeCreateInfoEXT', lambda: define_struct('SamplerReductionModeCreateInfoEXT', 
     ('type', StructureType),
     ('next', c_void_p),
     ('reduction_mode', SamplerReductionModeEXT),
-)
+))
 
-PhysicalDeviceSamplerFilterMinmaxPropertiesEXT = define_struct('PhysicalDeviceSamplerFilterMinmaxPropertiesEXT', 
+define_lazy('PhysicalDeviceSamplerFilterMinmaxPropertiesEXT', lambda: define_struct('PhysicalDeviceSamplerFilterMinmaxPropertiesEXT', 
     ('type', StructureType),
     ('next', c_void_p),
     ('filter_minmax_single_component_formats', Bool32),
     ('filter_minmax_image_component_mapping', Bool32),
-)
+))
 
-PhysicalDeviceInlineUniformBlockFeaturesEXT = define_struct('PhysicalDeviceInlineUniformBlockFeaturesEXT', 
+define_lazy('PhysicalDeviceInlineUniformBlockFeaturesEXT', lambda: define_struct('PhysicalDeviceInlineUniformBlockFeaturesEXT', 
     ('type', StructureType),
     ('next', c_void_p),
     ('inline_uniform_block', Bool32),
     ('descriptor_binding_inline_uniform_block_update_after_bind', Bool32),
-)
+))
 
-PhysicalDeviceInlineUniformBlockPropertiesEXT = define_struct('PhysicalDeviceInlineUniformBlockPropertiesEXT', 
+define_lazy('PhysicalDeviceInlineUniformBlockPropertiesEXT', lambda: define_struct('PhysicalDeviceInlineUniformBlockPropertiesEXT', 
     ('type', StructureType),
     ('next', c_void_p),
     ('max_inline_uniform_block_size', c_uint32),
@@ -4737,62 +5865,62 @@ PhysicalDeviceInlineUniformBlockPropertiesEXT = define_struct('PhysicalDeviceInl
     ('max_per_stage_descriptor_update_after_bind_inline_uniform_blocks', c_uint32),
     ('max_descriptor_set_inline_uniform_blocks', c_uint32),
     ('max_descriptor_set_update_after_bind_inline_uniform_blocks', c_uint32),
-)
+))
 
-WriteDescriptorSetInlineUniformBlockEXT = define_struct('WriteDescriptorSetInlineUniformBlockEXT', 
+define_lazy('WriteDescriptorSetInlineUniformBlockEXT', lambda: define_struct('WriteDescriptorSetInlineUniformBlockEXT', 
     ('type', StructureType),
     ('next', c_void_p),
     ('data_size', c_uint32),
     ('data', c_void_p),
-)
+))
 
-DescriptorPoolInlineUniformBlockCreateInfoEXT = define_struct('DescriptorPoolInlineUniformBlockCreateInfoEXT', 
+define_lazy('DescriptorPoolInlineUniformBlockCreateInfoEXT', lambda: define_struct('DescriptorPoolInlineUniformBlockCreateInfoEXT', 
     ('type', StructureType),
     ('next', c_void_p),
     ('max_inline_uniform_block_bindings', c_uint32),
-)
+))
 
-SampleLocationEXT = define_struct('SampleLocationEXT', 
+define_lazy('SampleLocationEXT', lambda: define_struct('SampleLocationEXT', 
     ('x', c_float),
     ('y', c_float),
-)
+))
 
-SampleLocationsInfoEXT = define_struct('SampleLocationsInfoEXT', 
+define_lazy('SampleLocationsInfoEXT', lambda: define_struct('SampleLocationsInfoEXT', 
     ('type', StructureType),
     ('next', c_void_p),
     ('sample_locations_per_pixel', SampleCountFlagBits),
     ('sample_location_grid_size', Extent2D),
     ('sample_locations_count', c_uint32),
     ('sample_locations', POINTER(SampleLocationEXT)),
-)
+))
 
-AttachmentSampleLocationsEXT = define_struct('AttachmentSampleLocationsEXT', 
+define_lazy('AttachmentSampleLocationsEXT', lambda: define_struct('AttachmentSampleLocationsEXT', 
     ('attachment_index', c_uint32),
     ('sample_locations_info', SampleLocationsInfoEXT),
-)
+))
 
-SubpassSampleLocationsEXT = define_struct('SubpassSampleLocationsEXT', 
+define_lazy('SubpassSampleLocationsEXT', lambda: define_struct('SubpassSampleLocationsEXT', 
     ('subpass_index', c_uint32),
     ('sample_locations_info', SampleLocationsInfoEXT),
-)
+))
 
-RenderPassSampleLocationsBeginInfoEXT = define_struct('RenderPassSampleLocationsBeginInfoEXT', 
+define_lazy('RenderPassSampleLocationsBeginInfoEXT', lambda: define_struct('RenderPassSampleLocationsBeginInfoEXT', 
     ('type', StructureType),
     ('next', c_void_p),
     ('attachment_initial_sample_locations_count', c_uint32),
     ('attachment_initial_sample_locations', POINTER(AttachmentSampleLocationsEXT)),
     ('post_subpass_sample_locations_count', c_uint32),
     ('post_subpass_sample_locations', POINTER(SubpassSampleLocationsEXT)),
-)
+))
 
-PipelineSampleLocationsStateCreateInfoEXT = define_struct('PipelineSampleLocationsStateCreateInfoEXT', 
+define_lazy('PipelineSampleLocationsStateCreateInfoEXT', lambda: define_struct('PipelineSampleLocationsStateCreateInfoEXT', 
     ('type', StructureType),
     ('next', c_void_p),
     ('sample_locations_enable', Bool32),
     ('sample_locations_info', SampleLocationsInfoEXT),
-)
+))
 
-PhysicalDeviceSampleLocationsPropertiesEXT = define_struct('PhysicalDeviceSampleLocationsPropertiesEXT', 
+define_lazy('PhysicalDeviceSampleLocationsPropertiesEXT', lambda: define_struct('PhysicalDeviceSampleLocationsPropertiesEXT', 
     ('type', StructureType),
     ('next', c_void_p),
     ('sample_location_sample_counts', SampleCountFlags),
@@ -4800,21 +5928,21 @@ PhysicalDeviceSampleLocationsPropertiesEXT = define_struct('PhysicalDeviceSample
     ('sample_location_coordinate_range', c_float * 2),
     ('sample_location_sub_pixel_bits', c_uint32),
     ('variable_sample_locations', Bool32),
-)
+))
 
-MultisamplePropertiesEXT = define_struct('MultisamplePropertiesEXT', 
+define_lazy('MultisamplePropertiesEXT', lambda: define_struct('MultisamplePropertiesEXT', 
     ('type', StructureType),
     ('next', c_void_p),
     ('max_sample_location_grid_size', Extent2D),
-)
+))
 
-PhysicalDeviceBlendOperationAdvancedFeaturesEXT = define_struct('PhysicalDeviceBlendOperationAdvancedFeaturesEXT', 
+define_lazy('PhysicalDeviceBlendOperationAdvancedFeaturesEXT', lambda: define_struct('PhysicalDeviceBlendOperationAdvancedFeaturesEXT', 
     ('type', StructureType),
     ('next', c_void_p),
     ('advanced_blend_coherent_operations', Bool32),
-)
+))
 
-PhysicalDeviceBlendOperationAdvancedPropertiesEXT = define_struct('PhysicalDeviceBlendOperationAdvancedPropertiesEXT', 
+define_lazy('PhysicalDeviceBlendOperationAdvancedPropertiesEXT', lambda: define_struct('PhysicalDeviceBlendOperationAdvancedPropertiesEXT', 
     ('type', StructureType),
     ('next', c_void_p),
     ('advanced_blend_max_color_attachments', c_uint32),
@@ -4823,25 +5951,25 @@ PhysicalDeviceBlendOperationAdvancedPropertiesEXT = define_struct('PhysicalDevic
     ('advanced_blend_non_premultiplied_dst_color', Bool32),
     ('advanced_blend_correlated_overlap', Bool32),
     ('advanced_blend_all_operations', Bool32),
-)
+))
 
-PipelineColorBlendAdvancedStateCreateInfoEXT = define_struct('PipelineColorBlendAdvancedStateCreateInfoEXT', 
+define_lazy('PipelineColorBlendAdvancedStateCreateInfoEXT', lambda: define_struct('PipelineColorBlendAdvancedStateCreateInfoEXT', 
     ('type', StructureType),
     ('next', c_void_p),
     ('src_premultiplied', Bool32),
     ('dst_premultiplied', Bool32),
     ('blend_overlap', BlendOverlapEXT),
-)
+))
 
-PipelineCoverageToColorStateCreateInfoNV = define_struct('PipelineCoverageToColorStateCreateInfoNV', 
+define_lazy('PipelineCoverageToColorStateCreateInfoNV', lambda: define_struct('PipelineCoverageToColorStateCreateInfoNV', 
     ('type', StructureType),
     ('next', c_void_p),
     ('flags', PipelineCoverageToColorStateCreateFlagsNV),
     ('coverage_toColor_enable', Bool32),
     ('coverage_toColor_location', c_uint32),
-)
+))
 
-PipelineCoverageModulationStateCreateInfoNV = define_struct('PipelineCoverageModulationStateCreateInfoNV', 
+define_lazy('PipelineCoverageModulationStateCreateInfoNV', lambda: define_struct('PipelineCoverageModulationStateCreateInfoNV', 
     ('type', StructureType),
     ('next', c_void_p),
     ('flags', PipelineCoverageModulationStateCreateFlagsNV),
@@ -4849,73 +5977,73 @@ PipelineCoverageModulationStateCreateInfoNV = define_struct('PipelineCoverageMod
     ('coverage_modulation_table_enable', Bool32),
     ('coverage_modulation_table_count', c_uint32),
     ('coverage_modulation_table', POINTER(c_float)),
-)
+))
 
-DrmFormatModifierPropertiesEXT = define_struct('DrmFormatModifierPropertiesEXT', 
+define_lazy('DrmFormatModifierPropertiesEXT', lambda: define_struct('DrmFormatModifierPropertiesEXT', 
     ('drm_format_modifier', c_uint64),
     ('drm_format_modifier_plane_count', c_uint32),
     ('drm_format_modifier_tiling_features', FormatFeatureFlags),
-)
+))
 
-DrmFormatModifierPropertiesListEXT = define_struct('DrmFormatModifierPropertiesListEXT', 
+define_lazy('DrmFormatModifierPropertiesListEXT', lambda: define_struct('DrmFormatModifierPropertiesListEXT', 
     ('type', StructureType),
     ('next', c_void_p),
     ('drm_format_modifier_count', c_uint32),
     ('drm_format_modifier_properties', POINTER(DrmFormatModifierPropertiesEXT)),
-)
+))
 
-PhysicalDeviceImageDrmFormatModifierInfoEXT = define_struct('PhysicalDeviceImageDrmFormatModifierInfoEXT', 
+define_lazy('PhysicalDeviceImageDrmFormatModifierInfoEXT', lambda: define_struct('PhysicalDeviceImageDrmFormatModifierInfoEXT', 
     ('type', StructureType),
     ('next', c_void_p),
     ('drm_format_modifier', c_uint64),
     ('sharing_mode', SharingMode),
     ('queue_family_index_count', c_uint32),
     ('queue_family_indices', POINTER(c_uint32)),
-)
+))
 
-ImageDrmFormatModifierListCreateInfoEXT = define_struct('ImageDrmFormatModifierListCreateInfoEXT', 
+define_lazy('ImageDrmFormatModifierListCreateInfoEXT', lambda: define_struct('ImageDrmFormatModifierListCreateInfoEXT', 
     ('type', StructureType),
     ('next', c_void_p),
     ('drm_format_modifier_count', c_uint32),
     ('drm_format_modifiers', POINTER(c_uint64)),
-)
+))
 
-ImageDrmFormatModifierExplicitCreateInfoEXT = define_struct('ImageDrmFormatModifierExplicitCreateInfoEXT', 
+define_lazy('ImageDrmFormatModifierExplicitCreateInfoEXT', lambda: define_struct('ImageDrmFormatModifierExplicitCreateInfoEXT', 
     ('type', StructureType),
     ('next', c_void_p),
     ('drm_format_modifier', c_uint64),
     ('drm_format_modifier_plane_count', c_uint32),
     ('plane_layouts', POINTER(SubresourceLayout)),
-)
+))
 
-ImageDrmFormatModifierPropertiesEXT = define_struct('ImageDrmFormatModifierPropertiesEXT', 
+define_lazy('ImageDrmFormatModifierPropertiesEXT', lambda: define_struct('ImageDrmFormatModifierPropertiesEXT', 
     ('type', StructureType),
     ('next', c_void_p),
     ('drm_format_modifier', c_uint64),
-)
+))
 
-ValidationCacheCreateInfoEXT = define_struct('ValidationCacheCreateInfoEXT', 
+define_lazy('ValidationCacheCreateInfoEXT', lambda: define_struct('ValidationCacheCreateInfoEXT', 
     ('type', StructureType),
     ('next', c_void_p),
     ('flags', ValidationCacheCreateFlagsEXT),
     ('initial_data_size', c_size_t),
     ('initial_data', c_void_p),
-)
+))
 
-ShaderModuleValidationCacheCreateInfoEXT = define_struct('ShaderModuleValidationCacheCreateInfoEXT', 
+define_lazy('ShaderModuleValidationCacheCreateInfoEXT', lambda: define_struct('ShaderModuleValidationCacheCreateInfoEXT', 
     ('type', StructureType),
     ('next', c_void_p),
     ('validation_cache', ValidationCacheEXT),
-)
+))
 
-DescriptorSetLayoutBindingFlagsCreateInfoEXT = define_struct('DescriptorSetLayoutBindingFlagsCreateInfoEXT', 
+define_lazy('DescriptorSetLayoutBindingFlagsCreateInfoEXT', lambda: define_struct('DescriptorSetLayoutBindingFlagsCreateInfoEXT', 
     ('type', StructureType),
     ('next', c_void_p),
     ('binding_count', c_uint32),
     ('binding_flags', POINTER(DescriptorBindingFlagsEXT)),
-)
+))
 
-PhysicalDeviceDescriptorIndexingFeaturesEXT = define_struct('PhysicalDeviceDescriptorIndexingFeaturesEXT', 
+define_lazy('PhysicalDeviceDescriptorIndexingFeaturesEXT', lambda: define_struct('PhysicalDeviceDescriptorIndexingFeaturesEXT', 
     ('type', StructureType),
     ('next', c_void_p),
     ('shader_input_attachment_array_dynamic_indexing', Bool32),
@@ -4938,9 +6066,9 @@ PhysicalDeviceDescriptorIndexingFeaturesEXT = define_struct('PhysicalDeviceDescr
     ('descriptor_binding_partially_bound', Bool32),
     ('descriptor_binding_variable_descriptor_count', Bool32),
     ('runtime_descriptor_array', Bool32),
-)
+))
 
-PhysicalDeviceDescriptorIndexingPropertiesEXT = define_struct('PhysicalDeviceDescriptorIndexingPropertiesEXT', 
+define_lazy('PhysicalDeviceDescriptorIndexingPropertiesEXT', lambda: define_struct('PhysicalDeviceDescriptorIndexingPropertiesEXT', 
     ('type', StructureType),
     ('next', c_void_p),
     ('max_update_after_bind_descriptors_inAll_pools', c_uint32),
@@ -4966,71 +6094,71 @@ PhysicalDeviceDescriptorIndexingPropertiesEXT = define_struct('PhysicalDeviceDes
     ('max_descriptor_set_update_after_bind_sampled_images', c_uint32),
     ('max_descriptor_set_update_after_bind_storage_images', c_uint32),
     ('max_descriptor_set_update_after_bind_input_attachments', c_uint32),
-)
+))
 
-DescriptorSetVariableDescriptorCountAllocateInfoEXT = define_struct('DescriptorSetVariableDescriptorCountAllocateInfoEXT', 
+define_lazy('DescriptorSetVariableDescriptorCountAllocateInfoEXT', lambda: define_struct('DescriptorSetVariableDescriptorCountAllocateInfoEXT', 
     ('type', StructureType),
     ('next', c_void_p),
     ('descriptor_set_count', c_uint32),
     ('descriptor_counts', POINTER(c_uint32)),
-)
+))
 
-DescriptorSetVariableDescriptorCountLayoutSupportEXT = define_struct('DescriptorSetVariableDescriptorCountLayoutSupportEXT', 
+define_lazy('DescriptorSetVariableDescriptorCountLayoutSupportEXT', lambda: define_struct('DescriptorSetVariableDescriptorCountLayoutSupportEXT', 
     ('type', StructureType),
     ('next', c_void_p),
     ('max_variable_descriptor_count', c_uint32),
-)
+))
 
-ShadingRatePaletteNV = define_struct('ShadingRatePaletteNV', 
+define_lazy('ShadingRatePaletteNV', lambda: define_struct('ShadingRatePaletteNV', 
     ('shading_rate_palette_entry_count', c_uint32),
     ('shading_rate_palette_entries', POINTER(ShadingRatePaletteEntryNV)),
-)
+))
 
-PipelineViewportShadingRateImageStateCreateInfoNV = define_struct('PipelineViewportShadingRateImageStateCreateInfoNV', 
+define_lazy('PipelineViewportShadingRateImageStateCreateInfoNV', lambda: define_struct('PipelineViewportShadingRateImageStateCreateInfoNV', 
     ('type', StructureType),
     ('next', c_void_p),
     ('shading_rate_image_enable', Bool32),
     ('viewport_count', c_uint32),
     ('shading_rate_palettes', POINTER(ShadingRatePaletteNV)),
-)
+))
 
-PhysicalDeviceShadingRateImageFeaturesNV = define_struct('PhysicalDeviceShadingRateImageFeaturesNV', 
+define_lazy('PhysicalDeviceShadingRateImageFeaturesNV', lambda: define_struct('PhysicalDeviceShadingRateImageFeaturesNV', 
     ('type', StructureType),
     ('next', c_void_p),
     ('shading_rate_image', Bool32),
     ('shading_rate_coarse_sample_order', Bool32),
-)
+))
 
-PhysicalDeviceShadingRateImagePropertiesNV = define_struct('PhysicalDeviceShadingRateImagePropertiesNV', 
+define_lazy('PhysicalDeviceShadingRateImagePropertiesNV', lambda: define_struct('PhysicalDeviceShadingRateImagePropertiesNV', 
     ('type', StructureType),
     ('next', c_void_p),
     ('shading_rate_texel_size', Extent2D),
     ('shading_rate_palette_size', c_uint32),
     ('shading_rate_max_coarse_samples', c_uint32),
-)
+))
 
-CoarseSampleLocationNV = define_struct('CoarseSampleLocationNV', 
+define_lazy('CoarseSampleLocationNV', lambda: define_struct('CoarseSampleLocationNV', 
     ('pixel_X', c_uint32),
     ('pixel_Y', c_uint32),
     ('sample', c_uint32),
-)
+))
 
-CoarseSampleOrderCustomNV = define_struct('CoarseSampleOrderCustomNV', 
+define_lazy('CoarseSampleOrderCustomNV', lambda: define_struct('CoarseSampleOrderCustomNV', 
     ('shading_rate', ShadingRatePaletteEntryNV),
     ('sample_count', c_uint32),
     ('sample_location_count', c_uint32),
     ('sample_locations', POINTER(CoarseSampleLocationNV)),
-)
+))
 
-PipelineViewportCoarseSampleOrderStateCreateInfoNV = define_struct('PipelineViewportCoarseSampleOrderStateCreateInfoNV', 
+define_lazy('PipelineViewportCoarseSampleOrderStateCreateInfoNV', lambda: define_struct('PipelineViewportCoarseSampleOrderStateCreateInfoNV', 
     ('type', StructureType),
     ('next', c_void_p),
     ('sample_order_type', CoarseSampleOrderTypeNV),
     ('custom_sample_order_count', c_uint32),
     ('custom_sample_orders', POINTER(CoarseSampleOrderCustomNV)),
-)
+))
 
-RayTracingShaderGroupCreateInfoNV = define_struct('RayTracingShaderGroupCreateInfoNV', 
+define_lazy('RayTracingShaderGroupCreateInfoNV', lambda: define_struct('RayTracingShaderGroupCreateInfoNV', 
     ('type', StructureType),
     ('next', c_void_p),
     ('type', RayTracingShaderGroupTypeNV),
@@ -5038,9 +6166,9 @@ RayTracingShaderGroupCreateInfoNV = define_struct('RayTracingShaderGroupCreateIn
     ('closest_hit_shader', c_uint32),
     ('any_hit_shader', c_uint32),
     ('intersection_shader', c_uint32),
-)
+))
 
-RayTracingPipelineCreateInfoNV = define_struct('RayTracingPipelineCreateInfoNV', 
+define_lazy('RayTracingPipelineCreateInfoNV', lambda: define_struct('RayTracingPipelineCreateInfoNV', 
     ('type', StructureType),
     ('next', c_void_p),
     ('flags', PipelineCreateFlags),
@@ -5052,9 +6180,9 @@ RayTracingPipelineCreateInfoNV = define_struct('RayTracingPipelineCreateInfoNV',
     ('layout', PipelineLayout),
     ('base_pipeline_handle', Pipeline),
     ('base_pipeline_index', c_int32),
-)
+))
 
-GeometryTrianglesNV = define_struct('GeometryTrianglesNV', 
+define_lazy('GeometryTrianglesNV', lambda: define_struct('GeometryTrianglesNV', 
     ('type', StructureType),
     ('next', c_void_p),
     ('vertex_data', Buffer),
@@ -5068,31 +6196,31 @@ GeometryTrianglesNV = define_struct('GeometryTrianglesNV',
     ('index_type', IndexType),
     ('transform_data', Buffer),
     ('transform_offset', DeviceSize),
-)
+))
 
-GeometryAABBNV = define_struct('GeometryAABBNV', 
+define_lazy('GeometryAABBNV', lambda: define_struct('GeometryAABBNV', 
     ('type', StructureType),
     ('next', c_void_p),
     ('aabb_data', Buffer),
     ('num_AABBs', c_uint32),
     ('stride', c_uint32),
     ('offset', DeviceSize),
-)
+))
 
-GeometryDataNV = define_struct('GeometryDataNV', 
+define_lazy('GeometryDataNV', lambda: define_struct('GeometryDataNV', 
     ('triangles', GeometryTrianglesNV),
     ('aabbs', GeometryAABBNV),
-)
+))
 
-GeometryNV = define_struct('GeometryNV', 
+define_lazy('GeometryNV', lambda: define_struct('GeometryNV', 
     ('type', StructureType),
     ('next', c_void_p),
     ('geometry_type', GeometryTypeNV),
     ('geometry', GeometryDataNV),
     ('flags', GeometryFlagsNV),
-)
+))
 
-AccelerationStructureInfoNV = define_struct('AccelerationStructureInfoNV', 
+define_lazy('AccelerationStructureInfoNV', lambda: define_struct('AccelerationStructureInfoNV', 
     ('type', StructureType),
     ('next', c_void_p),
     ('type', AccelerationStructureTypeNV),
@@ -5100,16 +6228,16 @@ AccelerationStructureInfoNV = define_struct('AccelerationStructureInfoNV',
     ('instance_count', c_uint32),
     ('geometry_count', c_uint32),
     ('geometries', POINTER(GeometryNV)),
-)
+))
 
-AccelerationStructureCreateInfoNV = define_struct('AccelerationStructureCreateInfoNV', 
+define_lazy('AccelerationStructureCreateInfoNV', lambda: define_struct('AccelerationStructureCreateInfoNV', 
     ('type', StructureType),
     ('next', c_void_p),
     ('compacted_size', DeviceSize),
     ('info', AccelerationStructureInfoNV),
-)
+))
 
-BindAccelerationStructureMemoryInfoNV = define_struct('BindAccelerationStructureMemoryInfoNV', 
+define_lazy('BindAccelerationStructureMemoryInfoNV', lambda: define_struct('BindAccelerationStructureMemoryInfoNV', 
     ('type', StructureType),
     ('next', c_void_p),
     ('acceleration_structure', AccelerationStructureNV),
@@ -5117,23 +6245,23 @@ BindAccelerationStructureMemoryInfoNV = define_struct('BindAccelerationStructure
     ('memory_offset', DeviceSize),
     ('device_index_count', c_uint32),
     ('device_indices', POINTER(c_uint32)),
-)
+))
 
-WriteDescriptorSetAccelerationStructureNV = define_struct('WriteDescriptorSetAccelerationStructureNV', 
+define_lazy('WriteDescriptorSetAccelerationStructureNV', lambda: define_struct('WriteDescriptorSetAccelerationStructureNV', 
     ('type', StructureType),
     ('next', c_void_p),
     ('acceleration_structure_count', c_uint32),
     ('acceleration_structures', POINTER(AccelerationStructureNV)),
-)
+))
 
-AccelerationStructureMemoryRequirementsInfoNV = define_struct('AccelerationStructureMemoryRequirementsInfoNV', 
+define_lazy('AccelerationStructureMemoryRequirementsInfoNV', lambda: define_struct('AccelerationStructureMemoryRequirementsInfoNV', 
     ('type', StructureType),
     ('next', c_void_p),
     ('type', AccelerationStructureMemoryRequirementsTypeNV),
     ('acceleration_structure', AccelerationStructureNV),
-)
+))
 
-PhysicalDeviceRayTracingPropertiesNV = define_struct('PhysicalDeviceRayTracingPropertiesNV', 
+define_lazy('PhysicalDeviceRayTracingPropertiesNV', lambda: define_struct('PhysicalDeviceRayTracingPropertiesNV', 
     ('type', StructureType),
     ('next', c_void_p),
     ('shader_group_handle_size', c_uint32),
@@ -5144,52 +6272,52 @@ PhysicalDeviceRayTracingPropertiesNV = define_struct('PhysicalDeviceRayTracingPr
     ('max_instance_count', c_uint64),
     ('max_triangle_count', c_uint64),
     ('max_descriptor_set_acceleration_structures', c_uint32),
-)
+))
 
-PhysicalDeviceRepresentativeFragmentTestFeaturesNV = define_struct('PhysicalDeviceRepresentativeFragmentTestFeaturesNV', 
+define_lazy('PhysicalDeviceRepresentativeFragmentTestFeaturesNV', lambda: define_struct('PhysicalDeviceRepresentativeFragmentTestFeaturesNV', 
     ('type', StructureType),
     ('next', c_void_p),
     ('representative_fragment_test', Bool32),
-)
+))
 
-PipelineRepresentativeFragmentTestStateCreateInfoNV = define_struct('PipelineRepresentativeFragmentTestStateCreateInfoNV', 
+define_lazy('PipelineRepresentativeFragmentTestStateCreateInfoNV', lambda: define_struct('PipelineRepresentativeFragmentTestStateCreateInfoNV', 
     ('type', StructureType),
     ('next', c_void_p),
     ('representative_fragment_test_enable', Bool32),
-)
+))
 
-DeviceQueueGlobalPriorityCreateInfoEXT = define_struct('DeviceQueueGlobalPriorityCreateInfoEXT', 
+define_lazy('DeviceQueueGlobalPriorityCreateInfoEXT', lambda: define_struct('DeviceQueueGlobalPriorityCreateInfoEXT', 
     ('type', StructureType),
     ('next', c_void_p),
     ('global_priority', QueueGlobalPriorityEXT),
-)
+))
 
-ImportMemoryHostPointerInfoEXT = define_struct('ImportMemoryHostPointerInfoEXT', 
+define_lazy('ImportMemoryHostPointerInfoEXT', lambda: define_struct('ImportMemoryHostPointerInfoEXT', 
     ('type', StructureType),
     ('next', c_void_p),
     ('handle_type', ExternalMemoryHandleTypeFlagBits),
     ('host_pointer', c_void_p),
-)
+))
 
-MemoryHostPointerPropertiesEXT = define_struct('MemoryHostPointerPropertiesEXT', 
+define_lazy('MemoryHostPointerPropertiesEXT', lambda: define_struct('MemoryHostPointerPropertiesEXT', 
     ('type', StructureType),
     ('next', c_void_p),
     ('memory_type_bits', c_uint32),
-)
+))
 
-PhysicalDeviceExternalMemoryHostPropertiesEXT = define_struct('PhysicalDeviceExternalMemoryHostPropertiesEXT', 
+define_lazy('PhysicalDeviceExternalMemoryHostPropertiesEXT', lambda: define_struct('PhysicalDeviceExternalMemoryHostPropertiesEXT', 
     ('type', StructureType),
     ('next', c_void_p),
     ('min_imported_host_pointer_alignment', DeviceSize),
-)
+))
 
-CalibratedTimestampInfoEXT = define_struct('CalibratedTimestampInfoEXT', 
+define_lazy('CalibratedTimestampInfoEXT', lambda: define_struct('CalibratedTimestampInfoEXT', 
     ('type', StructureType),
     ('next', c_void_p),
     ('time_domain', TimeDomainEXT),
-)
+))
 
-PhysicalDeviceShaderCorePropertiesAMD = define_struct('PhysicalDeviceShaderCorePropertiesAMD', 
+define_lazy('PhysicalDeviceShaderCorePropertiesAMD', lambda: define_struct('PhysicalDeviceShaderCorePropertiesAMD', 
     ('type', StructureType),
     ('next', c_void_p),
     ('shader_engine_count', c_uint32),
@@ -5206,54 +6334,54 @@ PhysicalDeviceShaderCorePropertiesAMD = define_struct('PhysicalDeviceShaderCoreP
     ('min_vgpr_allocation', c_uint32),
     ('max_vgpr_allocation', c_uint32),
     ('vgpr_allocation_granularity', c_uint32),
-)
+))
 
-DeviceMemoryOverallocationCreateInfoAMD = define_struct('DeviceMemoryOverallocationCreateInfoAMD', 
+define_lazy('DeviceMemoryOverallocationCreateInfoAMD', lambda: define_struct('DeviceMemoryOverallocationCreateInfoAMD', 
     ('type', StructureType),
     ('next', c_void_p),
     ('overallocation_behavior', MemoryOverallocationBehaviorAMD),
-)
+))
 
-PhysicalDeviceVertexAttributeDivisorPropertiesEXT = define_struct('PhysicalDeviceVertexAttributeDivisorPropertiesEXT', 
+define_lazy('PhysicalDeviceVertexAttributeDivisorPropertiesEXT', lambda: define_struct('PhysicalDeviceVertexAttributeDivisorPropertiesEXT', 
     ('type', StructureType),
     ('next', c_void_p),
     ('max_vertex_attrib_divisor', c_uint32),
-)
+))
 
-VertexInputBindingDivisorDescriptionEXT = define_struct('VertexInputBindingDivisorDescriptionEXT', 
+define_lazy('VertexInputBindingDivisorDescriptionEXT', lambda: define_struct('VertexInputBindingDivisorDescriptionEXT', 
     ('binding', c_uint32),
     ('divisor', c_uint32),
-)
+))
 
-PipelineVertexInputDivisorStateCreateInfoEXT = define_struct('PipelineVertexInputDivisorStateCreateInfoEXT', 
+define_lazy('PipelineVertexInputDivisorStateCreateInfoEXT', lambda: define_struct('PipelineVertexInputDivisorStateCreateInfoEXT', 
     ('type', StructureType),
     ('next', c_void_p),
     ('vertex_binding_divisor_count', c_uint32),
     ('vertex_binding_divisors', POINTER(VertexInputBindingDivisorDescriptionEXT)),
-)
+))
 
-PhysicalDeviceVertexAttributeDivisorFeaturesEXT = define_struct('PhysicalDeviceVertexAttributeDivisorFeaturesEXT', 
+define_lazy('PhysicalDeviceVertexAttributeDivisorFeaturesEXT', lambda: define_struct('PhysicalDeviceVertexAttributeDivisorFeaturesEXT', 
     ('type', StructureType),
     ('next', c_void_p),
     ('vertex_attribute_instance_rate_divisor', Bool32),
     ('vertex_attribute_instance_rate_zero_divisor', Bool32),
-)
+))
 
-PhysicalDeviceComputeShaderDerivativesFeaturesNV = define_struct('PhysicalDeviceComputeShaderDerivativesFeaturesNV', 
+define_lazy('PhysicalDeviceComputeShaderDerivativesFeaturesNV', lambda: define_struct('PhysicalDeviceComputeShaderDerivativesFeaturesNV', 
     ('type', StructureType),
     ('next', c_void_p),
     ('compute_derivative_group_quads', Bool32),
     ('compute_derivative_group_linear', Bool32),
-)
+))
 
-PhysicalDeviceMeshShaderFeaturesNV = define_struct('PhysicalDeviceMeshShaderFeaturesNV', 
+define_lazy('PhysicalDeviceMeshShaderFeaturesNV', lambda: define_struct('PhysicalDeviceMeshShaderFeaturesNV', 
     ('type', StructureType),
     ('next', c_void_p),
     ('task_shader', Bool32),
     ('mesh_shader', Bool32),
-)
+))
 
-PhysicalDeviceMeshShaderPropertiesNV = define_struct('PhysicalDeviceMeshShaderPropertiesNV', 
+define_lazy('PhysicalDeviceMeshShaderPropertiesNV', lambda: define_struct('PhysicalDeviceMeshShaderPropertiesNV', 
     ('type', StructureType),
     ('next', c_void_p),
     ('max_draw_mesh_tasks_count', c_uint32),
@@ -5269,98 +6397,98 @@ PhysicalDeviceMeshShaderPropertiesNV = define_struct('PhysicalDeviceMeshShaderPr
     ('max_mesh_multiview_view_count', c_uint32),
     ('mesh_output_per_vertex_granularity', c_uint32),
     ('mesh_output_per_primitive_granularity', c_uint32),
-)
+))
 
-DrawMeshTasksIndirectCommandNV = define_struct('DrawMeshTasksIndirectCommandNV', 
+define_lazy('DrawMeshTasksIndirectCommandNV', lambda: define_struct('DrawMeshTasksIndirectCommandNV', 
     ('task_count', c_uint32),
     ('first_task', c_uint32),
-)
+))
 
-PhysicalDeviceFragmentShaderBarycentricFeaturesNV = define_struct('PhysicalDeviceFragmentShaderBarycentricFeaturesNV', 
+define_lazy('PhysicalDeviceFragmentShaderBarycentricFeaturesNV', lambda: define_struct('PhysicalDeviceFragmentShaderBarycentricFeaturesNV', 
     ('type', StructureType),
     ('next', c_void_p),
     ('fragment_shader_barycentric', Bool32),
-)
+))
 
-PhysicalDeviceShaderImageFootprintFeaturesNV = define_struct('PhysicalDeviceShaderImageFootprintFeaturesNV', 
+define_lazy('PhysicalDeviceShaderImageFootprintFeaturesNV', lambda: define_struct('PhysicalDeviceShaderImageFootprintFeaturesNV', 
     ('type', StructureType),
     ('next', c_void_p),
     ('image_footprint', Bool32),
-)
+))
 
-PipelineViewportExclusiveScissorStateCreateInfoNV = define_struct('PipelineViewportExclusiveScissorStateCreateInfoNV', 
+define_lazy('PipelineViewportExclusiveScissorStateCreateInfoNV', lambda: define_struct('PipelineViewportExclusiveScissorStateCreateInfoNV', 
     ('type', StructureType),
     ('next', c_void_p),
     ('exclusive_scissor_count', c_uint32),
     ('exclusive_scissors', POINTER(Rect2D)),
-)
+))
 
-PhysicalDeviceExclusiveScissorFeaturesNV = define_struct('PhysicalDeviceExclusiveScissorFeaturesNV', 
+define_lazy('PhysicalDeviceExclusiveScissorFeaturesNV', lambda: define_struct('PhysicalDeviceExclusiveScissorFeaturesNV', 
     ('type', StructureType),
     ('next', c_void_p),
     ('exclusive_scissor', Bool32),
-)
+))
 
-QueueFamilyCheckpointPropertiesNV = define_struct('QueueFamilyCheckpointPropertiesNV', 
+define_lazy('QueueFamilyCheckpointPropertiesNV', lambda: define_struct('QueueFamilyCheckpointPropertiesNV', 
     ('type', StructureType),
     ('next', c_void_p),
     ('checkpoint_execution_stage_mask', PipelineStageFlags),
-)
+))
 
-CheckpointDataNV = define_struct('CheckpointDataNV', 
+define_lazy('CheckpointDataNV', lambda: define_struct('CheckpointDataNV', 
     ('type', StructureType),
     ('next', c_void_p),
     ('stage', PipelineStageFlagBits),
     ('checkpoint_marker', c_void_p),
-)
+))
 
-PhysicalDevicePCIBusInfoPropertiesEXT = define_struct('PhysicalDevicePCIBusInfoPropertiesEXT', 
+define_lazy('PhysicalDevicePCIBusInfoPropertiesEXT', lambda: define_struct('PhysicalDevicePCIBusInfoPropertiesEXT', 
     ('type', StructureType),
     ('next', c_void_p),
     ('pci_domain', c_uint16),
     ('pci_bus', c_int8),
     ('pci_device', c_int8),
     ('pci_function', c_int8),
-)
+))
 
-Win32SurfaceCreateInfoKHR = define_struct('Win32SurfaceCreateInfoKHR', 
+define_lazy('Win32SurfaceCreateInfoKHR', lambda: define_struct('Win32SurfaceCreateInfoKHR', 
     ('type', StructureType),
     ('next', c_void_p),
     ('flags', Win32SurfaceCreateFlagsKHR),
     ('hinstance', HINSTANCE),
     ('hwnd', HWND),
-)
+))
 
-ImportMemoryWin32HandleInfoKHR = define_struct('ImportMemoryWin32HandleInfoKHR', 
+define_lazy('ImportMemoryWin32HandleInfoKHR', lambda: define_struct('ImportMemoryWin32HandleInfoKHR', 
     ('type', StructureType),
     ('next', c_void_p),
     ('handle_type', ExternalMemoryHandleTypeFlagBits),
     ('handle', HANDLE),
     ('name', LPCWSTR),
-)
+))
 
-ExportMemoryWin32HandleInfoKHR = define_struct('ExportMemoryWin32HandleInfoKHR', 
+define_lazy('ExportMemoryWin32HandleInfoKHR', lambda: define_struct('ExportMemoryWin32HandleInfoKHR', 
     ('type', StructureType),
     ('next', c_void_p),
     ('attributes', POINTER(SECURITY_ATTRIBUTES)),
     ('dw_access', DWORD),
     ('name', LPCWSTR),
-)
+))
 
-MemoryWin32HandlePropertiesKHR = define_struct('MemoryWin32HandlePropertiesKHR', 
+define_lazy('MemoryWin32HandlePropertiesKHR', lambda: define_struct('MemoryWin32HandlePropertiesKHR', 
     ('type', StructureType),
     ('next', c_void_p),
     ('memory_type_bits', c_uint32),
-)
+))
 
-MemoryGetWin32HandleInfoKHR = define_struct('MemoryGetWin32HandleInfoKHR', 
+define_lazy('MemoryGetWin32HandleInfoKHR', lambda: define_struct('MemoryGetWin32HandleInfoKHR', 
     ('type', StructureType),
     ('next', c_void_p),
     ('memory', DeviceMemory),
     ('handle_type', ExternalMemoryHandleTypeFlagBits),
-)
+))
 
-Win32KeyedMutexAcquireReleaseInfoKHR = define_struct('Win32KeyedMutexAcquireReleaseInfoKHR', 
+define_lazy('Win32KeyedMutexAcquireReleaseInfoKHR', lambda: define_struct('Win32KeyedMutexAcquireReleaseInfoKHR', 
     ('type', StructureType),
     ('next', c_void_p),
     ('acquire_count', c_uint32),
@@ -5370,9 +6498,9 @@ Win32KeyedMutexAcquireReleaseInfoKHR = define_struct('Win32KeyedMutexAcquireRele
     ('release_count', c_uint32),
     ('release_syncs', POINTER(DeviceMemory)),
     ('release_keys', POINTER(c_uint64)),
-)
+))
 
-ImportSemaphoreWin32HandleInfoKHR = define_struct('ImportSemaphoreWin32HandleInfoKHR', 
+define_lazy('ImportSemaphoreWin32HandleInfoKHR', lambda: define_struct('ImportSemaphoreWin32HandleInfoKHR', 
     ('type', StructureType),
     ('next', c_void_p),
     ('semaphore', Semaphore),
@@ -5380,33 +6508,33 @@ ImportSemaphoreWin32HandleInfoKHR = define_struct('ImportSemaphoreWin32HandleInf
     ('handle_type', ExternalSemaphoreHandleTypeFlagBits),
     ('handle', HANDLE),
     ('name', LPCWSTR),
-)
+))
 
-ExportSemaphoreWin32HandleInfoKHR = define_struct('ExportSemaphoreWin32HandleInfoKHR', 
+define_lazy('ExportSemaphoreWin32HandleInfoKHR', lambda: define_struct('ExportSemaphoreWin32HandleInfoKHR', 
     ('type', StructureType),
     ('next', c_void_p),
     ('attributes', POINTER(SECURITY_ATTRIBUTES)),
     ('dw_access', DWORD),
     ('name', LPCWSTR),
-)
+))
 
-D3D12FenceSubmitInfoKHR = define_struct('D3D12FenceSubmitInfoKHR', 
+define_lazy('D3D12FenceSubmitInfoKHR', lambda: define_struct('D3D12FenceSubmitInfoKHR', 
     ('type', StructureType),
     ('next', c_void_p),
     ('wait_semaphore_values_count', c_uint32),
     ('wait_semaphore_values', POINTER(c_uint64)),
     ('signal_semaphore_values_count', c_uint32),
     ('signal_semaphore_values', POINTER(c_uint64)),
-)
+))
 
-SemaphoreGetWin32HandleInfoKHR = define_struct('SemaphoreGetWin32HandleInfoKHR', 
+define_lazy('SemaphoreGetWin32HandleInfoKHR', lambda: define_struct('SemaphoreGetWin32HandleInfoKHR', 
     ('type', StructureType),
     ('next', c_void_p),
     ('semaphore', Semaphore),
     ('handle_type', ExternalSemaphoreHandleTypeFlagBits),
-)
+))
 
-ImportFenceWin32HandleInfoKHR = define_struct('ImportFenceWin32HandleInfoKHR', 
+define_lazy('ImportFenceWin32HandleInfoKHR', lambda: define_struct('ImportFenceWin32HandleInfoKHR', 
     ('type', StructureType),
     ('next', c_void_p),
     ('fence', Fence),
@@ -5414,38 +6542,38 @@ ImportFenceWin32HandleInfoKHR = define_struct('ImportFenceWin32HandleInfoKHR',
     ('handle_type', ExternalFenceHandleTypeFlagBits),
     ('handle', HANDLE),
     ('name', LPCWSTR),
-)
+))
 
-ExportFenceWin32HandleInfoKHR = define_struct('ExportFenceWin32HandleInfoKHR', 
+define_lazy('ExportFenceWin32HandleInfoKHR', lambda: define_struct('ExportFenceWin32HandleInfoKHR', 
     ('type', StructureType),
     ('next', c_void_p),
     ('attributes', POINTER(SECURITY_ATTRIBUTES)),
     ('dw_access', DWORD),
     ('name', LPCWSTR),
-)
+))
 
-FenceGetWin32HandleInfoKHR = define_struct('FenceGetWin32HandleInfoKHR', 
+define_lazy('FenceGetWin32HandleInfoKHR', lambda: define_struct('FenceGetWin32HandleInfoKHR', 
     ('type', StructureType),
     ('next', c_void_p),
     ('fence', Fence),
     ('handle_type', ExternalFenceHandleTypeFlagBits),
-)
+))
 
-ImportMemoryWin32HandleInfoNV = define_struct('ImportMemoryWin32HandleInfoNV', 
+define_lazy('ImportMemoryWin32HandleInfoNV', lambda: define_struct('ImportMemoryWin32HandleInfoNV', 
     ('type', StructureType),
     ('next', c_void_p),
     ('handle_type', ExternalMemoryHandleTypeFlagsNV),
     ('handle', HANDLE),
-)
+))
 
-ExportMemoryWin32HandleInfoNV = define_struct('ExportMemoryWin32HandleInfoNV', 
+define_lazy('ExportMemoryWin32HandleInfoNV', lambda: define_struct('ExportMemoryWin32HandleInfoNV', 
     ('type', StructureType),
     ('next', c_void_p),
     ('attributes', POINTER(SECURITY_ATTRIBUTES)),
     ('dw_access', DWORD),
-)
+))
 
-Win32KeyedMutexAcquireReleaseInfoNV = define_struct('Win32KeyedMutexAcquireReleaseInfoNV', 
+define_lazy('Win32KeyedMutexAcquireReleaseInfoNV', lambda: define_struct('Win32KeyedMutexAcquireReleaseInfoNV', 
     ('type', StructureType),
     ('next', c_void_p),
     ('acquire_count', c_uint32),
@@ -5455,351 +6583,1117 @@ Win32KeyedMutexAcquireReleaseInfoNV = define_struct('Win32KeyedMutexAcquireRelea
     ('release_count', c_uint32),
     ('release_syncs', POINTER(DeviceMemory)),
     ('release_keys', POINTER(c_uint64)),
-)
+))
 
-XcbSurfaceCreateInfoKHR = define_struct('XcbSurfaceCreateInfoKHR', 
+define_lazy('XcbSurfaceCreateInfoKHR', lambda: define_struct('XcbSurfaceCreateInfoKHR', 
     ('type', StructureType),
     ('next', c_void_p),
     ('flags', XcbSurfaceCreateFlagsKHR),
     ('connection', POINTER(xcb_connection_t)),
     ('window', xcb_window_t),
-)
-
-
-
-FnVoidFunction = FUNCTYPE(None, )
-FnCreateInstance = FUNCTYPE(Result, POINTER(InstanceCreateInfo), POINTER(AllocationCallbacks), POINTER(Instance))
-FnDestroyInstance = FUNCTYPE(None, Instance, POINTER(AllocationCallbacks))
-FnEnumeratePhysicalDevices = FUNCTYPE(Result, Instance, POINTER(c_uint32), POINTER(PhysicalDevice))
-FnGetPhysicalDeviceFeatures = FUNCTYPE(None, PhysicalDevice, POINTER(PhysicalDeviceFeatures))
-FnGetPhysicalDeviceFormatProperties = FUNCTYPE(None, PhysicalDevice, Format, POINTER(FormatProperties))
-FnGetPhysicalDeviceImageFormatProperties = FUNCTYPE(Result, PhysicalDevice, Format, ImageType, ImageTiling, ImageUsageFlags, ImageCreateFlags, POINTER(ImageFormatProperties))
-FnGetPhysicalDeviceProperties = FUNCTYPE(None, PhysicalDevice, POINTER(PhysicalDeviceProperties))
-FnGetPhysicalDeviceQueueFamilyProperties = FUNCTYPE(None, PhysicalDevice, POINTER(c_uint32), POINTER(QueueFamilyProperties))
-FnGetPhysicalDeviceMemoryProperties = FUNCTYPE(None, PhysicalDevice, POINTER(PhysicalDeviceMemoryProperties))
-FnGetInstanceProcAddr = FUNCTYPE(FnVoidFunction, Instance, c_char_p)
-FnGetDeviceProcAddr = FUNCTYPE(FnVoidFunction, Device, c_char_p)
-FnCreateDevice = FUNCTYPE(Result, PhysicalDevice, POINTER(DeviceCreateInfo), POINTER(AllocationCallbacks), POINTER(Device))
-FnDestroyDevice = FUNCTYPE(None, Device, POINTER(AllocationCallbacks))
-FnEnumerateInstanceExtensionProperties = FUNCTYPE(Result, c_char_p, POINTER(c_uint32), POINTER(ExtensionProperties))
-FnEnumerateDeviceExtensionProperties = FUNCTYPE(Result, PhysicalDevice, c_char_p, POINTER(c_uint32), POINTER(ExtensionProperties))
-FnEnumerateInstanceLayerProperties = FUNCTYPE(Result, POINTER(c_uint32), POINTER(LayerProperties))
-FnEnumerateDeviceLayerProperties = FUNCTYPE(Result, PhysicalDevice, POINTER(c_uint32), POINTER(LayerProperties))
-FnGetDeviceQueue = FUNCTYPE(None, Device, c_uint32, c_uint32, POINTER(Queue))
-FnQueueSubmit = FUNCTYPE(Result, Queue, c_uint32, POINTER(SubmitInfo), Fence)
-FnQueueWaitIdle = FUNCTYPE(Result, Queue)
-FnDeviceWaitIdle = FUNCTYPE(Result, Device)
-FnAllocateMemory = FUNCTYPE(Result, Device, POINTER(MemoryAllocateInfo), POINTER(AllocationCallbacks), POINTER(DeviceMemory))
-FnFreeMemory = FUNCTYPE(None, Device, DeviceMemory, POINTER(AllocationCallbacks))
-FnMapMemory = FUNCTYPE(Result, Device, DeviceMemory, DeviceSize, DeviceSize, MemoryMapFlags, POINTER(c_void_p))
-FnUnmapMemory = FUNCTYPE(None, Device, DeviceMemory)
-FnFlushMappedMemoryRanges = FUNCTYPE(Result, Device, c_uint32, POINTER(MappedMemoryRange))
-FnInvalidateMappedMemoryRanges = FUNCTYPE(Result, Device, c_uint32, POINTER(MappedMemoryRange))
-FnGetDeviceMemoryCommitment = FUNCTYPE(None, Device, DeviceMemory, POINTER(DeviceSize))
-FnBindBufferMemory = FUNCTYPE(Result, Device, Buffer, DeviceMemory, DeviceSize)
-FnBindImageMemory = FUNCTYPE(Result, Device, Image, DeviceMemory, DeviceSize)
-FnGetBufferMemoryRequirements = FUNCTYPE(None, Device, Buffer, POINTER(MemoryRequirements))
-FnGetImageMemoryRequirements = FUNCTYPE(None, Device, Image, POINTER(MemoryRequirements))
-FnGetImageSparseMemoryRequirements = FUNCTYPE(None, Device, Image, POINTER(c_uint32), POINTER(SparseImageMemoryRequirements))
-FnGetPhysicalDeviceSparseImageFormatProperties = FUNCTYPE(None, PhysicalDevice, Format, ImageType, SampleCountFlagBits, ImageUsageFlags, ImageTiling, POINTER(c_uint32), POINTER(SparseImageFormatProperties))
-FnQueueBindSparse = FUNCTYPE(Result, Queue, c_uint32, POINTER(BindSparseInfo), Fence)
-FnCreateFence = FUNCTYPE(Result, Device, POINTER(FenceCreateInfo), POINTER(AllocationCallbacks), POINTER(Fence))
-FnDestroyFence = FUNCTYPE(None, Device, Fence, POINTER(AllocationCallbacks))
-FnResetFences = FUNCTYPE(Result, Device, c_uint32, POINTER(Fence))
-FnGetFenceStatus = FUNCTYPE(Result, Device, Fence)
-FnWaitForFences = FUNCTYPE(Result, Device, c_uint32, POINTER(Fence), Bool32, c_uint64)
-FnCreateSemaphore = FUNCTYPE(Result, Device, POINTER(SemaphoreCreateInfo), POINTER(AllocationCallbacks), POINTER(Semaphore))
-FnDestroySemaphore = FUNCTYPE(None, Device, Semaphore, POINTER(AllocationCallbacks))
-FnCreateEvent = FUNCTYPE(Result, Device, POINTER(EventCreateInfo), POINTER(AllocationCallbacks), POINTER(Event))
-FnDestroyEvent = FUNCTYPE(None, Device, Event, POINTER(AllocationCallbacks))
-FnGetEventStatus = FUNCTYPE(Result, Device, Event)
-FnSetEvent = FUNCTYPE(Result, Device, Event)
-FnResetEvent = FUNCTYPE(Result, Device, Event)
-FnCreateQueryPool = FUNCTYPE(Result, Device, POINTER(QueryPoolCreateInfo), POINTER(AllocationCallbacks), POINTER(QueryPool))
-FnDestroyQueryPool = FUNCTYPE(None, Device, QueryPool, POINTER(AllocationCallbacks))
-FnGetQueryPoolResults = FUNCTYPE(Result, Device, QueryPool, c_uint32, c_uint32, c_size_t, c_void_p, DeviceSize, QueryResultFlags)
-FnCreateBuffer = FUNCTYPE(Result, Device, POINTER(BufferCreateInfo), POINTER(AllocationCallbacks), POINTER(Buffer))
-FnDestroyBuffer = FUNCTYPE(None, Device, Buffer, POINTER(AllocationCallbacks))
-FnCreateBufferView = FUNCTYPE(Result, Device, POINTER(BufferViewCreateInfo), POINTER(AllocationCallbacks), POINTER(BufferView))
-FnDestroyBufferView = FUNCTYPE(None, Device, BufferView, POINTER(AllocationCallbacks))
-FnCreateImage = FUNCTYPE(Result, Device, POINTER(ImageCreateInfo), POINTER(AllocationCallbacks), POINTER(Image))
-FnDestroyImage = FUNCTYPE(None, Device, Image, POINTER(AllocationCallbacks))
-FnGetImageSubresourceLayout = FUNCTYPE(None, Device, Image, POINTER(ImageSubresource), POINTER(SubresourceLayout))
-FnCreateImageView = FUNCTYPE(Result, Device, POINTER(ImageViewCreateInfo), POINTER(AllocationCallbacks), POINTER(ImageView))
-FnDestroyImageView = FUNCTYPE(None, Device, ImageView, POINTER(AllocationCallbacks))
-FnCreateShaderModule = FUNCTYPE(Result, Device, POINTER(ShaderModuleCreateInfo), POINTER(AllocationCallbacks), POINTER(ShaderModule))
-FnDestroyShaderModule = FUNCTYPE(None, Device, ShaderModule, POINTER(AllocationCallbacks))
-FnCreatePipelineCache = FUNCTYPE(Result, Device, POINTER(PipelineCacheCreateInfo), POINTER(AllocationCallbacks), POINTER(PipelineCache))
-FnDestroyPipelineCache = FUNCTYPE(None, Device, PipelineCache, POINTER(AllocationCallbacks))
-FnGetPipelineCacheData = FUNCTYPE(Result, Device, PipelineCache, POINTER(c_size_t), c_void_p)
-FnMergePipelineCaches = FUNCTYPE(Result, Device, PipelineCache, c_uint32, POINTER(PipelineCache))
-FnCreateGraphicsPipelines = FUNCTYPE(Result, Device, PipelineCache, c_uint32, POINTER(GraphicsPipelineCreateInfo), POINTER(AllocationCallbacks), POINTER(Pipeline))
-FnCreateComputePipelines = FUNCTYPE(Result, Device, PipelineCache, c_uint32, POINTER(ComputePipelineCreateInfo), POINTER(AllocationCallbacks), POINTER(Pipeline))
-FnDestroyPipeline = FUNCTYPE(None, Device, Pipeline, POINTER(AllocationCallbacks))
-FnCreatePipelineLayout = FUNCTYPE(Result, Device, POINTER(PipelineLayoutCreateInfo), POINTER(AllocationCallbacks), POINTER(PipelineLayout))
-FnDestroyPipelineLayout = FUNCTYPE(None, Device, PipelineLayout, POINTER(AllocationCallbacks))
-FnCreateSampler = FUNCTYPE(Result, Device, POINTER(SamplerCreateInfo), POINTER(AllocationCallbacks), POINTER(Sampler))
-FnDestroySampler = FUNCTYPE(None, Device, Sampler, POINTER(AllocationCallbacks))
-FnCreateDescriptorSetLayout = FUNCTYPE(Result, Device, POINTER(DescriptorSetLayoutCreateInfo), POINTER(AllocationCallbacks), POINTER(DescriptorSetLayout))
-FnDestroyDescriptorSetLayout = FUNCTYPE(None, Device, DescriptorSetLayout, POINTER(AllocationCallbacks))
-FnCreateDescriptorPool = FUNCTYPE(Result, Device, POINTER(DescriptorPoolCreateInfo), POINTER(AllocationCallbacks), POINTER(DescriptorPool))
-FnDestroyDescriptorPool = FUNCTYPE(None, Device, DescriptorPool, POINTER(AllocationCallbacks))
-FnResetDescriptorPool = FUNCTYPE(Result, Device, DescriptorPool, DescriptorPoolResetFlags)
-FnAllocateDescriptorSets = FUNCTYPE(Result, Device, POINTER(DescriptorSetAllocateInfo), POINTER(DescriptorSet))
-FnFreeDescriptorSets = FUNCTYPE(Result, Device, DescriptorPool, c_uint32, POINTER(DescriptorSet))
-FnUpdateDescriptorSets = FUNCTYPE(None, Device, c_uint32, POINTER(WriteDescriptorSet), c_uint32, POINTER(CopyDescriptorSet))
-FnCreateFramebuffer = FUNCTYPE(Result, Device, POINTER(FramebufferCreateInfo), POINTER(AllocationCallbacks), POINTER(Framebuffer))
-FnDestroyFramebuffer = FUNCTYPE(None, Device, Framebuffer, POINTER(AllocationCallbacks))
-FnCreateRenderPass = FUNCTYPE(Result, Device, POINTER(RenderPassCreateInfo), POINTER(AllocationCallbacks), POINTER(RenderPass))
-FnDestroyRenderPass = FUNCTYPE(None, Device, RenderPass, POINTER(AllocationCallbacks))
-FnGetRenderAreaGranularity = FUNCTYPE(None, Device, RenderPass, POINTER(Extent2D))
-FnCreateCommandPool = FUNCTYPE(Result, Device, POINTER(CommandPoolCreateInfo), POINTER(AllocationCallbacks), POINTER(CommandPool))
-FnDestroyCommandPool = FUNCTYPE(None, Device, CommandPool, POINTER(AllocationCallbacks))
-FnResetCommandPool = FUNCTYPE(Result, Device, CommandPool, CommandPoolResetFlags)
-FnAllocateCommandBuffers = FUNCTYPE(Result, Device, POINTER(CommandBufferAllocateInfo), POINTER(CommandBuffer))
-FnFreeCommandBuffers = FUNCTYPE(None, Device, CommandPool, c_uint32, POINTER(CommandBuffer))
-FnBeginCommandBuffer = FUNCTYPE(Result, CommandBuffer, POINTER(CommandBufferBeginInfo))
-FnEndCommandBuffer = FUNCTYPE(Result, CommandBuffer)
-FnResetCommandBuffer = FUNCTYPE(Result, CommandBuffer, CommandBufferResetFlags)
-FnCmdBindPipeline = FUNCTYPE(None, CommandBuffer, PipelineBindPoint, Pipeline)
-FnCmdSetViewport = FUNCTYPE(None, CommandBuffer, c_uint32, c_uint32, POINTER(Viewport))
-FnCmdSetScissor = FUNCTYPE(None, CommandBuffer, c_uint32, c_uint32, POINTER(Rect2D))
-FnCmdSetLineWidth = FUNCTYPE(None, CommandBuffer, c_float)
-FnCmdSetDepthBias = FUNCTYPE(None, CommandBuffer, c_float, c_float, c_float)
-FnCmdSetBlendConstants = FUNCTYPE(None, CommandBuffer)
-FnCmdSetDepthBounds = FUNCTYPE(None, CommandBuffer, c_float, c_float)
-FnCmdSetStencilCompareMask = FUNCTYPE(None, CommandBuffer, StencilFaceFlags, c_uint32)
-FnCmdSetStencilWriteMask = FUNCTYPE(None, CommandBuffer, StencilFaceFlags, c_uint32)
-FnCmdSetStencilReference = FUNCTYPE(None, CommandBuffer, StencilFaceFlags, c_uint32)
-FnCmdBindDescriptorSets = FUNCTYPE(None, CommandBuffer, PipelineBindPoint, PipelineLayout, c_uint32, c_uint32, POINTER(DescriptorSet), c_uint32, POINTER(c_uint32))
-FnCmdBindIndexBuffer = FUNCTYPE(None, CommandBuffer, Buffer, DeviceSize, IndexType)
-FnCmdBindVertexBuffers = FUNCTYPE(None, CommandBuffer, c_uint32, c_uint32, POINTER(Buffer), POINTER(DeviceSize))
-FnCmdDraw = FUNCTYPE(None, CommandBuffer, c_uint32, c_uint32, c_uint32, c_uint32)
-FnCmdDrawIndexed = FUNCTYPE(None, CommandBuffer, c_uint32, c_uint32, c_uint32, c_int32, c_uint32)
-FnCmdDrawIndirect = FUNCTYPE(None, CommandBuffer, Buffer, DeviceSize, c_uint32, c_uint32)
-FnCmdDrawIndexedIndirect = FUNCTYPE(None, CommandBuffer, Buffer, DeviceSize, c_uint32, c_uint32)
-FnCmdDispatch = FUNCTYPE(None, CommandBuffer, c_uint32, c_uint32, c_uint32)
-FnCmdDispatchIndirect = FUNCTYPE(None, CommandBuffer, Buffer, DeviceSize)
-FnCmdCopyBuffer = FUNCTYPE(None, CommandBuffer, Buffer, Buffer, c_uint32, POINTER(BufferCopy))
-FnCmdCopyImage = FUNCTYPE(None, CommandBuffer, Image, ImageLayout, Image, ImageLayout, c_uint32, POINTER(ImageCopy))
-FnCmdBlitImage = FUNCTYPE(None, CommandBuffer, Image, ImageLayout, Image, ImageLayout, c_uint32, POINTER(ImageBlit), Filter)
-FnCmdCopyBufferToImage = FUNCTYPE(None, CommandBuffer, Buffer, Image, ImageLayout, c_uint32, POINTER(BufferImageCopy))
-FnCmdCopyImageToBuffer = FUNCTYPE(None, CommandBuffer, Image, ImageLayout, Buffer, c_uint32, POINTER(BufferImageCopy))
-FnCmdUpdateBuffer = FUNCTYPE(None, CommandBuffer, Buffer, DeviceSize, DeviceSize, c_void_p)
-FnCmdFillBuffer = FUNCTYPE(None, CommandBuffer, Buffer, DeviceSize, DeviceSize, c_uint32)
-FnCmdClearColorImage = FUNCTYPE(None, CommandBuffer, Image, ImageLayout, POINTER(ClearColorValue), c_uint32, POINTER(ImageSubresourceRange))
-FnCmdClearDepthStencilImage = FUNCTYPE(None, CommandBuffer, Image, ImageLayout, POINTER(ClearDepthStencilValue), c_uint32, POINTER(ImageSubresourceRange))
-FnCmdClearAttachments = FUNCTYPE(None, CommandBuffer, c_uint32, POINTER(ClearAttachment), c_uint32, POINTER(ClearRect))
-FnCmdResolveImage = FUNCTYPE(None, CommandBuffer, Image, ImageLayout, Image, ImageLayout, c_uint32, POINTER(ImageResolve))
-FnCmdSetEvent = FUNCTYPE(None, CommandBuffer, Event, PipelineStageFlags)
-FnCmdResetEvent = FUNCTYPE(None, CommandBuffer, Event, PipelineStageFlags)
-FnCmdWaitEvents = FUNCTYPE(None, CommandBuffer, c_uint32, POINTER(Event), PipelineStageFlags, PipelineStageFlags, c_uint32, POINTER(MemoryBarrier), c_uint32, POINTER(BufferMemoryBarrier), c_uint32, POINTER(ImageMemoryBarrier))
-FnCmdPipelineBarrier = FUNCTYPE(None, CommandBuffer, PipelineStageFlags, PipelineStageFlags, DependencyFlags, c_uint32, POINTER(MemoryBarrier), c_uint32, POINTER(BufferMemoryBarrier), c_uint32, POINTER(ImageMemoryBarrier))
-FnCmdBeginQuery = FUNCTYPE(None, CommandBuffer, QueryPool, c_uint32, QueryControlFlags)
-FnCmdEndQuery = FUNCTYPE(None, CommandBuffer, QueryPool, c_uint32)
-FnCmdResetQueryPool = FUNCTYPE(None, CommandBuffer, QueryPool, c_uint32, c_uint32)
-FnCmdWriteTimestamp = FUNCTYPE(None, CommandBuffer, PipelineStageFlagBits, QueryPool, c_uint32)
-FnCmdCopyQueryPoolResults = FUNCTYPE(None, CommandBuffer, QueryPool, c_uint32, c_uint32, Buffer, DeviceSize, DeviceSize, QueryResultFlags)
-FnCmdPushConstants = FUNCTYPE(None, CommandBuffer, PipelineLayout, ShaderStageFlags, c_uint32, c_uint32, c_void_p)
-FnCmdBeginRenderPass = FUNCTYPE(None, CommandBuffer, POINTER(RenderPassBeginInfo), SubpassContents)
-FnCmdNextSubpass = FUNCTYPE(None, CommandBuffer, SubpassContents)
-FnCmdEndRenderPass = FUNCTYPE(None, CommandBuffer)
-FnCmdExecuteCommands = FUNCTYPE(None, CommandBuffer, c_uint32, POINTER(CommandBuffer))
-FnEnumerateInstanceVersion = FUNCTYPE(Result, POINTER(c_uint32))
-FnBindBufferMemory2 = FUNCTYPE(Result, Device, c_uint32, POINTER(BindBufferMemoryInfo))
-FnBindImageMemory2 = FUNCTYPE(Result, Device, c_uint32, POINTER(BindImageMemoryInfo))
-FnGetDeviceGroupPeerMemoryFeatures = FUNCTYPE(None, Device, c_uint32, c_uint32, c_uint32, POINTER(PeerMemoryFeatureFlags))
-FnCmdSetDeviceMask = FUNCTYPE(None, CommandBuffer, c_uint32)
-FnCmdDispatchBase = FUNCTYPE(None, CommandBuffer, c_uint32, c_uint32, c_uint32, c_uint32, c_uint32, c_uint32)
-FnEnumeratePhysicalDeviceGroups = FUNCTYPE(Result, Instance, POINTER(c_uint32), POINTER(PhysicalDeviceGroupProperties))
-FnGetImageMemoryRequirements2 = FUNCTYPE(None, Device, POINTER(ImageMemoryRequirementsInfo2), POINTER(MemoryRequirements2))
-FnGetBufferMemoryRequirements2 = FUNCTYPE(None, Device, POINTER(BufferMemoryRequirementsInfo2), POINTER(MemoryRequirements2))
-FnGetImageSparseMemoryRequirements2 = FUNCTYPE(None, Device, POINTER(ImageSparseMemoryRequirementsInfo2), POINTER(c_uint32), POINTER(SparseImageMemoryRequirements2))
-FnGetPhysicalDeviceFeatures2 = FUNCTYPE(None, PhysicalDevice, POINTER(PhysicalDeviceFeatures2))
-FnGetPhysicalDeviceProperties2 = FUNCTYPE(None, PhysicalDevice, POINTER(PhysicalDeviceProperties2))
-FnGetPhysicalDeviceFormatProperties2 = FUNCTYPE(None, PhysicalDevice, Format, POINTER(FormatProperties2))
-FnGetPhysicalDeviceImageFormatProperties2 = FUNCTYPE(Result, PhysicalDevice, POINTER(PhysicalDeviceImageFormatInfo2), POINTER(ImageFormatProperties2))
-FnGetPhysicalDeviceQueueFamilyProperties2 = FUNCTYPE(None, PhysicalDevice, POINTER(c_uint32), POINTER(QueueFamilyProperties2))
-FnGetPhysicalDeviceMemoryProperties2 = FUNCTYPE(None, PhysicalDevice, POINTER(PhysicalDeviceMemoryProperties2))
-FnGetPhysicalDeviceSparseImageFormatProperties2 = FUNCTYPE(None, PhysicalDevice, POINTER(PhysicalDeviceSparseImageFormatInfo2), POINTER(c_uint32), POINTER(SparseImageFormatProperties2))
-FnTrimCommandPool = FUNCTYPE(None, Device, CommandPool, CommandPoolTrimFlags)
-FnGetDeviceQueue2 = FUNCTYPE(None, Device, POINTER(DeviceQueueInfo2), POINTER(Queue))
-FnCreateSamplerYcbcrConversion = FUNCTYPE(Result, Device, POINTER(SamplerYcbcrConversionCreateInfo), POINTER(AllocationCallbacks), POINTER(SamplerYcbcrConversion))
-FnDestroySamplerYcbcrConversion = FUNCTYPE(None, Device, SamplerYcbcrConversion, POINTER(AllocationCallbacks))
-FnCreateDescriptorUpdateTemplate = FUNCTYPE(Result, Device, POINTER(DescriptorUpdateTemplateCreateInfo), POINTER(AllocationCallbacks), POINTER(DescriptorUpdateTemplate))
-FnDestroyDescriptorUpdateTemplate = FUNCTYPE(None, Device, DescriptorUpdateTemplate, POINTER(AllocationCallbacks))
-FnUpdateDescriptorSetWithTemplate = FUNCTYPE(None, Device, DescriptorSet, DescriptorUpdateTemplate, c_void_p)
-FnGetPhysicalDeviceExternalBufferProperties = FUNCTYPE(None, PhysicalDevice, POINTER(PhysicalDeviceExternalBufferInfo), POINTER(ExternalBufferProperties))
-FnGetPhysicalDeviceExternalFenceProperties = FUNCTYPE(None, PhysicalDevice, POINTER(PhysicalDeviceExternalFenceInfo), POINTER(ExternalFenceProperties))
-FnGetPhysicalDeviceExternalSemaphoreProperties = FUNCTYPE(None, PhysicalDevice, POINTER(PhysicalDeviceExternalSemaphoreInfo), POINTER(ExternalSemaphoreProperties))
-FnGetDescriptorSetLayoutSupport = FUNCTYPE(None, Device, POINTER(DescriptorSetLayoutCreateInfo), POINTER(DescriptorSetLayoutSupport))
-FnDestroySurfaceKHR = FUNCTYPE(None, Instance, SurfaceKHR, POINTER(AllocationCallbacks))
-FnGetPhysicalDeviceSurfaceSupportKHR = FUNCTYPE(Result, PhysicalDevice, c_uint32, SurfaceKHR, POINTER(Bool32))
-FnGetPhysicalDeviceSurfaceCapabilitiesKHR = FUNCTYPE(Result, PhysicalDevice, SurfaceKHR, POINTER(SurfaceCapabilitiesKHR))
-FnGetPhysicalDeviceSurfaceFormatsKHR = FUNCTYPE(Result, PhysicalDevice, SurfaceKHR, POINTER(c_uint32), POINTER(SurfaceFormatKHR))
-FnGetPhysicalDeviceSurfacePresentModesKHR = FUNCTYPE(Result, PhysicalDevice, SurfaceKHR, POINTER(c_uint32), POINTER(PresentModeKHR))
-FnCreateSwapchainKHR = FUNCTYPE(Result, Device, POINTER(SwapchainCreateInfoKHR), POINTER(AllocationCallbacks), POINTER(SwapchainKHR))
-FnDestroySwapchainKHR = FUNCTYPE(None, Device, SwapchainKHR, POINTER(AllocationCallbacks))
-FnGetSwapchainImagesKHR = FUNCTYPE(Result, Device, SwapchainKHR, POINTER(c_uint32), POINTER(Image))
-FnAcquireNextImageKHR = FUNCTYPE(Result, Device, SwapchainKHR, c_uint64, Semaphore, Fence, POINTER(c_uint32))
-FnQueuePresentKHR = FUNCTYPE(Result, Queue, POINTER(PresentInfoKHR))
-FnGetDeviceGroupPresentCapabilitiesKHR = FUNCTYPE(Result, Device, POINTER(DeviceGroupPresentCapabilitiesKHR))
-FnGetDeviceGroupSurfacePresentModesKHR = FUNCTYPE(Result, Device, SurfaceKHR, POINTER(DeviceGroupPresentModeFlagsKHR))
-FnGetPhysicalDevicePresentRectanglesKHR = FUNCTYPE(Result, PhysicalDevice, SurfaceKHR, POINTER(c_uint32), POINTER(Rect2D))
-FnAcquireNextImage2KHR = FUNCTYPE(Result, Device, POINTER(AcquireNextImageInfoKHR), POINTER(c_uint32))
-FnGetPhysicalDeviceDisplayPropertiesKHR = FUNCTYPE(Result, PhysicalDevice, POINTER(c_uint32), POINTER(DisplayPropertiesKHR))
-FnGetPhysicalDeviceDisplayPlanePropertiesKHR = FUNCTYPE(Result, PhysicalDevice, POINTER(c_uint32), POINTER(DisplayPlanePropertiesKHR))
-FnGetDisplayPlaneSupportedDisplaysKHR = FUNCTYPE(Result, PhysicalDevice, c_uint32, POINTER(c_uint32), POINTER(DisplayKHR))
-FnGetDisplayModePropertiesKHR = FUNCTYPE(Result, PhysicalDevice, DisplayKHR, POINTER(c_uint32), POINTER(DisplayModePropertiesKHR))
-FnCreateDisplayModeKHR = FUNCTYPE(Result, PhysicalDevice, DisplayKHR, POINTER(DisplayModeCreateInfoKHR), POINTER(AllocationCallbacks), POINTER(DisplayModeKHR))
-FnGetDisplayPlaneCapabilitiesKHR = FUNCTYPE(Result, PhysicalDevice, DisplayModeKHR, c_uint32, POINTER(DisplayPlaneCapabilitiesKHR))
-FnCreateDisplayPlaneSurfaceKHR = FUNCTYPE(Result, Instance, POINTER(DisplaySurfaceCreateInfoKHR), POINTER(AllocationCallbacks), POINTER(SurfaceKHR))
-FnCreateSharedSwapchainsKHR = FUNCTYPE(Result, Device, c_uint32, POINTER(SwapchainCreateInfoKHR), POINTER(AllocationCallbacks), POINTER(SwapchainKHR))
-FnGetPhysicalDeviceFeatures2KHR = FUNCTYPE(None, PhysicalDevice, POINTER(PhysicalDeviceFeatures2))
-FnGetPhysicalDeviceProperties2KHR = FUNCTYPE(None, PhysicalDevice, POINTER(PhysicalDeviceProperties2))
-FnGetPhysicalDeviceFormatProperties2KHR = FUNCTYPE(None, PhysicalDevice, Format, POINTER(FormatProperties2))
-FnGetPhysicalDeviceImageFormatProperties2KHR = FUNCTYPE(Result, PhysicalDevice, POINTER(PhysicalDeviceImageFormatInfo2), POINTER(ImageFormatProperties2))
-FnGetPhysicalDeviceQueueFamilyProperties2KHR = FUNCTYPE(None, PhysicalDevice, POINTER(c_uint32), POINTER(QueueFamilyProperties2))
-FnGetPhysicalDeviceMemoryProperties2KHR = FUNCTYPE(None, PhysicalDevice, POINTER(PhysicalDeviceMemoryProperties2))
-FnGetPhysicalDeviceSparseImageFormatProperties2KHR = FUNCTYPE(None, PhysicalDevice, POINTER(PhysicalDeviceSparseImageFormatInfo2), POINTER(c_uint32), POINTER(SparseImageFormatProperties2))
-FnGetDeviceGroupPeerMemoryFeaturesKHR = FUNCTYPE(None, Device, c_uint32, c_uint32, c_uint32, POINTER(PeerMemoryFeatureFlags))
-FnCmdSetDeviceMaskKHR = FUNCTYPE(None, CommandBuffer, c_uint32)
-FnCmdDispatchBaseKHR = FUNCTYPE(None, CommandBuffer, c_uint32, c_uint32, c_uint32, c_uint32, c_uint32, c_uint32)
-FnTrimCommandPoolKHR = FUNCTYPE(None, Device, CommandPool, CommandPoolTrimFlags)
-FnEnumeratePhysicalDeviceGroupsKHR = FUNCTYPE(Result, Instance, POINTER(c_uint32), POINTER(PhysicalDeviceGroupProperties))
-FnGetPhysicalDeviceExternalBufferPropertiesKHR = FUNCTYPE(None, PhysicalDevice, POINTER(PhysicalDeviceExternalBufferInfo), POINTER(ExternalBufferProperties))
-FnGetMemoryFdKHR = FUNCTYPE(Result, Device, POINTER(MemoryGetFdInfoKHR), POINTER(c_int32))
-FnGetMemoryFdPropertiesKHR = FUNCTYPE(Result, Device, ExternalMemoryHandleTypeFlagBits, c_int32, POINTER(MemoryFdPropertiesKHR))
-FnGetPhysicalDeviceExternalSemaphorePropertiesKHR = FUNCTYPE(None, PhysicalDevice, POINTER(PhysicalDeviceExternalSemaphoreInfo), POINTER(ExternalSemaphoreProperties))
-FnImportSemaphoreFdKHR = FUNCTYPE(Result, Device, POINTER(ImportSemaphoreFdInfoKHR))
-FnGetSemaphoreFdKHR = FUNCTYPE(Result, Device, POINTER(SemaphoreGetFdInfoKHR), POINTER(c_int32))
-FnCmdPushDescriptorSetKHR = FUNCTYPE(None, CommandBuffer, PipelineBindPoint, PipelineLayout, c_uint32, c_uint32, POINTER(WriteDescriptorSet))
-FnCmdPushDescriptorSetWithTemplateKHR = FUNCTYPE(None, CommandBuffer, DescriptorUpdateTemplate, PipelineLayout, c_uint32, c_void_p)
-FnCreateDescriptorUpdateTemplateKHR = FUNCTYPE(Result, Device, POINTER(DescriptorUpdateTemplateCreateInfo), POINTER(AllocationCallbacks), POINTER(DescriptorUpdateTemplate))
-FnDestroyDescriptorUpdateTemplateKHR = FUNCTYPE(None, Device, DescriptorUpdateTemplate, POINTER(AllocationCallbacks))
-FnUpdateDescriptorSetWithTemplateKHR = FUNCTYPE(None, Device, DescriptorSet, DescriptorUpdateTemplate, c_void_p)
-FnCreateRenderPass2KHR = FUNCTYPE(Result, Device, POINTER(RenderPassCreateInfo2KHR), POINTER(AllocationCallbacks), POINTER(RenderPass))
-FnCmdBeginRenderPass2KHR = FUNCTYPE(None, CommandBuffer, POINTER(RenderPassBeginInfo), POINTER(SubpassBeginInfoKHR))
-FnCmdNextSubpass2KHR = FUNCTYPE(None, CommandBuffer, POINTER(SubpassBeginInfoKHR), POINTER(SubpassEndInfoKHR))
-FnCmdEndRenderPass2KHR = FUNCTYPE(None, CommandBuffer, POINTER(SubpassEndInfoKHR))
-FnGetSwapchainStatusKHR = FUNCTYPE(Result, Device, SwapchainKHR)
-FnGetPhysicalDeviceExternalFencePropertiesKHR = FUNCTYPE(None, PhysicalDevice, POINTER(PhysicalDeviceExternalFenceInfo), POINTER(ExternalFenceProperties))
-FnImportFenceFdKHR = FUNCTYPE(Result, Device, POINTER(ImportFenceFdInfoKHR))
-FnGetFenceFdKHR = FUNCTYPE(Result, Device, POINTER(FenceGetFdInfoKHR), POINTER(c_int32))
-FnGetPhysicalDeviceSurfaceCapabilities2KHR = FUNCTYPE(Result, PhysicalDevice, POINTER(PhysicalDeviceSurfaceInfo2KHR), POINTER(SurfaceCapabilities2KHR))
-FnGetPhysicalDeviceSurfaceFormats2KHR = FUNCTYPE(Result, PhysicalDevice, POINTER(PhysicalDeviceSurfaceInfo2KHR), POINTER(c_uint32), POINTER(SurfaceFormat2KHR))
-FnGetPhysicalDeviceDisplayProperties2KHR = FUNCTYPE(Result, PhysicalDevice, POINTER(c_uint32), POINTER(DisplayProperties2KHR))
-FnGetPhysicalDeviceDisplayPlaneProperties2KHR = FUNCTYPE(Result, PhysicalDevice, POINTER(c_uint32), POINTER(DisplayPlaneProperties2KHR))
-FnGetDisplayModeProperties2KHR = FUNCTYPE(Result, PhysicalDevice, DisplayKHR, POINTER(c_uint32), POINTER(DisplayModeProperties2KHR))
-FnGetDisplayPlaneCapabilities2KHR = FUNCTYPE(Result, PhysicalDevice, POINTER(DisplayPlaneInfo2KHR), POINTER(DisplayPlaneCapabilities2KHR))
-FnGetImageMemoryRequirements2KHR = FUNCTYPE(None, Device, POINTER(ImageMemoryRequirementsInfo2), POINTER(MemoryRequirements2))
-FnGetBufferMemoryRequirements2KHR = FUNCTYPE(None, Device, POINTER(BufferMemoryRequirementsInfo2), POINTER(MemoryRequirements2))
-FnGetImageSparseMemoryRequirements2KHR = FUNCTYPE(None, Device, POINTER(ImageSparseMemoryRequirementsInfo2), POINTER(c_uint32), POINTER(SparseImageMemoryRequirements2))
-FnCreateSamplerYcbcrConversionKHR = FUNCTYPE(Result, Device, POINTER(SamplerYcbcrConversionCreateInfo), POINTER(AllocationCallbacks), POINTER(SamplerYcbcrConversion))
-FnDestroySamplerYcbcrConversionKHR = FUNCTYPE(None, Device, SamplerYcbcrConversion, POINTER(AllocationCallbacks))
-FnBindBufferMemory2KHR = FUNCTYPE(Result, Device, c_uint32, POINTER(BindBufferMemoryInfo))
-FnBindImageMemory2KHR = FUNCTYPE(Result, Device, c_uint32, POINTER(BindImageMemoryInfo))
-FnGetDescriptorSetLayoutSupportKHR = FUNCTYPE(None, Device, POINTER(DescriptorSetLayoutCreateInfo), POINTER(DescriptorSetLayoutSupport))
-FnCmdDrawIndirectCountKHR = FUNCTYPE(None, CommandBuffer, Buffer, DeviceSize, Buffer, DeviceSize, c_uint32, c_uint32)
-FnCmdDrawIndexedIndirectCountKHR = FUNCTYPE(None, CommandBuffer, Buffer, DeviceSize, Buffer, DeviceSize, c_uint32, c_uint32)
-FnCreateDebugReportCallbackEXT = FUNCTYPE(Result, Instance, POINTER(DebugReportCallbackCreateInfoEXT), POINTER(AllocationCallbacks), POINTER(DebugReportCallbackEXT))
-FnDestroyDebugReportCallbackEXT = FUNCTYPE(None, Instance, DebugReportCallbackEXT, POINTER(AllocationCallbacks))
-FnDebugReportMessageEXT = FUNCTYPE(None, Instance, DebugReportFlagsEXT, DebugReportObjectTypeEXT, c_uint64, c_size_t, c_int32, c_char_p, c_char_p)
-FnDebugMarkerSetObjectTagEXT = FUNCTYPE(Result, Device, POINTER(DebugMarkerObjectTagInfoEXT))
-FnDebugMarkerSetObjectNameEXT = FUNCTYPE(Result, Device, POINTER(DebugMarkerObjectNameInfoEXT))
-FnCmdDebugMarkerBeginEXT = FUNCTYPE(None, CommandBuffer, POINTER(DebugMarkerMarkerInfoEXT))
-FnCmdDebugMarkerEndEXT = FUNCTYPE(None, CommandBuffer)
-FnCmdDebugMarkerInsertEXT = FUNCTYPE(None, CommandBuffer, POINTER(DebugMarkerMarkerInfoEXT))
-FnCmdBindTransformFeedbackBuffersEXT = FUNCTYPE(None, CommandBuffer, c_uint32, c_uint32, POINTER(Buffer), POINTER(DeviceSize), POINTER(DeviceSize))
-FnCmdBeginTransformFeedbackEXT = FUNCTYPE(None, CommandBuffer, c_uint32, c_uint32, POINTER(Buffer), POINTER(DeviceSize))
-FnCmdEndTransformFeedbackEXT = FUNCTYPE(None, CommandBuffer, c_uint32, c_uint32, POINTER(Buffer), POINTER(DeviceSize))
-FnCmdBeginQueryIndexedEXT = FUNCTYPE(None, CommandBuffer, QueryPool, c_uint32, QueryControlFlags, c_uint32)
-FnCmdEndQueryIndexedEXT = FUNCTYPE(None, CommandBuffer, QueryPool, c_uint32, c_uint32)
-FnCmdDrawIndirectByteCountEXT = FUNCTYPE(None, CommandBuffer, c_uint32, c_uint32, Buffer, DeviceSize, c_uint32, c_uint32)
-FnCmdDrawIndirectCountAMD = FUNCTYPE(None, CommandBuffer, Buffer, DeviceSize, Buffer, DeviceSize, c_uint32, c_uint32)
-FnCmdDrawIndexedIndirectCountAMD = FUNCTYPE(None, CommandBuffer, Buffer, DeviceSize, Buffer, DeviceSize, c_uint32, c_uint32)
-FnGetShaderInfoAMD = FUNCTYPE(Result, Device, Pipeline, ShaderStageFlagBits, ShaderInfoTypeAMD, POINTER(c_size_t), c_void_p)
-FnGetPhysicalDeviceExternalImageFormatPropertiesNV = FUNCTYPE(Result, PhysicalDevice, Format, ImageType, ImageTiling, ImageUsageFlags, ImageCreateFlags, ExternalMemoryHandleTypeFlagsNV, POINTER(ExternalImageFormatPropertiesNV))
-FnCmdBeginConditionalRenderingEXT = FUNCTYPE(None, CommandBuffer, POINTER(ConditionalRenderingBeginInfoEXT))
-FnCmdEndConditionalRenderingEXT = FUNCTYPE(None, CommandBuffer)
-FnCmdProcessCommandsNVX = FUNCTYPE(None, CommandBuffer, POINTER(CmdProcessCommandsInfoNVX))
-FnCmdReserveSpaceForCommandsNVX = FUNCTYPE(None, CommandBuffer, POINTER(CmdReserveSpaceForCommandsInfoNVX))
-FnCreateIndirectCommandsLayoutNVX = FUNCTYPE(Result, Device, POINTER(IndirectCommandsLayoutCreateInfoNVX), POINTER(AllocationCallbacks), POINTER(IndirectCommandsLayoutNVX))
-FnDestroyIndirectCommandsLayoutNVX = FUNCTYPE(None, Device, IndirectCommandsLayoutNVX, POINTER(AllocationCallbacks))
-FnCreateObjectTableNVX = FUNCTYPE(Result, Device, POINTER(ObjectTableCreateInfoNVX), POINTER(AllocationCallbacks), POINTER(ObjectTableNVX))
-FnDestroyObjectTableNVX = FUNCTYPE(None, Device, ObjectTableNVX, POINTER(AllocationCallbacks))
-FnRegisterObjectsNVX = FUNCTYPE(Result, Device, ObjectTableNVX, c_uint32, POINTER(POINTER(ObjectTableEntryNVX)), POINTER(c_uint32))
-FnUnregisterObjectsNVX = FUNCTYPE(Result, Device, ObjectTableNVX, c_uint32, POINTER(ObjectEntryTypeNVX), POINTER(c_uint32))
-FnGetPhysicalDeviceGeneratedCommandsPropertiesNVX = FUNCTYPE(None, PhysicalDevice, POINTER(DeviceGeneratedCommandsFeaturesNVX), POINTER(DeviceGeneratedCommandsLimitsNVX))
-FnCmdSetViewportWScalingNV = FUNCTYPE(None, CommandBuffer, c_uint32, c_uint32, POINTER(ViewportWScalingNV))
-FnReleaseDisplayEXT = FUNCTYPE(Result, PhysicalDevice, DisplayKHR)
-FnGetPhysicalDeviceSurfaceCapabilities2EXT = FUNCTYPE(Result, PhysicalDevice, SurfaceKHR, POINTER(SurfaceCapabilities2EXT))
-FnDisplayPowerControlEXT = FUNCTYPE(Result, Device, DisplayKHR, POINTER(DisplayPowerInfoEXT))
-FnRegisterDeviceEventEXT = FUNCTYPE(Result, Device, POINTER(DeviceEventInfoEXT), POINTER(AllocationCallbacks), POINTER(Fence))
-FnRegisterDisplayEventEXT = FUNCTYPE(Result, Device, DisplayKHR, POINTER(DisplayEventInfoEXT), POINTER(AllocationCallbacks), POINTER(Fence))
-FnGetSwapchainCounterEXT = FUNCTYPE(Result, Device, SwapchainKHR, SurfaceCounterFlagBitsEXT, POINTER(c_uint64))
-FnGetRefreshCycleDurationGOOGLE = FUNCTYPE(Result, Device, SwapchainKHR, POINTER(RefreshCycleDurationGOOGLE))
-FnGetPastPresentationTimingGOOGLE = FUNCTYPE(Result, Device, SwapchainKHR, POINTER(c_uint32), POINTER(PastPresentationTimingGOOGLE))
-FnCmdSetDiscardRectangleEXT = FUNCTYPE(None, CommandBuffer, c_uint32, c_uint32, POINTER(Rect2D))
-FnSetHdrMetadataEXT = FUNCTYPE(None, Device, c_uint32, POINTER(SwapchainKHR), POINTER(HdrMetadataEXT))
-FnDebugUtilsMessengerCallbackEXT = FUNCTYPE(Bool32, DebugUtilsMessageSeverityFlagBitsEXT, DebugUtilsMessageTypeFlagsEXT, POINTER(DebugUtilsMessengerCallbackDataEXT), c_void_p)
-FnSetDebugUtilsObjectNameEXT = FUNCTYPE(Result, Device, POINTER(DebugUtilsObjectNameInfoEXT))
-FnSetDebugUtilsObjectTagEXT = FUNCTYPE(Result, Device, POINTER(DebugUtilsObjectTagInfoEXT))
-FnQueueBeginDebugUtilsLabelEXT = FUNCTYPE(None, Queue, POINTER(DebugUtilsLabelEXT))
-FnQueueEndDebugUtilsLabelEXT = FUNCTYPE(None, Queue)
-FnQueueInsertDebugUtilsLabelEXT = FUNCTYPE(None, Queue, POINTER(DebugUtilsLabelEXT))
-FnCmdBeginDebugUtilsLabelEXT = FUNCTYPE(None, CommandBuffer, POINTER(DebugUtilsLabelEXT))
-FnCmdEndDebugUtilsLabelEXT = FUNCTYPE(None, CommandBuffer)
-FnCmdInsertDebugUtilsLabelEXT = FUNCTYPE(None, CommandBuffer, POINTER(DebugUtilsLabelEXT))
-FnCreateDebugUtilsMessengerEXT = FUNCTYPE(Result, Instance, POINTER(DebugUtilsMessengerCreateInfoEXT), POINTER(AllocationCallbacks), POINTER(DebugUtilsMessengerEXT))
-FnDestroyDebugUtilsMessengerEXT = FUNCTYPE(None, Instance, DebugUtilsMessengerEXT, POINTER(AllocationCallbacks))
-FnSubmitDebugUtilsMessageEXT = FUNCTYPE(None, Instance, DebugUtilsMessageSeverityFlagBitsEXT, DebugUtilsMessageTypeFlagsEXT, POINTER(DebugUtilsMessengerCallbackDataEXT))
-FnCmdSetSampleLocationsEXT = FUNCTYPE(None, CommandBuffer, POINTER(SampleLocationsInfoEXT))
-FnGetPhysicalDeviceMultisamplePropertiesEXT = FUNCTYPE(None, PhysicalDevice, SampleCountFlagBits, POINTER(MultisamplePropertiesEXT))
-FnGetImageDrmFormatModifierPropertiesEXT = FUNCTYPE(Result, Device, Image, POINTER(ImageDrmFormatModifierPropertiesEXT))
-FnCreateValidationCacheEXT = FUNCTYPE(Result, Device, POINTER(ValidationCacheCreateInfoEXT), POINTER(AllocationCallbacks), POINTER(ValidationCacheEXT))
-FnDestroyValidationCacheEXT = FUNCTYPE(None, Device, ValidationCacheEXT, POINTER(AllocationCallbacks))
-FnMergeValidationCachesEXT = FUNCTYPE(Result, Device, ValidationCacheEXT, c_uint32, POINTER(ValidationCacheEXT))
-FnGetValidationCacheDataEXT = FUNCTYPE(Result, Device, ValidationCacheEXT, POINTER(c_size_t), c_void_p)
-FnCmdBindShadingRateImageNV = FUNCTYPE(None, CommandBuffer, ImageView, ImageLayout)
-FnCmdSetViewportShadingRatePaletteNV = FUNCTYPE(None, CommandBuffer, c_uint32, c_uint32, POINTER(ShadingRatePaletteNV))
-FnCmdSetCoarseSampleOrderNV = FUNCTYPE(None, CommandBuffer, CoarseSampleOrderTypeNV, c_uint32, POINTER(CoarseSampleOrderCustomNV))
-FnCreateAccelerationStructureNV = FUNCTYPE(Result, Device, POINTER(AccelerationStructureCreateInfoNV), POINTER(AllocationCallbacks), POINTER(AccelerationStructureNV))
-FnDestroyAccelerationStructureNV = FUNCTYPE(None, Device, AccelerationStructureNV, POINTER(AllocationCallbacks))
-FnGetAccelerationStructureMemoryRequirementsNV = FUNCTYPE(None, Device, POINTER(AccelerationStructureMemoryRequirementsInfoNV), POINTER(MemoryRequirements2KHR))
-FnBindAccelerationStructureMemoryNV = FUNCTYPE(Result, Device, c_uint32, POINTER(BindAccelerationStructureMemoryInfoNV))
-FnCmdBuildAccelerationStructureNV = FUNCTYPE(None, CommandBuffer, POINTER(AccelerationStructureInfoNV), Buffer, DeviceSize, Bool32, AccelerationStructureNV, AccelerationStructureNV, Buffer, DeviceSize)
-FnCmdCopyAccelerationStructureNV = FUNCTYPE(None, CommandBuffer, AccelerationStructureNV, AccelerationStructureNV, CopyAccelerationStructureModeNV)
-FnCmdTraceRaysNV = FUNCTYPE(None, CommandBuffer, Buffer, DeviceSize, Buffer, DeviceSize, DeviceSize, Buffer, DeviceSize, DeviceSize, Buffer, DeviceSize, DeviceSize, c_uint32, c_uint32, c_uint32)
-FnCreateRayTracingPipelinesNV = FUNCTYPE(Result, Device, PipelineCache, c_uint32, POINTER(RayTracingPipelineCreateInfoNV), POINTER(AllocationCallbacks), POINTER(Pipeline))
-FnGetRayTracingShaderGroupHandlesNV = FUNCTYPE(Result, Device, Pipeline, c_uint32, c_uint32, c_size_t, c_void_p)
-FnGetAccelerationStructureHandleNV = FUNCTYPE(Result, Device, AccelerationStructureNV, c_size_t, c_void_p)
-FnCmdWriteAccelerationStructuresPropertiesNV = FUNCTYPE(None, CommandBuffer, c_uint32, POINTER(AccelerationStructureNV), QueryType, QueryPool, c_uint32)
-FnCompileDeferredNV = FUNCTYPE(Result, Device, Pipeline, c_uint32)
-FnGetMemoryHostPointerPropertiesEXT = FUNCTYPE(Result, Device, ExternalMemoryHandleTypeFlagBits, c_void_p, POINTER(MemoryHostPointerPropertiesEXT))
-FnCmdWriteBufferMarkerAMD = FUNCTYPE(None, CommandBuffer, PipelineStageFlagBits, Buffer, DeviceSize, c_uint32)
-FnGetPhysicalDeviceCalibrateableTimeDomainsEXT = FUNCTYPE(Result, PhysicalDevice, POINTER(c_uint32), POINTER(TimeDomainEXT))
-FnGetCalibratedTimestampsEXT = FUNCTYPE(Result, Device, c_uint32, POINTER(CalibratedTimestampInfoEXT), POINTER(c_uint64), POINTER(c_uint64))
-FnCmdDrawMeshTasksNV = FUNCTYPE(None, CommandBuffer, c_uint32, c_uint32)
-FnCmdDrawMeshTasksIndirectNV = FUNCTYPE(None, CommandBuffer, Buffer, DeviceSize, c_uint32, c_uint32)
-FnCmdDrawMeshTasksIndirectCountNV = FUNCTYPE(None, CommandBuffer, Buffer, DeviceSize, Buffer, DeviceSize, c_uint32, c_uint32)
-FnCmdSetExclusiveScissorNV = FUNCTYPE(None, CommandBuffer, c_uint32, c_uint32, POINTER(Rect2D))
-FnCmdSetCheckpointNV = FUNCTYPE(None, CommandBuffer, c_void_p)
-FnGetQueueCheckpointDataNV = FUNCTYPE(None, Queue, POINTER(c_uint32), POINTER(CheckpointDataNV))
-FnCreateWin32SurfaceKHR = FUNCTYPE(Result, Instance, POINTER(Win32SurfaceCreateInfoKHR), POINTER(AllocationCallbacks), POINTER(SurfaceKHR))
-FnGetPhysicalDeviceWin32PresentationSupportKHR = FUNCTYPE(Bool32, PhysicalDevice, c_uint32)
-FnGetMemoryWin32HandleKHR = FUNCTYPE(Result, Device, POINTER(MemoryGetWin32HandleInfoKHR), POINTER(HANDLE))
-FnGetMemoryWin32HandlePropertiesKHR = FUNCTYPE(Result, Device, ExternalMemoryHandleTypeFlagBits, HANDLE, POINTER(MemoryWin32HandlePropertiesKHR))
-FnImportSemaphoreWin32HandleKHR = FUNCTYPE(Result, Device, POINTER(ImportSemaphoreWin32HandleInfoKHR))
-FnGetSemaphoreWin32HandleKHR = FUNCTYPE(Result, Device, POINTER(SemaphoreGetWin32HandleInfoKHR), POINTER(HANDLE))
-FnImportFenceWin32HandleKHR = FUNCTYPE(Result, Device, POINTER(ImportFenceWin32HandleInfoKHR))
-FnGetFenceWin32HandleKHR = FUNCTYPE(Result, Device, POINTER(FenceGetWin32HandleInfoKHR), POINTER(HANDLE))
-FnGetMemoryWin32HandleNV = FUNCTYPE(Result, Device, DeviceMemory, ExternalMemoryHandleTypeFlagsNV, POINTER(HANDLE))
-FnCreateXcbSurfaceKHR = FUNCTYPE(Result, Instance, POINTER(XcbSurfaceCreateInfoKHR), POINTER(AllocationCallbacks), POINTER(SurfaceKHR))
-FnGetPhysicalDeviceXcbPresentationSupportKHR = FUNCTYPE(Bool32, PhysicalDevice, c_uint32, POINTER(xcb_connection_t), xcb_visualid_t)
-
-
-InstanceFunctions = (
+))
+
+
+
+define_lazy('ApplicationInfoTemplate', lambda: define_template(ApplicationInfo))
+define_lazy('InstanceCreateInfoTemplate', lambda: define_template(InstanceCreateInfo))
+define_lazy('AllocationCallbacksTemplate', lambda: define_template(AllocationCallbacks))
+define_lazy('PhysicalDeviceFeaturesTemplate', lambda: define_template(PhysicalDeviceFeatures))
+define_lazy('FormatPropertiesTemplate', lambda: define_template(FormatProperties))
+define_lazy('Extent3DTemplate', lambda: define_template(Extent3D))
+define_lazy('ImageFormatPropertiesTemplate', lambda: define_template(ImageFormatProperties))
+define_lazy('PhysicalDeviceLimitsTemplate', lambda: define_template(PhysicalDeviceLimits))
+define_lazy('PhysicalDeviceSparsePropertiesTemplate', lambda: define_template(PhysicalDeviceSparseProperties))
+define_lazy('PhysicalDevicePropertiesTemplate', lambda: define_template(PhysicalDeviceProperties))
+define_lazy('QueueFamilyPropertiesTemplate', lambda: define_template(QueueFamilyProperties))
+define_lazy('MemoryTypeTemplate', lambda: define_template(MemoryType))
+define_lazy('MemoryHeapTemplate', lambda: define_template(MemoryHeap))
+define_lazy('PhysicalDeviceMemoryPropertiesTemplate', lambda: define_template(PhysicalDeviceMemoryProperties))
+define_lazy('DeviceQueueCreateInfoTemplate', lambda: define_template(DeviceQueueCreateInfo))
+define_lazy('DeviceCreateInfoTemplate', lambda: define_template(DeviceCreateInfo))
+define_lazy('ExtensionPropertiesTemplate', lambda: define_template(ExtensionProperties))
+define_lazy('LayerPropertiesTemplate', lambda: define_template(LayerProperties))
+define_lazy('SubmitInfoTemplate', lambda: define_template(SubmitInfo))
+define_lazy('MemoryAllocateInfoTemplate', lambda: define_template(MemoryAllocateInfo))
+define_lazy('MappedMemoryRangeTemplate', lambda: define_template(MappedMemoryRange))
+define_lazy('MemoryRequirementsTemplate', lambda: define_template(MemoryRequirements))
+define_lazy('SparseImageFormatPropertiesTemplate', lambda: define_template(SparseImageFormatProperties))
+define_lazy('SparseImageMemoryRequirementsTemplate', lambda: define_template(SparseImageMemoryRequirements))
+define_lazy('SparseMemoryBindTemplate', lambda: define_template(SparseMemoryBind))
+define_lazy('SparseBufferMemoryBindInfoTemplate', lambda: define_template(SparseBufferMemoryBindInfo))
+define_lazy('SparseImageOpaqueMemoryBindInfoTemplate', lambda: define_template(SparseImageOpaqueMemoryBindInfo))
+define_lazy('ImageSubresourceTemplate', lambda: define_template(ImageSubresource))
+define_lazy('Offset3DTemplate', lambda: define_template(Offset3D))
+define_lazy('SparseImageMemoryBindTemplate', lambda: define_template(SparseImageMemoryBind))
+define_lazy('SparseImageMemoryBindInfoTemplate', lambda: define_template(SparseImageMemoryBindInfo))
+define_lazy('BindSparseInfoTemplate', lambda: define_template(BindSparseInfo))
+define_lazy('FenceCreateInfoTemplate', lambda: define_template(FenceCreateInfo))
+define_lazy('SemaphoreCreateInfoTemplate', lambda: define_template(SemaphoreCreateInfo))
+define_lazy('EventCreateInfoTemplate', lambda: define_template(EventCreateInfo))
+define_lazy('QueryPoolCreateInfoTemplate', lambda: define_template(QueryPoolCreateInfo))
+define_lazy('BufferCreateInfoTemplate', lambda: define_template(BufferCreateInfo))
+define_lazy('BufferViewCreateInfoTemplate', lambda: define_template(BufferViewCreateInfo))
+define_lazy('ImageCreateInfoTemplate', lambda: define_template(ImageCreateInfo))
+define_lazy('SubresourceLayoutTemplate', lambda: define_template(SubresourceLayout))
+define_lazy('ComponentMappingTemplate', lambda: define_template(ComponentMapping))
+define_lazy('ImageSubresourceRangeTemplate', lambda: define_template(ImageSubresourceRange))
+define_lazy('ImageViewCreateInfoTemplate', lambda: define_template(ImageViewCreateInfo))
+define_lazy('ShaderModuleCreateInfoTemplate', lambda: define_template(ShaderModuleCreateInfo))
+define_lazy('PipelineCacheCreateInfoTemplate', lambda: define_template(PipelineCacheCreateInfo))
+define_lazy('SpecializationMapEntryTemplate', lambda: define_template(SpecializationMapEntry))
+define_lazy('SpecializationInfoTemplate', lambda: define_template(SpecializationInfo))
+define_lazy('PipelineShaderStageCreateInfoTemplate', lambda: define_template(PipelineShaderStageCreateInfo))
+define_lazy('VertexInputBindingDescriptionTemplate', lambda: define_template(VertexInputBindingDescription))
+define_lazy('VertexInputAttributeDescriptionTemplate', lambda: define_template(VertexInputAttributeDescription))
+define_lazy('PipelineVertexInputStateCreateInfoTemplate', lambda: define_template(PipelineVertexInputStateCreateInfo))
+define_lazy('PipelineInputAssemblyStateCreateInfoTemplate', lambda: define_template(PipelineInputAssemblyStateCreateInfo))
+define_lazy('PipelineTessellationStateCreateInfoTemplate', lambda: define_template(PipelineTessellationStateCreateInfo))
+define_lazy('ViewportTemplate', lambda: define_template(Viewport))
+define_lazy('Offset2DTemplate', lambda: define_template(Offset2D))
+define_lazy('Extent2DTemplate', lambda: define_template(Extent2D))
+define_lazy('Rect2DTemplate', lambda: define_template(Rect2D))
+define_lazy('PipelineViewportStateCreateInfoTemplate', lambda: define_template(PipelineViewportStateCreateInfo))
+define_lazy('PipelineRasterizationStateCreateInfoTemplate', lambda: define_template(PipelineRasterizationStateCreateInfo))
+define_lazy('PipelineMultisampleStateCreateInfoTemplate', lambda: define_template(PipelineMultisampleStateCreateInfo))
+define_lazy('StencilOpStateTemplate', lambda: define_template(StencilOpState))
+define_lazy('PipelineDepthStencilStateCreateInfoTemplate', lambda: define_template(PipelineDepthStencilStateCreateInfo))
+define_lazy('PipelineColorBlendAttachmentStateTemplate', lambda: define_template(PipelineColorBlendAttachmentState))
+define_lazy('PipelineColorBlendStateCreateInfoTemplate', lambda: define_template(PipelineColorBlendStateCreateInfo))
+define_lazy('PipelineDynamicStateCreateInfoTemplate', lambda: define_template(PipelineDynamicStateCreateInfo))
+define_lazy('GraphicsPipelineCreateInfoTemplate', lambda: define_template(GraphicsPipelineCreateInfo))
+define_lazy('ComputePipelineCreateInfoTemplate', lambda: define_template(ComputePipelineCreateInfo))
+define_lazy('PushConstantRangeTemplate', lambda: define_template(PushConstantRange))
+define_lazy('PipelineLayoutCreateInfoTemplate', lambda: define_template(PipelineLayoutCreateInfo))
+define_lazy('SamplerCreateInfoTemplate', lambda: define_template(SamplerCreateInfo))
+define_lazy('DescriptorSetLayoutBindingTemplate', lambda: define_template(DescriptorSetLayoutBinding))
+define_lazy('DescriptorSetLayoutCreateInfoTemplate', lambda: define_template(DescriptorSetLayoutCreateInfo))
+define_lazy('DescriptorPoolSizeTemplate', lambda: define_template(DescriptorPoolSize))
+define_lazy('DescriptorPoolCreateInfoTemplate', lambda: define_template(DescriptorPoolCreateInfo))
+define_lazy('DescriptorSetAllocateInfoTemplate', lambda: define_template(DescriptorSetAllocateInfo))
+define_lazy('DescriptorImageInfoTemplate', lambda: define_template(DescriptorImageInfo))
+define_lazy('DescriptorBufferInfoTemplate', lambda: define_template(DescriptorBufferInfo))
+define_lazy('WriteDescriptorSetTemplate', lambda: define_template(WriteDescriptorSet))
+define_lazy('CopyDescriptorSetTemplate', lambda: define_template(CopyDescriptorSet))
+define_lazy('FramebufferCreateInfoTemplate', lambda: define_template(FramebufferCreateInfo))
+define_lazy('AttachmentDescriptionTemplate', lambda: define_template(AttachmentDescription))
+define_lazy('AttachmentReferenceTemplate', lambda: define_template(AttachmentReference))
+define_lazy('SubpassDescriptionTemplate', lambda: define_template(SubpassDescription))
+define_lazy('SubpassDependencyTemplate', lambda: define_template(SubpassDependency))
+define_lazy('RenderPassCreateInfoTemplate', lambda: define_template(RenderPassCreateInfo))
+define_lazy('CommandPoolCreateInfoTemplate', lambda: define_template(CommandPoolCreateInfo))
+define_lazy('CommandBufferAllocateInfoTemplate', lambda: define_template(CommandBufferAllocateInfo))
+define_lazy('CommandBufferInheritanceInfoTemplate', lambda: define_template(CommandBufferInheritanceInfo))
+define_lazy('CommandBufferBeginInfoTemplate', lambda: define_template(CommandBufferBeginInfo))
+define_lazy('BufferCopyTemplate', lambda: define_template(BufferCopy))
+define_lazy('ImageSubresourceLayersTemplate', lambda: define_template(ImageSubresourceLayers))
+define_lazy('ImageCopyTemplate', lambda: define_template(ImageCopy))
+define_lazy('ImageBlitTemplate', lambda: define_template(ImageBlit))
+define_lazy('BufferImageCopyTemplate', lambda: define_template(BufferImageCopy))
+define_lazy('ClearColorValueTemplate', lambda: define_template(ClearColorValue))
+define_lazy('ClearDepthStencilValueTemplate', lambda: define_template(ClearDepthStencilValue))
+define_lazy('ClearValueTemplate', lambda: define_template(ClearValue))
+define_lazy('ClearAttachmentTemplate', lambda: define_template(ClearAttachment))
+define_lazy('ClearRectTemplate', lambda: define_template(ClearRect))
+define_lazy('ImageResolveTemplate', lambda: define_template(ImageResolve))
+define_lazy('MemoryBarrierTemplate', lambda: define_template(MemoryBarrier))
+define_lazy('BufferMemoryBarrierTemplate', lambda: define_template(BufferMemoryBarrier))
+define_lazy('ImageMemoryBarrierTemplate', lambda: define_template(ImageMemoryBarrier))
+define_lazy('RenderPassBeginInfoTemplate', lambda: define_template(RenderPassBeginInfo))
+define_lazy('DispatchIndirectCommandTemplate', lambda: define_template(DispatchIndirectCommand))
+define_lazy('DrawIndexedIndirectCommandTemplate', lambda: define_template(DrawIndexedIndirectCommand))
+define_lazy('DrawIndirectCommandTemplate', lambda: define_template(DrawIndirectCommand))
+define_lazy('PhysicalDeviceSubgroupPropertiesTemplate', lambda: define_template(PhysicalDeviceSubgroupProperties))
+define_lazy('BindBufferMemoryInfoTemplate', lambda: define_template(BindBufferMemoryInfo))
+define_lazy('BindImageMemoryInfoTemplate', lambda: define_template(BindImageMemoryInfo))
+define_lazy('PhysicalDevice16BitStorageFeaturesTemplate', lambda: define_template(PhysicalDevice16BitStorageFeatures))
+define_lazy('MemoryDedicatedRequirementsTemplate', lambda: define_template(MemoryDedicatedRequirements))
+define_lazy('MemoryDedicatedAllocateInfoTemplate', lambda: define_template(MemoryDedicatedAllocateInfo))
+define_lazy('MemoryAllocateFlagsInfoTemplate', lambda: define_template(MemoryAllocateFlagsInfo))
+define_lazy('DeviceGroupRenderPassBeginInfoTemplate', lambda: define_template(DeviceGroupRenderPassBeginInfo))
+define_lazy('DeviceGroupCommandBufferBeginInfoTemplate', lambda: define_template(DeviceGroupCommandBufferBeginInfo))
+define_lazy('DeviceGroupSubmitInfoTemplate', lambda: define_template(DeviceGroupSubmitInfo))
+define_lazy('DeviceGroupBindSparseInfoTemplate', lambda: define_template(DeviceGroupBindSparseInfo))
+define_lazy('BindBufferMemoryDeviceGroupInfoTemplate', lambda: define_template(BindBufferMemoryDeviceGroupInfo))
+define_lazy('BindImageMemoryDeviceGroupInfoTemplate', lambda: define_template(BindImageMemoryDeviceGroupInfo))
+define_lazy('PhysicalDeviceGroupPropertiesTemplate', lambda: define_template(PhysicalDeviceGroupProperties))
+define_lazy('DeviceGroupDeviceCreateInfoTemplate', lambda: define_template(DeviceGroupDeviceCreateInfo))
+define_lazy('BufferMemoryRequirementsInfo2Template', lambda: define_template(BufferMemoryRequirementsInfo2))
+define_lazy('ImageMemoryRequirementsInfo2Template', lambda: define_template(ImageMemoryRequirementsInfo2))
+define_lazy('ImageSparseMemoryRequirementsInfo2Template', lambda: define_template(ImageSparseMemoryRequirementsInfo2))
+define_lazy('MemoryRequirements2Template', lambda: define_template(MemoryRequirements2))
+define_lazy('SparseImageMemoryRequirements2Template', lambda: define_template(SparseImageMemoryRequirements2))
+define_lazy('PhysicalDeviceFeatures2Template', lambda: define_template(PhysicalDeviceFeatures2))
+define_lazy('PhysicalDeviceProperties2Template', lambda: define_template(PhysicalDeviceProperties2))
+define_lazy('FormatProperties2Template', lambda: define_template(FormatProperties2))
+define_lazy('ImageFormatProperties2Template', lambda: define_template(ImageFormatProperties2))
+define_lazy('PhysicalDeviceImageFormatInfo2Template', lambda: define_template(PhysicalDeviceImageFormatInfo2))
+define_lazy('QueueFamilyProperties2Template', lambda: define_template(QueueFamilyProperties2))
+define_lazy('PhysicalDeviceMemoryProperties2Template', lambda: define_template(PhysicalDeviceMemoryProperties2))
+define_lazy('SparseImageFormatProperties2Template', lambda: define_template(SparseImageFormatProperties2))
+define_lazy('PhysicalDeviceSparseImageFormatInfo2Template', lambda: define_template(PhysicalDeviceSparseImageFormatInfo2))
+define_lazy('PhysicalDevicePointClippingPropertiesTemplate', lambda: define_template(PhysicalDevicePointClippingProperties))
+define_lazy('InputAttachmentAspectReferenceTemplate', lambda: define_template(InputAttachmentAspectReference))
+define_lazy('RenderPassInputAttachmentAspectCreateInfoTemplate', lambda: define_template(RenderPassInputAttachmentAspectCreateInfo))
+define_lazy('ImageViewUsageCreateInfoTemplate', lambda: define_template(ImageViewUsageCreateInfo))
+define_lazy('PipelineTessellationDomainOriginStateCreateInfoTemplate', lambda: define_template(PipelineTessellationDomainOriginStateCreateInfo))
+define_lazy('RenderPassMultiviewCreateInfoTemplate', lambda: define_template(RenderPassMultiviewCreateInfo))
+define_lazy('PhysicalDeviceMultiviewFeaturesTemplate', lambda: define_template(PhysicalDeviceMultiviewFeatures))
+define_lazy('PhysicalDeviceMultiviewPropertiesTemplate', lambda: define_template(PhysicalDeviceMultiviewProperties))
+define_lazy('PhysicalDeviceVariablePointerFeaturesTemplate', lambda: define_template(PhysicalDeviceVariablePointerFeatures))
+define_lazy('PhysicalDeviceProtectedMemoryFeaturesTemplate', lambda: define_template(PhysicalDeviceProtectedMemoryFeatures))
+define_lazy('PhysicalDeviceProtectedMemoryPropertiesTemplate', lambda: define_template(PhysicalDeviceProtectedMemoryProperties))
+define_lazy('DeviceQueueInfo2Template', lambda: define_template(DeviceQueueInfo2))
+define_lazy('ProtectedSubmitInfoTemplate', lambda: define_template(ProtectedSubmitInfo))
+define_lazy('SamplerYcbcrConversionCreateInfoTemplate', lambda: define_template(SamplerYcbcrConversionCreateInfo))
+define_lazy('SamplerYcbcrConversionInfoTemplate', lambda: define_template(SamplerYcbcrConversionInfo))
+define_lazy('BindImagePlaneMemoryInfoTemplate', lambda: define_template(BindImagePlaneMemoryInfo))
+define_lazy('ImagePlaneMemoryRequirementsInfoTemplate', lambda: define_template(ImagePlaneMemoryRequirementsInfo))
+define_lazy('PhysicalDeviceSamplerYcbcrConversionFeaturesTemplate', lambda: define_template(PhysicalDeviceSamplerYcbcrConversionFeatures))
+define_lazy('SamplerYcbcrConversionImageFormatPropertiesTemplate', lambda: define_template(SamplerYcbcrConversionImageFormatProperties))
+define_lazy('DescriptorUpdateTemplateEntryTemplate', lambda: define_template(DescriptorUpdateTemplateEntry))
+define_lazy('DescriptorUpdateTemplateCreateInfoTemplate', lambda: define_template(DescriptorUpdateTemplateCreateInfo))
+define_lazy('ExternalMemoryPropertiesTemplate', lambda: define_template(ExternalMemoryProperties))
+define_lazy('PhysicalDeviceExternalImageFormatInfoTemplate', lambda: define_template(PhysicalDeviceExternalImageFormatInfo))
+define_lazy('ExternalImageFormatPropertiesTemplate', lambda: define_template(ExternalImageFormatProperties))
+define_lazy('PhysicalDeviceExternalBufferInfoTemplate', lambda: define_template(PhysicalDeviceExternalBufferInfo))
+define_lazy('ExternalBufferPropertiesTemplate', lambda: define_template(ExternalBufferProperties))
+define_lazy('PhysicalDeviceIDPropertiesTemplate', lambda: define_template(PhysicalDeviceIDProperties))
+define_lazy('ExternalMemoryImageCreateInfoTemplate', lambda: define_template(ExternalMemoryImageCreateInfo))
+define_lazy('ExternalMemoryBufferCreateInfoTemplate', lambda: define_template(ExternalMemoryBufferCreateInfo))
+define_lazy('ExportMemoryAllocateInfoTemplate', lambda: define_template(ExportMemoryAllocateInfo))
+define_lazy('PhysicalDeviceExternalFenceInfoTemplate', lambda: define_template(PhysicalDeviceExternalFenceInfo))
+define_lazy('ExternalFencePropertiesTemplate', lambda: define_template(ExternalFenceProperties))
+define_lazy('ExportFenceCreateInfoTemplate', lambda: define_template(ExportFenceCreateInfo))
+define_lazy('ExportSemaphoreCreateInfoTemplate', lambda: define_template(ExportSemaphoreCreateInfo))
+define_lazy('PhysicalDeviceExternalSemaphoreInfoTemplate', lambda: define_template(PhysicalDeviceExternalSemaphoreInfo))
+define_lazy('ExternalSemaphorePropertiesTemplate', lambda: define_template(ExternalSemaphoreProperties))
+define_lazy('PhysicalDeviceMaintenance3PropertiesTemplate', lambda: define_template(PhysicalDeviceMaintenance3Properties))
+define_lazy('DescriptorSetLayoutSupportTemplate', lambda: define_template(DescriptorSetLayoutSupport))
+define_lazy('PhysicalDeviceShaderDrawParameterFeaturesTemplate', lambda: define_template(PhysicalDeviceShaderDrawParameterFeatures))
+define_lazy('SurfaceCapabilitiesKHRTemplate', lambda: define_template(SurfaceCapabilitiesKHR))
+define_lazy('SurfaceFormatKHRTemplate', lambda: define_template(SurfaceFormatKHR))
+define_lazy('SwapchainCreateInfoKHRTemplate', lambda: define_template(SwapchainCreateInfoKHR))
+define_lazy('PresentInfoKHRTemplate', lambda: define_template(PresentInfoKHR))
+define_lazy('ImageSwapchainCreateInfoKHRTemplate', lambda: define_template(ImageSwapchainCreateInfoKHR))
+define_lazy('BindImageMemorySwapchainInfoKHRTemplate', lambda: define_template(BindImageMemorySwapchainInfoKHR))
+define_lazy('AcquireNextImageInfoKHRTemplate', lambda: define_template(AcquireNextImageInfoKHR))
+define_lazy('DeviceGroupPresentCapabilitiesKHRTemplate', lambda: define_template(DeviceGroupPresentCapabilitiesKHR))
+define_lazy('DeviceGroupPresentInfoKHRTemplate', lambda: define_template(DeviceGroupPresentInfoKHR))
+define_lazy('DeviceGroupSwapchainCreateInfoKHRTemplate', lambda: define_template(DeviceGroupSwapchainCreateInfoKHR))
+define_lazy('DisplayPropertiesKHRTemplate', lambda: define_template(DisplayPropertiesKHR))
+define_lazy('DisplayModeParametersKHRTemplate', lambda: define_template(DisplayModeParametersKHR))
+define_lazy('DisplayModePropertiesKHRTemplate', lambda: define_template(DisplayModePropertiesKHR))
+define_lazy('DisplayModeCreateInfoKHRTemplate', lambda: define_template(DisplayModeCreateInfoKHR))
+define_lazy('DisplayPlaneCapabilitiesKHRTemplate', lambda: define_template(DisplayPlaneCapabilitiesKHR))
+define_lazy('DisplayPlanePropertiesKHRTemplate', lambda: define_template(DisplayPlanePropertiesKHR))
+define_lazy('DisplaySurfaceCreateInfoKHRTemplate', lambda: define_template(DisplaySurfaceCreateInfoKHR))
+define_lazy('DisplayPresentInfoKHRTemplate', lambda: define_template(DisplayPresentInfoKHR))
+define_lazy('ImportMemoryFdInfoKHRTemplate', lambda: define_template(ImportMemoryFdInfoKHR))
+define_lazy('MemoryFdPropertiesKHRTemplate', lambda: define_template(MemoryFdPropertiesKHR))
+define_lazy('MemoryGetFdInfoKHRTemplate', lambda: define_template(MemoryGetFdInfoKHR))
+define_lazy('ImportSemaphoreFdInfoKHRTemplate', lambda: define_template(ImportSemaphoreFdInfoKHR))
+define_lazy('SemaphoreGetFdInfoKHRTemplate', lambda: define_template(SemaphoreGetFdInfoKHR))
+define_lazy('PhysicalDevicePushDescriptorPropertiesKHRTemplate', lambda: define_template(PhysicalDevicePushDescriptorPropertiesKHR))
+define_lazy('RectLayerKHRTemplate', lambda: define_template(RectLayerKHR))
+define_lazy('PresentRegionKHRTemplate', lambda: define_template(PresentRegionKHR))
+define_lazy('PresentRegionsKHRTemplate', lambda: define_template(PresentRegionsKHR))
+define_lazy('AttachmentDescription2KHRTemplate', lambda: define_template(AttachmentDescription2KHR))
+define_lazy('AttachmentReference2KHRTemplate', lambda: define_template(AttachmentReference2KHR))
+define_lazy('SubpassDescription2KHRTemplate', lambda: define_template(SubpassDescription2KHR))
+define_lazy('SubpassDependency2KHRTemplate', lambda: define_template(SubpassDependency2KHR))
+define_lazy('RenderPassCreateInfo2KHRTemplate', lambda: define_template(RenderPassCreateInfo2KHR))
+define_lazy('SubpassBeginInfoKHRTemplate', lambda: define_template(SubpassBeginInfoKHR))
+define_lazy('SubpassEndInfoKHRTemplate', lambda: define_template(SubpassEndInfoKHR))
+define_lazy('SharedPresentSurfaceCapabilitiesKHRTemplate', lambda: define_template(SharedPresentSurfaceCapabilitiesKHR))
+define_lazy('ImportFenceFdInfoKHRTemplate', lambda: define_template(ImportFenceFdInfoKHR))
+define_lazy('FenceGetFdInfoKHRTemplate', lambda: define_template(FenceGetFdInfoKHR))
+define_lazy('PhysicalDeviceSurfaceInfo2KHRTemplate', lambda: define_template(PhysicalDeviceSurfaceInfo2KHR))
+define_lazy('SurfaceCapabilities2KHRTemplate', lambda: define_template(SurfaceCapabilities2KHR))
+define_lazy('SurfaceFormat2KHRTemplate', lambda: define_template(SurfaceFormat2KHR))
+define_lazy('DisplayProperties2KHRTemplate', lambda: define_template(DisplayProperties2KHR))
+define_lazy('DisplayPlaneProperties2KHRTemplate', lambda: define_template(DisplayPlaneProperties2KHR))
+define_lazy('DisplayModeProperties2KHRTemplate', lambda: define_template(DisplayModeProperties2KHR))
+define_lazy('DisplayPlaneInfo2KHRTemplate', lambda: define_template(DisplayPlaneInfo2KHR))
+define_lazy('DisplayPlaneCapabilities2KHRTemplate', lambda: define_template(DisplayPlaneCapabilities2KHR))
+define_lazy('ImageFormatListCreateInfoKHRTemplate', lambda: define_template(ImageFormatListCreateInfoKHR))
+define_lazy('PhysicalDevice8BitStorageFeaturesKHRTemplate', lambda: define_template(PhysicalDevice8BitStorageFeaturesKHR))
+define_lazy('PhysicalDeviceShaderAtomicInt64FeaturesKHRTemplate', lambda: define_template(PhysicalDeviceShaderAtomicInt64FeaturesKHR))
+define_lazy('ConformanceVersionKHRTemplate', lambda: define_template(ConformanceVersionKHR))
+define_lazy('PhysicalDeviceDriverPropertiesKHRTemplate', lambda: define_template(PhysicalDeviceDriverPropertiesKHR))
+define_lazy('PhysicalDeviceVulkanMemoryModelFeaturesKHRTemplate', lambda: define_template(PhysicalDeviceVulkanMemoryModelFeaturesKHR))
+define_lazy('DebugReportCallbackCreateInfoEXTTemplate', lambda: define_template(DebugReportCallbackCreateInfoEXT))
+define_lazy('PipelineRasterizationStateRasterizationOrderAMDTemplate', lambda: define_template(PipelineRasterizationStateRasterizationOrderAMD))
+define_lazy('DebugMarkerObjectNameInfoEXTTemplate', lambda: define_template(DebugMarkerObjectNameInfoEXT))
+define_lazy('DebugMarkerObjectTagInfoEXTTemplate', lambda: define_template(DebugMarkerObjectTagInfoEXT))
+define_lazy('DebugMarkerMarkerInfoEXTTemplate', lambda: define_template(DebugMarkerMarkerInfoEXT))
+define_lazy('DedicatedAllocationImageCreateInfoNVTemplate', lambda: define_template(DedicatedAllocationImageCreateInfoNV))
+define_lazy('DedicatedAllocationBufferCreateInfoNVTemplate', lambda: define_template(DedicatedAllocationBufferCreateInfoNV))
+define_lazy('DedicatedAllocationMemoryAllocateInfoNVTemplate', lambda: define_template(DedicatedAllocationMemoryAllocateInfoNV))
+define_lazy('PhysicalDeviceTransformFeedbackFeaturesEXTTemplate', lambda: define_template(PhysicalDeviceTransformFeedbackFeaturesEXT))
+define_lazy('PhysicalDeviceTransformFeedbackPropertiesEXTTemplate', lambda: define_template(PhysicalDeviceTransformFeedbackPropertiesEXT))
+define_lazy('PipelineRasterizationStateStreamCreateInfoEXTTemplate', lambda: define_template(PipelineRasterizationStateStreamCreateInfoEXT))
+define_lazy('TextureLODGatherFormatPropertiesAMDTemplate', lambda: define_template(TextureLODGatherFormatPropertiesAMD))
+define_lazy('ShaderResourceUsageAMDTemplate', lambda: define_template(ShaderResourceUsageAMD))
+define_lazy('ShaderStatisticsInfoAMDTemplate', lambda: define_template(ShaderStatisticsInfoAMD))
+define_lazy('PhysicalDeviceCornerSampledImageFeaturesNVTemplate', lambda: define_template(PhysicalDeviceCornerSampledImageFeaturesNV))
+define_lazy('ExternalImageFormatPropertiesNVTemplate', lambda: define_template(ExternalImageFormatPropertiesNV))
+define_lazy('ExternalMemoryImageCreateInfoNVTemplate', lambda: define_template(ExternalMemoryImageCreateInfoNV))
+define_lazy('ExportMemoryAllocateInfoNVTemplate', lambda: define_template(ExportMemoryAllocateInfoNV))
+define_lazy('ValidationFlagsEXTTemplate', lambda: define_template(ValidationFlagsEXT))
+define_lazy('ImageViewASTCDecodeModeEXTTemplate', lambda: define_template(ImageViewASTCDecodeModeEXT))
+define_lazy('PhysicalDeviceASTCDecodeFeaturesEXTTemplate', lambda: define_template(PhysicalDeviceASTCDecodeFeaturesEXT))
+define_lazy('ConditionalRenderingBeginInfoEXTTemplate', lambda: define_template(ConditionalRenderingBeginInfoEXT))
+define_lazy('PhysicalDeviceConditionalRenderingFeaturesEXTTemplate', lambda: define_template(PhysicalDeviceConditionalRenderingFeaturesEXT))
+define_lazy('CommandBufferInheritanceConditionalRenderingInfoEXTTemplate', lambda: define_template(CommandBufferInheritanceConditionalRenderingInfoEXT))
+define_lazy('DeviceGeneratedCommandsFeaturesNVXTemplate', lambda: define_template(DeviceGeneratedCommandsFeaturesNVX))
+define_lazy('DeviceGeneratedCommandsLimitsNVXTemplate', lambda: define_template(DeviceGeneratedCommandsLimitsNVX))
+define_lazy('IndirectCommandsTokenNVXTemplate', lambda: define_template(IndirectCommandsTokenNVX))
+define_lazy('IndirectCommandsLayoutTokenNVXTemplate', lambda: define_template(IndirectCommandsLayoutTokenNVX))
+define_lazy('IndirectCommandsLayoutCreateInfoNVXTemplate', lambda: define_template(IndirectCommandsLayoutCreateInfoNVX))
+define_lazy('CmdProcessCommandsInfoNVXTemplate', lambda: define_template(CmdProcessCommandsInfoNVX))
+define_lazy('CmdReserveSpaceForCommandsInfoNVXTemplate', lambda: define_template(CmdReserveSpaceForCommandsInfoNVX))
+define_lazy('ObjectTableCreateInfoNVXTemplate', lambda: define_template(ObjectTableCreateInfoNVX))
+define_lazy('ObjectTableEntryNVXTemplate', lambda: define_template(ObjectTableEntryNVX))
+define_lazy('ObjectTablePipelineEntryNVXTemplate', lambda: define_template(ObjectTablePipelineEntryNVX))
+define_lazy('ObjectTableDescriptorSetEntryNVXTemplate', lambda: define_template(ObjectTableDescriptorSetEntryNVX))
+define_lazy('ObjectTableVertexBufferEntryNVXTemplate', lambda: define_template(ObjectTableVertexBufferEntryNVX))
+define_lazy('ObjectTableIndexBufferEntryNVXTemplate', lambda: define_template(ObjectTableIndexBufferEntryNVX))
+define_lazy('ObjectTablePushConstantEntryNVXTemplate', lambda: define_template(ObjectTablePushConstantEntryNVX))
+define_lazy('ViewportWScalingNVTemplate', lambda: define_template(ViewportWScalingNV))
+define_lazy('PipelineViewportWScalingStateCreateInfoNVTemplate', lambda: define_template(PipelineViewportWScalingStateCreateInfoNV))
+define_lazy('SurfaceCapabilities2EXTTemplate', lambda: define_template(SurfaceCapabilities2EXT))
+define_lazy('DisplayPowerInfoEXTTemplate', lambda: define_template(DisplayPowerInfoEXT))
+define_lazy('DeviceEventInfoEXTTemplate', lambda: define_template(DeviceEventInfoEXT))
+define_lazy('DisplayEventInfoEXTTemplate', lambda: define_template(DisplayEventInfoEXT))
+define_lazy('SwapchainCounterCreateInfoEXTTemplate', lambda: define_template(SwapchainCounterCreateInfoEXT))
+define_lazy('RefreshCycleDurationGOOGLETemplate', lambda: define_template(RefreshCycleDurationGOOGLE))
+define_lazy('PastPresentationTimingGOOGLETemplate', lambda: define_template(PastPresentationTimingGOOGLE))
+define_lazy('PresentTimeGOOGLETemplate', lambda: define_template(PresentTimeGOOGLE))
+define_lazy('PresentTimesInfoGOOGLETemplate', lambda: define_template(PresentTimesInfoGOOGLE))
+define_lazy('PhysicalDeviceMultiviewPerViewAttributesPropertiesNVXTemplate', lambda: define_template(PhysicalDeviceMultiviewPerViewAttributesPropertiesNVX))
+define_lazy('ViewportSwizzleNVTemplate', lambda: define_template(ViewportSwizzleNV))
+define_lazy('PipelineViewportSwizzleStateCreateInfoNVTemplate', lambda: define_template(PipelineViewportSwizzleStateCreateInfoNV))
+define_lazy('PhysicalDeviceDiscardRectanglePropertiesEXTTemplate', lambda: define_template(PhysicalDeviceDiscardRectanglePropertiesEXT))
+define_lazy('PipelineDiscardRectangleStateCreateInfoEXTTemplate', lambda: define_template(PipelineDiscardRectangleStateCreateInfoEXT))
+define_lazy('PhysicalDeviceConservativeRasterizationPropertiesEXTTemplate', lambda: define_template(PhysicalDeviceConservativeRasterizationPropertiesEXT))
+define_lazy('PipelineRasterizationConservativeStateCreateInfoEXTTemplate', lambda: define_template(PipelineRasterizationConservativeStateCreateInfoEXT))
+define_lazy('XYColorEXTTemplate', lambda: define_template(XYColorEXT))
+define_lazy('HdrMetadataEXTTemplate', lambda: define_template(HdrMetadataEXT))
+define_lazy('DebugUtilsObjectNameInfoEXTTemplate', lambda: define_template(DebugUtilsObjectNameInfoEXT))
+define_lazy('DebugUtilsObjectTagInfoEXTTemplate', lambda: define_template(DebugUtilsObjectTagInfoEXT))
+define_lazy('DebugUtilsLabelEXTTemplate', lambda: define_template(DebugUtilsLabelEXT))
+define_lazy('DebugUtilsMessengerCallbackDataEXTTemplate', lambda: define_template(DebugUtilsMessengerCallbackDataEXT))
+define_lazy('DebugUtilsMessengerCreateInfoEXTTemplate', lambda: define_template(DebugUtilsMessengerCreateInfoEXT))
+define_lazy('SamplerReductionModeCreateInfoEXTTemplate', lambda: define_template(SamplerReductionModeCreateInfoEXT))
+define_lazy('PhysicalDeviceSamplerFilterMinmaxPropertiesEXTTemplate', lambda: define_template(PhysicalDeviceSamplerFilterMinmaxPropertiesEXT))
+define_lazy('PhysicalDeviceInlineUniformBlockFeaturesEXTTemplate', lambda: define_template(PhysicalDeviceInlineUniformBlockFeaturesEXT))
+define_lazy('PhysicalDeviceInlineUniformBlockPropertiesEXTTemplate', lambda: define_template(PhysicalDeviceInlineUniformBlockPropertiesEXT))
+define_lazy('WriteDescriptorSetInlineUniformBlockEXTTemplate', lambda: define_template(WriteDescriptorSetInlineUniformBlockEXT))
+define_lazy('DescriptorPoolInlineUniformBlockCreateInfoEXTTemplate', lambda: define_template(DescriptorPoolInlineUniformBlockCreateInfoEXT))
+define_lazy('SampleLocationEXTTemplate', lambda: define_template(SampleLocationEXT))
+define_lazy('SampleLocationsInfoEXTTemplate', lambda: define_template(SampleLocationsInfoEXT))
+define_lazy('AttachmentSampleLocationsEXTTemplate', lambda: define_template(AttachmentSampleLocationsEXT))
+define_lazy('SubpassSampleLocationsEXTTemplate', lambda: define_template(SubpassSampleLocationsEXT))
+define_lazy('RenderPassSampleLocationsBeginInfoEXTTemplate', lambda: define_template(RenderPassSampleLocationsBeginInfoEXT))
+define_lazy('PipelineSampleLocationsStateCreateInfoEXTTemplate', lambda: define_template(PipelineSampleLocationsStateCreateInfoEXT))
+define_lazy('PhysicalDeviceSampleLocationsPropertiesEXTTemplate', lambda: define_template(PhysicalDeviceSampleLocationsPropertiesEXT))
+define_lazy('MultisamplePropertiesEXTTemplate', lambda: define_template(MultisamplePropertiesEXT))
+define_lazy('PhysicalDeviceBlendOperationAdvancedFeaturesEXTTemplate', lambda: define_template(PhysicalDeviceBlendOperationAdvancedFeaturesEXT))
+define_lazy('PhysicalDeviceBlendOperationAdvancedPropertiesEXTTemplate', lambda: define_template(PhysicalDeviceBlendOperationAdvancedPropertiesEXT))
+define_lazy('PipelineColorBlendAdvancedStateCreateInfoEXTTemplate', lambda: define_template(PipelineColorBlendAdvancedStateCreateInfoEXT))
+define_lazy('PipelineCoverageToColorStateCreateInfoNVTemplate', lambda: define_template(PipelineCoverageToColorStateCreateInfoNV))
+define_lazy('PipelineCoverageModulationStateCreateInfoNVTemplate', lambda: define_template(PipelineCoverageModulationStateCreateInfoNV))
+define_lazy('DrmFormatModifierPropertiesEXTTemplate', lambda: define_template(DrmFormatModifierPropertiesEXT))
+define_lazy('DrmFormatModifierPropertiesListEXTTemplate', lambda: define_template(DrmFormatModifierPropertiesListEXT))
+define_lazy('PhysicalDeviceImageDrmFormatModifierInfoEXTTemplate', lambda: define_template(PhysicalDeviceImageDrmFormatModifierInfoEXT))
+define_lazy('ImageDrmFormatModifierListCreateInfoEXTTemplate', lambda: define_template(ImageDrmFormatModifierListCreateInfoEXT))
+define_lazy('ImageDrmFormatModifierExplicitCreateInfoEXTTemplate', lambda: define_template(ImageDrmFormatModifierExplicitCreateInfoEXT))
+define_lazy('ImageDrmFormatModifierPropertiesEXTTemplate', lambda: define_template(ImageDrmFormatModifierPropertiesEXT))
+define_lazy('ValidationCacheCreateInfoEXTTemplate', lambda: define_template(ValidationCacheCreateInfoEXT))
+define_lazy('ShaderModuleValidationCacheCreateInfoEXTTemplate', lambda: define_template(ShaderModuleValidationCacheCreateInfoEXT))
+define_lazy('DescriptorSetLayoutBindingFlagsCreateInfoEXTTemplate', lambda: define_template(DescriptorSetLayoutBindingFlagsCreateInfoEXT))
+define_lazy('PhysicalDeviceDescriptorIndexingFeaturesEXTTemplate', lambda: define_template(PhysicalDeviceDescriptorIndexingFeaturesEXT))
+define_lazy('PhysicalDeviceDescriptorIndexingPropertiesEXTTemplate', lambda: define_template(PhysicalDeviceDescriptorIndexingPropertiesEXT))
+define_lazy('DescriptorSetVariableDescriptorCountAllocateInfoEXTTemplate', lambda: define_template(DescriptorSetVariableDescriptorCountAllocateInfoEXT))
+define_lazy('DescriptorSetVariableDescriptorCountLayoutSupportEXTTemplate', lambda: define_template(DescriptorSetVariableDescriptorCountLayoutSupportEXT))
+define_lazy('ShadingRatePaletteNVTemplate', lambda: define_template(ShadingRatePaletteNV))
+define_lazy('PipelineViewportShadingRateImageStateCreateInfoNVTemplate', lambda: define_template(PipelineViewportShadingRateImageStateCreateInfoNV))
+define_lazy('PhysicalDeviceShadingRateImageFeaturesNVTemplate', lambda: define_template(PhysicalDeviceShadingRateImageFeaturesNV))
+define_lazy('PhysicalDeviceShadingRateImagePropertiesNVTemplate', lambda: define_template(PhysicalDeviceShadingRateImagePropertiesNV))
+define_lazy('CoarseSampleLocationNVTemplate', lambda: define_template(CoarseSampleLocationNV))
+define_lazy('CoarseSampleOrderCustomNVTemplate', lambda: define_template(CoarseSampleOrderCustomNV))
+define_lazy('PipelineViewportCoarseSampleOrderStateCreateInfoNVTemplate', lambda: define_template(PipelineViewportCoarseSampleOrderStateCreateInfoNV))
+define_lazy('RayTracingShaderGroupCreateInfoNVTemplate', lambda: define_template(RayTracingShaderGroupCreateInfoNV))
+define_lazy('RayTracingPipelineCreateInfoNVTemplate', lambda: define_template(RayTracingPipelineCreateInfoNV))
+define_lazy('GeometryTrianglesNVTemplate', lambda: define_template(GeometryTrianglesNV))
+define_lazy('GeometryAABBNVTemplate', lambda: define_template(GeometryAABBNV))
+define_lazy('GeometryDataNVTemplate', lambda: define_template(GeometryDataNV))
+define_lazy('GeometryNVTemplate', lambda: define_template(GeometryNV))
+define_lazy('AccelerationStructureInfoNVTemplate', lambda: define_template(AccelerationStructureInfoNV))
+define_lazy('AccelerationStructureCreateInfoNVTemplate', lambda: define_template(AccelerationStructureCreateInfoNV))
+define_lazy('BindAccelerationStructureMemoryInfoNVTemplate', lambda: define_template(BindAccelerationStructureMemoryInfoNV))
+define_lazy('WriteDescriptorSetAccelerationStructureNVTemplate', lambda: define_template(WriteDescriptorSetAccelerationStructureNV))
+define_lazy('AccelerationStructureMemoryRequirementsInfoNVTemplate', lambda: define_template(AccelerationStructureMemoryRequirementsInfoNV))
+define_lazy('PhysicalDeviceRayTracingPropertiesNVTemplate', lambda: define_template(PhysicalDeviceRayTracingPropertiesNV))
+define_lazy('PhysicalDeviceRepresentativeFragmentTestFeaturesNVTemplate', lambda: define_template(PhysicalDeviceRepresentativeFragmentTestFeaturesNV))
+define_lazy('PipelineRepresentativeFragmentTestStateCreateInfoNVTemplate', lambda: define_template(PipelineRepresentativeFragmentTestStateCreateInfoNV))
+define_lazy('DeviceQueueGlobalPriorityCreateInfoEXTTemplate', lambda: define_template(DeviceQueueGlobalPriorityCreateInfoEXT))
+define_lazy('ImportMemoryHostPointerInfoEXTTemplate', lambda: define_template(ImportMemoryHostPointerInfoEXT))
+define_lazy('MemoryHostPointerPropertiesEXTTemplate', lambda: define_template(MemoryHostPointerPropertiesEXT))
+define_lazy('PhysicalDeviceExternalMemoryHostPropertiesEXTTemplate', lambda: define_template(PhysicalDeviceExternalMemoryHostPropertiesEXT))
+define_lazy('CalibratedTimestampInfoEXTTemplate', lambda: define_template(CalibratedTimestampInfoEXT))
+define_lazy('PhysicalDeviceShaderCorePropertiesAMDTemplate', lambda: define_template(PhysicalDeviceShaderCorePropertiesAMD))
+define_lazy('DeviceMemoryOverallocationCreateInfoAMDTemplate', lambda: define_template(DeviceMemoryOverallocationCreateInfoAMD))
+define_lazy('PhysicalDeviceVertexAttributeDivisorPropertiesEXTTemplate', lambda: define_template(PhysicalDeviceVertexAttributeDivisorPropertiesEXT))
+define_lazy('VertexInputBindingDivisorDescriptionEXTTemplate', lambda: define_template(VertexInputBindingDivisorDescriptionEXT))
+define_lazy('PipelineVertexInputDivisorStateCreateInfoEXTTemplate', lambda: define_template(PipelineVertexInputDivisorStateCreateInfoEXT))
+define_lazy('PhysicalDeviceVertexAttributeDivisorFeaturesEXTTemplate', lambda: define_template(PhysicalDeviceVertexAttributeDivisorFeaturesEXT))
+define_lazy('PhysicalDeviceComputeShaderDerivativesFeaturesNVTemplate', lambda: define_template(PhysicalDeviceComputeShaderDerivativesFeaturesNV))
+define_lazy('PhysicalDeviceMeshShaderFeaturesNVTemplate', lambda: define_template(PhysicalDeviceMeshShaderFeaturesNV))
+define_lazy('PhysicalDeviceMeshShaderPropertiesNVTemplate', lambda: define_template(PhysicalDeviceMeshShaderPropertiesNV))
+define_lazy('DrawMeshTasksIndirectCommandNVTemplate', lambda: define_template(DrawMeshTasksIndirectCommandNV))
+define_lazy('PhysicalDeviceFragmentShaderBarycentricFeaturesNVTemplate', lambda: define_template(PhysicalDeviceFragmentShaderBarycentricFeaturesNV))
+define_lazy('PhysicalDeviceShaderImageFootprintFeaturesNVTemplate', lambda: define_template(PhysicalDeviceShaderImageFootprintFeaturesNV))
+define_lazy('PipelineViewportExclusiveScissorStateCreateInfoNVTemplate', lambda: define_template(PipelineViewportExclusiveScissorStateCreateInfoNV))
+define_lazy('PhysicalDeviceExclusiveScissorFeaturesNVTemplate', lambda: define_template(PhysicalDeviceExclusiveScissorFeaturesNV))
+define_lazy('QueueFamilyCheckpointPropertiesNVTemplate', lambda: define_template(QueueFamilyCheckpointPropertiesNV))
+define_lazy('CheckpointDataNVTemplate', lambda: define_template(CheckpointDataNV))
+define_lazy('PhysicalDevicePCIBusInfoPropertiesEXTTemplate', lambda: define_template(PhysicalDevicePCIBusInfoPropertiesEXT))
+define_lazy('Win32SurfaceCreateInfoKHRTemplate', lambda: define_template(Win32SurfaceCreateInfoKHR))
+define_lazy('ImportMemoryWin32HandleInfoKHRTemplate', lambda: define_template(ImportMemoryWin32HandleInfoKHR))
+define_lazy('ExportMemoryWin32HandleInfoKHRTemplate', lambda: define_template(ExportMemoryWin32HandleInfoKHR))
+define_lazy('MemoryWin32HandlePropertiesKHRTemplate', lambda: define_template(MemoryWin32HandlePropertiesKHR))
+define_lazy('MemoryGetWin32HandleInfoKHRTemplate', lambda: define_template(MemoryGetWin32HandleInfoKHR))
+define_lazy('Win32KeyedMutexAcquireReleaseInfoKHRTemplate', lambda: define_template(Win32KeyedMutexAcquireReleaseInfoKHR))
+define_lazy('ImportSemaphoreWin32HandleInfoKHRTemplate', lambda: define_template(ImportSemaphoreWin32HandleInfoKHR))
+define_lazy('ExportSemaphoreWin32HandleInfoKHRTemplate', lambda: define_template(ExportSemaphoreWin32HandleInfoKHR))
+define_lazy('D3D12FenceSubmitInfoKHRTemplate', lambda: define_template(D3D12FenceSubmitInfoKHR))
+define_lazy('SemaphoreGetWin32HandleInfoKHRTemplate', lambda: define_template(SemaphoreGetWin32HandleInfoKHR))
+define_lazy('ImportFenceWin32HandleInfoKHRTemplate', lambda: define_template(ImportFenceWin32HandleInfoKHR))
+define_lazy('ExportFenceWin32HandleInfoKHRTemplate', lambda: define_template(ExportFenceWin32HandleInfoKHR))
+define_lazy('FenceGetWin32HandleInfoKHRTemplate', lambda: define_template(FenceGetWin32HandleInfoKHR))
+define_lazy('ImportMemoryWin32HandleInfoNVTemplate', lambda: define_template(ImportMemoryWin32HandleInfoNV))
+define_lazy('ExportMemoryWin32HandleInfoNVTemplate', lambda: define_template(ExportMemoryWin32HandleInfoNV))
+define_lazy('Win32KeyedMutexAcquireReleaseInfoNVTemplate', lambda: define_template(Win32KeyedMutexAcquireReleaseInfoNV))
+define_lazy('XcbSurfaceCreateInfoKHRTemplate', lambda: define_template(XcbSurfaceCreateInfoKHR))
+
+
+define_lazy('ApplicationInfoDtype', lambda: define_dtype(ApplicationInfo))
+define_lazy('InstanceCreateInfoDtype', lambda: define_dtype(InstanceCreateInfo))
+define_lazy('AllocationCallbacksDtype', lambda: define_dtype(AllocationCallbacks))
+define_lazy('PhysicalDeviceFeaturesDtype', lambda: define_dtype(PhysicalDeviceFeatures))
+define_lazy('FormatPropertiesDtype', lambda: define_dtype(FormatProperties))
+define_lazy('Extent3DDtype', lambda: define_dtype(Extent3D))
+define_lazy('ImageFormatPropertiesDtype', lambda: define_dtype(ImageFormatProperties))
+define_lazy('PhysicalDeviceLimitsDtype', lambda: define_dtype(PhysicalDeviceLimits))
+define_lazy('PhysicalDeviceSparsePropertiesDtype', lambda: define_dtype(PhysicalDeviceSparseProperties))
+define_lazy('PhysicalDevicePropertiesDtype', lambda: define_dtype(PhysicalDeviceProperties))
+define_lazy('QueueFamilyPropertiesDtype', lambda: define_dtype(QueueFamilyProperties))
+define_lazy('MemoryTypeDtype', lambda: define_dtype(MemoryType))
+define_lazy('MemoryHeapDtype', lambda: define_dtype(MemoryHeap))
+define_lazy('PhysicalDeviceMemoryPropertiesDtype', lambda: define_dtype(PhysicalDeviceMemoryProperties))
+define_lazy('DeviceQueueCreateInfoDtype', lambda: define_dtype(DeviceQueueCreateInfo))
+define_lazy('DeviceCreateInfoDtype', lambda: define_dtype(DeviceCreateInfo))
+define_lazy('ExtensionPropertiesDtype', lambda: define_dtype(ExtensionProperties))
+define_lazy('LayerPropertiesDtype', lambda: define_dtype(LayerProperties))
+define_lazy('SubmitInfoDtype', lambda: define_dtype(SubmitInfo))
+define_lazy('MemoryAllocateInfoDtype', lambda: define_dtype(MemoryAllocateInfo))
+define_lazy('MappedMemoryRangeDtype', lambda: define_dtype(MappedMemoryRange))
+define_lazy('MemoryRequirementsDtype', lambda: define_dtype(MemoryRequirements))
+define_lazy('SparseImageFormatPropertiesDtype', lambda: define_dtype(SparseImageFormatProperties))
+define_lazy('SparseImageMemoryRequirementsDtype', lambda: define_dtype(SparseImageMemoryRequirements))
+define_lazy('SparseMemoryBindDtype', lambda: define_dtype(SparseMemoryBind))
+define_lazy('SparseBufferMemoryBindInfoDtype', lambda: define_dtype(SparseBufferMemoryBindInfo))
+define_lazy('SparseImageOpaqueMemoryBindInfoDtype', lambda: define_dtype(SparseImageOpaqueMemoryBindInfo))
+define_lazy('ImageSubresourceDtype', lambda: define_dtype(ImageSubresource))
+define_lazy('Offset3DDtype', lambda: define_dtype(Offset3D))
+define_lazy('SparseImageMemoryBindDtype', lambda: define_dtype(SparseImageMemoryBind))
+define_lazy('SparseImageMemoryBindInfoDtype', lambda: define_dtype(SparseImageMemoryBindInfo))
+define_lazy('BindSparseInfoDtype', lambda: define_dtype(BindSparseInfo))
+define_lazy('FenceCreateInfoDtype', lambda: define_dtype(FenceCreateInfo))
+define_lazy('SemaphoreCreateInfoDtype', lambda: define_dtype(SemaphoreCreateInfo))
+define_lazy('EventCreateInfoDtype', lambda: define_dtype(EventCreateInfo))
+define_lazy('QueryPoolCreateInfoDtype', lambda: define_dtype(QueryPoolCreateInfo))
+define_lazy('BufferCreateInfoDtype', lambda: define_dtype(BufferCreateInfo))
+define_lazy('BufferViewCreateInfoDtype', lambda: define_dtype(BufferViewCreateInfo))
+define_lazy('ImageCreateInfoDtype', lambda: define_dtype(ImageCreateInfo))
+define_lazy('SubresourceLayoutDtype', lambda: define_dtype(SubresourceLayout))
+define_lazy('ComponentMappingDtype', lambda: define_dtype(ComponentMapping))
+define_lazy('ImageSubresourceRangeDtype', lambda: define_dtype(ImageSubresourceRange))
+define_lazy('ImageViewCreateInfoDtype', lambda: define_dtype(ImageViewCreateInfo))
+define_lazy('ShaderModuleCreateInfoDtype', lambda: define_dtype(ShaderModuleCreateInfo))
+define_lazy('PipelineCacheCreateInfoDtype', lambda: define_dtype(PipelineCacheCreateInfo))
+define_lazy('SpecializationMapEntryDtype', lambda: define_dtype(SpecializationMapEntry))
+define_lazy('SpecializationInfoDtype', lambda: define_dtype(SpecializationInfo))
+define_lazy('PipelineShaderStageCreateInfoDtype', lambda: define_dtype(PipelineShaderStageCreateInfo))
+define_lazy('VertexInputBindingDescriptionDtype', lambda: define_dtype(VertexInputBindingDescription))
+define_lazy('VertexInputAttributeDescriptionDtype', lambda: define_dtype(VertexInputAttributeDescription))
+define_lazy('PipelineVertexInputStateCreateInfoDtype', lambda: define_dtype(PipelineVertexInputStateCreateInfo))
+define_lazy('PipelineInputAssemblyStateCreateInfoDtype', lambda: define_dtype(PipelineInputAssemblyStateCreateInfo))
+define_lazy('PipelineTessellationStateCreateInfoDtype', lambda: define_dtype(PipelineTessellationStateCreateInfo))
+define_lazy('ViewportDtype', lambda: define_dtype(Viewport))
+define_lazy('Offset2DDtype', lambda: define_dtype(Offset2D))
+define_lazy('Extent2DDtype', lambda: define_dtype(Extent2D))
+define_lazy('Rect2DDtype', lambda: define_dtype(Rect2D))
+define_lazy('PipelineViewportStateCreateInfoDtype', lambda: define_dtype(PipelineViewportStateCreateInfo))
+define_lazy('PipelineRasterizationStateCreateInfoDtype', lambda: define_dtype(PipelineRasterizationStateCreateInfo))
+define_lazy('PipelineMultisampleStateCreateInfoDtype', lambda: define_dtype(PipelineMultisampleStateCreateInfo))
+define_lazy('StencilOpStateDtype', lambda: define_dtype(StencilOpState))
+define_lazy('PipelineDepthStencilStateCreateInfoDtype', lambda: define_dtype(PipelineDepthStencilStateCreateInfo))
+define_lazy('PipelineColorBlendAttachmentStateDtype', lambda: define_dtype(PipelineColorBlendAttachmentState))
+define_lazy('PipelineColorBlendStateCreateInfoDtype', lambda: define_dtype(PipelineColorBlendStateCreateInfo))
+define_lazy('PipelineDynamicStateCreateInfoDtype', lambda: define_dtype(PipelineDynamicStateCreateInfo))
+define_lazy('GraphicsPipelineCreateInfoDtype', lambda: define_dtype(GraphicsPipelineCreateInfo))
+define_lazy('ComputePipelineCreateInfoDtype', lambda: define_dtype(ComputePipelineCreateInfo))
+define_lazy('PushConstantRangeDtype', lambda: define_dtype(PushConstantRange))
+define_lazy('PipelineLayoutCreateInfoDtype', lambda: define_dtype(PipelineLayoutCreateInfo))
+define_lazy('SamplerCreateInfoDtype', lambda: define_dtype(SamplerCreateInfo))
+define_lazy('DescriptorSetLayoutBindingDtype', lambda: define_dtype(DescriptorSetLayoutBinding))
+define_lazy('DescriptorSetLayoutCreateInfoDtype', lambda: define_dtype(DescriptorSetLayoutCreateInfo))
+define_lazy('DescriptorPoolSizeDtype', lambda: define_dtype(DescriptorPoolSize))
+define_lazy('DescriptorPoolCreateInfoDtype', lambda: define_dtype(DescriptorPoolCreateInfo))
+define_lazy('DescriptorSetAllocateInfoDtype', lambda: define_dtype(DescriptorSetAllocateInfo))
+define_lazy('DescriptorImageInfoDtype', lambda: define_dtype(DescriptorImageInfo))
+define_lazy('DescriptorBufferInfoDtype', lambda: define_dtype(DescriptorBufferInfo))
+define_lazy('WriteDescriptorSetDtype', lambda: define_dtype(WriteDescriptorSet))
+define_lazy('CopyDescriptorSetDtype', lambda: define_dtype(CopyDescriptorSet))
+define_lazy('FramebufferCreateInfoDtype', lambda: define_dtype(FramebufferCreateInfo))
+define_lazy('AttachmentDescriptionDtype', lambda: define_dtype(AttachmentDescription))
+define_lazy('AttachmentReferenceDtype', lambda: define_dtype(AttachmentReference))
+define_lazy('SubpassDescriptionDtype', lambda: define_dtype(SubpassDescription))
+define_lazy('SubpassDependencyDtype', lambda: define_dtype(SubpassDependency))
+define_lazy('RenderPassCreateInfoDtype', lambda: define_dtype(RenderPassCreateInfo))
+define_lazy('CommandPoolCreateInfoDtype', lambda: define_dtype(CommandPoolCreateInfo))
+define_lazy('CommandBufferAllocateInfoDtype', lambda: define_dtype(CommandBufferAllocateInfo))
+define_lazy('CommandBufferInheritanceInfoDtype', lambda: define_dtype(CommandBufferInheritanceInfo))
+define_lazy('CommandBufferBeginInfoDtype', lambda: define_dtype(CommandBufferBeginInfo))
+define_lazy('BufferCopyDtype', lambda: define_dtype(BufferCopy))
+define_lazy('ImageSubresourceLayersDtype', lambda: define_dtype(ImageSubresourceLayers))
+define_lazy('ImageCopyDtype', lambda: define_dtype(ImageCopy))
+define_lazy('ImageBlitDtype', lambda: define_dtype(ImageBlit))
+define_lazy('BufferImageCopyDtype', lambda: define_dtype(BufferImageCopy))
+define_lazy('ClearColorValueDtype', lambda: define_dtype(ClearColorValue))
+define_lazy('ClearDepthStencilValueDtype', lambda: define_dtype(ClearDepthStencilValue))
+define_lazy('ClearValueDtype', lambda: define_dtype(ClearValue))
+define_lazy('ClearAttachmentDtype', lambda: define_dtype(ClearAttachment))
+define_lazy('ClearRectDtype', lambda: define_dtype(ClearRect))
+define_lazy('ImageResolveDtype', lambda: define_dtype(ImageResolve))
+define_lazy('MemoryBarrierDtype', lambda: define_dtype(MemoryBarrier))
+define_lazy('BufferMemoryBarrierDtype', lambda: define_dtype(BufferMemoryBarrier))
+define_lazy('ImageMemoryBarrierDtype', lambda: define_dtype(ImageMemoryBarrier))
+define_lazy('RenderPassBeginInfoDtype', lambda: define_dtype(RenderPassBeginInfo))
+define_lazy('DispatchIndirectCommandDtype', lambda: define_dtype(DispatchIndirectCommand))
+define_lazy('DrawIndexedIndirectCommandDtype', lambda: define_dtype(DrawIndexedIndirectCommand))
+define_lazy('DrawIndirectCommandDtype', lambda: define_dtype(DrawIndirectCommand))
+define_lazy('PhysicalDeviceSubgroupPropertiesDtype', lambda: define_dtype(PhysicalDeviceSubgroupProperties))
+define_lazy('BindBufferMemoryInfoDtype', lambda: define_dtype(BindBufferMemoryInfo))
+define_lazy('BindImageMemoryInfoDtype', lambda: define_dtype(BindImageMemoryInfo))
+define_lazy('PhysicalDevice16BitStorageFeaturesDtype', lambda: define_dtype(PhysicalDevice16BitStorageFeatures))
+define_lazy('MemoryDedicatedRequirementsDtype', lambda: define_dtype(MemoryDedicatedRequirements))
+define_lazy('MemoryDedicatedAllocateInfoDtype', lambda: define_dtype(MemoryDedicatedAllocateInfo))
+define_lazy('MemoryAllocateFlagsInfoDtype', lambda: define_dtype(MemoryAllocateFlagsInfo))
+define_lazy('DeviceGroupRenderPassBeginInfoDtype', lambda: define_dtype(DeviceGroupRenderPassBeginInfo))
+define_lazy('DeviceGroupCommandBufferBeginInfoDtype', lambda: define_dtype(DeviceGroupCommandBufferBeginInfo))
+define_lazy('DeviceGroupSubmitInfoDtype', lambda: define_dtype(DeviceGroupSubmitInfo))
+define_lazy('DeviceGroupBindSparseInfoDtype', lambda: define_dtype(DeviceGroupBindSparseInfo))
+define_lazy('BindBufferMemoryDeviceGroupInfoDtype', lambda: define_dtype(BindBufferMemoryDeviceGroupInfo))
+define_lazy('BindImageMemoryDeviceGroupInfoDtype', lambda: define_dtype(BindImageMemoryDeviceGroupInfo))
+define_lazy('PhysicalDeviceGroupPropertiesDtype', lambda: define_dtype(PhysicalDeviceGroupProperties))
+define_lazy('DeviceGroupDeviceCreateInfoDtype', lambda: define_dtype(DeviceGroupDeviceCreateInfo))
+define_lazy('BufferMemoryRequirementsInfo2Dtype', lambda: define_dtype(BufferMemoryRequirementsInfo2))
+define_lazy('ImageMemoryRequirementsInfo2Dtype', lambda: define_dtype(ImageMemoryRequirementsInfo2))
+define_lazy('ImageSparseMemoryRequirementsInfo2Dtype', lambda: define_dtype(ImageSparseMemoryRequirementsInfo2))
+define_lazy('MemoryRequirements2Dtype', lambda: define_dtype(MemoryRequirements2))
+define_lazy('SparseImageMemoryRequirements2Dtype', lambda: define_dtype(SparseImageMemoryRequirements2))
+define_lazy('PhysicalDeviceFeatures2Dtype', lambda: define_dtype(PhysicalDeviceFeatures2))
+define_lazy('PhysicalDeviceProperties2Dtype', lambda: define_dtype(PhysicalDeviceProperties2))
+define_lazy('FormatProperties2Dtype', lambda: define_dtype(FormatProperties2))
+define_lazy('ImageFormatProperties2Dtype', lambda: define_dtype(ImageFormatProperties2))
+define_lazy('PhysicalDeviceImageFormatInfo2Dtype', lambda: define_dtype(PhysicalDeviceImageFormatInfo2))
+define_lazy('QueueFamilyProperties2Dtype', lambda: define_dtype(QueueFamilyProperties2))
+define_lazy('PhysicalDeviceMemoryProperties2Dtype', lambda: define_dtype(PhysicalDeviceMemoryProperties2))
+define_lazy('SparseImageFormatProperties2Dtype', lambda: define_dtype(SparseImageFormatProperties2))
+define_lazy('PhysicalDeviceSparseImageFormatInfo2Dtype', lambda: define_dtype(PhysicalDeviceSparseImageFormatInfo2))
+define_lazy('PhysicalDevicePointClippingPropertiesDtype', lambda: define_dtype(PhysicalDevicePointClippingProperties))
+define_lazy('InputAttachmentAspectReferenceDtype', lambda: define_dtype(InputAttachmentAspectReference))
+define_lazy('RenderPassInputAttachmentAspectCreateInfoDtype', lambda: define_dtype(RenderPassInputAttachmentAspectCreateInfo))
+define_lazy('ImageViewUsageCreateInfoDtype', lambda: define_dtype(ImageViewUsageCreateInfo))
+define_lazy('PipelineTessellationDomainOriginStateCreateInfoDtype', lambda: define_dtype(PipelineTessellationDomainOriginStateCreateInfo))
+define_lazy('RenderPassMultiviewCreateInfoDtype', lambda: define_dtype(RenderPassMultiviewCreateInfo))
+define_lazy('PhysicalDeviceMultiviewFeaturesDtype', lambda: define_dtype(PhysicalDeviceMultiviewFeatures))
+define_lazy('PhysicalDeviceMultiviewPropertiesDtype', lambda: define_dtype(PhysicalDeviceMultiviewProperties))
+define_lazy('PhysicalDeviceVariablePointerFeaturesDtype', lambda: define_dtype(PhysicalDeviceVariablePointerFeatures))
+define_lazy('PhysicalDeviceProtectedMemoryFeaturesDtype', lambda: define_dtype(PhysicalDeviceProtectedMemoryFeatures))
+define_lazy('PhysicalDeviceProtectedMemoryPropertiesDtype', lambda: define_dtype(PhysicalDeviceProtectedMemoryProperties))
+define_lazy('DeviceQueueInfo2Dtype', lambda: define_dtype(DeviceQueueInfo2))
+define_lazy('ProtectedSubmitInfoDtype', lambda: define_dtype(ProtectedSubmitInfo))
+define_lazy('SamplerYcbcrConversionCreateInfoDtype', lambda: define_dtype(SamplerYcbcrConversionCreateInfo))
+define_lazy('SamplerYcbcrConversionInfoDtype', lambda: define_dtype(SamplerYcbcrConversionInfo))
+define_lazy('BindImagePlaneMemoryInfoDtype', lambda: define_dtype(BindImagePlaneMemoryInfo))
+define_lazy('ImagePlaneMemoryRequirementsInfoDtype', lambda: define_dtype(ImagePlaneMemoryRequirementsInfo))
+define_lazy('PhysicalDeviceSamplerYcbcrConversionFeaturesDtype', lambda: define_dtype(PhysicalDeviceSamplerYcbcrConversionFeatures))
+define_lazy('SamplerYcbcrConversionImageFormatPropertiesDtype', lambda: define_dtype(SamplerYcbcrConversionImageFormatProperties))
+define_lazy('DescriptorUpdateTemplateEntryDtype', lambda: define_dtype(DescriptorUpdateTemplateEntry))
+define_lazy('DescriptorUpdateTemplateCreateInfoDtype', lambda: define_dtype(DescriptorUpdateTemplateCreateInfo))
+define_lazy('ExternalMemoryPropertiesDtype', lambda: define_dtype(ExternalMemoryProperties))
+define_lazy('PhysicalDeviceExternalImageFormatInfoDtype', lambda: define_dtype(PhysicalDeviceExternalImageFormatInfo))
+define_lazy('ExternalImageFormatPropertiesDtype', lambda: define_dtype(ExternalImageFormatProperties))
+define_lazy('PhysicalDeviceExternalBufferInfoDtype', lambda: define_dtype(PhysicalDeviceExternalBufferInfo))
+define_lazy('ExternalBufferPropertiesDtype', lambda: define_dtype(ExternalBufferProperties))
+define_lazy('PhysicalDeviceIDPropertiesDtype', lambda: define_dtype(PhysicalDeviceIDProperties))
+define_lazy('ExternalMemoryImageCreateInfoDtype', lambda: define_dtype(ExternalMemoryImageCreateInfo))
+define_lazy('ExternalMemoryBufferCreateInfoDtype', lambda: define_dtype(ExternalMemoryBufferCreateInfo))
+define_lazy('ExportMemoryAllocateInfoDtype', lambda: define_dtype(ExportMemoryAllocateInfo))
+define_lazy('PhysicalDeviceExternalFenceInfoDtype', lambda: define_dtype(PhysicalDeviceExternalFenceInfo))
+define_lazy('ExternalFencePropertiesDtype', lambda: define_dtype(ExternalFenceProperties))
+define_lazy('ExportFenceCreateInfoDtype', lambda: define_dtype(ExportFenceCreateInfo))
+define_lazy('ExportSemaphoreCreateInfoDtype', lambda: define_dtype(ExportSemaphoreCreateInfo))
+define_lazy('PhysicalDeviceExternalSemaphoreInfoDtype', lambda: define_dtype(PhysicalDeviceExternalSemaphoreInfo))
+define_lazy('ExternalSemaphorePropertiesDtype', lambda: define_dtype(ExternalSemaphoreProperties))
+define_lazy('PhysicalDeviceMaintenance3PropertiesDtype', lambda: define_dtype(PhysicalDeviceMaintenance3Properties))
+define_lazy('DescriptorSetLayoutSupportDtype', lambda: define_dtype(DescriptorSetLayoutSupport))
+define_lazy('PhysicalDeviceShaderDrawParameterFeaturesDtype', lambda: define_dtype(PhysicalDeviceShaderDrawParameterFeatures))
+define_lazy('SurfaceCapabilitiesKHRDtype', lambda: define_dtype(SurfaceCapabilitiesKHR))
+define_lazy('SurfaceFormatKHRDtype', lambda: define_dtype(SurfaceFormatKHR))
+define_lazy('SwapchainCreateInfoKHRDtype', lambda: define_dtype(SwapchainCreateInfoKHR))
+define_lazy('PresentInfoKHRDtype', lambda: define_dtype(PresentInfoKHR))
+define_lazy('ImageSwapchainCreateInfoKHRDtype', lambda: define_dtype(ImageSwapchainCreateInfoKHR))
+define_lazy('BindImageMemorySwapchainInfoKHRDtype', lambda: define_dtype(BindImageMemorySwapchainInfoKHR))
+define_lazy('AcquireNextImageInfoKHRDtype', lambda: define_dtype(AcquireNextImageInfoKHR))
+define_lazy('DeviceGroupPresentCapabilitiesKHRDtype', lambda: define_dtype(DeviceGroupPresentCapabilitiesKHR))
+define_lazy('DeviceGroupPresentInfoKHRDtype', lambda: define_dtype(DeviceGroupPresentInfoKHR))
+define_lazy('DeviceGroupSwapchainCreateInfoKHRDtype', lambda: define_dtype(DeviceGroupSwapchainCreateInfoKHR))
+define_lazy('DisplayPropertiesKHRDtype', lambda: define_dtype(DisplayPropertiesKHR))
+define_lazy('DisplayModeParametersKHRDtype', lambda: define_dtype(DisplayModeParametersKHR))
+define_lazy('DisplayModePropertiesKHRDtype', lambda: define_dtype(DisplayModePropertiesKHR))
+define_lazy('DisplayModeCreateInfoKHRDtype', lambda: define_dtype(DisplayModeCreateInfoKHR))
+define_lazy('DisplayPlaneCapabilitiesKHRDtype', lambda: define_dtype(DisplayPlaneCapabilitiesKHR))
+define_lazy('DisplayPlanePropertiesKHRDtype', lambda: define_dtype(DisplayPlanePropertiesKHR))
+define_lazy('DisplaySurfaceCreateInfoKHRDtype', lambda: define_dtype(DisplaySurfaceCreateInfoKHR))
+define_lazy('DisplayPresentInfoKHRDtype', lambda: define_dtype(DisplayPresentInfoKHR))
+define_lazy('ImportMemoryFdInfoKHRDtype', lambda: define_dtype(ImportMemoryFdInfoKHR))
+define_lazy('MemoryFdPropertiesKHRDtype', lambda: define_dtype(MemoryFdPropertiesKHR))
+define_lazy('MemoryGetFdInfoKHRDtype', lambda: define_dtype(MemoryGetFdInfoKHR))
+define_lazy('ImportSemaphoreFdInfoKHRDtype', lambda: define_dtype(ImportSemaphoreFdInfoKHR))
+define_lazy('SemaphoreGetFdInfoKHRDtype', lambda: define_dtype(SemaphoreGetFdInfoKHR))
+define_lazy('PhysicalDevicePushDescriptorPropertiesKHRDtype', lambda: define_dtype(PhysicalDevicePushDescriptorPropertiesKHR))
+define_lazy('RectLayerKHRDtype', lambda: define_dtype(RectLayerKHR))
+define_lazy('PresentRegionKHRDtype', lambda: define_dtype(PresentRegionKHR))
+define_lazy('PresentRegionsKHRDtype', lambda: define_dtype(PresentRegionsKHR))
+define_lazy('AttachmentDescription2KHRDtype', lambda: define_dtype(AttachmentDescription2KHR))
+define_lazy('AttachmentReference2KHRDtype', lambda: define_dtype(AttachmentReference2KHR))
+define_lazy('SubpassDescription2KHRDtype', lambda: define_dtype(SubpassDescription2KHR))
+define_lazy('SubpassDependency2KHRDtype', lambda: define_dtype(SubpassDependency2KHR))
+define_lazy('RenderPassCreateInfo2KHRDtype', lambda: define_dtype(RenderPassCreateInfo2KHR))
+define_lazy('SubpassBeginInfoKHRDtype', lambda: define_dtype(SubpassBeginInfoKHR))
+define_lazy('SubpassEndInfoKHRDtype', lambda: define_dtype(SubpassEndInfoKHR))
+define_lazy('SharedPresentSurfaceCapabilitiesKHRDtype', lambda: define_dtype(SharedPresentSurfaceCapabilitiesKHR))
+define_lazy('ImportFenceFdInfoKHRDtype', lambda: define_dtype(ImportFenceFdInfoKHR))
+define_lazy('FenceGetFdInfoKHRDtype', lambda: define_dtype(FenceGetFdInfoKHR))
+define_lazy('PhysicalDeviceSurfaceInfo2KHRDtype', lambda: define_dtype(PhysicalDeviceSurfaceInfo2KHR))
+define_lazy('SurfaceCapabilities2KHRDtype', lambda: define_dtype(SurfaceCapabilities2KHR))
+define_lazy('SurfaceFormat2KHRDtype', lambda: define_dtype(SurfaceFormat2KHR))
+define_lazy('DisplayProperties2KHRDtype', lambda: define_dtype(DisplayProperties2KHR))
+define_lazy('DisplayPlaneProperties2KHRDtype', lambda: define_dtype(DisplayPlaneProperties2KHR))
+define_lazy('DisplayModeProperties2KHRDtype', lambda: define_dtype(DisplayModeProperties2KHR))
+define_lazy('DisplayPlaneInfo2KHRDtype', lambda: define_dtype(DisplayPlaneInfo2KHR))
+define_lazy('DisplayPlaneCapabilities2KHRDtype', lambda: define_dtype(DisplayPlaneCapabilities2KHR))
+define_lazy('ImageFormatListCreateInfoKHRDtype', lambda: define_dtype(ImageFormatListCreateInfoKHR))
+define_lazy('PhysicalDevice8BitStorageFeaturesKHRDtype', lambda: define_dtype(PhysicalDevice8BitStorageFeaturesKHR))
+define_lazy('PhysicalDeviceShaderAtomicInt64FeaturesKHRDtype', lambda: define_dtype(PhysicalDeviceShaderAtomicInt64FeaturesKHR))
+define_lazy('ConformanceVersionKHRDtype', lambda: define_dtype(ConformanceVersionKHR))
+define_lazy('PhysicalDeviceDriverPropertiesKHRDtype', lambda: define_dtype(PhysicalDeviceDriverPropertiesKHR))
+define_lazy('PhysicalDeviceVulkanMemoryModelFeaturesKHRDtype', lambda: define_dtype(PhysicalDeviceVulkanMemoryModelFeaturesKHR))
+define_lazy('DebugReportCallbackCreateInfoEXTDtype', lambda: define_dtype(DebugReportCallbackCreateInfoEXT))
+define_lazy('PipelineRasterizationStateRasterizationOrderAMDDtype', lambda: define_dtype(PipelineRasterizationStateRasterizationOrderAMD))
+define_lazy('DebugMarkerObjectNameInfoEXTDtype', lambda: define_dtype(DebugMarkerObjectNameInfoEXT))
+define_lazy('DebugMarkerObjectTagInfoEXTDtype', lambda: define_dtype(DebugMarkerObjectTagInfoEXT))
+define_lazy('DebugMarkerMarkerInfoEXTDtype', lambda: define_dtype(DebugMarkerMarkerInfoEXT))
+define_lazy('DedicatedAllocationImageCreateInfoNVDtype', lambda: define_dtype(DedicatedAllocationImageCreateInfoNV))
+define_lazy('DedicatedAllocationBufferCreateInfoNVDtype', lambda: define_dtype(DedicatedAllocationBufferCreateInfoNV))
+define_lazy('DedicatedAllocationMemoryAllocateInfoNVDtype', lambda: define_dtype(DedicatedAllocationMemoryAllocateInfoNV))
+define_lazy('PhysicalDeviceTransformFeedbackFeaturesEXTDtype', lambda: define_dtype(PhysicalDeviceTransformFeedbackFeaturesEXT))
+define_lazy('PhysicalDeviceTransformFeedbackPropertiesEXTDtype', lambda: define_dtype(PhysicalDeviceTransformFeedbackPropertiesEXT))
+define_lazy('PipelineRasterizationStateStreamCreateInfoEXTDtype', lambda: define_dtype(PipelineRasterizationStateStreamCreateInfoEXT))
+define_lazy('TextureLODGatherFormatPropertiesAMDDtype', lambda: define_dtype(TextureLODGatherFormatPropertiesAMD))
+define_lazy('ShaderResourceUsageAMDDtype', lambda: define_dtype(ShaderResourceUsageAMD))
+define_lazy('ShaderStatisticsInfoAMDDtype', lambda: define_dtype(ShaderStatisticsInfoAMD))
+define_lazy('PhysicalDeviceCornerSampledImageFeaturesNVDtype', lambda: define_dtype(PhysicalDeviceCornerSampledImageFeaturesNV))
+define_lazy('ExternalImageFormatPropertiesNVDtype', lambda: define_dtype(ExternalImageFormatPropertiesNV))
+define_lazy('ExternalMemoryImageCreateInfoNVDtype', lambda: define_dtype(ExternalMemoryImageCreateInfoNV))
+define_lazy('ExportMemoryAllocateInfoNVDtype', lambda: define_dtype(ExportMemoryAllocateInfoNV))
+define_lazy('ValidationFlagsEXTDtype', lambda: define_dtype(ValidationFlagsEXT))
+define_lazy('ImageViewASTCDecodeModeEXTDtype', lambda: define_dtype(ImageViewASTCDecodeModeEXT))
+define_lazy('PhysicalDeviceASTCDecodeFeaturesEXTDtype', lambda: define_dtype(PhysicalDeviceASTCDecodeFeaturesEXT))
+define_lazy('ConditionalRenderingBeginInfoEXTDtype', lambda: define_dtype(ConditionalRenderingBeginInfoEXT))
+define_lazy('PhysicalDeviceConditionalRenderingFeaturesEXTDtype', lambda: define_dtype(PhysicalDeviceConditionalRenderingFeaturesEXT))
+define_lazy('CommandBufferInheritanceConditionalRenderingInfoEXTDtype', lambda: define_dtype(CommandBufferInheritanceConditionalRenderingInfoEXT))
+define_lazy('DeviceGeneratedCommandsFeaturesNVXDtype', lambda: define_dtype(DeviceGeneratedCommandsFeaturesNVX))
+define_lazy('DeviceGeneratedCommandsLimitsNVXDtype', lambda: define_dtype(DeviceGeneratedCommandsLimitsNVX))
+define_lazy('IndirectCommandsTokenNVXDtype', lambda: define_dtype(IndirectCommandsTokenNVX))
+define_lazy('IndirectCommandsLayoutTokenNVXDtype', lambda: define_dtype(IndirectCommandsLayoutTokenNVX))
+define_lazy('IndirectCommandsLayoutCreateInfoNVXDtype', lambda: define_dtype(IndirectCommandsLayoutCreateInfoNVX))
+define_lazy('CmdProcessCommandsInfoNVXDtype', lambda: define_dtype(CmdProcessCommandsInfoNVX))
+define_lazy('CmdReserveSpaceForCommandsInfoNVXDtype', lambda: define_dtype(CmdReserveSpaceForCommandsInfoNVX))
+define_lazy('ObjectTableCreateInfoNVXDtype', lambda: define_dtype(ObjectTableCreateInfoNVX))
+define_lazy('ObjectTableEntryNVXDtype', lambda: define_dtype(ObjectTableEntryNVX))
+define_lazy('ObjectTablePipelineEntryNVXDtype', lambda: define_dtype(ObjectTablePipelineEntryNVX))
+define_lazy('ObjectTableDescriptorSetEntryNVXDtype', lambda: define_dtype(ObjectTableDescriptorSetEntryNVX))
+define_lazy('ObjectTableVertexBufferEntryNVXDtype', lambda: define_dtype(ObjectTableVertexBufferEntryNVX))
+define_lazy('ObjectTableIndexBufferEntryNVXDtype', lambda: define_dtype(ObjectTableIndexBufferEntryNVX))
+define_lazy('ObjectTablePushConstantEntryNVXDtype', lambda: define_dtype(ObjectTablePushConstantEntryNVX))
+define_lazy('ViewportWScalingNVDtype', lambda: define_dtype(ViewportWScalingNV))
+define_lazy('PipelineViewportWScalingStateCreateInfoNVDtype', lambda: define_dtype(PipelineViewportWScalingStateCreateInfoNV))
+define_lazy('SurfaceCapabilities2EXTDtype', lambda: define_dtype(SurfaceCapabilities2EXT))
+define_lazy('DisplayPowerInfoEXTDtype', lambda: define_dtype(DisplayPowerInfoEXT))
+define_lazy('DeviceEventInfoEXTDtype', lambda: define_dtype(DeviceEventInfoEXT))
+define_lazy('DisplayEventInfoEXTDtype', lambda: define_dtype(DisplayEventInfoEXT))
+define_lazy('SwapchainCounterCreateInfoEXTDtype', lambda: define_dtype(SwapchainCounterCreateInfoEXT))
+define_lazy('RefreshCycleDurationGOOGLEDtype', lambda: define_dtype(RefreshCycleDurationGOOGLE))
+define_lazy('PastPresentationTimingGOOGLEDtype', lambda: define_dtype(PastPresentationTimingGOOGLE))
+define_lazy('PresentTimeGOOGLEDtype', lambda: define_dtype(PresentTimeGOOGLE))
+define_lazy('PresentTimesInfoGOOGLEDtype', lambda: define_dtype(PresentTimesInfoGOOGLE))
+define_lazy('PhysicalDeviceMultiviewPerViewAttributesPropertiesNVXDtype', lambda: define_dtype(PhysicalDeviceMultiviewPerViewAttributesPropertiesNVX))
+define_lazy('ViewportSwizzleNVDtype', lambda: define_dtype(ViewportSwizzleNV))
+define_lazy('PipelineViewportSwizzleStateCreateInfoNVDtype', lambda: define_dtype(PipelineViewportSwizzleStateCreateInfoNV))
+define_lazy('PhysicalDeviceDiscardRectanglePropertiesEXTDtype', lambda: define_dtype(PhysicalDeviceDiscardRectanglePropertiesEXT))
+define_lazy('PipelineDiscardRectangleStateCreateInfoEXTDtype', lambda: define_dtype(PipelineDiscardRectangleStateCreateInfoEXT))
+define_lazy('PhysicalDeviceConservativeRasterizationPropertiesEXTDtype', lambda: define_dtype(PhysicalDeviceConservativeRasterizationPropertiesEXT))
+define_lazy('PipelineRasterizationConservativeStateCreateInfoEXTDtype', lambda: define_dtype(PipelineRasterizationConservativeStateCreateInfoEXT))
+define_lazy('XYColorEXTDtype', lambda: define_dtype(XYColorEXT))
+define_lazy('HdrMetadataEXTDtype', lambda: define_dtype(HdrMetadataEXT))
+define_lazy('DebugUtilsObjectNameInfoEXTDtype', lambda: define_dtype(DebugUtilsObjectNameInfoEXT))
+define_lazy('DebugUtilsObjectTagInfoEXTDtype', lambda: define_dtype(DebugUtilsObjectTagInfoEXT))
+define_lazy('DebugUtilsLabelEXTDtype', lambda: define_dtype(DebugUtilsLabelEXT))
+define_lazy('DebugUtilsMessengerCallbackDataEXTDtype', lambda: define_dtype(DebugUtilsMessengerCallbackDataEXT))
+define_lazy('DebugUtilsMessengerCreateInfoEXTDtype', lambda: define_dtype(DebugUtilsMessengerCreateInfoEXT))
+define_lazy('SamplerReductionModeCreateInfoEXTDtype', lambda: define_dtype(SamplerReductionModeCreateInfoEXT))
+define_lazy('PhysicalDeviceSamplerFilterMinmaxPropertiesEXTDtype', lambda: define_dtype(PhysicalDeviceSamplerFilterMinmaxPropertiesEXT))
+define_lazy('PhysicalDeviceInlineUniformBlockFeaturesEXTDtype', lambda: define_dtype(PhysicalDeviceInlineUniformBlockFeaturesEXT))
+define_lazy('PhysicalDeviceInlineUniformBlockPropertiesEXTDtype', lambda: define_dtype(PhysicalDeviceInlineUniformBlockPropertiesEXT))
+define_lazy('WriteDescriptorSetInlineUniformBlockEXTDtype', lambda: define_dtype(WriteDescriptorSetInlineUniformBlockEXT))
+define_lazy('DescriptorPoolInlineUniformBlockCreateInfoEXTDtype', lambda: define_dtype(DescriptorPoolInlineUniformBlockCreateInfoEXT))
+define_lazy('SampleLocationEXTDtype', lambda: define_dtype(SampleLocationEXT))
+define_lazy('SampleLocationsInfoEXTDtype', lambda: define_dtype(SampleLocationsInfoEXT))
+define_lazy('AttachmentSampleLocationsEXTDtype', lambda: define_dtype(AttachmentSampleLocationsEXT))
+define_lazy('SubpassSampleLocationsEXTDtype', lambda: define_dtype(SubpassSampleLocationsEXT))
+define_lazy('RenderPassSampleLocationsBeginInfoEXTDtype', lambda: define_dtype(RenderPassSampleLocationsBeginInfoEXT))
+define_lazy('PipelineSampleLocationsStateCreateInfoEXTDtype', lambda: define_dtype(PipelineSampleLocationsStateCreateInfoEXT))
+define_lazy('PhysicalDeviceSampleLocationsPropertiesEXTDtype', lambda: define_dtype(PhysicalDeviceSampleLocationsPropertiesEXT))
+define_lazy('MultisamplePropertiesEXTDtype', lambda: define_dtype(MultisamplePropertiesEXT))
+define_lazy('PhysicalDeviceBlendOperationAdvancedFeaturesEXTDtype', lambda: define_dtype(PhysicalDeviceBlendOperationAdvancedFeaturesEXT))
+define_lazy('PhysicalDeviceBlendOperationAdvancedPropertiesEXTDtype', lambda: define_dtype(PhysicalDeviceBlendOperationAdvancedPropertiesEXT))
+define_lazy('PipelineColorBlendAdvancedStateCreateInfoEXTDtype', lambda: define_dtype(PipelineColorBlendAdvancedStateCreateInfoEXT))
+define_lazy('PipelineCoverageToColorStateCreateInfoNVDtype', lambda: define_dtype(PipelineCoverageToColorStateCreateInfoNV))
+define_lazy('PipelineCoverageModulationStateCreateInfoNVDtype', lambda: define_dtype(PipelineCoverageModulationStateCreateInfoNV))
+define_lazy('DrmFormatModifierPropertiesEXTDtype', lambda: define_dtype(DrmFormatModifierPropertiesEXT))
+define_lazy('DrmFormatModifierPropertiesListEXTDtype', lambda: define_dtype(DrmFormatModifierPropertiesListEXT))
+define_lazy('PhysicalDeviceImageDrmFormatModifierInfoEXTDtype', lambda: define_dtype(PhysicalDeviceImageDrmFormatModifierInfoEXT))
+define_lazy('ImageDrmFormatModifierListCreateInfoEXTDtype', lambda: define_dtype(ImageDrmFormatModifierListCreateInfoEXT))
+define_lazy('ImageDrmFormatModifierExplicitCreateInfoEXTDtype', lambda: define_dtype(ImageDrmFormatModifierExplicitCreateInfoEXT))
+define_lazy('ImageDrmFormatModifierPropertiesEXTDtype', lambda: define_dtype(ImageDrmFormatModifierPropertiesEXT))
+define_lazy('ValidationCacheCreateInfoEXTDtype', lambda: define_dtype(ValidationCacheCreateInfoEXT))
+define_lazy('ShaderModuleValidationCacheCreateInfoEXTDtype', lambda: define_dtype(ShaderModuleValidationCacheCreateInfoEXT))
+define_lazy('DescriptorSetLayoutBindingFlagsCreateInfoEXTDtype', lambda: define_dtype(DescriptorSetLayoutBindingFlagsCreateInfoEXT))
+define_lazy('PhysicalDeviceDescriptorIndexingFeaturesEXTDtype', lambda: define_dtype(PhysicalDeviceDescriptorIndexingFeaturesEXT))
+define_lazy('PhysicalDeviceDescriptorIndexingPropertiesEXTDtype', lambda: define_dtype(PhysicalDeviceDescriptorIndexingPropertiesEXT))
+define_lazy('DescriptorSetVariableDescriptorCountAllocateInfoEXTDtype', lambda: define_dtype(DescriptorSetVariableDescriptorCountAllocateInfoEXT))
+define_lazy('DescriptorSetVariableDescriptorCountLayoutSupportEXTDtype', lambda: define_dtype(DescriptorSetVariableDescriptorCountLayoutSupportEXT))
+define_lazy('ShadingRatePaletteNVDtype', lambda: define_dtype(ShadingRatePaletteNV))
+define_lazy('PipelineViewportShadingRateImageStateCreateInfoNVDtype', lambda: define_dtype(PipelineViewportShadingRateImageStateCreateInfoNV))
+define_lazy('PhysicalDeviceShadingRateImageFeaturesNVDtype', lambda: define_dtype(PhysicalDeviceShadingRateImageFeaturesNV))
+define_lazy('PhysicalDeviceShadingRateImagePropertiesNVDtype', lambda: define_dtype(PhysicalDeviceShadingRateImagePropertiesNV))
+define_lazy('CoarseSampleLocationNVDtype', lambda: define_dtype(CoarseSampleLocationNV))
+define_lazy('CoarseSampleOrderCustomNVDtype', lambda: define_dtype(CoarseSampleOrderCustomNV))
+define_lazy('PipelineViewportCoarseSampleOrderStateCreateInfoNVDtype', lambda: define_dtype(PipelineViewportCoarseSampleOrderStateCreateInfoNV))
+define_lazy('RayTracingShaderGroupCreateInfoNVDtype', lambda: define_dtype(RayTracingShaderGroupCreateInfoNV))
+define_lazy('RayTracingPipelineCreateInfoNVDtype', lambda: define_dtype(RayTracingPipelineCreateInfoNV))
+define_lazy('GeometryTrianglesNVDtype', lambda: define_dtype(GeometryTrianglesNV))
+define_lazy('GeometryAABBNVDtype', lambda: define_dtype(GeometryAABBNV))
+define_lazy('GeometryDataNVDtype', lambda: define_dtype(GeometryDataNV))
+define_lazy('GeometryNVDtype', lambda: define_dtype(GeometryNV))
+define_lazy('AccelerationStructureInfoNVDtype', lambda: define_dtype(AccelerationStructureInfoNV))
+define_lazy('AccelerationStructureCreateInfoNVDtype', lambda: define_dtype(AccelerationStructureCreateInfoNV))
+define_lazy('BindAccelerationStructureMemoryInfoNVDtype', lambda: define_dtype(BindAccelerationStructureMemoryInfoNV))
+define_lazy('WriteDescriptorSetAccelerationStructureNVDtype', lambda: define_dtype(WriteDescriptorSetAccelerationStructureNV))
+define_lazy('AccelerationStructureMemoryRequirementsInfoNVDtype', lambda: define_dtype(AccelerationStructureMemoryRequirementsInfoNV))
+define_lazy('PhysicalDeviceRayTracingPropertiesNVDtype', lambda: define_dtype(PhysicalDeviceRayTracingPropertiesNV))
+define_lazy('PhysicalDeviceRepresentativeFragmentTestFeaturesNVDtype', lambda: define_dtype(PhysicalDeviceRepresentativeFragmentTestFeaturesNV))
+define_lazy('PipelineRepresentativeFragmentTestStateCreateInfoNVDtype', lambda: define_dtype(PipelineRepresentativeFragmentTestStateCreateInfoNV))
+define_lazy('DeviceQueueGlobalPriorityCreateInfoEXTDtype', lambda: define_dtype(DeviceQueueGlobalPriorityCreateInfoEXT))
+define_lazy('ImportMemoryHostPointerInfoEXTDtype', lambda: define_dtype(ImportMemoryHostPointerInfoEXT))
+define_lazy('MemoryHostPointerPropertiesEXTDtype', lambda: define_dtype(MemoryHostPointerPropertiesEXT))
+define_lazy('PhysicalDeviceExternalMemoryHostPropertiesEXTDtype', lambda: define_dtype(PhysicalDeviceExternalMemoryHostPropertiesEXT))
+define_lazy('CalibratedTimestampInfoEXTDtype', lambda: define_dtype(CalibratedTimestampInfoEXT))
+define_lazy('PhysicalDeviceShaderCorePropertiesAMDDtype', lambda: define_dtype(PhysicalDeviceShaderCorePropertiesAMD))
+define_lazy('DeviceMemoryOverallocationCreateInfoAMDDtype', lambda: define_dtype(DeviceMemoryOverallocationCreateInfoAMD))
+define_lazy('PhysicalDeviceVertexAttributeDivisorPropertiesEXTDtype', lambda: define_dtype(PhysicalDeviceVertexAttributeDivisorPropertiesEXT))
+define_lazy('VertexInputBindingDivisorDescriptionEXTDtype', lambda: define_dtype(VertexInputBindingDivisorDescriptionEXT))
+define_lazy('PipelineVertexInputDivisorStateCreateInfoEXTDtype', lambda: define_dtype(PipelineVertexInputDivisorStateCreateInfoEXT))
+define_lazy('PhysicalDeviceVertexAttributeDivisorFeaturesEXTDtype', lambda: define_dtype(PhysicalDeviceVertexAttributeDivisorFeaturesEXT))
+define_lazy('PhysicalDeviceComputeShaderDerivativesFeaturesNVDtype', lambda: define_dtype(PhysicalDeviceComputeShaderDerivativesFeaturesNV))
+define_lazy('PhysicalDeviceMeshShaderFeaturesNVDtype', lambda: define_dtype(PhysicalDeviceMeshShaderFeaturesNV))
+define_lazy('PhysicalDeviceMeshShaderPropertiesNVDtype', lambda: define_dtype(PhysicalDeviceMeshShaderPropertiesNV))
+define_lazy('DrawMeshTasksIndirectCommandNVDtype', lambda: define_dtype(DrawMeshTasksIndirectCommandNV))
+define_lazy('PhysicalDeviceFragmentShaderBarycentricFeaturesNVDtype', lambda: define_dtype(PhysicalDeviceFragmentShaderBarycentricFeaturesNV))
+define_lazy('PhysicalDeviceShaderImageFootprintFeaturesNVDtype', lambda: define_dtype(PhysicalDeviceShaderImageFootprintFeaturesNV))
+define_lazy('PipelineViewportExclusiveScissorStateCreateInfoNVDtype', lambda: define_dtype(PipelineViewportExclusiveScissorStateCreateInfoNV))
+define_lazy('PhysicalDeviceExclusiveScissorFeaturesNVDtype', lambda: define_dtype(PhysicalDeviceExclusiveScissorFeaturesNV))
+define_lazy('QueueFamilyCheckpointPropertiesNVDtype', lambda: define_dtype(QueueFamilyCheckpointPropertiesNV))
+define_lazy('CheckpointDataNVDtype', lambda: define_dtype(CheckpointDataNV))
+define_lazy('PhysicalDevicePCIBusInfoPropertiesEXTDtype', lambda: define_dtype(PhysicalDevicePCIBusInfoPropertiesEXT))
+define_lazy('Win32SurfaceCreateInfoKHRDtype', lambda: define_dtype(Win32SurfaceCreateInfoKHR))
+define_lazy('ImportMemoryWin32HandleInfoKHRDtype', lambda: define_dtype(ImportMemoryWin32HandleInfoKHR))
+define_lazy('ExportMemoryWin32HandleInfoKHRDtype', lambda: define_dtype(ExportMemoryWin32HandleInfoKHR))
+define_lazy('MemoryWin32HandlePropertiesKHRDtype', lambda: define_dtype(MemoryWin32HandlePropertiesKHR))
+define_lazy('MemoryGetWin32HandleInfoKHRDtype', lambda: define_dtype(MemoryGetWin32HandleInfoKHR))
+define_lazy('Win32KeyedMutexAcquireReleaseInfoKHRDtype', lambda: define_dtype(Win32KeyedMutexAcquireReleaseInfoKHR))
+define_lazy('ImportSemaphoreWin32HandleInfoKHRDtype', lambda: define_dtype(ImportSemaphoreWin32HandleInfoKHR))
+define_lazy('ExportSemaphoreWin32HandleInfoKHRDtype', lambda: define_dtype(ExportSemaphoreWin32HandleInfoKHR))
+define_lazy('D3D12FenceSubmitInfoKHRDtype', lambda: define_dtype(D3D12FenceSubmitInfoKHR))
+define_lazy('SemaphoreGetWin32HandleInfoKHRDtype', lambda: define_dtype(SemaphoreGetWin32HandleInfoKHR))
+define_lazy('ImportFenceWin32HandleInfoKHRDtype', lambda: define_dtype(ImportFenceWin32HandleInfoKHR))
+define_lazy('ExportFenceWin32HandleInfoKHRDtype', lambda: define_dtype(ExportFenceWin32HandleInfoKHR))
+define_lazy('FenceGetWin32HandleInfoKHRDtype', lambda: define_dtype(FenceGetWin32HandleInfoKHR))
+define_lazy('ImportMemoryWin32HandleInfoNVDtype', lambda: define_dtype(ImportMemoryWin32HandleInfoNV))
+define_lazy('ExportMemoryWin32HandleInfoNVDtype', lambda: define_dtype(ExportMemoryWin32HandleInfoNV))
+define_lazy('Win32KeyedMutexAcquireReleaseInfoNVDtype', lambda: define_dtype(Win32KeyedMutexAcquireReleaseInfoNV))
+define_lazy('XcbSurfaceCreateInfoKHRDtype', lambda: define_dtype(XcbSurfaceCreateInfoKHR))
+
+
+define_lazy('FnVoidFunction', lambda: FUNCTYPE(None, ))
+define_lazy('FnCreateInstance', lambda: FUNCTYPE(Result, POINTER(InstanceCreateInfo), POINTER(AllocationCallbacks), array_pointer(Instance, output=True)))
+define_lazy('FnDestroyInstance', lambda: FUNCTYPE(None, Instance, POINTER(AllocationCallbacks)))
+define_lazy('FnEnumeratePhysicalDevices', lambda: FUNCTYPE(Result, Instance, POINTER(c_uint32), array_pointer(PhysicalDevice, output=True)))
+define_lazy('FnGetPhysicalDeviceFeatures', lambda: FUNCTYPE(None, PhysicalDevice, POINTER(PhysicalDeviceFeatures)))
+define_lazy('FnGetPhysicalDeviceFormatProperties', lambda: FUNCTYPE(None, PhysicalDevice, Format, POINTER(FormatProperties)))
+define_lazy('FnGetPhysicalDeviceImageFormatProperties', lambda: FUNCTYPE(Result, PhysicalDevice, Format, ImageType, ImageTiling, ImageUsageFlags, ImageCreateFlags, POINTER(ImageFormatProperties)))
+define_lazy('FnGetPhysicalDeviceProperties', lambda: FUNCTYPE(None, PhysicalDevice, POINTER(PhysicalDeviceProperties)))
+define_lazy('FnGetPhysicalDeviceQueueFamilyProperties', lambda: FUNCTYPE(None, PhysicalDevice, POINTER(c_uint32), POINTER(QueueFamilyProperties)))
+define_lazy('FnGetPhysicalDeviceMemoryProperties', lambda: FUNCTYPE(None, PhysicalDevice, POINTER(PhysicalDeviceMemoryProperties)))
+define_lazy('FnGetInstanceProcAddr', lambda: FUNCTYPE(FnVoidFunction, Instance, c_char_p))
+define_lazy('FnGetDeviceProcAddr', lambda: FUNCTYPE(FnVoidFunction, Device, c_char_p))
+define_lazy('FnCreateDevice', lambda: FUNCTYPE(Result, PhysicalDevice, POINTER(DeviceCreateInfo), POINTER(AllocationCallbacks), array_pointer(Device, output=True)))
+define_lazy('FnDestroyDevice', lambda: FUNCTYPE(None, Device, POINTER(AllocationCallbacks)))
+define_lazy('FnEnumerateInstanceExtensionProperties', lambda: FUNCTYPE(Result, c_char_p, POINTER(c_uint32), POINTER(ExtensionProperties)))
+define_lazy('FnEnumerateDeviceExtensionProperties', lambda: FUNCTYPE(Result, PhysicalDevice, c_char_p, POINTER(c_uint32), POINTER(ExtensionProperties)))
+define_lazy('FnEnumerateInstanceLayerProperties', lambda: FUNCTYPE(Result, POINTER(c_uint32), POINTER(LayerProperties)))
+define_lazy('FnEnumerateDeviceLayerProperties', lambda: FUNCTYPE(Result, PhysicalDevice, POINTER(c_uint32), POINTER(LayerProperties)))
+define_lazy('FnGetDeviceQueue', lambda: FUNCTYPE(None, Device, c_uint32, c_uint32, array_pointer(Queue, output=True)))
+define_lazy('FnQueueSubmit', lambda: FUNCTYPE(Result, Queue, c_uint32, POINTER(SubmitInfo), Fence))
+define_lazy('FnQueueWaitIdle', lambda: FUNCTYPE(Result, Queue))
+define_lazy('FnDeviceWaitIdle', lambda: FUNCTYPE(Result, Device))
+define_lazy('FnAllocateMemory', lambda: FUNCTYPE(Result, Device, POINTER(MemoryAllocateInfo), POINTER(AllocationCallbacks), array_pointer(DeviceMemory, output=True)))
+define_lazy('FnFreeMemory', lambda: FUNCTYPE(None, Device, DeviceMemory, POINTER(AllocationCallbacks)))
+define_lazy('FnMapMemory', lambda: FUNCTYPE(Result, Device, DeviceMemory, DeviceSize, DeviceSize, MemoryMapFlags, POINTER(c_void_p)))
+define_lazy('FnUnmapMemory', lambda: FUNCTYPE(None, Device, DeviceMemory))
+define_lazy('FnFlushMappedMemoryRanges', lambda: FUNCTYPE(Result, Device, c_uint32, POINTER(MappedMemoryRange)))
+define_lazy('FnInvalidateMappedMemoryRanges', lambda: FUNCTYPE(Result, Device, c_uint32, POINTER(MappedMemoryRange)))
+define_lazy('FnGetDeviceMemoryCommitment', lambda: FUNCTYPE(None, Device, DeviceMemory, array_pointer(DeviceSize, output=True)))
+define_lazy('FnBindBufferMemory', lambda: FUNCTYPE(Result, Device, Buffer, DeviceMemory, DeviceSize))
+define_lazy('FnBindImageMemory', lambda: FUNCTYPE(Result, Device, Image, DeviceMemory, DeviceSize))
+define_lazy('FnGetBufferMemoryRequirements', lambda: FUNCTYPE(None, Device, Buffer, POINTER(MemoryRequirements)))
+define_lazy('FnGetImageMemoryRequirements', lambda: FUNCTYPE(None, Device, Image, POINTER(MemoryRequirements)))
+define_lazy('FnGetImageSparseMemoryRequirements', lambda: FUNCTYPE(None, Device, Image, POINTER(c_uint32), POINTER(SparseImageMemoryRequirements)))
+define_lazy('FnGetPhysicalDeviceSparseImageFormatProperties', lambda: FUNCTYPE(None, PhysicalDevice, Format, ImageType, SampleCountFlagBits, ImageUsageFlags, ImageTiling, POINTER(c_uint32), POINTER(SparseImageFormatProperties)))
+define_lazy('FnQueueBindSparse', lambda: FUNCTYPE(Result, Queue, c_uint32, POINTER(BindSparseInfo), Fence))
+define_lazy('FnCreateFence', lambda: FUNCTYPE(Result, Device, POINTER(FenceCreateInfo), POINTER(AllocationCallbacks), array_pointer(Fence, output=True)))
+define_lazy('FnDestroyFence', lambda: FUNCTYPE(None, Device, Fence, POINTER(AllocationCallbacks)))
+define_lazy('FnResetFences', lambda: FUNCTYPE(Result, Device, c_uint32, array_pointer(Fence)))
+define_lazy('FnGetFenceStatus', lambda: FUNCTYPE(Result, Device, Fence))
+define_lazy('FnWaitForFences', lambda: FUNCTYPE(Result, Device, c_uint32, array_pointer(Fence), Bool32, c_uint64))
+define_lazy('FnCreateSemaphore', lambda: FUNCTYPE(Result, Device, POINTER(SemaphoreCreateInfo), POINTER(AllocationCallbacks), array_pointer(Semaphore, output=True)))
+define_lazy('FnDestroySemaphore', lambda: FUNCTYPE(None, Device, Semaphore, POINTER(AllocationCallbacks)))
+define_lazy('FnCreateEvent', lambda: FUNCTYPE(Result, Device, POINTER(EventCreateInfo), POINTER(AllocationCallbacks), array_pointer(Event, output=True)))
+define_lazy('FnDestroyEvent', lambda: FUNCTYPE(None, Device, Event, POINTER(AllocationCallbacks)))
+define_lazy('FnGetEventStatus', lambda: FUNCTYPE(Result, Device, Event))
+define_lazy('FnSetEvent', lambda: FUNCTYPE(Result, Device, Event))
+define_lazy('FnResetEvent', lambda: FUNCTYPE(Result, Device, Event))
+define_lazy('FnCreateQueryPool', lambda: FUNCTYPE(Result, Device, POINTER(QueryPoolCreateInfo), POINTER(AllocationCallbacks), array_pointer(QueryPool, output=True)))
+define_lazy('FnDestroyQueryPool', lambda: FUNCTYPE(None, Device, QueryPool, POINTER(AllocationCallbacks)))
+define_lazy('FnGetQueryPoolResults', lambda: FUNCTYPE(Result, Device, QueryPool, c_uint32, c_uint32, c_size_t, output_void_pointer, DeviceSize, QueryResultFlags))
+define_lazy('FnCreateBuffer', lambda: FUNCTYPE(Result, Device, POINTER(BufferCreateInfo), POINTER(AllocationCallbacks), array_pointer(Buffer, output=True)))
+define_lazy('FnDestroyBuffer', lambda: FUNCTYPE(None, Device, Buffer, POINTER(AllocationCallbacks)))
+define_lazy('FnCreateBufferView', lambda: FUNCTYPE(Result, Device, POINTER(BufferViewCreateInfo), POINTER(AllocationCallbacks), array_pointer(BufferView, output=True)))
+define_lazy('FnDestroyBufferView', lambda: FUNCTYPE(None, Device, BufferView, POINTER(AllocationCallbacks)))
+define_lazy('FnCreateImage', lambda: FUNCTYPE(Result, Device, POINTER(ImageCreateInfo), POINTER(AllocationCallbacks), array_pointer(Image, output=True)))
+define_lazy('FnDestroyImage', lambda: FUNCTYPE(None, Device, Image, POINTER(AllocationCallbacks)))
+define_lazy('FnGetImageSubresourceLayout', lambda: FUNCTYPE(None, Device, Image, POINTER(ImageSubresource), POINTER(SubresourceLayout)))
+define_lazy('FnCreateImageView', lambda: FUNCTYPE(Result, Device, POINTER(ImageViewCreateInfo), POINTER(AllocationCallbacks), array_pointer(ImageView, output=True)))
+define_lazy('FnDestroyImageView', lambda: FUNCTYPE(None, Device, ImageView, POINTER(AllocationCallbacks)))
+define_lazy('FnCreateShaderModule', lambda: FUNCTYPE(Result, Device, POINTER(ShaderModuleCreateInfo), POINTER(AllocationCallbacks), array_pointer(ShaderModule, output=True)))
+define_lazy('FnDestroyShaderModule', lambda: FUNCTYPE(None, Device, ShaderModule, POINTER(AllocationCallbacks)))
+define_lazy('FnCreatePipelineCache', lambda: FUNCTYPE(Result, Device, POINTER(PipelineCacheCreateInfo), POINTER(AllocationCallbacks), array_pointer(PipelineCache, output=True)))
+define_lazy('FnDestroyPipelineCache', lambda: FUNCTYPE(None, Device, PipelineCache, POINTER(AllocationCallbacks)))
+define_lazy('FnGetPipelineCacheData', lambda: FUNCTYPE(Result, Device, PipelineCache, POINTER(c_size_t), output_void_pointer))
+define_lazy('FnMergePipelineCaches', lambda: FUNCTYPE(Result, Device, PipelineCache, c_uint32, array_pointer(PipelineCache)))
+define_lazy('FnCreateGraphicsPipelines', lambda: FUNCTYPE(Result, Device, PipelineCache, c_uint32, POINTER(GraphicsPipelineCreateInfo), POINTER(AllocationCallbacks), array_pointer(Pipeline, output=True)))
+define_lazy('FnCreateComputePipelines', lambda: FUNCTYPE(Result, Device, PipelineCache, c_uint32, POINTER(ComputePipelineCreateInfo), POINTER(AllocationCallbacks), array_pointer(Pipeline, output=True)))
+define_lazy('FnDestroyPipeline', lambda: FUNCTYPE(None, Device, Pipeline, POINTER(AllocationCallbacks)))
+define_lazy('FnCreatePipelineLayout', lambda: FUNCTYPE(Result, Device, POINTER(PipelineLayoutCreateInfo), POINTER(AllocationCallbacks), array_pointer(PipelineLayout, output=True)))
+define_lazy('FnDestroyPipelineLayout', lambda: FUNCTYPE(None, Device, PipelineLayout, POINTER(AllocationCallbacks)))
+define_lazy('FnCreateSampler', lambda: FUNCTYPE(Result, Device, POINTER(SamplerCreateInfo), POINTER(AllocationCallbacks), array_pointer(Sampler, output=True)))
+define_lazy('FnDestroySampler', lambda: FUNCTYPE(None, Device, Sampler, POINTER(AllocationCallbacks)))
+define_lazy('FnCreateDescriptorSetLayout', lambda: FUNCTYPE(Result, Device, POINTER(DescriptorSetLayoutCreateInfo), POINTER(AllocationCallbacks), array_pointer(DescriptorSetLayout, output=True)))
+define_lazy('FnDestroyDescriptorSetLayout', lambda: FUNCTYPE(None, Device, DescriptorSetLayout, POINTER(AllocationCallbacks)))
+define_lazy('FnCreateDescriptorPool', lambda: FUNCTYPE(Result, Device, POINTER(DescriptorPoolCreateInfo), POINTER(AllocationCallbacks), array_pointer(DescriptorPool, output=True)))
+define_lazy('FnDestroyDescriptorPool', lambda: FUNCTYPE(None, Device, DescriptorPool, POINTER(AllocationCallbacks)))
+define_lazy('FnResetDescriptorPool', lambda: FUNCTYPE(Result, Device, DescriptorPool, DescriptorPoolResetFlags))
+define_lazy('FnAllocateDescriptorSets', lambda: FUNCTYPE(Result, Device, POINTER(DescriptorSetAllocateInfo), array_pointer(DescriptorSet, output=True)))
+define_lazy('FnFreeDescriptorSets', lambda: FUNCTYPE(Result, Device, DescriptorPool, c_uint32, array_pointer(DescriptorSet)))
+define_lazy('FnUpdateDescriptorSets', lambda: FUNCTYPE(None, Device, c_uint32, POINTER(WriteDescriptorSet), c_uint32, POINTER(CopyDescriptorSet)))
+define_lazy('FnCreateFramebuffer', lambda: FUNCTYPE(Result, Device, POINTER(FramebufferCreateInfo), POINTER(AllocationCallbacks), array_pointer(Framebuffer, output=True)))
+define_lazy('FnDestroyFramebuffer', lambda: FUNCTYPE(None, Device, Framebuffer, POINTER(AllocationCallbacks)))
+define_lazy('FnCreateRenderPass', lambda: FUNCTYPE(Result, Device, POINTER(RenderPassCreateInfo), POINTER(AllocationCallbacks), array_pointer(RenderPass, output=True)))
+define_lazy('FnDestroyRenderPass', lambda: FUNCTYPE(None, Device, RenderPass, POINTER(AllocationCallbacks)))
+define_lazy('FnGetRenderAreaGranularity', lambda: FUNCTYPE(None, Device, RenderPass, POINTER(Extent2D)))
+define_lazy('FnCreateCommandPool', lambda: FUNCTYPE(Result, Device, POINTER(CommandPoolCreateInfo), POINTER(AllocationCallbacks), array_pointer(CommandPool, output=True)))
+define_lazy('FnDestroyCommandPool', lambda: FUNCTYPE(None, Device, CommandPool, POINTER(AllocationCallbacks)))
+define_lazy('FnResetCommandPool', lambda: FUNCTYPE(Result, Device, CommandPool, CommandPoolResetFlags))
+define_lazy('FnAllocateCommandBuffers', lambda: FUNCTYPE(Result, Device, POINTER(CommandBufferAllocateInfo), array_pointer(CommandBuffer, output=True)))
+define_lazy('FnFreeCommandBuffers', lambda: FUNCTYPE(None, Device, CommandPool, c_uint32, array_pointer(CommandBuffer)))
+define_lazy('FnBeginCommandBuffer', lambda: FUNCTYPE(Result, CommandBuffer, POINTER(CommandBufferBeginInfo)))
+define_lazy('FnEndCommandBuffer', lambda: FUNCTYPE(Result, CommandBuffer))
+define_lazy('FnResetCommandBuffer', lambda: FUNCTYPE(Result, CommandBuffer, CommandBufferResetFlags))
+define_lazy('FnCmdBindPipeline', lambda: FUNCTYPE(None, CommandBuffer, PipelineBindPoint, Pipeline))
+define_lazy('FnCmdSetViewport', lambda: FUNCTYPE(None, CommandBuffer, c_uint32, c_uint32, POINTER(Viewport)))
+define_lazy('FnCmdSetScissor', lambda: FUNCTYPE(None, CommandBuffer, c_uint32, c_uint32, POINTER(Rect2D)))
+define_lazy('FnCmdSetLineWidth', lambda: FUNCTYPE(None, CommandBuffer, c_float))
+define_lazy('FnCmdSetDepthBias', lambda: FUNCTYPE(None, CommandBuffer, c_float, c_float, c_float))
+define_lazy('FnCmdSetBlendConstants', lambda: FUNCTYPE(None, CommandBuffer))
+define_lazy('FnCmdSetDepthBounds', lambda: FUNCTYPE(None, CommandBuffer, c_float, c_float))
+define_lazy('FnCmdSetStencilCompareMask', lambda: FUNCTYPE(None, CommandBuffer, StencilFaceFlags, c_uint32))
+define_lazy('FnCmdSetStencilWriteMask', lambda: FUNCTYPE(None, CommandBuffer, StencilFaceFlags, c_uint32))
+define_lazy('FnCmdSetStencilReference', lambda: FUNCTYPE(None, CommandBuffer, StencilFaceFlags, c_uint32))
+define_lazy('FnCmdBindDescriptorSets', lambda: FUNCTYPE(None, CommandBuffer, PipelineBindPoint, PipelineLayout, c_uint32, c_uint32, array_pointer(DescriptorSet), c_uint32, POINTER(c_uint32)))
+define_lazy('FnCmdBindIndexBuffer', lambda: FUNCTYPE(None, CommandBuffer, Buffer, DeviceSize, IndexType))
+define_lazy('FnCmdBindVertexBuffers', lambda: FUNCTYPE(None, CommandBuffer, c_uint32, c_uint32, array_pointer(Buffer), array_pointer(DeviceSize)))
+define_lazy('FnCmdDraw', lambda: FUNCTYPE(None, CommandBuffer, c_uint32, c_uint32, c_uint32, c_uint32))
+define_lazy('FnCmdDrawIndexed', lambda: FUNCTYPE(None, CommandBuffer, c_uint32, c_uint32, c_uint32, c_int32, c_uint32))
+define_lazy('FnCmdDrawIndirect', lambda: FUNCTYPE(None, CommandBuffer, Buffer, DeviceSize, c_uint32, c_uint32))
+define_lazy('FnCmdDrawIndexedIndirect', lambda: FUNCTYPE(None, CommandBuffer, Buffer, DeviceSize, c_uint32, c_uint32))
+define_lazy('FnCmdDispatch', lambda: FUNCTYPE(None, CommandBuffer, c_uint32, c_uint32, c_uint32))
+define_lazy('FnCmdDispatchIndirect', lambda: FUNCTYPE(None, CommandBuffer, Buffer, DeviceSize))
+define_lazy('FnCmdCopyBuffer', lambda: FUNCTYPE(None, CommandBuffer, Buffer, Buffer, c_uint32, POINTER(BufferCopy)))
+define_lazy('FnCmdCopyImage', lambda: FUNCTYPE(None, CommandBuffer, Image, ImageLayout, Image, ImageLayout, c_uint32, POINTER(ImageCopy)))
+define_lazy('FnCmdBlitImage', lambda: FUNCTYPE(None, CommandBuffer, Image, ImageLayout, Image, ImageLayout, c_uint32, POINTER(ImageBlit), Filter))
+define_lazy('FnCmdCopyBufferToImage', lambda: FUNCTYPE(None, CommandBuffer, Buffer, Image, ImageLayout, c_uint32, POINTER(BufferImageCopy)))
+define_lazy('FnCmdCopyImageToBuffer', lambda: FUNCTYPE(None, CommandBuffer, Image, ImageLayout, Buffer, c_uint32, POINTER(BufferImageCopy)))
+define_lazy('FnCmdUpdateBuffer', lambda: FUNCTYPE(None, CommandBuffer, Buffer, DeviceSize, DeviceSize, void_pointer))
+define_lazy('FnCmdFillBuffer', lambda: FUNCTYPE(None, CommandBuffer, Buffer, DeviceSize, DeviceSize, c_uint32))
+define_lazy('FnCmdClearColorImage', lambda: FUNCTYPE(None, CommandBuffer, Image, ImageLayout, POINTER(ClearColorValue), c_uint32, POINTER(ImageSubresourceRange)))
+define_lazy('FnCmdClearDepthStencilImage', lambda: FUNCTYPE(None, CommandBuffer, Image, ImageLayout, POINTER(ClearDepthStencilValue), c_uint32, POINTER(ImageSubresourceRange)))
+define_lazy('FnCmdClearAttachments', lambda: FUNCTYPE(None, CommandBuffer, c_uint32, POINTER(ClearAttachment), c_uint32, POINTER(ClearRect)))
+define_lazy('FnCmdResolveImage', lambda: FUNCTYPE(None, CommandBuffer, Image, ImageLayout, Image, ImageLayout, c_uint32, POINTER(ImageResolve)))
+define_lazy('FnCmdSetEvent', lambda: FUNCTYPE(None, CommandBuffer, Event, PipelineStageFlags))
+define_lazy('FnCmdResetEvent', lambda: FUNCTYPE(None, CommandBuffer, Event, PipelineStageFlags))
+define_lazy('FnCmdWaitEvents', lambda: FUNCTYPE(None, CommandBuffer, c_uint32, array_pointer(Event), PipelineStageFlags, PipelineStageFlags, c_uint32, POINTER(MemoryBarrier), c_uint32, POINTER(BufferMemoryBarrier), c_uint32, POINTER(ImageMemoryBarrier)))
+define_lazy('FnCmdPipelineBarrier', lambda: FUNCTYPE(None, CommandBuffer, PipelineStageFlags, PipelineStageFlags, DependencyFlags, c_uint32, POINTER(MemoryBarrier), c_uint32, POINTER(BufferMemoryBarrier), c_uint32, POINTER(ImageMemoryBarrier)))
+define_lazy('FnCmdBeginQuery', lambda: FUNCTYPE(None, CommandBuffer, QueryPool, c_uint32, QueryControlFlags))
+define_lazy('FnCmdEndQuery', lambda: FUNCTYPE(None, CommandBuffer, QueryPool, c_uint32))
+define_lazy('FnCmdResetQueryPool', lambda: FUNCTYPE(None, CommandBuffer, QueryPool, c_uint32, c_uint32))
+define_lazy('FnCmdWriteTimestamp', lambda: FUNCTYPE(None, CommandBuffer, PipelineStageFlagBits, QueryPool, c_uint32))
+define_lazy('FnCmdCopyQueryPoolResults', lambda: FUNCTYPE(None, CommandBuffer, QueryPool, c_uint32, c_uint32, Buffer, DeviceSize, DeviceSize, QueryResultFlags))
+define_lazy('FnCmdPushConstants', lambda: FUNCTYPE(None, CommandBuffer, PipelineLayout, ShaderStageFlags, c_uint32, c_uint32, void_pointer))
+define_lazy('FnCmdBeginRenderPass', lambda: FUNCTYPE(None, CommandBuffer, POINTER(RenderPassBeginInfo), SubpassContents))
+define_lazy('FnCmdNextSubpass', lambda: FUNCTYPE(None, CommandBuffer, SubpassContents))
+define_lazy('FnCmdEndRenderPass', lambda: FUNCTYPE(None, CommandBuffer))
+define_lazy('FnCmdExecuteCommands', lambda: FUNCTYPE(None, CommandBuffer, c_uint32, array_pointer(CommandBuffer)))
+define_lazy('FnEnumerateInstanceVersion', lambda: FUNCTYPE(Result, POINTER(c_uint32)))
+define_lazy('FnBindBufferMemory2', lambda: FUNCTYPE(Result, Device, c_uint32, POINTER(BindBufferMemoryInfo)))
+define_lazy('FnBindImageMemory2', lambda: FUNCTYPE(Result, Device, c_uint32, POINTER(BindImageMemoryInfo)))
+define_lazy('FnGetDeviceGroupPeerMemoryFeatures', lambda: FUNCTYPE(None, Device, c_uint32, c_uint32, c_uint32, POINTER(PeerMemoryFeatureFlags)))
+define_lazy('FnCmdSetDeviceMask', lambda: FUNCTYPE(None, CommandBuffer, c_uint32))
+define_lazy('FnCmdDispatchBase', lambda: FUNCTYPE(None, CommandBuffer, c_uint32, c_uint32, c_uint32, c_uint32, c_uint32, c_uint32))
+define_lazy('FnEnumeratePhysicalDeviceGroups', lambda: FUNCTYPE(Result, Instance, POINTER(c_uint32), POINTER(PhysicalDeviceGroupProperties)))
+define_lazy('FnGetImageMemoryRequirements2', lambda: FUNCTYPE(None, Device, POINTER(ImageMemoryRequirementsInfo2), POINTER(MemoryRequirements2)))
+define_lazy('FnGetBufferMemoryRequirements2', lambda: FUNCTYPE(None, Device, POINTER(BufferMemoryRequirementsInfo2), POINTER(MemoryRequirements2)))
+define_lazy('FnGetImageSparseMemoryRequirements2', lambda: FUNCTYPE(None, Device, POINTER(ImageSparseMemoryRequirementsInfo2), POINTER(c_uint32), POINTER(SparseImageMemoryRequirements2)))
+define_lazy('FnGetPhysicalDeviceFeatures2', lambda: FUNCTYPE(None, PhysicalDevice, POINTER(PhysicalDeviceFeatures2)))
+define_lazy('FnGetPhysicalDeviceProperties2', lambda: FUNCTYPE(None, PhysicalDevice, POINTER(PhysicalDeviceProperties2)))
+define_lazy('FnGetPhysicalDeviceFormatProperties2', lambda: FUNCTYPE(None, PhysicalDevice, Format, POINTER(FormatProperties2)))
+define_lazy('FnGetPhysicalDeviceImageFormatProperties2', lambda: FUNCTYPE(Result, PhysicalDevice, POINTER(PhysicalDeviceImageFormatInfo2), POINTER(ImageFormatProperties2)))
+define_lazy('FnGetPhysicalDeviceQueueFamilyProperties2', lambda: FUNCTYPE(None, PhysicalDevice, POINTER(c_uint32), POINTER(QueueFamilyProperties2)))
+define_lazy('FnGetPhysicalDeviceMemoryProperties2', lambda: FUNCTYPE(None, PhysicalDevice, POINTER(PhysicalDeviceMemoryProperties2)))
+define_lazy('FnGetPhysicalDeviceSparseImageFormatProperties2', lambda: FUNCTYPE(None, PhysicalDevice, POINTER(PhysicalDeviceSparseImageFormatInfo2), POINTER(c_uint32), POINTER(SparseImageFormatProperties2)))
+define_lazy('FnTrimCommandPool', lambda: FUNCTYPE(None, Device, CommandPool, CommandPoolTrimFlags))
+define_lazy('FnGetDeviceQueue2', lambda: FUNCTYPE(None, Device, POINTER(DeviceQueueInfo2), array_pointer(Queue, output=True)))
+define_lazy('FnCreateSamplerYcbcrConversion', lambda: FUNCTYPE(Result, Device, POINTER(SamplerYcbcrConversionCreateInfo), POINTER(AllocationCallbacks), array_pointer(SamplerYcbcrConversion, output=True)))
+define_lazy('FnDestroySamplerYcbcrConversion', lambda: FUNCTYPE(None, Device, SamplerYcbcrConversion, POINTER(AllocationCallbacks)))
+define_lazy('FnCreateDescriptorUpdateTemplate', lambda: FUNCTYPE(Result, Device, POINTER(DescriptorUpdateTemplateCreateInfo), POINTER(AllocationCallbacks), array_pointer(DescriptorUpdateTemplate, output=True)))
+define_lazy('FnDestroyDescriptorUpdateTemplate', lambda: FUNCTYPE(None, Device, DescriptorUpdateTemplate, POINTER(AllocationCallbacks)))
+define_lazy('FnUpdateDescriptorSetWithTemplate', lambda: FUNCTYPE(None, Device, DescriptorSet, DescriptorUpdateTemplate, void_pointer))
+define_lazy('FnGetPhysicalDeviceExternalBufferProperties', lambda: FUNCTYPE(None, PhysicalDevice, POINTER(PhysicalDeviceExternalBufferInfo), POINTER(ExternalBufferProperties)))
+define_lazy('FnGetPhysicalDeviceExternalFenceProperties', lambda: FUNCTYPE(None, PhysicalDevice, POINTER(PhysicalDeviceExternalFenceInfo), POINTER(ExternalFenceProperties)))
+define_lazy('FnGetPhysicalDeviceExternalSemaphoreProperties', lambda: FUNCTYPE(None, PhysicalDevice, POINTER(PhysicalDeviceExternalSemaphoreInfo), POINTER(ExternalSemaphoreProperties)))
+define_lazy('FnGetDescriptorSetLayoutSupport', lambda: FUNCTYPE(None, Device, POINTER(DescriptorSetLayoutCreateInfo), POINTER(DescriptorSetLayoutSupport)))
+define_lazy('FnDestroySurfaceKHR', lambda: FUNCTYPE(None, Instance, SurfaceKHR, POINTER(AllocationCallbacks)))
+define_lazy('FnGetPhysicalDeviceSurfaceSupportKHR', lambda: FUNCTYPE(Result, PhysicalDevice, c_uint32, SurfaceKHR, POINTER(Bool32)))
+define_lazy('FnGetPhysicalDeviceSurfaceCapabilitiesKHR', lambda: FUNCTYPE(Result, PhysicalDevice, SurfaceKHR, POINTER(SurfaceCapabilitiesKHR)))
+define_lazy('FnGetPhysicalDeviceSurfaceFormatsKHR', lambda: FUNCTYPE(Result, PhysicalDevice, SurfaceKHR, POINTER(c_uint32), POINTER(SurfaceFormatKHR)))
+define_lazy('FnGetPhysicalDeviceSurfacePresentModesKHR', lambda: FUNCTYPE(Result, PhysicalDevice, SurfaceKHR, POINTER(c_uint32), POINTER(PresentModeKHR)))
+define_lazy('FnCreateSwapchainKHR', lambda: FUNCTYPE(Result, Device, POINTER(SwapchainCreateInfoKHR), POINTER(AllocationCallbacks), array_pointer(SwapchainKHR, output=True)))
+define_lazy('FnDestroySwapchainKHR', lambda: FUNCTYPE(None, Device, SwapchainKHR, POINTER(AllocationCallbacks)))
+define_lazy('FnGetSwapchainImagesKHR', lambda: FUNCTYPE(Result, Device, SwapchainKHR, POINTER(c_uint32), array_pointer(Image, output=True)))
+define_lazy('FnAcquireNextImageKHR', lambda: FUNCTYPE(Result, Device, SwapchainKHR, c_uint64, Semaphore, Fence, POINTER(c_uint32)))
+define_lazy('FnQueuePresentKHR', lambda: FUNCTYPE(Result, Queue, POINTER(PresentInfoKHR)))
+define_lazy('FnGetDeviceGroupPresentCapabilitiesKHR', lambda: FUNCTYPE(Result, Device, POINTER(DeviceGroupPresentCapabilitiesKHR)))
+define_lazy('FnGetDeviceGroupSurfacePresentModesKHR', lambda: FUNCTYPE(Result, Device, SurfaceKHR, POINTER(DeviceGroupPresentModeFlagsKHR)))
+define_lazy('FnGetPhysicalDevicePresentRectanglesKHR', lambda: FUNCTYPE(Result, PhysicalDevice, SurfaceKHR, POINTER(c_uint32), POINTER(Rect2D)))
+define_lazy('FnAcquireNextImage2KHR', lambda: FUNCTYPE(Result, Device, POINTER(AcquireNextImageInfoKHR), POINTER(c_uint32)))
+define_lazy('FnGetPhysicalDeviceDisplayPropertiesKHR', lambda: FUNCTYPE(Result, PhysicalDevice, POINTER(c_uint32), POINTER(DisplayPropertiesKHR)))
+define_lazy('FnGetPhysicalDeviceDisplayPlanePropertiesKHR', lambda: FUNCTYPE(Result, PhysicalDevice, POINTER(c_uint32), POINTER(DisplayPlanePropertiesKHR)))
+define_lazy('FnGetDisplayPlaneSupportedDisplaysKHR', lambda: FUNCTYPE(Result, PhysicalDevice, c_uint32, POINTER(c_uint32), array_pointer(DisplayKHR, output=True)))
+define_lazy('FnGetDisplayModePropertiesKHR', lambda: FUNCTYPE(Result, PhysicalDevice, DisplayKHR, POINTER(c_uint32), POINTER(DisplayModePropertiesKHR)))
+define_lazy('FnCreateDisplayModeKHR', lambda: FUNCTYPE(Result, PhysicalDevice, DisplayKHR, POINTER(DisplayModeCreateInfoKHR), POINTER(AllocationCallbacks), array_pointer(DisplayModeKHR, output=True)))
+define_lazy('FnGetDisplayPlaneCapabilitiesKHR', lambda: FUNCTYPE(Result, PhysicalDevice, DisplayModeKHR, c_uint32, POINTER(DisplayPlaneCapabilitiesKHR)))
+define_lazy('FnCreateDisplayPlaneSurfaceKHR', lambda: FUNCTYPE(Result, Instance, POINTER(DisplaySurfaceCreateInfoKHR), POINTER(AllocationCallbacks), array_pointer(SurfaceKHR, output=True)))
+define_lazy('FnCreateSharedSwapchainsKHR', lambda: FUNCTYPE(Result, Device, c_uint32, POINTER(SwapchainCreateInfoKHR), POINTER(AllocationCallbacks), array_pointer(SwapchainKHR, output=True)))
+define_lazy('FnGetPhysicalDeviceFeatures2KHR', lambda: FUNCTYPE(None, PhysicalDevice, POINTER(PhysicalDeviceFeatures2)))
+define_lazy('FnGetPhysicalDeviceProperties2KHR', lambda: FUNCTYPE(None, PhysicalDevice, POINTER(PhysicalDeviceProperties2)))
+define_lazy('FnGetPhysicalDeviceFormatProperties2KHR', lambda: FUNCTYPE(None, PhysicalDevice, Format, POINTER(FormatProperties2)))
+define_lazy('FnGetPhysicalDeviceImageFormatProperties2KHR', lambda: FUNCTYPE(Result, PhysicalDevice, POINTER(PhysicalDeviceImageFormatInfo2), POINTER(ImageFormatProperties2)))
+define_lazy('FnGetPhysicalDeviceQueueFamilyProperties2KHR', lambda: FUNCTYPE(None, PhysicalDevice, POINTER(c_uint32), POINTER(QueueFamilyProperties2)))
+define_lazy('FnGetPhysicalDeviceMemoryProperties2KHR', lambda: FUNCTYPE(None, PhysicalDevice, POINTER(PhysicalDeviceMemoryProperties2)))
+define_lazy('FnGetPhysicalDeviceSparseImageFormatProperties2KHR', lambda: FUNCTYPE(None, PhysicalDevice, POINTER(PhysicalDeviceSparseImageFormatInfo2), POINTER(c_uint32), POINTER(SparseImageFormatProperties2)))
+define_lazy('FnGetDeviceGroupPeerMemoryFeaturesKHR', lambda: FUNCTYPE(None, Device, c_uint32, c_uint32, c_uint32, POINTER(PeerMemoryFeatureFlags)))
+define_lazy('FnCmdSetDeviceMaskKHR', lambda: FUNCTYPE(None, CommandBuffer, c_uint32))
+define_lazy('FnCmdDispatchBaseKHR', lambda: FUNCTYPE(None, CommandBuffer, c_uint32, c_uint32, c_uint32, c_uint32, c_uint32, c_uint32))
+define_lazy('FnTrimCommandPoolKHR', lambda: FUNCTYPE(None, Device, CommandPool, CommandPoolTrimFlags))
+define_lazy('FnEnumeratePhysicalDeviceGroupsKHR', lambda: FUNCTYPE(Result, Instance, POINTER(c_uint32), POINTER(PhysicalDeviceGroupProperties)))
+define_lazy('FnGetPhysicalDeviceExternalBufferPropertiesKHR', lambda: FUNCTYPE(None, PhysicalDevice, POINTER(PhysicalDeviceExternalBufferInfo), POINTER(ExternalBufferProperties)))
+define_lazy('FnGetMemoryFdKHR', lambda: FUNCTYPE(Result, Device, POINTER(MemoryGetFdInfoKHR), POINTER(c_int32)))
+define_lazy('FnGetMemoryFdPropertiesKHR', lambda: FUNCTYPE(Result, Device, ExternalMemoryHandleTypeFlagBits, c_int32, POINTER(MemoryFdPropertiesKHR)))
+define_lazy('FnGetPhysicalDeviceExternalSemaphorePropertiesKHR', lambda: FUNCTYPE(None, PhysicalDevice, POINTER(PhysicalDeviceExternalSemaphoreInfo), POINTER(ExternalSemaphoreProperties)))
+define_lazy('FnImportSemaphoreFdKHR', lambda: FUNCTYPE(Result, Device, POINTER(ImportSemaphoreFdInfoKHR)))
+define_lazy('FnGetSemaphoreFdKHR', lambda: FUNCTYPE(Result, Device, POINTER(SemaphoreGetFdInfoKHR), POINTER(c_int32)))
+define_lazy('FnCmdPushDescriptorSetKHR', lambda: FUNCTYPE(None, CommandBuffer, PipelineBindPoint, PipelineLayout, c_uint32, c_uint32, POINTER(WriteDescriptorSet)))
+define_lazy('FnCmdPushDescriptorSetWithTemplateKHR', lambda: FUNCTYPE(None, CommandBuffer, DescriptorUpdateTemplate, PipelineLayout, c_uint32, void_pointer))
+define_lazy('FnCreateDescriptorUpdateTemplateKHR', lambda: FUNCTYPE(Result, Device, POINTER(DescriptorUpdateTemplateCreateInfo), POINTER(AllocationCallbacks), array_pointer(DescriptorUpdateTemplate, output=True)))
+define_lazy('FnDestroyDescriptorUpdateTemplateKHR', lambda: FUNCTYPE(None, Device, DescriptorUpdateTemplate, POINTER(AllocationCallbacks)))
+define_lazy('FnUpdateDescriptorSetWithTemplateKHR', lambda: FUNCTYPE(None, Device, DescriptorSet, DescriptorUpdateTemplate, output_void_pointer))
+define_lazy('FnCreateRenderPass2KHR', lambda: FUNCTYPE(Result, Device, POINTER(RenderPassCreateInfo2KHR), POINTER(AllocationCallbacks), array_pointer(RenderPass, output=True)))
+define_lazy('FnCmdBeginRenderPass2KHR', lambda: FUNCTYPE(None, CommandBuffer, POINTER(RenderPassBeginInfo), POINTER(SubpassBeginInfoKHR)))
+define_lazy('FnCmdNextSubpass2KHR', lambda: FUNCTYPE(None, CommandBuffer, POINTER(SubpassBeginInfoKHR), POINTER(SubpassEndInfoKHR)))
+define_lazy('FnCmdEndRenderPass2KHR', lambda: FUNCTYPE(None, CommandBuffer, POINTER(SubpassEndInfoKHR)))
+define_lazy('FnGetSwapchainStatusKHR', lambda: FUNCTYPE(Result, Device, SwapchainKHR))
+define_lazy('FnGetPhysicalDeviceExternalFencePropertiesKHR', lambda: FUNCTYPE(None, PhysicalDevice, POINTER(PhysicalDeviceExternalFenceInfo), POINTER(ExternalFenceProperties)))
+define_lazy('FnImportFenceFdKHR', lambda: FUNCTYPE(Result, Device, POINTER(ImportFenceFdInfoKHR)))
+define_lazy('FnGetFenceFdKHR', lambda: FUNCTYPE(Result, Device, POINTER(FenceGetFdInfoKHR), POINTER(c_int32)))
+define_lazy('FnGetPhysicalDeviceSurfaceCapabilities2KHR', lambda: FUNCTYPE(Result, PhysicalDevice, POINTER(PhysicalDeviceSurfaceInfo2KHR), POINTER(SurfaceCapabilities2KHR)))
+define_lazy('FnGetPhysicalDeviceSurfaceFormats2KHR', lambda: FUNCTYPE(Result, PhysicalDevice, POINTER(PhysicalDeviceSurfaceInfo2KHR), POINTER(c_uint32), POINTER(SurfaceFormat2KHR)))
+define_lazy('FnGetPhysicalDeviceDisplayProperties2KHR', lambda: FUNCTYPE(Result, PhysicalDevice, POINTER(c_uint32), POINTER(DisplayProperties2KHR)))
+define_lazy('FnGetPhysicalDeviceDisplayPlaneProperties2KHR', lambda: FUNCTYPE(Result, PhysicalDevice, POINTER(c_uint32), POINTER(DisplayPlaneProperties2KHR)))
+define_lazy('FnGetDisplayModeProperties2KHR', lambda: FUNCTYPE(Result, PhysicalDevice, DisplayKHR, POINTER(c_uint32), POINTER(DisplayModeProperties2KHR)))
+define_lazy('FnGetDisplayPlaneCapabilities2KHR', lambda: FUNCTYPE(Result, PhysicalDevice, POINTER(DisplayPlaneInfo2KHR), POINTER(DisplayPlaneCapabilities2KHR)))
+define_lazy('FnGetImageMemoryRequirements2KHR', lambda: FUNCTYPE(None, Device, POINTER(ImageMemoryRequirementsInfo2), POINTER(MemoryRequirements2)))
+define_lazy('FnGetBufferMemoryRequirements2KHR', lambda: FUNCTYPE(None, Device, POINTER(BufferMemoryRequirementsInfo2), POINTER(MemoryRequirements2)))
+define_lazy('FnGetImageSparseMemoryRequirements2KHR', lambda: FUNCTYPE(None, Device, POINTER(ImageSparseMemoryRequirementsInfo2), POINTER(c_uint32), POINTER(SparseImageMemoryRequirements2)))
+define_lazy('FnCreateSamplerYcbcrConversionKHR', lambda: FUNCTYPE(Result, Device, POINTER(SamplerYcbcrConversionCreateInfo), POINTER(AllocationCallbacks), array_pointer(SamplerYcbcrConversion, output=True)))
+define_lazy('FnDestroySamplerYcbcrConversionKHR', lambda: FUNCTYPE(None, Device, SamplerYcbcrConversion, POINTER(AllocationCallbacks)))
+define_lazy('FnBindBufferMemory2KHR', lambda: FUNCTYPE(Result, Device, c_uint32, POINTER(BindBufferMemoryInfo)))
+define_lazy('FnBindImageMemory2KHR', lambda: FUNCTYPE(Result, Device, c_uint32, POINTER(BindImageMemoryInfo)))
+define_lazy('FnGetDescriptorSetLayoutSupportKHR', lambda: FUNCTYPE(None, Device, POINTER(DescriptorSetLayoutCreateInfo), POINTER(DescriptorSetLayoutSupport)))
+define_lazy('FnCmdDrawIndirectCountKHR', lambda: FUNCTYPE(None, CommandBuffer, Buffer, DeviceSize, Buffer, DeviceSize, c_uint32, c_uint32))
+define_lazy('FnCmdDrawIndexedIndirectCountKHR', lambda: FUNCTYPE(None, CommandBuffer, Buffer, DeviceSize, Buffer, DeviceSize, c_uint32, c_uint32))
+define_lazy('FnCreateDebugReportCallbackEXT', lambda: FUNCTYPE(Result, Instance, POINTER(DebugReportCallbackCreateInfoEXT), POINTER(AllocationCallbacks), array_pointer(DebugReportCallbackEXT, output=True)))
+define_lazy('FnDestroyDebugReportCallbackEXT', lambda: FUNCTYPE(None, Instance, DebugReportCallbackEXT, POINTER(AllocationCallbacks)))
+define_lazy('FnDebugReportMessageEXT', lambda: FUNCTYPE(None, Instance, DebugReportFlagsEXT, DebugReportObjectTypeEXT, c_uint64, c_size_t, c_int32, c_char_p, c_char_p))
+define_lazy('FnDebugMarkerSetObjectTagEXT', lambda: FUNCTYPE(Result, Device, POINTER(DebugMarkerObjectTagInfoEXT)))
+define_lazy('FnDebugMarkerSetObjectNameEXT', lambda: FUNCTYPE(Result, Device, POINTER(DebugMarkerObjectNameInfoEXT)))
+define_lazy('FnCmdDebugMarkerBeginEXT', lambda: FUNCTYPE(None, CommandBuffer, POINTER(DebugMarkerMarkerInfoEXT)))
+define_lazy('FnCmdDebugMarkerEndEXT', lambda: FUNCTYPE(None, CommandBuffer))
+define_lazy('FnCmdDebugMarkerInsertEXT', lambda: FUNCTYPE(None, CommandBuffer, POINTER(DebugMarkerMarkerInfoEXT)))
+define_lazy('FnCmdBindTransformFeedbackBuffersEXT', lambda: FUNCTYPE(None, CommandBuffer, c_uint32, c_uint32, array_pointer(Buffer), array_pointer(DeviceSize), array_pointer(DeviceSize)))
+define_lazy('FnCmdBeginTransformFeedbackEXT', lambda: FUNCTYPE(None, CommandBuffer, c_uint32, c_uint32, array_pointer(Buffer), array_pointer(DeviceSize)))
+define_lazy('FnCmdEndTransformFeedbackEXT', lambda: FUNCTYPE(None, CommandBuffer, c_uint32, c_uint32, array_pointer(Buffer), array_pointer(DeviceSize)))
+define_lazy('FnCmdBeginQueryIndexedEXT', lambda: FUNCTYPE(None, CommandBuffer, QueryPool, c_uint32, QueryControlFlags, c_uint32))
+define_lazy('FnCmdEndQueryIndexedEXT', lambda: FUNCTYPE(None, CommandBuffer, QueryPool, c_uint32, c_uint32))
+define_lazy('FnCmdDrawIndirectByteCountEXT', lambda: FUNCTYPE(None, CommandBuffer, c_uint32, c_uint32, Buffer, DeviceSize, c_uint32, c_uint32))
+define_lazy('FnCmdDrawIndirectCountAMD', lambda: FUNCTYPE(None, CommandBuffer, Buffer, DeviceSize, Buffer, DeviceSize, c_uint32, c_uint32))
+define_lazy('FnCmdDrawIndexedIndirectCountAMD', lambda: FUNCTYPE(None, CommandBuffer, Buffer, DeviceSize, Buffer, DeviceSize, c_uint32, c_uint32))
+define_lazy('FnGetShaderInfoAMD', lambda: FUNCTYPE(Result, Device, Pipeline, ShaderStageFlagBits, ShaderInfoTypeAMD, POINTER(c_size_t), output_void_pointer))
+define_lazy('FnGetPhysicalDeviceExternalImageFormatPropertiesNV', lambda: FUNCTYPE(Result, PhysicalDevice, Format, ImageType, ImageTiling, ImageUsageFlags, ImageCreateFlags, ExternalMemoryHandleTypeFlagsNV, POINTER(ExternalImageFormatPropertiesNV)))
+define_lazy('FnCmdBeginConditionalRenderingEXT', lambda: FUNCTYPE(None, CommandBuffer, POINTER(ConditionalRenderingBeginInfoEXT)))
+define_lazy('FnCmdEndConditionalRenderingEXT', lambda: FUNCTYPE(None, CommandBuffer))
+define_lazy('FnCmdProcessCommandsNVX', lambda: FUNCTYPE(None, CommandBuffer, POINTER(CmdProcessCommandsInfoNVX)))
+define_lazy('FnCmdReserveSpaceForCommandsNVX', lambda: FUNCTYPE(None, CommandBuffer, POINTER(CmdReserveSpaceForCommandsInfoNVX)))
+define_lazy('FnCreateIndirectCommandsLayoutNVX', lambda: FUNCTYPE(Result, Device, POINTER(IndirectCommandsLayoutCreateInfoNVX), POINTER(AllocationCallbacks), array_pointer(IndirectCommandsLayoutNVX, output=True)))
+define_lazy('FnDestroyIndirectCommandsLayoutNVX', lambda: FUNCTYPE(None, Device, IndirectCommandsLayoutNVX, POINTER(AllocationCallbacks)))
+define_lazy('FnCreateObjectTableNVX', lambda: FUNCTYPE(Result, Device, POINTER(ObjectTableCreateInfoNVX), POINTER(AllocationCallbacks), array_pointer(ObjectTableNVX, output=True)))
+define_lazy('FnDestroyObjectTableNVX', lambda: FUNCTYPE(None, Device, ObjectTableNVX, POINTER(AllocationCallbacks)))
+define_lazy('FnRegisterObjectsNVX', lambda: FUNCTYPE(Result, Device, ObjectTableNVX, c_uint32, POINTER(POINTER(ObjectTableEntryNVX)), POINTER(c_uint32)))
+define_lazy('FnUnregisterObjectsNVX', lambda: FUNCTYPE(Result, Device, ObjectTableNVX, c_uint32, POINTER(ObjectEntryTypeNVX), POINTER(c_uint32)))
+define_lazy('FnGetPhysicalDeviceGeneratedCommandsPropertiesNVX', lambda: FUNCTYPE(None, PhysicalDevice, POINTER(DeviceGeneratedCommandsFeaturesNVX), POINTER(DeviceGeneratedCommandsLimitsNVX)))
+define_lazy('FnCmdSetViewportWScalingNV', lambda: FUNCTYPE(None, CommandBuffer, c_uint32, c_uint32, POINTER(ViewportWScalingNV)))
+define_lazy('FnReleaseDisplayEXT', lambda: FUNCTYPE(Result, PhysicalDevice, DisplayKHR))
+define_lazy('FnGetPhysicalDeviceSurfaceCapabilities2EXT', lambda: FUNCTYPE(Result, PhysicalDevice, SurfaceKHR, POINTER(SurfaceCapabilities2EXT)))
+define_lazy('FnDisplayPowerControlEXT', lambda: FUNCTYPE(Result, Device, DisplayKHR, POINTER(DisplayPowerInfoEXT)))
+define_lazy('FnRegisterDeviceEventEXT', lambda: FUNCTYPE(Result, Device, POINTER(DeviceEventInfoEXT), POINTER(AllocationCallbacks), array_pointer(Fence, output=True)))
+define_lazy('FnRegisterDisplayEventEXT', lambda: FUNCTYPE(Result, Device, DisplayKHR, POINTER(DisplayEventInfoEXT), POINTER(AllocationCallbacks), array_pointer(Fence, output=True)))
+define_lazy('FnGetSwapchainCounterEXT', lambda: FUNCTYPE(Result, Device, SwapchainKHR, SurfaceCounterFlagBitsEXT, POINTER(c_uint64)))
+define_lazy('FnGetRefreshCycleDurationGOOGLE', lambda: FUNCTYPE(Result, Device, SwapchainKHR, POINTER(RefreshCycleDurationGOOGLE)))
+define_lazy('FnGetPastPresentationTimingGOOGLE', lambda: FUNCTYPE(Result, Device, SwapchainKHR, POINTER(c_uint32), POINTER(PastPresentationTimingGOOGLE)))
+define_lazy('FnCmdSetDiscardRectangleEXT', lambda: FUNCTYPE(None, CommandBuffer, c_uint32, c_uint32, POINTER(Rect2D)))
+define_lazy('FnSetHdrMetadataEXT', lambda: FUNCTYPE(None, Device, c_uint32, array_pointer(SwapchainKHR), POINTER(HdrMetadataEXT)))
+define_lazy('FnDebugUtilsMessengerCallbackEXT', lambda: FUNCTYPE(Bool32, DebugUtilsMessageSeverityFlagBitsEXT, DebugUtilsMessageTypeFlagsEXT, POINTER(DebugUtilsMessengerCallbackDataEXT), c_void_p))
+define_lazy('FnSetDebugUtilsObjectNameEXT', lambda: FUNCTYPE(Result, Device, POINTER(DebugUtilsObjectNameInfoEXT)))
+define_lazy('FnSetDebugUtilsObjectTagEXT', lambda: FUNCTYPE(Result, Device, POINTER(DebugUtilsObjectTagInfoEXT)))
+define_lazy('FnQueueBeginDebugUtilsLabelEXT', lambda: FUNCTYPE(None, Queue, POINTER(DebugUtilsLabelEXT)))
+define_lazy('FnQueueEndDebugUtilsLabelEXT', lambda: FUNCTYPE(None, Queue))
+define_lazy('FnQueueInsertDebugUtilsLabelEXT', lambda: FUNCTYPE(None, Queue, POINTER(DebugUtilsLabelEXT)))
+define_lazy('FnCmdBeginDebugUtilsLabelEXT', lambda: FUNCTYPE(None, CommandBuffer, POINTER(DebugUtilsLabelEXT)))
+define_lazy('FnCmdEndDebugUtilsLabelEXT', lambda: FUNCTYPE(None, CommandBuffer))
+define_lazy('FnCmdInsertDebugUtilsLabelEXT', lambda: FUNCTYPE(None, CommandBuffer, POINTER(DebugUtilsLabelEXT)))
+define_lazy('FnCreateDebugUtilsMessengerEXT', lambda: FUNCTYPE(Result, Instance, POINTER(DebugUtilsMessengerCreateInfoEXT), POINTER(AllocationCallbacks), array_pointer(DebugUtilsMessengerEXT, output=True)))
+define_lazy('FnDestroyDebugUtilsMessengerEXT', lambda: FUNCTYPE(None, Instance, DebugUtilsMessengerEXT, POINTER(AllocationCallbacks)))
+define_lazy('FnSubmitDebugUtilsMessageEXT', lambda: FUNCTYPE(None, Instance, DebugUtilsMessageSeverityFlagBitsEXT, DebugUtilsMessageTypeFlagsEXT, POINTER(DebugUtilsMessengerCallbackDataEXT)))
+define_lazy('FnCmdSetSampleLocationsEXT', lambda: FUNCTYPE(None, CommandBuffer, POINTER(SampleLocationsInfoEXT)))
+define_lazy('FnGetPhysicalDeviceMultisamplePropertiesEXT', lambda: FUNCTYPE(None, PhysicalDevice, SampleCountFlagBits, POINTER(MultisamplePropertiesEXT)))
+define_lazy('FnGetImageDrmFormatModifierPropertiesEXT', lambda: FUNCTYPE(Result, Device, Image, POINTER(ImageDrmFormatModifierPropertiesEXT)))
+define_lazy('FnCreateValidationCacheEXT', lambda: FUNCTYPE(Result, Device, POINTER(ValidationCacheCreateInfoEXT), POINTER(AllocationCallbacks), array_pointer(ValidationCacheEXT, output=True)))
+define_lazy('FnDestroyValidationCacheEXT', lambda: FUNCTYPE(None, Device, ValidationCacheEXT, POINTER(AllocationCallbacks)))
+define_lazy('FnMergeValidationCachesEXT', lambda: FUNCTYPE(Result, Device, ValidationCacheEXT, c_uint32, array_pointer(ValidationCacheEXT)))
+define_lazy('FnGetValidationCacheDataEXT', lambda: FUNCTYPE(Result, Device, ValidationCacheEXT, POINTER(c_size_t), output_void_pointer))
+define_lazy('FnCmdBindShadingRateImageNV', lambda: FUNCTYPE(None, CommandBuffer, ImageView, ImageLayout))
+define_lazy('FnCmdSetViewportShadingRatePaletteNV', lambda: FUNCTYPE(None, CommandBuffer, c_uint32, c_uint32, POINTER(ShadingRatePaletteNV)))
+define_lazy('FnCmdSetCoarseSampleOrderNV', lambda: FUNCTYPE(None, CommandBuffer, CoarseSampleOrderTypeNV, c_uint32, POINTER(CoarseSampleOrderCustomNV)))
+define_lazy('FnCreateAccelerationStructureNV', lambda: FUNCTYPE(Result, Device, POINTER(AccelerationStructureCreateInfoNV), POINTER(AllocationCallbacks), array_pointer(AccelerationStructureNV, output=True)))
+define_lazy('FnDestroyAccelerationStructureNV', lambda: FUNCTYPE(None, Device, AccelerationStructureNV, POINTER(AllocationCallbacks)))
+define_lazy('FnGetAccelerationStructureMemoryRequirementsNV', lambda: FUNCTYPE(None, Device, POINTER(AccelerationStructureMemoryRequirementsInfoNV), POINTER(MemoryRequirements2KHR)))
+define_lazy('FnBindAccelerationStructureMemoryNV', lambda: FUNCTYPE(Result, Device, c_uint32, POINTER(BindAccelerationStructureMemoryInfoNV)))
+define_lazy('FnCmdBuildAccelerationStructureNV', lambda: FUNCTYPE(None, CommandBuffer, POINTER(AccelerationStructureInfoNV), Buffer, DeviceSize, Bool32, AccelerationStructureNV, AccelerationStructureNV, Buffer, DeviceSize))
+define_lazy('FnCmdCopyAccelerationStructureNV', lambda: FUNCTYPE(None, CommandBuffer, AccelerationStructureNV, AccelerationStructureNV, CopyAccelerationStructureModeNV))
+define_lazy('FnCmdTraceRaysNV', lambda: FUNCTYPE(None, CommandBuffer, Buffer, DeviceSize, Buffer, DeviceSize, DeviceSize, Buffer, DeviceSize, DeviceSize, Buffer, DeviceSize, DeviceSize, c_uint32, c_uint32, c_uint32))
+define_lazy('FnCreateRayTracingPipelinesNV', lambda: FUNCTYPE(Result, Device, PipelineCache, c_uint32, POINTER(RayTracingPipelineCreateInfoNV), POINTER(AllocationCallbacks), array_pointer(Pipeline, output=True)))
+define_lazy('FnGetRayTracingShaderGroupHandlesNV', lambda: FUNCTYPE(Result, Device, Pipeline, c_uint32, c_uint32, c_size_t, output_void_pointer))
+define_lazy('FnGetAccelerationStructureHandleNV', lambda: FUNCTYPE(Result, Device, AccelerationStructureNV, c_size_t, output_void_pointer))
+define_lazy('FnCmdWriteAccelerationStructuresPropertiesNV', lambda: FUNCTYPE(None, CommandBuffer, c_uint32, array_pointer(AccelerationStructureNV), QueryType, QueryPool, c_uint32))
+define_lazy('FnCompileDeferredNV', lambda: FUNCTYPE(Result, Device, Pipeline, c_uint32))
+define_lazy('FnGetMemoryHostPointerPropertiesEXT', lambda: FUNCTYPE(Result, Device, ExternalMemoryHandleTypeFlagBits, void_pointer, POINTER(MemoryHostPointerPropertiesEXT)))
+define_lazy('FnCmdWriteBufferMarkerAMD', lambda: FUNCTYPE(None, CommandBuffer, PipelineStageFlagBits, Buffer, DeviceSize, c_uint32))
+define_lazy('FnGetPhysicalDeviceCalibrateableTimeDomainsEXT', lambda: FUNCTYPE(Result, PhysicalDevice, POINTER(c_uint32), POINTER(TimeDomainEXT)))
+define_lazy('FnGetCalibratedTimestampsEXT', lambda: FUNCTYPE(Result, Device, c_uint32, POINTER(CalibratedTimestampInfoEXT), POINTER(c_uint64), POINTER(c_uint64)))
+define_lazy('FnCmdDrawMeshTasksNV', lambda: FUNCTYPE(None, CommandBuffer, c_uint32, c_uint32))
+define_lazy('FnCmdDrawMeshTasksIndirectNV', lambda: FUNCTYPE(None, CommandBuffer, Buffer, DeviceSize, c_uint32, c_uint32))
+define_lazy('FnCmdDrawMeshTasksIndirectCountNV', lambda: FUNCTYPE(None, CommandBuffer, Buffer, DeviceSize, Buffer, DeviceSize, c_uint32, c_uint32))
+define_lazy('FnCmdSetExclusiveScissorNV', lambda: FUNCTYPE(None, CommandBuffer, c_uint32, c_uint32, POINTER(Rect2D)))
+define_lazy('FnCmdSetCheckpointNV', lambda: FUNCTYPE(None, CommandBuffer, void_pointer))
+define_lazy('FnGetQueueCheckpointDataNV', lambda: FUNCTYPE(None, Queue, POINTER(c_uint32), POINTER(CheckpointDataNV)))
+define_lazy('FnCreateWin32SurfaceKHR', lambda: FUNCTYPE(Result, Instance, POINTER(Win32SurfaceCreateInfoKHR), POINTER(AllocationCallbacks), array_pointer(SurfaceKHR, output=True)))
+define_lazy('FnGetPhysicalDeviceWin32PresentationSupportKHR', lambda: FUNCTYPE(Bool32, PhysicalDevice, c_uint32))
+define_lazy('FnGetMemoryWin32HandleKHR', lambda: FUNCTYPE(Result, Device, POINTER(MemoryGetWin32HandleInfoKHR), POINTER(HANDLE)))
+define_lazy('FnGetMemoryWin32HandlePropertiesKHR', lambda: FUNCTYPE(Result, Device, ExternalMemoryHandleTypeFlagBits, HANDLE, POINTER(MemoryWin32HandlePropertiesKHR)))
+define_lazy('FnImportSemaphoreWin32HandleKHR', lambda: FUNCTYPE(Result, Device, POINTER(ImportSemaphoreWin32HandleInfoKHR)))
+define_lazy('FnGetSemaphoreWin32HandleKHR', lambda: FUNCTYPE(Result, Device, POINTER(SemaphoreGetWin32HandleInfoKHR), POINTER(HANDLE)))
+define_lazy('FnImportFenceWin32HandleKHR', lambda: FUNCTYPE(Result, Device, POINTER(ImportFenceWin32HandleInfoKHR)))
+define_lazy('FnGetFenceWin32HandleKHR', lambda: FUNCTYPE(Result, Device, POINTER(FenceGetWin32HandleInfoKHR), POINTER(HANDLE)))
+define_lazy('FnGetMemoryWin32HandleNV', lambda: FUNCTYPE(Result, Device, DeviceMemory, ExternalMemoryHandleTypeFlagsNV, POINTER(HANDLE)))
+define_lazy('FnCreateXcbSurfaceKHR', lambda: FUNCTYPE(Result, Instance, POINTER(XcbSurfaceCreateInfoKHR), POINTER(AllocationCallbacks), array_pointer(SurfaceKHR, output=True)))
+define_lazy('FnGetPhysicalDeviceXcbPresentationSupportKHR', lambda: FUNCTYPE(Bool32, PhysicalDevice, c_uint32, POINTER(xcb_connection_t), xcb_visualid_t))
+
+
+define_lazy('InstanceFunctions', lambda: (
   (b"vkDestroyInstance", FnDestroyInstance),
   (b"vkEnumeratePhysicalDevices", FnEnumeratePhysicalDevices),
   (b"vkGetPhysicalDeviceFeatures", FnGetPhysicalDeviceFeatures),
@@ -5871,9 +7765,9 @@ InstanceFunctions = (
   (b"vkGetPhysicalDeviceWin32PresentationSupportKHR", FnGetPhysicalDeviceWin32PresentationSupportKHR),
   (b"vkCreateXcbSurfaceKHR", FnCreateXcbSurfaceKHR),
   (b"vkGetPhysicalDeviceXcbPresentationSupportKHR", FnGetPhysicalDeviceXcbPresentationSupportKHR),
-)
+))
 
-DeviceFunctions = (
+define_lazy('DeviceFunctions', lambda: (
   (b"vkDestroyDevice", FnDestroyDevice),
   (b"vkGetDeviceQueue", FnGetDeviceQueue),
   (b"vkQueueSubmit", FnQueueSubmit),
@@ -6127,23 +8021,43 @@ DeviceFunctions = (
   (b"vkImportFenceWin32HandleKHR", FnImportFenceWin32HandleKHR),
   (b"vkGetFenceWin32HandleKHR", FnGetFenceWin32HandleKHR),
   (b"vkGetMemoryWin32HandleNV", FnGetMemoryWin32HandleNV),
-)
+))
 
-LoaderFunctions = (
+define_lazy('LoaderFunctions', lambda: (
   (b"vkCreateInstance", FnCreateInstance),
   (b"vkEnumerateInstanceExtensionProperties", FnEnumerateInstanceExtensionProperties),
   (b"vkEnumerateInstanceLayerProperties", FnEnumerateInstanceLayerProperties),
   (b"vkEnumerateInstanceVersion", FnEnumerateInstanceVersion),
-  (b"vkDebugUtilsMessengerCallbackEXT", FnDebugUtilsMessengerCallbackEXT),
-)
+))
 
+define_lazy('InstanceDispatch', lambda: define_dispatch('InstanceDispatch', InstanceFunctions))
+define_lazy('DeviceDispatch', lambda: define_dispatch('DeviceDispatch', DeviceFunctions))
 
 
 # Loading proc
-GetInstanceProcAddr = FnGetInstanceProcAddr((b"vkGetInstanceProcAddr", vk))
-
-# Load the loader functions in the module namespace
-loc = locals()
-for name, fnptr in load_functions(Instance(0), LoaderFunctions, GetInstanceProcAddr):
-    loc[name] = fnptr
-del loc
\ No newline at end of file
+define_lazy('GetInstanceProcAddr', lambda: FnGetInstanceProcAddr((b"vkGetInstanceProcAddr", vk)))
+
+# The loader functions are loaded in the module namespace on first access
+define_lazy('CreateInstance', lambda: load_function(Instance(0), b"vkCreateInstance", FnCreateInstance, GetInstanceProcAddr))
+define_lazy('EnumerateInstanceExtensionProperties', lambda: load_function(Instance(0), b"vkEnumerateInstanceExtensionProperties", FnEnumerateInstanceExtensionProperties, GetInstanceProcAddr))
+define_lazy('EnumerateInstanceLayerProperties', lambda: load_function(Instance(0), b"vkEnumerateInstanceLayerProperties", FnEnumerateInstanceLayerProperties, GetInstanceProcAddr))
+define_lazy('EnumerateInstanceVersion', lambda: load_function(Instance(0), b"vkEnumerateInstanceVersion", FnEnumerateInstanceVersion, GetInstanceProcAddr))
+
+loader_commands = ('CreateInstance', 'EnumerateInstanceExtensionProperties', 'EnumerateInstanceLayerProperties', 'EnumerateInstanceVersion')
+
+def star_names():
+    "Names exported by star imports. The library is not exported, and the loader functions only when they can be loaded"
+    names = []
+    for name in list(globals()) + list(lazy_definitions):
+        if name.startswith('_') or name == 'vk':
+            continue
+        if name == 'GetInstanceProcAddr' or name in loader_commands:
+            try:
+                lazy_value(name)
+            except (OSError, AttributeError):
+                continue
+        names.append(name)
+    return names
+
+# Star imports build every lazy value
+define_lazy('__all__', star_names)
\ No newline at end of file
@@ -0,0 +1,1429 @@
+"""
+Helpers built on the generated wrapper (vk.py): device memory allocators, transfers, pipeline caches, pipeline
+compilation and recording, synchronization objects, command pools, queue submissions and image layouts.
+"""
+import json
+import os
+import threading
+import zlib
+from base64 import b64decode, b64encode
+from bisect import bisect_left, bisect_right
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from ctypes import Array, _Pointer, addressof, byref, c_int32, c_ubyte, c_uint64, c_void_p, cast
+from struct import unpack_from
+from time import perf_counter
+
+import vk
+
+class MappedMemory(object):
+    "Device memory objects that are mapped once and stay mapped. Ranges of the mappings are exposed as memoryviews or numpy arrays"
+    __slots__ = ('device', 'non_coherent_atom_size', 'mappings')
+
+    def __init__(self, device, non_coherent_atom_size=1):
+        self.device = device
+        self.non_coherent_atom_size = non_coherent_atom_size
+
+        # (address, size) of the mappings, by memory handle
+        self.mappings = {}
+
+    def map(self, memory, size=vk.WHOLE_SIZE.value, allocation_size=None):
+        """Map the first `size` bytes of memory (all of it by default), if it is not mapped already. allocation_size is the size
+        of the whole memory. Return a memoryview of the mapping (None if its size is unknown)"""
+        key = getattr(memory, 'value', memory)
+        mapping = self.mappings.get(key)
+        if mapping is None:
+            data = c_void_p()
+            self.device.MapMemory(self.device.handle, key, 0, size, 0, byref(data))
+            mapping = self.mappings[key] = (data.value, allocation_size if size == vk.WHOLE_SIZE.value else size)
+        if mapping[1] is None:
+            return None
+        return memoryview((c_ubyte * mapping[1]).from_address(mapping[0])).cast('B')
+
+    def mapping(self, memory, offset, size):
+        address, mapping_size = self.mappings[getattr(memory, 'value', memory)]
+        if mapping_size is None:
+            # Whole size mappings of a memory of unknown size: the ranges are not checked
+            if size is None:
+                raise ValueError("The size of the mapping is unknown, a size is required")
+            mapping_size = offset + size
+        if size is None:
+            size = mapping_size - offset
+        if offset < 0 or size < 0 or offset + size > mapping_size:
+            raise ValueError("Range ({}, {}) is outside of the mapping of {} bytes".format(offset, size, mapping_size))
+        return address + offset, size
+
+    def address(self, memory, offset=0):
+        "Address of a byte of a mapped memory"
+        return self.mapping(memory, offset, 0)[0]
+
+    def view(self, memory, offset=0, size=None):
+        "Writable memoryview of a range of a mapped memory (until the end of the mapping if size is None)"
+        address, size = self.mapping(memory, offset, size)
+        return memoryview((c_ubyte * size).from_address(address)).cast('B')
+
+    def array(self, memory, dtype, offset=0, count=None):
+        "Numpy array of `count` values of dtype (as many as possible if count is None) sharing a mapped memory"
+        import numpy
+        dtype = numpy.dtype(dtype)
+        address, size = self.mapping(memory, offset, None if count is None else count * dtype.itemsize)
+        return numpy.frombuffer((c_ubyte * size).from_address(address), dtype, size // dtype.itemsize)
+
+    def ranges(self, memory, offset, size):
+        # Ranges of non coherent memories must be aligned on the nonCoherentAtomSize limit. A range that the alignment would
+        # extend past the mapping ends at the end of the mapping (WHOLE_SIZE): the end of a mapping of a part of a memory may
+        # not be aligned
+        key = getattr(memory, 'value', memory)
+        atom = self.non_coherent_atom_size
+        mapping_size = self.mappings[key][1]
+        start = offset & -atom
+        if size is None:
+            return vk.MappedMemoryRange(vk.STRUCTURE_TYPE_MAPPED_MEMORY_RANGE, None, key, start, vk.WHOLE_SIZE.value)
+        end = offset + size + atom - 1 & -atom
+        if mapping_size is not None and end > mapping_size:
+            return vk.MappedMemoryRange(vk.STRUCTURE_TYPE_MAPPED_MEMORY_RANGE, None, key, start, vk.WHOLE_SIZE.value)
+        return vk.MappedMemoryRange(vk.STRUCTURE_TYPE_MAPPED_MEMORY_RANGE, None, key, start, end - start)
+
+    def flush(self, memory, offset=0, size=None):
+        "Make the host writes to a range of a non coherent memory visible to the device"
+        self.device.FlushMappedMemoryRanges(self.device.handle, 1, byref(self.ranges(memory, offset, size)))
+
+    def invalidate(self, memory, offset=0, size=None):
+        "Make the device writes to a range of a non coherent memory visible to the host"
+        self.device.InvalidateMappedMemoryRanges(self.device.handle, 1, byref(self.ranges(memory, offset, size)))
+
+    def unmap(self, memory):
+        "Unmap a memory. Must be called before FreeMemory. The views of the memory must not be used anymore"
+        key = getattr(memory, 'value', memory)
+        if self.mappings.pop(key, None) is not None:
+            self.device.UnmapMemory(self.device.handle, key)
+
+    def unmap_all(self):
+        for key in list(self.mappings):
+            self.unmap(key)
+
+class RingAllocator(object):
+    "Ranges of a circular buffer, that are released in the order they were allocated (ex: per frame data)"
+    __slots__ = ('size', 'head', 'allocations', 'ranges', 'used')
+
+    def __init__(self, size):
+        self.size = size
+        self.head = 0
+        self.used = 0
+
+        # [offset, end, freed] of the allocations from the oldest to the newest, and the same lists by offset
+        self.allocations = deque()
+        self.ranges = {}
+
+    def allocate(self, size, alignment=1):
+        "Return the offset of a range of `size` bytes aligned on `alignment` (a power of two), or None if the buffer is full"
+        size = max(size, 1)
+        if not self.allocations:
+            self.head = offset = 0
+            if size > self.size:
+                return None
+        else:
+            tail = self.allocations[0][0]
+            offset = (self.head + alignment - 1) & -alignment
+            if self.head > tail and offset + size > self.size:
+                # Wrap around. The end of the buffer is not used
+                offset = 0
+                if size > tail:
+                    return None
+            elif self.head <= tail and offset + size > tail:
+                return None
+
+        self.head = offset + size
+        self.used += size
+        allocation = self.ranges[offset] = [offset, self.head, False]
+        self.allocations.append(allocation)
+        return offset
+
+    def free(self, offset):
+        "Release a range. Its space is reused once the ranges allocated before it are released too"
+        allocation = self.ranges.pop(offset)
+        allocation[2] = True
+        self.used -= allocation[1] - allocation[0]
+        while self.allocations and self.allocations[0][2]:
+            self.allocations.popleft()
+
+    def reset(self):
+        "Release every range"
+        self.allocations.clear()
+        self.ranges.clear()
+        self.head = self.used = 0
+
+    def __len__(self):
+        return len(self.ranges)
+
+class BuddyAllocator(object):
+    "Ranges of power of two sizes, split in halves and merged back with their buddy. Ranges are aligned on their size"
+    __slots__ = ('size', 'min_size', 'free_ranges', 'ranges', 'used')
+
+    def __init__(self, size, min_size=256):
+        self.size = 1 << (size.bit_length() - 1)
+        self.min_size = min_size
+        self.used = 0
+
+        # Offsets of the free ranges by size, and the sizes of the allocated ranges by offset
+        self.free_ranges = {self.size: set([0])}
+        self.ranges = {}
+
+    def allocate(self, size, alignment=1):
+        "Return the offset of a range of `size` bytes aligned on `alignment` (a power of two), or None if no range is free"
+        block = 1 << (max(size, alignment, self.min_size) - 1).bit_length()
+        free_size = block
+        while free_size <= self.size and not self.free_ranges.get(free_size):
+            free_size <<= 1
+        if free_size > self.size:
+            return None
+
+        offset = self.free_ranges[free_size].pop()
+        while free_size > block:
+            free_size >>= 1
+            self.free_ranges.setdefault(free_size, set()).add(offset + free_size)
+
+        self.ranges[offset] = block
+        self.used += block
+        return offset
+
+    def free(self, offset):
+        "Release a range"
+        block = self.ranges.pop(offset)
+        self.used -= block
+        while block < self.size:
+            buddies = self.free_ranges.get(block)
+            buddy = offset ^ block
+            if not buddies or buddy not in buddies:
+                break
+            buddies.remove(buddy)
+            offset, block = min(offset, buddy), block << 1
+        self.free_ranges.setdefault(block, set()).add(offset)
+
+    def reset(self):
+        "Release every range"
+        self.free_ranges = {self.size: set([0])}
+        self.ranges.clear()
+        self.used = 0
+
+    def __len__(self):
+        return len(self.ranges)
+
+class MemoryBlock(object):
+    "Device memory allocated by DeviceMemoryAllocator. `ranges` and `pool` are None for the dedicated allocations"
+    __slots__ = ('memory', 'size', 'memory_type', 'ranges', 'pool')
+
+    def __init__(self, memory, size, memory_type, ranges=None, pool=None):
+        self.memory = memory
+        self.size = size
+        self.memory_type = memory_type
+        self.ranges = ranges
+        self.pool = pool
+
+class Allocation(object):
+    "Range of a device memory returned by DeviceMemoryAllocator"
+    __slots__ = ('memory', 'offset', 'size', 'block')
+
+    def __init__(self, memory, offset, size, block):
+        self.memory = memory
+        self.offset = offset
+        self.size = size
+        self.block = block
+
+    def __repr__(self):
+        return 'Allocation(memory={}, offset={}, size={})'.format(self.memory, self.offset, self.size)
+
+class DeviceMemoryAllocator(object):
+    "Sub-allocate buffers and images in large device memories, with pools of memory blocks by memory type"
+
+    def __init__(self, device, memory_properties, limits, block_size=0x4000000, strategy=BuddyAllocator):
+        self.device = device
+        self.memory_properties = memory_properties
+        self.block_size = block_size
+        self.strategy = strategy
+        self.buffer_image_granularity = limits.buffer_image_granularity
+        self.max_memory_allocation_count = limits.max_memory_allocation_count
+        self.mapped = MappedMemory(device, limits.non_coherent_atom_size)
+
+        # Blocks by (memory type, linear). Linear and non linear resources only share blocks if bufferImageGranularity is 1
+        self.pools = {}
+        self.dedicated = set()
+        self.allocation_count = 0
+
+    def memory_type(self, memory_type_bits, required_flags, preferred_flags=0):
+        "Index of the first memory type allowed by memory_type_bits with the required flags, preferably with the preferred flags"
+        candidates = []
+        for index in range(self.memory_properties.memory_type_count):
+            flags = self.memory_properties.memory_types[index].property_flags
+            if memory_type_bits & (1 << index) and flags & required_flags == required_flags:
+                candidates.append((flags & preferred_flags != preferred_flags, index))
+        if not candidates:
+            raise vk.VkErrorFeatureNotPresent(vk.ERROR_FEATURE_NOT_PRESENT)
+        return min(candidates)[1]
+
+    def allocate_memory(self, size, memory_type):
+        if self.device_memory_count() >= self.max_memory_allocation_count:
+            raise vk.VkErrorTooManyObjects(vk.ERROR_TOO_MANY_OBJECTS)
+        info = vk.MemoryAllocateInfo(vk.STRUCTURE_TYPE_MEMORY_ALLOCATE_INFO, None, size, memory_type)
+        memory = vk.DeviceMemory()
+        self.device.AllocateMemory(self.device.handle, byref(info), None, byref(memory))
+        return memory.value
+
+    def free_memory(self, block):
+        self.mapped.unmap(block.memory)
+        self.device.FreeMemory(self.device.handle, block.memory, None)
+
+    def allocate(self, requirements, required_flags=0, preferred_flags=0, linear=True):
+        "Allocate a range for the MemoryRequirements of a resource. `linear` is False for the images with an optimal tiling"
+        memory_type = self.memory_type(requirements.memory_type_bits, required_flags, preferred_flags)
+        size, alignment = requirements.size, requirements.alignment
+
+        # Large resources get their own memory
+        if size > self.block_size // 2:
+            block = MemoryBlock(self.allocate_memory(size, memory_type), size, memory_type)
+            self.dedicated.add(block)
+            self.allocation_count += 1
+            return Allocation(block.memory, 0, size, block)
+
+        pool = self.pools.setdefault((memory_type, linear or self.buffer_image_granularity <= 1), [])
+        for block in pool:
+            offset = block.ranges.allocate(size, alignment)
+            if offset is not None:
+                break
+        else:
+            memory = self.allocate_memory(self.block_size, memory_type)
+            block = MemoryBlock(memory, self.block_size, memory_type, self.strategy(self.block_size), pool)
+            pool.append(block)
+            offset = block.ranges.allocate(size, alignment)
+
+        self.allocation_count += 1
+        return Allocation(block.memory, offset, size, block)
+
+    def free(self, allocation):
+        "Release an allocation. Empty blocks are freed, except the last block of each pool"
+        block = allocation.block
+        self.allocation_count -= 1
+        if block.ranges is None:
+            self.dedicated.remove(block)
+            self.free_memory(block)
+            return
+
+        block.ranges.free(allocation.offset)
+        if not len(block.ranges) and any(b is not block and not len(b.ranges) for b in block.pool):
+            block.pool.remove(block)
+            self.free_memory(block)
+
+    def bind_buffer(self, buffer, required_flags=0, preferred_flags=0):
+        "Allocate memory for a buffer and bind it. Return the allocation"
+        requirements = vk.MemoryRequirements()
+        self.device.GetBufferMemoryRequirements(self.device.handle, buffer, byref(requirements))
+        allocation = self.allocate(requirements, required_flags, preferred_flags, True)
+        self.device.BindBufferMemory(self.device.handle, buffer, allocation.memory, allocation.offset)
+        return allocation
+
+    def bind_image(self, image, required_flags=0, preferred_flags=0, linear=False):
+        "Allocate memory for an image and bind it. Return the allocation. `linear` is True for the images with a linear tiling"
+        requirements = vk.MemoryRequirements()
+        self.device.GetImageMemoryRequirements(self.device.handle, image, byref(requirements))
+        allocation = self.allocate(requirements, required_flags, preferred_flags, linear)
+        self.device.BindImageMemory(self.device.handle, image, allocation.memory, allocation.offset)
+        return allocation
+
+    def view(self, allocation):
+        "Writable memoryview of a host visible allocation. Its block stays mapped until it is freed"
+        self.mapped.map(allocation.memory, allocation_size=allocation.block.size)
+        return self.mapped.view(allocation.memory, allocation.offset, allocation.size)
+
+    def property_flags(self, allocation):
+        "MemoryPropertyFlags of the memory type of an allocation"
+        return self.memory_properties.memory_types[allocation.block.memory_type].property_flags
+
+    def device_memory_count(self):
+        return len(self.dedicated) + sum(len(pool) for pool in self.pools.values())
+
+    def stats(self):
+        "Statistics of the allocator. Sizes are in bytes"
+        blocks = [block for pool in self.pools.values() for block in pool]
+        memory_types = {}
+        for block in blocks + list(self.dedicated):
+            stats = memory_types.setdefault(block.memory_type, {'device_memory_count': 0, 'size': 0, 'used': 0})
+            stats['device_memory_count'] += 1
+            stats['size'] += block.size
+            stats['used'] += block.size if block.ranges is None else block.ranges.used
+
+        return {
+            'allocation_count': self.allocation_count,
+            'device_memory_count': len(blocks) + len(self.dedicated),
+            'block_count': len(blocks),
+            'dedicated_count': len(self.dedicated),
+            'size': sum(s['size'] for s in memory_types.values()),
+            'used': sum(s['used'] for s in memory_types.values()),
+            'memory_types': memory_types,
+        }
+
+    def destroy(self):
+        "Free every device memory. The allocations must not be used anymore"
+        for block in [block for pool in self.pools.values() for block in pool] + list(self.dedicated):
+            self.free_memory(block)
+        self.pools.clear()
+        self.dedicated.clear()
+        self.allocation_count = 0
+
+def subtract_ranges(starts, ends, start, end):
+    "Parts of [start, end) that are not covered by the sorted, disjoint ranges [starts[i], ends[i])"
+    parts = []
+    index = bisect_right(ends, start)
+    while index < len(starts) and starts[index] < end:
+        if starts[index] > start:
+            parts.append((start, starts[index]))
+        start = max(start, ends[index])
+        index += 1
+    if start < end:
+        parts.append((start, end))
+    return parts
+
+def add_range(starts, ends, start, end):
+    "Add [start, end) to the sorted, disjoint ranges [starts[i], ends[i]). The ranges it touches are merged"
+    low, high = bisect_left(ends, start), bisect_right(starts, end)
+    if low < high:
+        start, end = min(start, starts[low]), max(end, ends[high - 1])
+    starts[low:high] = [start]
+    ends[low:high] = [end]
+
+def image_regions_overlap(a, b):
+    "True if two BufferImageCopy regions write some of the same texels"
+    a_layers, b_layers = a.image_subresource, b.image_subresource
+    if not a_layers.aspect_mask & b_layers.aspect_mask or a_layers.mip_level != b_layers.mip_level or \
+        a_layers.base_array_layer >= b_layers.base_array_layer + b_layers.layer_count or \
+        b_layers.base_array_layer >= a_layers.base_array_layer + a_layers.layer_count:
+        return False
+    return all(a_offset < b_offset + b_size and b_offset < a_offset + a_size for a_offset, a_size, b_offset, b_size in (
+        (a.image_offset.x, a.image_extent.width, b.image_offset.x, b.image_extent.width),
+        (a.image_offset.y, a.image_extent.height, b.image_offset.y, b.image_extent.height),
+        (a.image_offset.z, a.image_extent.depth, b.image_offset.z, b.image_extent.depth)))
+
+class TransferBatcher(object):
+    "Copy commands recorded together, by destination. The regions are sorted and the adjacent buffer regions are merged"
+    __slots__ = ('buffer_copies', 'image_copies')
+
+    def __init__(self):
+        # (source, src_offset, dst_offset, size) by destination buffer, and (source, BufferImageCopy) by (image, layout), in order
+        self.buffer_copies = {}
+        self.image_copies = {}
+
+    def __len__(self):
+        return len(self.buffer_copies) + len(self.image_copies)
+
+    def copy_buffer(self, src_buffer, dst_buffer, src_offset, dst_offset, size):
+        copy = (getattr(src_buffer, 'value', src_buffer), src_offset, dst_offset, size)
+        self.buffer_copies.setdefault(getattr(dst_buffer, 'value', dst_buffer), []).append(copy)
+
+    def copy_buffer_to_image(self, src_buffer, dst_image, layout, region):
+        "Add a BufferImageCopy region. The region is copied"
+        key = (getattr(dst_image, 'value', dst_image), layout)
+        self.image_copies.setdefault(key, []).append((getattr(src_buffer, 'value', src_buffer), region.clone()))
+
+    @staticmethod
+    def last_writes(copies):
+        "Trim the copies so that no destination byte is written twice. Like the copies made in order, the last write of a byte wins"
+        starts, ends, trimmed = [], [], []
+        for src_buffer, src_offset, dst_offset, size in reversed(copies):
+            for start, end in subtract_ranges(starts, ends, dst_offset, dst_offset + size):
+                trimmed.append((src_buffer, src_offset + start - dst_offset, start, end - start))
+            add_range(starts, ends, dst_offset, dst_offset + size)
+        return trimmed[::-1]
+
+    def buffer_regions(self, copies):
+        "Yield (source, numpy table of BufferCopyDtype) of the copies to a buffer, sorted and merged. Each table is copied with one command"
+        import numpy
+        dst_offsets = numpy.array([copy[2] for copy in copies], numpy.uint64)
+        dst_ends = dst_offsets + numpy.array([copy[3] for copy in copies], numpy.uint64)
+        order = numpy.argsort(dst_offsets, kind='stable')
+        if len(copies) > 1 and (dst_offsets[order][1:] < dst_ends[order][:-1]).any():
+            # Copies do not write in order (in a command, or in commands without barriers), so overlaps are removed first
+            copies = self.last_writes(copies)
+
+        sources = {}
+        for src_buffer, src_offset, dst_offset, size in copies:
+            sources.setdefault(src_buffer, []).append((src_offset, dst_offset, size))
+
+        for src_buffer, regions in sources.items():
+            # Merge the regions that continue the previous one in both buffers
+            table = numpy.array(regions, vk.BufferCopyDtype)
+            table = table[numpy.argsort(table['src_offset'], kind='stable')]
+            src_end = table['src_offset'] + table['size']
+            starts = numpy.ones(len(table), bool)
+            starts[1:] = (table['src_offset'][1:] != src_end[:-1]) | (table['dst_offset'][1:] != table['dst_offset'][:-1] + table['size'][:-1])
+            indices = numpy.flatnonzero(starts)
+            merged = table[indices]
+            merged['size'] = numpy.add.reduceat(table['size'], indices)
+            yield src_buffer, merged
+
+    def record(self, device, command_buffer):
+        "Record the copies in command_buffer and clear the batcher. Return the number of copy commands recorded. The copies are kept if recording fails"
+        count = 0
+        for dst_buffer, copies in self.buffer_copies.items():
+            for src_buffer, table in self.buffer_regions(copies):
+                device.CmdCopyBuffer(command_buffer, src_buffer, dst_buffer, len(table), vk.from_ndarray(table, vk.BufferCopy))
+                count += 1
+
+        for (dst_image, layout), copies in self.image_copies.items():
+            # Regions that overlap an earlier region go to the next batch, recorded after a transfer barrier
+            batches = [[]]
+            for copy in copies:
+                if any(image_regions_overlap(copy[1], region) for _, region in batches[-1]):
+                    batches.append([])
+                batches[-1].append(copy)
+
+            for index, batch in enumerate(batches):
+                if index:
+                    self.record_barrier(device, command_buffer, dst_image, layout, copies)
+                sources = {}
+                for src_buffer, region in batch:
+                    sources.setdefault(src_buffer, []).append(region)
+                for src_buffer, regions in sources.items():
+                    regions.sort(key=lambda region: region.buffer_offset)
+                    device.CmdCopyBufferToImage(command_buffer, src_buffer, dst_image, layout, len(regions), (vk.BufferImageCopy * len(regions))(*regions))
+                    count += 1
+
+        self.clear()
+        return count
+
+    @staticmethod
+    def record_barrier(device, command_buffer, image, layout, copies):
+        "Make the copies recorded before to an image visible to the next ones"
+        aspect_mask = 0
+        for _, region in copies:
+            aspect_mask |= region.image_subresource.aspect_mask
+        barrier = vk.ImageMemoryBarrier(vk.STRUCTURE_TYPE_IMAGE_MEMORY_BARRIER, None, vk.ACCESS_TRANSFER_WRITE_BIT, vk.ACCESS_TRANSFER_WRITE_BIT,
+            layout, layout, vk.QUEUE_FAMILY_IGNORED.value, vk.QUEUE_FAMILY_IGNORED.value, image,
+            vk.ImageSubresourceRange(aspect_mask, 0, vk.REMAINING_MIP_LEVELS.value, 0, vk.REMAINING_ARRAY_LAYERS.value))
+        device.CmdPipelineBarrier(command_buffer, vk.PIPELINE_STAGE_TRANSFER_BIT, vk.PIPELINE_STAGE_TRANSFER_BIT, 0, 0, None, 0, None, 1, byref(barrier))
+
+    def clear(self):
+        self.buffer_copies = {}
+        self.image_copies = {}
+
+class StagingRing(object):
+    "Persistently mapped staging buffer for the uploads to buffers and images. Its ranges are reused once the fences of their frame are signaled"
+
+    def __init__(self, device, allocator, size=0x1000000, alignment=16):
+        self.device = device
+        self.allocator = allocator
+        self.size = size
+        self.alignment = alignment
+        self.buffer, self.allocation = self.create_buffer(size)
+        self.view = allocator.view(self.allocation)
+        self.ranges = RingAllocator(size)
+        self.stats = {'uploads': 0, 'bytes': 0, 'dedicated_uploads': 0, 'copy_commands': 0, 'waits': 0}
+
+        # Copies to record
+        self.transfers = TransferBatcher()
+
+        # Ring offsets and dedicated (buffer, allocation) used by the copies to record, then (fence, offsets, dedicated) of the submitted copies
+        self.offsets = []
+        self.dedicated = []
+        self.in_flight = deque()
+
+    def create_buffer(self, size):
+        info = vk.BufferCreateInfo(vk.STRUCTURE_TYPE_BUFFER_CREATE_INFO, None, 0, size, vk.BUFFER_USAGE_TRANSFER_SRC_BIT, vk.SHARING_MODE_EXCLUSIVE)
+        buffer = vk.Buffer()
+        self.device.CreateBuffer(self.device.handle, byref(info), None, byref(buffer))
+        allocation = self.allocator.bind_buffer(buffer, vk.MEMORY_PROPERTY_HOST_VISIBLE_BIT, vk.MEMORY_PROPERTY_HOST_COHERENT_BIT)
+        return buffer.value, allocation
+
+    def reserve(self, size):
+        "Return (source buffer, offset, memoryview) of `size` bytes of staging memory"
+        offset = None if size > self.size // 2 else self.ranges.allocate(size, self.alignment)
+        while offset is None and size <= self.size // 2 and self.in_flight:
+            self.reclaim(wait=True)
+            offset = self.ranges.allocate(size, self.alignment)
+
+        self.stats['uploads'] += 1
+        self.stats['bytes'] += size
+        if offset is not None:
+            self.offsets.append(offset)
+            return self.buffer, offset, self.view[offset:offset + size]
+
+        # Uploads larger than half the ring (or that do not fit before the next submit) get their own staging buffer
+        buffer, allocation = self.create_buffer(size)
+        self.dedicated.append((buffer, allocation))
+        self.stats['dedicated_uploads'] += 1
+        return buffer, 0, self.allocator.view(allocation)
+
+    def buffer_upload(self, dst_buffer, dst_offset, size):
+        "Return a memoryview of `size` bytes that is copied to dst_buffer at dst_offset by the next record()"
+        src_buffer, src_offset, view = self.reserve(size)
+        self.transfers.copy_buffer(src_buffer, dst_buffer, src_offset, dst_offset, size)
+        return view
+
+    def upload_buffer(self, dst_buffer, data, dst_offset=0):
+        "Copy data (bytes or a C contiguous buffer) to the staging memory. It is copied to dst_buffer by the next record()"
+        data = memoryview(data).cast('B')
+        self.buffer_upload(dst_buffer, dst_offset, data.nbytes)[:] = data
+
+    def image_upload(self, dst_image, region, size, layout=None):
+        "Return a memoryview of `size` bytes that is copied to dst_image (in TRANSFER_DST_OPTIMAL layout by default) by the next record(). The buffer_offset of the BufferImageCopy region is set by the ring"
+        layout = vk.IMAGE_LAYOUT_TRANSFER_DST_OPTIMAL if layout is None else layout
+        src_buffer, src_offset, view = self.reserve(size)
+        region = region.clone()
+        region.buffer_offset = src_offset
+        self.transfers.copy_buffer_to_image(src_buffer, dst_image, layout, region)
+        return view
+
+    def upload_image(self, dst_image, data, region, layout=None):
+        "Copy data to the staging memory. It is copied to dst_image by the next record() (see image_upload)"
+        data = memoryview(data).cast('B')
+        self.image_upload(dst_image, region, data.nbytes, layout)[:] = data
+
+    def record(self, command_buffer, fence):
+        "Record the pending uploads, one copy command per destination. Their staging memory is reused once `fence` is signaled"
+        if not self.transfers:
+            return
+
+        for allocation in [self.allocation] + [allocation for _, allocation in self.dedicated]:
+            if not self.allocator.property_flags(allocation) & vk.MEMORY_PROPERTY_HOST_COHERENT_BIT:
+                self.allocator.mapped.flush(allocation.memory, allocation.offset, allocation.size)
+
+        self.stats['copy_commands'] += self.transfers.record(self.device, command_buffer)
+        self.in_flight.append((getattr(fence, 'value', fence), self.offsets, self.dedicated))
+        self.offsets, self.dedicated = [], []
+
+    def reclaim(self, wait=False):
+        "Reuse the staging memory of the submitted uploads whose fence is signaled. With wait, wait for the oldest fence first"
+        while self.in_flight:
+            fence, offsets, dedicated = self.in_flight[0]
+            if self.device.GetFenceStatus(self.device.handle, fence) != vk.SUCCESS:
+                if not wait:
+                    break
+                self.device.WaitForFences(self.device.handle, 1, byref(vk.Fence(fence)), vk.TRUE, 0xFFFFFFFFFFFFFFFF)
+                self.stats['waits'] += 1
+                wait = False
+
+            self.in_flight.popleft()
+            for offset in offsets:
+                self.ranges.free(offset)
+            for buffer, allocation in dedicated:
+                self.device.DestroyBuffer(self.device.handle, buffer, None)
+                self.allocator.free(allocation)
+
+    def destroy(self):
+        "Destroy the staging buffers. The submitted uploads must be completed"
+        for _, _, dedicated in self.in_flight:
+            self.dedicated.extend(dedicated)
+        for buffer, allocation in self.dedicated + [(self.buffer, self.allocation)]:
+            self.device.DestroyBuffer(self.device.handle, buffer, None)
+            self.allocator.free(allocation)
+        self.in_flight.clear()
+        self.dedicated = []
+
+def pipeline_cache_compatible(data, properties):
+    "True if the header of pipeline cache data matches the PhysicalDeviceProperties of a device"
+    if len(data) < 32:
+        return False
+    length, version, vendor_id, device_id = unpack_from('<4I', data)
+    return length >= 32 and len(data) >= length and version == vk.PIPELINE_CACHE_HEADER_VERSION_ONE and \
+        vendor_id == properties.vendor_ID and device_id == properties.device_ID and bytes(data[16:32]) == bytes(properties.pipeline_cache_UUID)
+
+class PipelineCacheStore(object):
+    "Pipeline cache loaded from a file and saved back to it. There is one file by device, driver version and pipeline cache UUID"
+
+    def __init__(self, device, properties, directory):
+        self.device = device
+        self.properties = properties
+        self.path = os.path.join(directory, self.file_name(properties))
+        self.cache = self.create(self.load())
+
+    @staticmethod
+    def file_name(properties):
+        return 'pipeline_cache_{:04x}_{:04x}_{:08x}_{}.bin'.format(properties.vendor_ID, properties.device_ID,
+            properties.driver_version, bytes(properties.pipeline_cache_UUID).hex())
+
+    def load(self):
+        "Data of the file, or None if there is no file or if it does not match the device"
+        try:
+            with open(self.path, 'rb') as f:
+                data = f.read()
+        except OSError:
+            return None
+        return data if pipeline_cache_compatible(data, self.properties) else None
+
+    def create(self, data=None):
+        "Create a PipelineCache filled with data (bytes or None)"
+        info = vk.PipelineCacheCreateInfo(vk.STRUCTURE_TYPE_PIPELINE_CACHE_CREATE_INFO, None, 0, len(data or b''), data)
+        cache = vk.PipelineCache()
+        self.device.CreatePipelineCache(self.device.handle, byref(info), None, byref(cache))
+        return cache.value
+
+    def merge(self, caches):
+        "Merge other pipeline caches (ex: the caches of worker threads) in the cache of the store"
+        caches = [getattr(cache, 'value', cache) for cache in caches]
+        if caches:
+            self.device.MergePipelineCaches(self.device.handle, self.cache, len(caches), (vk.PipelineCache * len(caches))(*caches))
+
+    def data(self):
+        "Data of the cache of the store"
+        return self.device.enumerate('GetPipelineCacheData', self.device.handle, self.cache)
+
+    def save(self, merge_file=True):
+        "Write the cache to its file. The file is replaced atomically. With merge_file, the pipelines saved by other processes since the load are kept"
+        if merge_file:
+            data = self.load()
+            if data is not None:
+                cache = self.create(data)
+                self.merge([cache])
+                self.device.DestroyPipelineCache(self.device.handle, cache, None)
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temp_path = '{}.{}.tmp'.format(self.path, os.getpid())
+        with open(temp_path, 'wb') as f:
+            f.write(self.data())
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, self.path)
+
+    def destroy(self):
+        self.device.DestroyPipelineCache(self.device.handle, self.cache, None)
+
+# Commands creating the pipelines, by create info structure
+pipeline_commands = {
+    'GraphicsPipelineCreateInfo': 'CreateGraphicsPipelines',
+    'ComputePipelineCreateInfo': 'CreateComputePipelines',
+    'RayTracingPipelineCreateInfoNV': 'CreateRayTracingPipelinesNV',
+}
+
+class PipelineCompiler(object):
+    "Create pipelines on a pool of threads sharing one pipeline cache. ctypes releases the GIL during the calls. Experimental: the speedup is not measured"
+
+    def __init__(self, device, cache=0, max_workers=None):
+        self.device = device
+        self.cache = getattr(cache, 'value', cache)
+        self.executor = ThreadPoolExecutor(max_workers, thread_name_prefix='PipelineCompiler')
+
+        # Compile time of the pipelines in seconds, by name. Pipelines without a name are named with their submission index
+        self.timings = {}
+        self.submitted = 0
+
+    def create(self, command, create_info, name):
+        pipeline = vk.Pipeline()
+        start = perf_counter()
+        command(self.device.handle, self.cache, 1, byref(create_info), None, byref(pipeline))
+        self.timings[name] = perf_counter() - start
+        return pipeline.value
+
+    def compile(self, create_info, name=None):
+        "Return a future of the Pipeline of a GraphicsPipelineCreateInfo, ComputePipelineCreateInfo or RayTracingPipelineCreateInfoNV"
+        command_name = pipeline_commands.get(type(create_info).__name__)
+        if command_name is None:
+            raise TypeError("Expected a pipeline create info, got {}".format(type(create_info).__name__))
+
+        self.submitted += 1
+        command = getattr(self.device, command_name)
+        return self.executor.submit(self.create, command, create_info, self.submitted - 1 if name is None else name)
+
+    def compile_all(self, create_infos):
+        "Return the futures of a list of create infos (or of a dict of create infos by name)"
+        if isinstance(create_infos, dict):
+            return dict((name, self.compile(info, name)) for name, info in create_infos.items())
+        return [self.compile(info) for info in create_infos]
+
+    def shutdown(self, wait=True):
+        self.executor.shutdown(wait)
+
+# Objects recorded by PipelineRecorder besides the pipelines, by creation command, with the command destroying them
+recorded_commands = {
+    'CreateSampler': 'DestroySampler',
+    'CreateDescriptorSetLayout': 'DestroyDescriptorSetLayout',
+    'CreatePipelineLayout': 'DestroyPipelineLayout',
+    'CreateRenderPass': 'DestroyRenderPass',
+    'CreateShaderModule': 'DestroyShaderModule',
+}
+
+# Must be incremented when the format of the manifests changes
+PIPELINE_MANIFEST_VERSION = 1
+
+def argument_address(value):
+    "Address of the memory passed as a pointer argument (a ctypes array, pointer or byref, an int or a writable buffer)"
+    if value is None or isinstance(value, int):
+        return value
+    elif isinstance(value, Array):
+        return addressof(value)
+    elif isinstance(value, _Pointer):
+        return cast(value, c_void_p).value
+    elif hasattr(value, '_obj'):
+        return addressof(value._obj)
+    return vk.pin_buffer(value)[0]
+
+def encode_tree(tree):
+    "JSON value of a struct_tree"
+    name, data, children = tree
+    encoded = []
+    for offset, child in children:
+        if isinstance(child, bytes):
+            child = b64encode(child).decode()
+        elif not child or isinstance(child[0], bytes):
+            child = {'strings': [b64encode(item).decode() for item in child]}
+        else:
+            child = [encode_tree(item) for item in child]
+        encoded.append([offset, child])
+    return [name, b64encode(data).decode(), encoded]
+
+def decode_tree(value):
+    "struct_tree of a JSON value made by encode_tree"
+    name, data, encoded = value
+    children = []
+    for offset, child in encoded:
+        if isinstance(child, str):
+            child = b64decode(child)
+        elif isinstance(child, dict):
+            child = tuple(b64decode(item) for item in child['strings'])
+        else:
+            child = tuple(decode_tree(item) for item in child)
+        children.append((offset, child))
+    return (name, b64decode(data), tuple(children))
+
+class PipelineRecorder(object):
+    "Record the pipelines created with a device dispatch table, and the objects they use, in a manifest read by replay_pipeline_manifest"
+
+    def __init__(self, device):
+        self.device = device
+        self.lock = threading.Lock()
+
+        # (creation command, handle, struct_tree of the create info) in creation order
+        self.objects = []
+
+        # struct_key of the recorded pipelines. The objects are recorded by struct_key and the keys are kept by handle
+        self.pipelines = set()
+        self.object_handles = {}
+        self.handle_keys = {}
+
+        # Objects created again with a recorded create info. Their handles are replaced by the handle of the recorded object
+        self.aliases = {}
+
+        # The commands of the dispatch table are replaced until uninstall() is called
+        self.commands = {}
+        for name in list(recorded_commands) + list(pipeline_commands.values()):
+            try:
+                command = getattr(device, name)
+            except AttributeError:
+                continue
+            self.commands[name] = command
+            record = self.record_object if name in recorded_commands else self.record_pipelines
+            setattr(device, name, record(name, command))
+
+    def record_object(self, name, command):
+        struct_name = name[6:] + 'CreateInfo'
+        def create(device, create_info, allocator, handle):
+            result = command(device, create_info, allocator, handle)
+            if result == vk.SUCCESS:
+                create_info = getattr(vk, struct_name).from_address(argument_address(create_info))
+                with self.lock:
+                    self.add_object(name, c_uint64.from_address(argument_address(handle)).value, create_info)
+            return result
+        return create
+
+    def record_pipelines(self, name, command):
+        struct_name = [struct for struct, command_name in pipeline_commands.items() if command_name == name][0]
+        def create(device, cache, count, create_infos, allocator, pipelines):
+            result = command(device, cache, count, create_infos, allocator, pipelines)
+            create_infos = (getattr(vk, struct_name) * count).from_address(argument_address(create_infos))
+            pipelines = (vk.Pipeline * count).from_address(argument_address(pipelines))
+            with self.lock:
+                for create_info, pipeline in zip(create_infos, pipelines):
+                    if not pipeline:
+                        continue
+                    key, tree = self.copy(create_info)
+                    if key not in self.pipelines:
+                        self.pipelines.add(key)
+                        self.objects.append((name, pipeline, tree))
+            return result
+        return create
+
+    def copy(self, create_info):
+        "struct_key and struct_tree of a create info, with the handles of the objects created again replaced by their alias"
+        if self.aliases:
+            objects = []
+            create_info = vk.build_struct(vk.struct_tree(create_info), objects, lambda handle: self.aliases.get(handle, handle))
+        return vk.struct_key(create_info), vk.struct_tree(create_info)
+
+    def add_object(self, name, handle, create_info):
+        key, tree = self.copy(create_info)
+
+        # The handle of a destroyed object can be reused by a new object. The objects created again from the destroyed
+        # object keep its record
+        self.aliases.pop(handle, None)
+        old_key = self.handle_keys.pop(handle, None)
+        if old_key is not None:
+            del self.object_handles[old_key]
+            copies = [alias for alias, target in self.aliases.items() if target == handle]
+            if copies:
+                old_name, _, old_tree = [entry for entry in self.objects if entry[1] == handle][-1]
+                self.objects.append((old_name, copies[0], old_tree))
+                self.object_handles[old_key], self.handle_keys[copies[0]] = copies[0], old_key
+                for alias in copies:
+                    self.aliases[alias] = copies[0]
+                del self.aliases[copies[0]]
+
+        recorded = self.object_handles.get(key)
+        if recorded is not None:
+            self.aliases[handle] = recorded
+        else:
+            self.objects.append((name, handle, tree))
+            self.object_handles[key], self.handle_keys[handle] = handle, key
+
+    def uninstall(self):
+        "Restore the commands of the dispatch table"
+        for name, command in self.commands.items():
+            setattr(self.device, name, command)
+        self.commands = {}
+
+    def save(self, path):
+        "Write the manifest (zlib compressed JSON). The file is replaced atomically"
+        objects = [[name, handle, encode_tree(tree)] for name, handle, tree in self.objects]
+        data = zlib.compress(json.dumps({'version': PIPELINE_MANIFEST_VERSION, 'objects': objects}, separators=(',', ':')).encode())
+
+        temp_path = '{}.{}.tmp'.format(path, os.getpid())
+        with open(temp_path, 'wb') as f:
+            f.write(data)
+        os.replace(temp_path, path)
+
+# Create infos of the objects shared by ObjectCache
+cached_objects = ('SamplerCreateInfo', 'DescriptorSetLayoutCreateInfo', 'PipelineLayoutCreateInfo', 'RenderPassCreateInfo')
+
+class ObjectCache(object):
+    "Share the samplers, descriptor set layouts, pipeline layouts and render passes created with identical create infos"
+
+    def __init__(self, device):
+        self.device = device
+
+        # [handle, references] by struct_key of the create info, and the keys by handle
+        self.objects = {}
+        self.keys = {}
+        self.stats = {'hits': 0, 'misses': 0}
+
+    def create(self, create_info):
+        "Handle of the object of a create info. The object is created on the first request, the following ones add a reference"
+        name = type(create_info).__name__
+        if name not in cached_objects:
+            raise TypeError("Expected {}, got {}".format(', '.join(cached_objects), name))
+
+        key = vk.struct_key(create_info)
+        entry = self.objects.get(key)
+        if entry is not None:
+            entry[1] += 1
+            self.stats['hits'] += 1
+            return entry[0]
+
+        handle = c_uint64()
+        getattr(self.device, 'Create' + name[:-10])(self.device.handle, byref(create_info), None, byref(handle))
+        self.objects[key] = [handle.value, 1]
+        self.keys[handle.value] = key
+        self.stats['misses'] += 1
+        return handle.value
+
+    def release(self, handle):
+        "Remove a reference to an object. The object is destroyed with its last reference"
+        handle = getattr(handle, 'value', handle)
+        key = self.keys[handle]
+        entry = self.objects[key]
+        entry[1] -= 1
+        if entry[1] == 0:
+            del self.objects[key], self.keys[handle]
+            getattr(self.device, 'Destroy' + key[0][:-10])(self.device.handle, handle, None)
+
+    def references(self, handle):
+        return self.objects[self.keys[getattr(handle, 'value', handle)]][1]
+
+    def destroy(self):
+        "Destroy every object, whatever their reference count"
+        for key, (handle, _) in self.objects.items():
+            getattr(self.device, 'Destroy' + key[0][:-10])(self.device.handle, handle, None)
+        self.objects, self.keys = {}, {}
+
+def replay_pipeline_manifest(device, path, cache=0, max_workers=None):
+    "Create the pipelines of a manifest in parallel to fill a pipeline cache, then destroy them. Returns (created, skipped)"
+    with open(path, 'rb') as f:
+        manifest = json.loads(zlib.decompress(f.read()).decode())
+    if manifest.get('version') != PIPELINE_MANIFEST_VERSION:
+        return 0, 0
+
+    # Recorded handles mapped to the objects created again. Objects using unknown handles are skipped
+    handles = {}
+    def handle(value):
+        return handles[value] if value else value
+
+    created, futures, objects, compiled, skipped = [], [], [], 0, 0
+    compiler = PipelineCompiler(device, cache, max_workers)
+    try:
+        for name, recorded_handle, tree in manifest['objects']:
+            try:
+                create_info = vk.build_struct(decode_tree(tree), objects, handle)
+            except KeyError:
+                skipped += 1
+                continue
+
+            if name in recorded_commands:
+                value = c_uint64()
+                getattr(device, name)(device.handle, byref(create_info), None, byref(value))
+                handles[recorded_handle] = value.value
+                created.append((recorded_commands[name], value.value))
+            else:
+                futures.append(compiler.compile(create_info))
+
+        for future in futures:
+            try:
+                created.append(('DestroyPipeline', future.result()))
+                compiled += 1
+            except vk.VkError:
+                skipped += 1
+    finally:
+        compiler.shutdown()
+        for name, value in reversed(created):
+            getattr(device, name)(device.handle, value, None)
+
+    return compiled, skipped
+
+def resolve_future(future, value=None, exception=None):
+    "Complete an asyncio future, unless it was cancelled"
+    if future.done():
+        return
+    elif exception is not None:
+        future.set_exception(exception)
+    else:
+        future.set_result(value)
+
+class FenceWaiter(object):
+    "Wait for fences with asyncio. A thread waits for all the pending fences with one WaitForFences call (wait_all=False)"
+
+    def __init__(self, device, interval=0.002):
+        self.device = device
+
+        # The fences added while the thread is waiting are included in the next wait, at most `interval` seconds later
+        self.timeout = int(interval * 1e9)
+
+        # (loop, future) waiting for each fence
+        self.pending = {}
+        self.condition = threading.Condition()
+        self.stats = {'waits': 0, 'signaled': 0}
+
+        self.running = True
+        self.thread = threading.Thread(target=self.run, name='FenceWaiter', daemon=True)
+        self.thread.start()
+
+    def wait(self, fence):
+        "Future of the running asyncio loop, completed when the fence is signaled. Ex: `await waiter.wait(fence)`"
+        import asyncio
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        with self.condition:
+            self.pending.setdefault(getattr(fence, 'value', fence), []).append((loop, future))
+            self.condition.notify()
+        return future
+
+    def wait_fd(self, fence):
+        "Like wait, with the sync file descriptor of the fence watched by the loop (GetFenceFdKHR). The export resets the fence"
+        import asyncio
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        info = vk.FenceGetFdInfoKHR(vk.STRUCTURE_TYPE_FENCE_GET_FD_INFO_KHR, None, getattr(fence, 'value', fence), vk.EXTERNAL_FENCE_HANDLE_TYPE_SYNC_FD_BIT)
+        fd = c_int32()
+        self.device.GetFenceFdKHR(self.device.handle, byref(info), byref(fd))
+
+        # -1 means that the fence was already signaled
+        if fd.value < 0:
+            future.set_result(None)
+            return future
+
+        def signaled():
+            loop.remove_reader(fd.value)
+            os.close(fd.value)
+            self.stats['signaled'] += 1
+            resolve_future(future)
+        loop.add_reader(fd.value, signaled)
+        return future
+
+    def run(self):
+        while True:
+            with self.condition:
+                # The fences of the cancelled futures are not waited for anymore
+                for fence in [fence for fence, waiters in self.pending.items() if all(future.done() for _, future in waiters)]:
+                    del self.pending[fence]
+                while self.running and not self.pending:
+                    self.condition.wait()
+                if not self.running:
+                    return
+                fences = list(self.pending)
+
+            try:
+                result = self.device.WaitForFences(self.device.handle, len(fences), (vk.Fence * len(fences))(*fences), vk.FALSE, self.timeout)
+                self.stats['waits'] += 1
+                if result != vk.SUCCESS:
+                    continue
+                signaled = [fence for fence in fences if self.device.GetFenceStatus(self.device.handle, fence) == vk.SUCCESS]
+                exception = None
+            except vk.VkError as e:
+                # Ex: ErrorDeviceLost. Every waiting future gets the error
+                signaled, exception = fences, e
+
+            with self.condition:
+                waiters = [waiter for fence in signaled for waiter in self.pending.pop(fence, ())]
+            self.stats['signaled'] += len(signaled)
+            for loop, future in waiters:
+                try:
+                    loop.call_soon_threadsafe(resolve_future, future, None, exception)
+                except RuntimeError:
+                    # The loop is closed
+                    pass
+
+    def close(self):
+        "Stop the thread. The futures that are still waiting are never completed"
+        with self.condition:
+            self.running = False
+            self.condition.notify()
+        self.thread.join()
+
+class SyncObjectPool(object):
+    "Reuse fences and binary semaphores. The objects taken during a frame are recycled when the fence of the frame is signaled"
+
+    def __init__(self, device):
+        self.device = device
+
+        # Reset fences and unused semaphores
+        self.fences = []
+        self.semaphores = []
+
+        # Objects taken during the current frame, and (frame, fence, fences, semaphores) of the frames in flight
+        self.frame = 0
+        self.frame_fences = []
+        self.frame_semaphores = []
+        self.in_flight = deque()
+
+        self.stats = {'fences': 0, 'semaphores': 0, 'fence_reuses': 0, 'semaphore_reuses': 0, 'reset_calls': 0, 'waits': 0}
+
+    def fence(self):
+        "Unsignaled fence, recycled with the current frame"
+        if self.fences:
+            fence = self.fences.pop()
+            self.stats['fence_reuses'] += 1
+        else:
+            value = vk.Fence()
+            self.device.CreateFence(self.device.handle, byref(vk.FenceCreateInfoTemplate), None, byref(value))
+            fence = value.value
+            self.stats['fences'] += 1
+        self.frame_fences.append(fence)
+        return fence
+
+    def semaphore(self):
+        "Binary semaphore, recycled with the current frame"
+        if self.semaphores:
+            semaphore = self.semaphores.pop()
+            self.stats['semaphore_reuses'] += 1
+        else:
+            value = vk.Semaphore()
+            self.device.CreateSemaphore(self.device.handle, byref(vk.SemaphoreCreateInfoTemplate), None, byref(value))
+            semaphore = value.value
+            self.stats['semaphores'] += 1
+        self.frame_semaphores.append(semaphore)
+        return semaphore
+
+    def end_frame(self, fence):
+        "End the current frame. Its objects are recycled once `fence` (usually the fence of its last submission) is signaled"
+        self.in_flight.append((self.frame, getattr(fence, 'value', fence), self.frame_fences, self.frame_semaphores))
+        self.frame += 1
+        self.frame_fences, self.frame_semaphores = [], []
+        return self.frame - 1
+
+    def recycle(self, wait=False):
+        "Recycle the objects of the completed frames. All their fences are reset with one ResetFences call. With wait, wait for the oldest frame first"
+        fences = []
+        while self.in_flight:
+            _, fence, frame_fences, frame_semaphores = self.in_flight[0]
+            if self.device.GetFenceStatus(self.device.handle, fence) != vk.SUCCESS:
+                if not wait:
+                    break
+                self.device.WaitForFences(self.device.handle, 1, byref(vk.Fence(fence)), vk.TRUE, 0xFFFFFFFFFFFFFFFF)
+                self.stats['waits'] += 1
+                wait = False
+
+            self.in_flight.popleft()
+            fences.extend(frame_fences)
+            self.semaphores.extend(frame_semaphores)
+
+        if fences:
+            self.device.ResetFences(self.device.handle, len(fences), (vk.Fence * len(fences))(*fences))
+            self.stats['reset_calls'] += 1
+            self.fences.extend(fences)
+
+    def completed_frame(self):
+        "Index of the last frame that was recycled, or -1"
+        return (self.in_flight[0][0] if self.in_flight else self.frame) - 1
+
+    def destroy(self):
+        "Destroy every fence and semaphore. The frames in flight must be completed"
+        fences, semaphores = self.fences + self.frame_fences, self.semaphores + self.frame_semaphores
+        for _, _, frame_fences, frame_semaphores in self.in_flight:
+            fences.extend(frame_fences)
+            semaphores.extend(frame_semaphores)
+        for fence in fences:
+            self.device.DestroyFence(self.device.handle, fence, None)
+        for semaphore in semaphores:
+            self.device.DestroySemaphore(self.device.handle, semaphore, None)
+        self.fences, self.semaphores, self.frame_fences, self.frame_semaphores = [], [], [], []
+        self.in_flight.clear()
+
+class ThreadCommandPool(object):
+    "Command pool of one thread, queue family and frame, with the command buffers allocated from it"
+    __slots__ = ('pool', 'buffers', 'used')
+
+    def __init__(self, pool):
+        self.pool = pool
+
+        # Allocated command buffers and number of command buffers handed out since the last reset, by level
+        self.buffers = ([], [])
+        self.used = [0, 0]
+
+class CommandPoolManager(object):
+    "Command pools by (thread, queue family, frame in flight), so that every thread records its command buffers without locks"
+
+    def __init__(self, device, frames=2, flags=None, allocation_size=8):
+        self.device = device
+        self.frames = frames
+        self.flags = vk.COMMAND_POOL_CREATE_TRANSIENT_BIT if flags is None else flags
+        self.allocation_size = allocation_size
+        self.get_ident = threading.get_ident
+
+        # ThreadCommandPool by (thread id, queue family, frame index). The lock is only taken to create a pool
+        self.pools = {}
+        self.lock = threading.Lock()
+        self.stats = {'pools': 0, 'command_buffers': 0, 'resets': 0, 'trims': 0}
+
+    def thread_pool(self, queue_family, frame):
+        "ThreadCommandPool of the calling thread"
+        key = (self.get_ident(), queue_family, frame % self.frames)
+        thread_pool = self.pools.get(key)
+        if thread_pool is None:
+            info = vk.CommandPoolCreateInfo(vk.STRUCTURE_TYPE_COMMAND_POOL_CREATE_INFO, None, self.flags, queue_family)
+            pool = vk.CommandPool()
+            self.device.CreateCommandPool(self.device.handle, byref(info), None, byref(pool))
+            thread_pool = ThreadCommandPool(pool.value)
+            with self.lock:
+                self.pools[key] = thread_pool
+                self.stats['pools'] += 1
+        return thread_pool
+
+    def command_buffer(self, queue_family, frame, level=None):
+        "Command buffer of the calling thread, usable until the pools of the frame are reset. level is primary by default"
+        level = vk.COMMAND_BUFFER_LEVEL_PRIMARY if level is None else level
+        thread_pool = self.thread_pool(queue_family, frame)
+        buffers, used = thread_pool.buffers[level], thread_pool.used[level]
+        if used == len(buffers):
+            count = max(self.allocation_size, len(buffers))
+            info = vk.CommandBufferAllocateInfo(vk.STRUCTURE_TYPE_COMMAND_BUFFER_ALLOCATE_INFO, None, thread_pool.pool, level, count)
+            allocated = (vk.CommandBuffer * count)()
+            self.device.AllocateCommandBuffers(self.device.handle, byref(info), allocated)
+            buffers.extend(allocated)
+            # The stats are shared by the recording threads
+            with self.lock:
+                self.stats['command_buffers'] += count
+
+        thread_pool.used[level] = used + 1
+        return buffers[used]
+
+    def reset(self, frame, release=False):
+        "Reset the pools of a frame (for all threads) once its command buffers completed. With release, the pools give their memory back"
+        flags = vk.COMMAND_POOL_RESET_RELEASE_RESOURCES_BIT if release else 0
+        frame %= self.frames
+        for (_, _, pool_frame), thread_pool in list(self.pools.items()):
+            if pool_frame == frame:
+                self.device.ResetCommandPool(self.device.handle, thread_pool.pool, flags)
+                thread_pool.used[:] = [0, 0]
+                with self.lock:
+                    self.stats['resets'] += 1
+
+    def trim(self, frame=None):
+        "Give the unused memory of the pools back to the system (ex: under memory pressure). Requires vulkan 1.1 or VK_KHR_maintenance1"
+        # Devices created for vulkan 1.0 only expose the extension command
+        trim_pool = getattr(self.device, 'TrimCommandPool', None) or getattr(self.device, 'TrimCommandPoolKHR')
+        for (_, _, pool_frame), thread_pool in list(self.pools.items()):
+            if frame is None or pool_frame == frame % self.frames:
+                trim_pool(self.device.handle, thread_pool.pool, 0)
+                with self.lock:
+                    self.stats['trims'] += 1
+
+    def destroy(self):
+        "Destroy the pools and their command buffers"
+        for thread_pool in self.pools.values():
+            self.device.DestroyCommandPool(self.device.handle, thread_pool.pool, None)
+        self.pools = {}
+
+class SubmissionBatcher(object):
+    "Collect the submissions of many producers for a queue and send them with one QueueSubmit call and one fence"
+
+    def __init__(self, device, queue):
+        self.device = device
+        self.queue = getattr(queue, 'value', queue)
+
+        # Queues must not be used by two threads at the same time. Other queue commands (ex: QueuePresentKHR) must hold the lock too
+        self.lock = threading.Lock()
+
+        # [wait semaphores, wait stages, command buffers, signal semaphores] of the queued submissions
+        self.submits = []
+        self.stats = {'submits': 0, 'submit_infos': 0, 'flushes': 0}
+
+    def submit(self, command_buffers, wait_semaphores=(), wait_stages=(), signal_semaphores=()):
+        "Queue command buffers with the semaphores they wait for (at wait_stages) and signal. They are sent by the next flush"
+        command_buffers = [getattr(value, 'value', value) for value in command_buffers]
+        wait_semaphores = [getattr(value, 'value', value) for value in wait_semaphores]
+        signal_semaphores = [getattr(value, 'value', value) for value in signal_semaphores]
+        if len(wait_stages) != len(wait_semaphores):
+            raise ValueError("Expected one wait stage by wait semaphore")
+
+        with self.lock:
+            self.stats['submits'] += 1
+            # Command buffers without waits are appended to the previous submission when it waits for and signals nothing.
+            # Merging them in a submission that waits would make them depend on its semaphores
+            if not wait_semaphores and self.submits and not self.submits[-1][0] and not self.submits[-1][3]:
+                submit = self.submits[-1]
+                submit[2].extend(command_buffers)
+                submit[3].extend(signal_semaphores)
+            else:
+                self.submits.append([wait_semaphores, list(wait_stages), command_buffers, signal_semaphores])
+
+    def flush(self, fence=0):
+        "Send the queued submissions with one QueueSubmit call. fence is signaled when all of them are completed"
+        fence = getattr(fence, 'value', fence)
+        with self.lock:
+            submits = self.submits
+            if not submits and not fence:
+                return 0
+
+            infos = (vk.SubmitInfo * len(submits))()
+            arrays = []
+            for info, (wait_semaphores, wait_stages, command_buffers, signal_semaphores) in zip(infos, submits):
+                arrays.append(((vk.Semaphore * len(wait_semaphores))(*wait_semaphores), (vk.PipelineStageFlags * len(wait_stages))(*wait_stages),
+                    (vk.CommandBuffer * len(command_buffers))(*command_buffers), (vk.Semaphore * len(signal_semaphores))(*signal_semaphores)))
+                info.type = vk.STRUCTURE_TYPE_SUBMIT_INFO
+                info.wait_semaphore_count, info.wait_semaphores, info.wait_dst_stage_mask = len(wait_semaphores), arrays[-1][0], arrays[-1][1]
+                info.command_buffer_count, info.command_buffers = len(command_buffers), arrays[-1][2]
+                info.signal_semaphore_count, info.signal_semaphores = len(signal_semaphores), arrays[-1][3]
+
+            # The submissions stay queued if QueueSubmit fails (ex: VkErrorDeviceLost)
+            self.device.QueueSubmit(self.queue, len(submits), infos, fence)
+            self.submits = []
+            self.stats['flushes'] += 1
+            self.stats['submit_infos'] += len(submits)
+            return len(submits)
+
+    def wait_idle(self):
+        "Flush, then wait for the queue to be idle"
+        self.flush()
+        with self.lock:
+            self.device.QueueWaitIdle(self.queue)
+
+class ImageLayoutTracker(object):
+    "Track the layout, access and stages of every subresource of images, and record the barriers of their transitions in one CmdPipelineBarrier call"
+
+    def __init__(self):
+        # (aspect mask, [mip level][array layer] -> (layout, access mask, stage mask)) by image
+        self.images = {}
+
+        # State of the subresources before their pending transition, by (image, mip level, array layer)
+        self.pending = {}
+        self.stats = {'transitions': 0, 'skipped': 0, 'barriers': 0, 'barrier_calls': 0}
+
+        self.write_access = 0
+        for name, value in vars(vk).items():
+            if name.startswith('ACCESS_') and '_WRITE_' in name:
+                self.write_access |= value
+
+    def add(self, image, aspect_mask, mip_levels=1, array_layers=1, layout=None, access=0, stages=0):
+        "Track an image. Its subresources start in `layout` (IMAGE_LAYOUT_UNDEFINED by default)"
+        state = (vk.IMAGE_LAYOUT_UNDEFINED if layout is None else layout, access, stages)
+        self.images[getattr(image, 'value', image)] = (aspect_mask, [[state] * array_layers for _ in range(mip_levels)])
+
+    def remove(self, image):
+        image = getattr(image, 'value', image)
+        del self.images[image]
+        for key in [key for key in self.pending if key[0] == image]:
+            del self.pending[key]
+
+    def layout(self, image, mip_level=0, array_layer=0):
+        "Current layout of a subresource (the layout after the pending barriers)"
+        return self.images[getattr(image, 'value', image)][1][mip_level][array_layer][0]
+
+    def use(self, image, layout, access, stages, subresource_range=None):
+        "Declare the next use of subresources of an image (all of them by default). Transitions are recorded by the next flush"
+        image = getattr(image, 'value', image)
+        levels = self.images[image][1]
+        if subresource_range is None:
+            mips, layers = range(len(levels)), range(len(levels[0]))
+        else:
+            base_mip, base_layer = subresource_range.base_mip_level, subresource_range.base_array_layer
+            mip_count, layer_count = subresource_range.level_count, subresource_range.layer_count
+            mips = range(base_mip, len(levels) if mip_count == vk.REMAINING_MIP_LEVELS.value else base_mip + mip_count)
+            layers = range(base_layer, len(levels[0]) if layer_count == vk.REMAINING_ARRAY_LAYERS.value else base_layer + layer_count)
+
+        pending, write_access = self.pending, self.write_access
+        for mip in mips:
+            states = levels[mip]
+            for layer in layers:
+                state = states[layer]
+                key = (image, mip, layer)
+                if state[0] == layout and (key in pending or not (state[1] | access) & write_access):
+                    # Reads in the same layout need no barrier. Uses that share a pending barrier are added to its destination
+                    states[layer] = (layout, state[1] | access, state[2] | stages)
+                    self.stats['skipped'] += key not in pending
+                    continue
+                if key not in pending:
+                    pending[key] = state
+                    self.stats['transitions'] += 1
+                states[layer] = (layout, access, stages)
+
+    def barriers(self):
+        "Merge the pending transitions into (src stages, dst stages, ImageMemoryBarrier array) and clear them"
+        # Runs of array layers with the same transition, then runs of mip levels with the same layer runs
+        runs, mip_runs = [], {}
+        for (image, mip, layer), old in sorted(self.pending.items(), key=lambda item: item[0]):
+            new = self.images[image][1][mip][layer]
+            run = runs[-1] if runs else None
+            if run is not None and run[:4] == [image, old, new, mip] and run[5] + run[6] == layer:
+                run[6] += 1
+            else:
+                runs.append([image, old, new, mip, 1, layer, 1])
+
+        merged = []
+        for run in runs:
+            image, old, new, mip, _, layer, layer_count = run
+            previous = mip_runs.get((image, old, new, layer, layer_count))
+            if previous is not None and previous[3] + previous[4] == mip:
+                previous[4] += 1
+            else:
+                mip_runs[(image, old, new, layer, layer_count)] = run
+                merged.append(run)
+        self.pending = {}
+
+        barriers = (vk.ImageMemoryBarrier * len(merged))()
+        src_stages = dst_stages = 0
+        for barrier, (image, old, new, mip, mip_count, layer, layer_count) in zip(barriers, merged):
+            barrier.type = vk.STRUCTURE_TYPE_IMAGE_MEMORY_BARRIER
+            barrier.src_access_mask, barrier.dst_access_mask = old[1], new[1]
+            barrier.old_layout, barrier.new_layout = old[0], new[0]
+            barrier.src_queue_family_index = barrier.dst_queue_family_index = vk.QUEUE_FAMILY_IGNORED.value
+            barrier.image = image
+            barrier.subresource_range = vk.ImageSubresourceRange(self.images[image][0], mip, mip_count, layer, layer_count)
+            src_stages |= old[2]
+            dst_stages |= new[2]
+
+        return src_stages or vk.PIPELINE_STAGE_TOP_OF_PIPE_BIT, dst_stages or vk.PIPELINE_STAGE_BOTTOM_OF_PIPE_BIT, barriers
+
+    def flush(self, device, command_buffer):
+        "Record the pending transitions with one CmdPipelineBarrier call. Returns the number of barriers"
+        if not self.pending:
+            return 0
+        src_stages, dst_stages, barriers = self.barriers()
+        device.CmdPipelineBarrier(command_buffer, src_stages, dst_stages, 0, 0, None, 0, None, len(barriers), barriers)
+        self.stats['barriers'] += len(barriers)
+        self.stats['barrier_calls'] += 1
+        return len(barriers)